@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+태스크 단위 실행 시간 기록 콜백 플러그인
+
+timer / profile_tasks 콜백은 사람이 읽는 텍스트만 stdout 에 남겨서 실행 간 비교가
+어렵습니다. 이 플러그인은 호스트별 태스크와 loop 항목별 실행 시간(벽시계 시간과
+command/shell 결과의 delta 로 얻는 원격 명령 시간)을 JSON lines 파일에 한 줄씩
+기록하고, 플레이북 종료 시 node_exporter textfile collector 용 Prometheus 파일을
+씁니다. 두 실행의 비교는 scripts/compare_task_timings.py 로 합니다.
+"""
+
+DOCUMENTATION = r'''
+name: task_timing
+type: aggregate
+short_description: Record per-task, per-host and per-loop-item timings as JSON lines and Prometheus metrics
+description:
+  - Writes one JSON object per line to C(<output_dir>/<playbook>-<run_id>.jsonl) while the playbook runs.
+  - C(type=task) lines hold the wall time of a task on one host, the remote command time (the C(delta) of
+    command/shell results, summed over loop items) and the remaining connection/module overhead.
+  - C(type=item) lines hold the time of each loop item, measured between consecutive item results.
+  - C(type=run) is the last line, with the playbook duration and per-host stats.
+  - At the end of the playbook writes C(ansible_task_timing_<playbook>.prom) to I(prometheus_dir) atomically,
+    for the node_exporter textfile collector.
+  - Compare two runs with C(scripts/compare_task_timings.py).
+options:
+  output_dir:
+    description: Directory of the JSON lines files.
+    type: path
+    default: ~/.ansible/task_timing
+    env:
+      - name: ANSIBLE_TASK_TIMING_DIR
+    ini:
+      - section: callback_task_timing
+        key: output_dir
+  prometheus_dir:
+    description: Directory of the Prometheus textfile. Defaults to I(output_dir).
+    type: path
+    env:
+      - name: ANSIBLE_TASK_TIMING_PROMETHEUS_DIR
+    ini:
+      - section: callback_task_timing
+        key: prometheus_dir
+  run_id:
+    description: Identifier of the run. Defaults to the start time and process id.
+    type: str
+    env:
+      - name: ANSIBLE_TASK_TIMING_RUN_ID
+'''
+
+import json
+import os
+import re
+import tempfile
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DELTA_RE = re.compile(r'^(\d+):(\d{2}):(\d{2}(?:\.\d+)?)$')
+LABEL_MAX = 120
+
+
+def delta_seconds(delta):
+    """command/shell 결과의 delta('0:00:01.234567') -> 초 (형식이 다르면 None)"""
+    match = DELTA_RE.match(str(delta or ''))
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def command_seconds(result):
+    """태스크 결과의 원격 명령 시간 (loop 결과는 항목 합계, 알 수 없으면 None)"""
+    if isinstance(result.get('results'), list):
+        values = [delta_seconds(r.get('delta')) for r in result['results'] if isinstance(r, dict)]
+        values = [v for v in values if v is not None]
+        return sum(values) if values else None
+    return delta_seconds(result.get('delta'))
+
+
+def item_label(result):
+    label = result.get('_ansible_item_label', result.get('item'))
+    if not isinstance(label, str):
+        label = json.dumps(label, sort_keys=True, default=str)
+    return label if len(label) <= LABEL_MAX else label[:LABEL_MAX - 3] + '...'
+
+
+def result_status(result, failed=False, ignore_errors=False):
+    if result.get('unreachable'):
+        return 'unreachable'
+    if failed:
+        return 'ignored' if ignore_errors else 'failed'
+    if result.get('skipped'):
+        return 'skipped'
+    return 'changed' if result.get('changed') else 'ok'
+
+
+def prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(playbook, records, duration, finished):
+    """호스트별 태스크 기록 -> Prometheus textfile 내용"""
+    base = f'playbook="{prometheus_label(playbook)}"'
+    metrics = {
+        'ansible_playbook_duration_seconds': ('Wall time of the last playbook run.', [(base, duration)]),
+        'ansible_playbook_last_run_timestamp_seconds': ('Unix time the last playbook run finished.',
+                                                        [(base, finished)]),
+        'ansible_task_duration_seconds': ('Wall time of a task on a host.', []),
+        'ansible_task_command_seconds': ('Remote command time (delta) of a command/shell task on a host.', []),
+        'ansible_task_loop_items': ('Number of loop items of a task on a host.', []),
+        'ansible_playbook_tasks': ('Number of host task results by status.', []),
+    }
+    statuses = {}
+    for record in records:
+        labels = (f'{base},task="{prometheus_label(record["task_key"])}",'
+                  f'host="{prometheus_label(record["host"])}"')
+        metrics['ansible_task_duration_seconds'][1].append((labels, record['wall_s']))
+        if record['command_s'] is not None:
+            metrics['ansible_task_command_seconds'][1].append((labels, record['command_s']))
+        if record['items']:
+            metrics['ansible_task_loop_items'][1].append((labels, record['items']))
+        statuses[record['status']] = statuses.get(record['status'], 0) + 1
+    for status, count in sorted(statuses.items()):
+        metrics['ansible_playbook_tasks'][1].append((f'{base},status="{status}"', count))
+
+    lines = []
+    for name, (help_text, samples) in metrics.items():
+        if not samples:
+            continue
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} gauge']
+        lines += [f'{name}{{{labels}}} {round(value, 6)}' for labels, value in samples]
+    return '\n'.join(lines) + '\n'
+
+
+def write_atomic(path, text):
+    """textfile collector 가 쓰다 만 파일을 읽지 않도록 임시 파일 후 rename"""
+    directory = os.path.dirname(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class CallbackModule(CallbackBase):
+    """호스트별 태스크/loop 항목 실행 시간을 JSON lines 와 Prometheus textfile 로 기록"""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'task_timing'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, display=None, clock=time.time):
+        super().__init__(display)
+        self.clock = clock
+        self.output_dir = os.path.expanduser('~/.ansible/task_timing')
+        self.prometheus_dir = None
+        self.run_id = None
+        self.playbook = None
+        self.play = None
+        self.path = None
+        self.started = None
+        self.tasks = {}
+        self.names = {}
+        self.running = {}
+        self.records = []
+        self._out = None
+
+    def set_options(self, task_keys=None, var_options=None, direct=None):
+        super().set_options(task_keys=task_keys, var_options=var_options, direct=direct)
+        self.output_dir = os.path.expanduser(self.get_option('output_dir'))
+        self.prometheus_dir = self.get_option('prometheus_dir')
+        self.run_id = self.get_option('run_id')
+
+    def _write(self, record):
+        if self._out is not None:
+            self._out.write(json.dumps(record, sort_keys=True, default=str) + '\n')
+            self._out.flush()
+
+    def v2_playbook_on_start(self, playbook):
+        self.started = self.clock()
+        self.playbook = os.path.basename(playbook._file_name)
+        self.run_id = self.run_id or time.strftime('%Y%m%dT%H%M%S', time.localtime(self.started)) + f'-{os.getpid()}'
+        stem = os.path.splitext(self.playbook)[0]
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.path = os.path.join(self.output_dir, f'{stem}-{self.run_id}.jsonl')
+        self._out = open(self.path, 'w')
+        self._write({'type': 'start', 'run_id': self.run_id, 'playbook': self.playbook, 'start': self.started})
+
+    def v2_playbook_on_play_start(self, play):
+        self.play = play.get_name().strip()
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        uuid = task._uuid
+        if uuid in self.tasks:
+            return
+        name = task.get_name().strip()
+        key = f'{self.play} | {name}'
+        self.names[key] = self.names.get(key, 0) + 1
+        if self.names[key] > 1:
+            key = f'{key} #{self.names[key]}'
+        self.tasks[uuid] = {'task_key': key, 'play': self.play, 'task': name, 'action': task.action,
+                            'start': self.clock()}
+
+    v2_playbook_on_handler_task_start = v2_playbook_on_task_start
+
+    def v2_runner_on_start(self, host, task):
+        now = self.clock()
+        self.running[(host.get_name(), task._uuid)] = {'start': now, 'mark': now, 'items': 0}
+
+    def _entry(self, result):
+        host, uuid = result._host.get_name(), result._task._uuid
+        meta = self.tasks.get(uuid) or {'task_key': result._task.get_name(), 'play': self.play,
+                                        'task': result._task.get_name(), 'action': result._task.action,
+                                        'start': self.clock()}
+        running = self.running.setdefault((host, uuid), {'start': meta['start'], 'mark': meta['start'],
+                                                         'items': 0})
+        return host, meta, running
+
+    def _item(self, result, failed=False):
+        host, meta, running = self._entry(result)
+        now = self.clock()
+        data = result._result
+        self._write({
+            'type': 'item',
+            'run_id': self.run_id,
+            'task_key': meta['task_key'],
+            'host': host,
+            'index': running['items'],
+            'item': item_label(data),
+            'status': result_status(data, failed),
+            'wall_s': round(now - running['mark'], 6),
+            'command_s': delta_seconds(data.get('delta')),
+        })
+        running['mark'] = now
+        running['items'] += 1
+
+    def v2_runner_item_on_ok(self, result):
+        self._item(result)
+
+    def v2_runner_item_on_failed(self, result):
+        self._item(result, failed=True)
+
+    def v2_runner_item_on_skipped(self, result):
+        self._item(result)
+
+    def _finish(self, result, failed=False, ignore_errors=False):
+        host, meta, running = self._entry(result)
+        del self.running[(host, result._task._uuid)]
+        now = self.clock()
+        data = result._result
+        wall = now - running['start']
+        command = command_seconds(data)
+        items = running['items'] or (len(data['results']) if isinstance(data.get('results'), list) else 0)
+        record = {
+            'type': 'task',
+            'run_id': self.run_id,
+            'task_key': meta['task_key'],
+            'play': meta['play'],
+            'task': meta['task'],
+            'action': meta['action'],
+            'host': host,
+            'status': result_status(data, failed, ignore_errors),
+            'start': running['start'],
+            'end': now,
+            'wall_s': round(wall, 6),
+            'command_s': None if command is None else round(command, 6),
+            'overhead_s': None if command is None else round(max(wall - command, 0.0), 6),
+            'items': items,
+        }
+        self.records.append(record)
+        self._write(record)
+
+    def v2_runner_on_ok(self, result):
+        self._finish(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._finish(result, failed=True, ignore_errors=ignore_errors)
+
+    def v2_runner_on_skipped(self, result):
+        self._finish(result)
+
+    def v2_runner_on_unreachable(self, result):
+        self._finish(result)
+
+    def v2_playbook_on_stats(self, stats):
+        if self._out is None:
+            return
+        finished = self.clock()
+        duration = finished - self.started
+        self._write({'type': 'run', 'run_id': self.run_id, 'playbook': self.playbook, 'start': self.started,
+                     'end': finished, 'duration_s': round(duration, 6),
+                     'hosts': {h: stats.summarize(h) for h in sorted(stats.processed)}})
+        self._out.close()
+        self._out = None
+
+        prometheus_dir = os.path.expanduser(self.prometheus_dir or self.output_dir)
+        stem = re.sub(r'[^A-Za-z0-9_.-]', '_', os.path.splitext(self.playbook)[0])
+        try:
+            os.makedirs(prometheus_dir, exist_ok=True)
+            write_atomic(os.path.join(prometheus_dir, f'ansible_task_timing_{stem}.prom'),
+                         prometheus_text(self.playbook, self.records, duration, finished))
+        except OSError as e:
+            self._display.warning(f'task_timing: could not write Prometheus textfile: {e}')
+        self._display.vv(f'task_timing: wrote {self.path}')
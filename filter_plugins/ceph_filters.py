@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Ceph 플레이북용 Jinja2 필터
+
+태스크마다 `selectattr(...) | first` 나 `json_query("[?...]")` 로 리스트 전체를
+다시 훑으면 템플릿 비용이 항목 수의 제곱으로 늘어납니다. 여기의 필터는 리스트를
+한 번만 순회해서 키 -> 항목 dict 를 만들고, 이후 조회는 dict 접근으로 처리합니다.
+"""
+
+import csv
+
+from ansible.errors import AnsibleFilterError
+
+_MISSING = object()
+
+
+def _lookup(obj, path):
+    """점 표기 경로('item.user_id') 또는 정수 인덱스로 값 조회"""
+    if isinstance(path, int):
+        path = [path]
+    elif isinstance(path, str):
+        path = path.split('.')
+    for part in path:
+        if isinstance(obj, dict):
+            obj = obj.get(part, _MISSING)
+        elif isinstance(obj, (list, tuple)):
+            try:
+                obj = obj[int(part)]
+            except (ValueError, IndexError):
+                return _MISSING
+        else:
+            obj = getattr(obj, str(part), _MISSING)
+        if obj is _MISSING:
+            return _MISSING
+    return obj
+
+
+def index_by(items, key='item.user_id'):
+    """리스트를 key 값 기준 dict 로 변환 (키가 없는 항목은 건너뜀, 중복 시 마지막 항목 유지)
+
+    기본 key 는 `register` 된 loop 결과(`results`)에서 원래 loop 항목의 user_id 입니다.
+    `register` 변수 자체를 넘기면 자동으로 `results` 를 사용합니다.
+
+        {{ user_info | index_by }}                -> {user_id: loop 결과}
+        {{ csv_text | csv_rows | index_by(0) }}        -> {첫 컬럼: 행}
+    """
+    if isinstance(items, dict) and 'results' in items:
+        items = items['results']
+    if isinstance(items, (str, bytes, dict)) or not hasattr(items, '__iter__'):
+        raise AnsibleFilterError(f"index_by expects a list, got {type(items).__name__}")
+
+    index = {}
+    for entry in items:
+        value = _lookup(entry, key)
+        if value is _MISSING or value is None:
+            continue
+        index[value] = entry
+    return index
+
+
+def csv_rows(text, columns=None, header=True):
+    """CSV 텍스트를 csv.reader 로 읽어 행 리스트로 변환 (빈 행 제외, 컬럼 양끝 공백 제거)
+
+    쉼표가 들어간 필드는 따옴표로 감싸 기록되므로 `split(',')` 대신 이 필터로 읽습니다.
+    header 가 참이면 첫 행을 버리고, columns 를 주면 컬럼 수가 다른 행을 건너뜁니다.
+
+        {{ content | b64decode | csv_rows(5) | index_by(0) }} -> {첫 컬럼: 행}
+    """
+    if not isinstance(text, str):
+        raise AnsibleFilterError(f"csv_rows expects CSV text, got {type(text).__name__}")
+
+    rows = [[col.strip() for col in row] for row in csv.reader(text.splitlines())]
+    if header:
+        rows = rows[1:]
+    return [row for row in rows if any(row) and (columns is None or len(row) == columns)]
+
+
+def osd_tree_index(tree):
+    """`ceph osd tree --format json` 결과를 한 번 순회해서 host -> OSD 색인 생성
+
+    CRUSH 계층(root/rack/host 등)을 따라가며 OSD 마다 소속 host 를 기록하므로
+    OSD ID 가 연속적이지 않아도 되고, `ceph osd find` 를 OSD 마다 호출할 필요가 없습니다.
+
+        {{ osd_tree.stdout | from_json | osd_tree_index }}
+        -> {'hosts': {host: [osd id, ...]}, 'osds': {id: {...}}, 'unplaced': [...],
+            'stray': [...], 'down': [...], 'out': [...], 'device_classes': [...], ...}
+    """
+    if isinstance(tree, (str, bytes)) or not isinstance(tree, dict):
+        raise AnsibleFilterError(f"osd_tree_index expects a parsed osd tree dict, got {type(tree).__name__}")
+
+    nodes = tree.get('nodes') or []
+    parent_host = {}
+    for node in nodes:
+        if node.get('type') == 'host':
+            for child in node.get('children') or []:
+                parent_host[child] = node['name']
+
+    hosts, osds = {}, {}
+    for node in nodes:
+        if node.get('type') == 'host':
+            hosts.setdefault(node['name'], [])
+        elif node.get('type') == 'osd':
+            osd_id = node['id']
+            host = parent_host.get(osd_id)
+            osds[osd_id] = {
+                'id': osd_id,
+                'name': node.get('name', f"osd.{osd_id}"),
+                'host': host,
+                'device_class': node.get('device_class'),
+                'status': node.get('status'),
+                'up': node.get('status') == 'up',
+                'in': float(node.get('reweight', 0) or 0) > 0,
+                'crush_weight': node.get('crush_weight'),
+            }
+            if host is not None:
+                hosts.setdefault(host, []).append(osd_id)
+
+    for osd_ids in hosts.values():
+        osd_ids.sort()
+    ordered = sorted(osds)
+    return {
+        'hosts': hosts,
+        'osds': osds,
+        'unplaced': [i for i in ordered if osds[i]['host'] is None],
+        'stray': sorted(node['id'] for node in tree.get('stray') or []),
+        'down': [i for i in ordered if not osds[i]['up']],
+        'out': [i for i in ordered if not osds[i]['in']],
+        'device_classes': sorted({o['device_class'] for o in osds.values() if o['device_class']}),
+        'total': len(osds),
+    }
+
+
+class FilterModule(object):
+    """Ceph 관련 필터 모음"""
+
+    def filters(self):
+        return {
+            'index_by': index_by,
+            'csv_rows': csv_rows,
+            'osd_tree_index': osd_tree_index,
+        }
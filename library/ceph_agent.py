@@ -0,0 +1,189 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Ceph 명령 에이전트 관리 모듈
+
+플레이 시작 시 관리 호스트에서 librados 연결 하나를 유지하는 에이전트 데몬을 띄우고
+(module_utils/ceph_agent.py), 끝날 때 종료합니다. 에이전트가 실행 중인 동안 같은
+호스트의 커스텀 모듈은 CephCLI 를 통해 `ceph` 명령을 프로세스 생성 없이 에이전트로
+보냅니다. python3-rados 또는 ceph_argparse 가 없으면 에이전트를 띄우지 않고 경고만
+남기며, 모듈들은 그대로 CLI 를 사용합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_agent
+short_description: Start or stop the Ceph admin command agent
+description:
+  - Starts a daemon on the admin host that keeps one authenticated librados connection and serves
+    C(ceph) commands over a local UNIX socket, or stops it.
+  - While the agent runs, the custom modules of this suite send C(ceph) commands to it instead of
+    starting a C(ceph) process per command. They fall back to the CLI when the socket is missing or
+    for commands the agent does not handle (C(tell), C(daemon), connection options).
+  - When python3-rados or ceph_argparse is not installed, or the connection fails, the agent is not
+    started and a warning is returned; modules keep using the CLI.
+  - The agent exits by itself after I(idle_timeout) seconds without requests.
+options:
+  state:
+    description: C(started) starts the agent unless it is running, C(stopped) stops it, C(status) only reports.
+    type: str
+    choices: [started, stopped, status]
+    default: started
+  socket:
+    description:
+      - UNIX socket path. Modules find the agent at this path, or at C(CEPH_AGENT_SOCKET) when that environment
+        variable is set.
+    type: path
+    default: /run/ceph-ansible/agent.sock
+  conffile:
+    description: Ceph configuration file used by librados.
+    type: path
+    default: /etc/ceph/ceph.conf
+  client:
+    description: Client name used by librados.
+    type: str
+    default: client.admin
+  timeout:
+    description: Connection and command timeout in seconds.
+    type: int
+    default: 10
+  idle_timeout:
+    description: Seconds without requests after which the agent exits. C(0) disables the limit.
+    type: int
+    default: 900
+'''
+
+EXAMPLES = r'''
+- name: Start the Ceph admin command agent
+  ceph_agent:
+    state: started
+
+- name: Stop the Ceph admin command agent
+  ceph_agent:
+    state: stopped
+'''
+
+RETURN = r'''
+running:
+  description: Whether the agent is running after the task.
+  returned: always
+  type: bool
+socket:
+  description: UNIX socket path of the agent.
+  returned: always
+  type: str
+pid:
+  description: Process id of the agent.
+  returned: when running
+  type: int
+method:
+  description: C(librados) when the agent serves commands, C(cli) when modules use the CLI.
+  returned: always
+  type: str
+stats:
+  description: Request counters of the agent (requests, errors, fallbacks, uptime).
+  returned: when the agent was running before the task
+  type: dict
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_agent import (
+    HAS_CEPH_ARGPARSE,
+    HAS_RADOS,
+    AgentClient,
+    AgentUnavailable,
+    RadosAgentBackend,
+    spawn_agent,
+)
+
+
+class AgentController:
+    """소켓 경로 하나에 대한 에이전트 상태 조회/시작/종료"""
+
+    def __init__(self, path, backend_factory, idle_timeout=900, timeout=10, spawn=spawn_agent):
+        self.path = path
+        self.backend_factory = backend_factory
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.spawn = spawn
+
+    def status(self):
+        """실행 중이면 에이전트 통계, 아니면 None"""
+        client = AgentClient(self.path, timeout=self.timeout)
+        try:
+            return client.ping()
+        except AgentUnavailable:
+            return None
+        finally:
+            client.close()
+
+    def start(self, check_mode=False):
+        stats = self.status()
+        if stats is not None:
+            return {'changed': False, 'running': True, 'pid': stats['pid'], 'method': stats['method'],
+                    'stats': stats}
+        if check_mode:
+            return {'changed': True, 'running': False, 'method': 'librados'}
+        pid = self.spawn(self.path, self.backend_factory, self.idle_timeout, self.timeout * 3)
+        return {'changed': True, 'running': True, 'pid': pid, 'method': 'librados'}
+
+    def stop(self, check_mode=False):
+        stats = self.status()
+        if stats is None:
+            return {'changed': False, 'running': False, 'method': 'cli'}
+        if not check_mode:
+            client = AgentClient(self.path, timeout=self.timeout)
+            try:
+                client.shutdown()
+            except AgentUnavailable:
+                pass
+            finally:
+                client.close()
+        return {'changed': True, 'running': False, 'method': 'cli', 'pid': stats['pid'], 'stats': stats}
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            state=dict(type='str', default='started', choices=['started', 'stopped', 'status']),
+            socket=dict(type='path', default='/run/ceph-ansible/agent.sock'),
+            conffile=dict(type='path', default='/etc/ceph/ceph.conf'),
+            client=dict(type='str', default='client.admin'),
+            timeout=dict(type='int', default=10),
+            idle_timeout=dict(type='int', default=900),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    controller = AgentController(
+        params['socket'],
+        lambda: RadosAgentBackend(params['conffile'], params['client'], params['timeout']),
+        params['idle_timeout'],
+        params['timeout'],
+    )
+
+    if params['state'] == 'status':
+        stats = controller.status()
+        result = {'changed': False, 'running': stats is not None, 'method': stats['method'] if stats else 'cli'}
+        if stats:
+            result.update(pid=stats['pid'], stats=stats)
+    elif params['state'] == 'stopped':
+        result = controller.stop(module.check_mode)
+    elif not (HAS_RADOS and HAS_CEPH_ARGPARSE):
+        missing = ', '.join(name for name, ok in (('python3-rados', HAS_RADOS), ('ceph_argparse', HAS_CEPH_ARGPARSE))
+                            if not ok)
+        module.warn(f"{missing} not available, the ceph agent is not started and modules use the ceph CLI")
+        result = {'changed': False, 'running': False, 'method': 'cli'}
+    else:
+        try:
+            result = controller.start(module.check_mode)
+        except RuntimeError as e:
+            module.warn(f"ceph agent could not start, modules use the ceph CLI: {e}")
+            result = {'changed': False, 'running': False, 'method': 'cli'}
+
+    module.exit_json(socket=params['socket'], **result)
+
+
+if __name__ == '__main__':
+    main()
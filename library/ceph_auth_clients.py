@@ -0,0 +1,256 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Ceph 클라이언트(auth 엔티티) 일괄 생성 모듈
+
+사용자마다 `ceph auth get-or-create` 와 `ceph auth get-key` 를 실행하던 방식을
+대체합니다. `ceph auth ls` 한 번으로 모든 엔티티의 키와 caps 를 가져와 원하는
+caps 와 비교하고, 없는 클라이언트만 생성하고 caps 가 다른 클라이언트만
+`ceph auth caps` 로 갱신합니다. 키는 같은 조회 결과에서 반환합니다.
+
+apply=false 로 실행하면 변경 없이 같은 조회 결과로 클라이언트별/cap 종류별 검증
+결과만 반환합니다. 사용자마다 `ceph auth get` 을 실행하고 텍스트에서 caps 를 부분
+문자열로 찾던 검증(`profile rbd` 가 `profile rbd pool=x` 와도 일치)을 대체합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_auth_clients
+short_description: Reconcile Ceph client keys and caps from a single auth dump
+description:
+  - Lists every auth entity once with C(ceph auth ls --format json).
+  - Creates missing clients with C(ceph auth get-or-create) and updates clients whose caps
+    differ with C(ceph auth caps). Clients that already match are not touched.
+  - Returns every client key and the caps drift found before the run, so a no-op re-run
+    issues a single mon command.
+  - With C(apply=false) nothing is changed and the same dump is used to validate every client
+    exactly (after whitespace normalization) against the desired caps, per cap type.
+options:
+  clients:
+    description:
+      - Desired clients, usually C(ceph.csi) from C(ceph-vars.yml).
+      - Each entry needs C(name) or C(ceph_csi_user) (with or without the C(client.) prefix)
+        and C(caps), a dict of C(mon), C(osd), C(mgr) and C(mds) capability strings.
+    type: list
+    elements: dict
+    required: true
+  apply:
+    description: Create and update clients. When false, only validate and return C(validation) and C(valid).
+    type: bool
+    default: true
+  update_caps:
+    description: Update the caps of existing clients that drifted. When false, drift is only reported.
+    type: bool
+    default: true
+  workers:
+    description: Maximum number of concurrent C(ceph auth) commands.
+    type: int
+    default: 4
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+'''
+
+EXAMPLES = r'''
+- name: Create CSI users with dynamic capabilities
+  ceph_auth_clients:
+    clients: "{{ ceph.csi }}"
+  register: csi_users
+
+- name: Validate CSI user capabilities
+  ceph_auth_clients:
+    clients: "{{ ceph.csi }}"
+    apply: false
+  register: csi_auth
+'''
+
+RETURN = r'''
+clients:
+  description: Per-client result keyed by entity name.
+  returned: when apply is true
+  type: dict
+  sample:
+    client.csi-rbd-user:
+      entity: client.csi-rbd-user
+      key: AQD...==
+      caps: {mon: profile rbd, osd: profile rbd pool=rbd-oa}
+      status: updated
+      drift: {osd: {expected: profile rbd pool=rbd-oa, actual: profile rbd}}
+created:
+  description: Entities created by this run.
+  returned: when apply is true
+  type: list
+updated:
+  description: Entities whose caps were updated by this run.
+  returned: when apply is true
+  type: list
+drift:
+  description: Caps drift of existing entities keyed by entity, as found before the run.
+  returned: always
+  type: dict
+errors:
+  description: Error message per entity that could not be created or updated.
+  returned: when apply is true
+  type: dict
+validation:
+  description: Per-client validation keyed by entity name. Keys are not returned. Only with C(apply=false).
+  returned: when apply is false
+  type: dict
+  sample:
+    client.csi-rbd-user:
+      exists: true
+      has_key: true
+      caps:
+        mon: {expected: profile rbd, actual: profile rbd, match: true}
+        osd: {expected: profile rbd pool=rbd-oa, actual: profile rbd, match: false}
+      problems: ["osd caps mismatch: expected 'profile rbd pool=rbd-oa', got 'profile rbd'"]
+      valid: false
+missing:
+  description: Desired entities that do not exist. Only with C(apply=false).
+  returned: when apply is false
+  type: list
+valid:
+  description: Whether every client exists, has a key and has exactly the desired caps. Only with C(apply=false).
+  returned: when apply is false
+  type: bool
+commands:
+  description: Number of ceph invocations made by the module.
+  returned: always
+  type: int
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_auth import auth_index, caps_args, caps_drift, caps_report, entity_name
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, run_parallel
+
+
+def desired_clients(clients):
+    """clients 옵션 -> [(entity, caps)] (같은 entity 는 마지막 정의 사용)"""
+    desired = {}
+    for client in clients:
+        name = client.get('name') or client.get('ceph_csi_user')
+        if not name:
+            raise ValueError("client definition needs 'name' or 'ceph_csi_user'")
+        desired[entity_name(name)] = {k: v for k, v in (client.get('caps') or {}).items() if v not in (None, '')}
+    return list(desired.items())
+
+
+class AuthReconciler:
+    """auth dump 1회 조회 후 누락/변경된 클라이언트만 생성 또는 갱신"""
+
+    def __init__(self, cli, workers=4, update_caps=True):
+        self.cli = cli
+        self.workers = workers
+        self.update_caps = update_caps
+
+    def create(self, entity, caps):
+        entries = self.cli.run_json(['auth', 'get-or-create', entity] + caps_args(caps)) or []
+        return entries[0].get('key') if entries else None
+
+    def set_caps(self, entity, caps):
+        self.cli.run(['auth', 'caps', entity] + caps_args(caps))
+
+    def validate(self, clients):
+        existing = auth_index(self.cli.run_json(['auth', 'ls']) or {})
+        result = {'validation': {}, 'missing': [], 'drift': {}}
+        for entity, caps in desired_clients(clients):
+            current = existing.get(entity)
+            entry = {'exists': current is not None, 'has_key': bool(current and current['key']),
+                     'caps': caps_report(caps, current['caps'] if current else {}), 'problems': []}
+            if current is None:
+                result['missing'].append(entity)
+                entry['problems'].append('entity not found')
+            else:
+                if not entry['has_key']:
+                    entry['problems'].append('no key')
+                drift = caps_drift(caps, current['caps'])
+                if drift:
+                    result['drift'][entity] = drift
+                entry['problems'].extend(f"{cap} caps mismatch: expected {d['expected']!r}, got {d['actual']!r}"
+                                         for cap, d in drift.items())
+            entry['valid'] = not entry['problems']
+            result['validation'][entity] = entry
+        result['valid'] = all(e['valid'] for e in result['validation'].values())
+        return result
+
+    def apply(self, clients, check_mode=False):
+        existing = auth_index(self.cli.run_json(['auth', 'ls']) or {})
+        result = {'clients': {}, 'created': [], 'updated': [], 'drift': {}, 'errors': {}}
+
+        jobs = []
+        for entity, caps in desired_clients(clients):
+            current = existing.get(entity)
+            entry = {'entity': entity, 'key': None, 'caps': caps, 'status': 'unchanged', 'drift': {}}
+            if current is None:
+                entry['status'] = 'created'
+                jobs.append((entity, caps, 'create'))
+            else:
+                entry['key'] = current['key']
+                entry['drift'] = caps_drift(caps, current['caps'])
+                if entry['drift']:
+                    result['drift'][entity] = entry['drift']
+                    if self.update_caps:
+                        entry['status'] = 'updated'
+                        jobs.append((entity, caps, 'update'))
+                    else:
+                        entry['status'] = 'drifted'
+                        entry['caps'] = current['caps']
+            result['clients'][entity] = entry
+
+        if not check_mode:
+            def run(job):
+                entity, caps, action = job
+                if action == 'create':
+                    return self.create(entity, caps)
+                self.set_caps(entity, caps)
+                return None
+
+            for (entity, _, action), key, error in run_parallel(run, jobs, self.workers):
+                if error is not None:
+                    result['errors'][entity] = error.stderr.strip() if isinstance(error, CephCommandError) \
+                        else str(error)
+                    result['clients'][entity]['status'] = 'failed'
+                elif action == 'create':
+                    result['clients'][entity]['key'] = key
+
+        for entity, _, action in jobs:
+            if entity not in result['errors']:
+                result['created' if action == 'create' else 'updated'].append(entity)
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            clients=dict(type='list', elements='dict', required=True),
+            apply=dict(type='bool', default=True),
+            update_caps=dict(type='bool', default=True),
+            workers=dict(type='int', default=4),
+            ceph=dict(type='str', default='ceph'),
+        ),
+        supports_check_mode=True,
+    )
+
+    cli = CephCLI(module.run_command, module.params['ceph'])
+    reconciler = AuthReconciler(cli, module.params['workers'], module.params['update_caps'])
+
+    try:
+        if module.params['apply']:
+            result = reconciler.apply(module.params['clients'], check_mode=module.check_mode)
+        else:
+            result = reconciler.validate(module.params['clients'])
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except ValueError as e:
+        module.fail_json(msg=str(e))
+
+    result['changed'] = bool(result.get('created') or result.get('updated'))
+    result['commands'] = cli.calls
+    if result.get('errors'):
+        module.fail_json(msg=f"Failed to reconcile {len(result['errors'])} Ceph client(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+CephFS 선언적 구성/검증 모듈
+
+`ceph.cephfs` 항목마다 존재 확인 없이 `ceph fs volume create` 와 `ceph orch apply mds`
+를 실행하고, 검증 때 다시 파일시스템마다 `ceph fs status` 와 `ceph fs get` 을
+실행하던 방식을 대체합니다. `ceph fs dump` 와 `ceph orch ls --service_type mds` 를 한
+번씩만 조회해 원하는 상태와 비교하고, 필요한 변경만 적용한 뒤 같은 조회 결과로
+검증 결과를 만듭니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_cephfs
+short_description: Reconcile and validate CephFS filesystems from one cluster snapshot
+description:
+  - Reads C(ceph fs dump --format json) and C(ceph orch ls --service_type mds --format json) once and
+    compares them with the desired filesystems.
+  - Creates missing filesystems with C(ceph fs volume create) and applies the MDS placement with
+    C(ceph orch apply mds) only when the service is missing or its placement count differs.
+  - Validates every unchanged filesystem (exists, has an active rank, MDS service fully running) from the same
+    snapshot. Filesystems applied or planned by this run are not validated, because the snapshot predates the
+    change; their C(valid) is null until a later I(apply=false) run.
+  - Returns the state as a normal result, not as a fact, so cached facts from an earlier run are never
+    validated. Run with I(apply=false) for a read-only check.
+  - Never removes filesystems or MDS services.
+options:
+  filesystems:
+    description:
+      - Desired filesystems, usually C(ceph.cephfs) from C(ceph-vars.yml).
+      - Each entry needs C(name) and may set C(mds.count), the MDS placement count.
+    type: list
+    elements: dict
+    required: true
+  apply:
+    description: Apply missing filesystems and MDS placements. When false, only validate.
+    type: bool
+    default: true
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+'''
+
+EXAMPLES = r'''
+- name: Configure CephFS
+  ceph_cephfs:
+    filesystems: "{{ ceph.cephfs }}"
+
+- name: Check CephFS state
+  ceph_cephfs:
+    filesystems: "{{ ceph.cephfs }}"
+    apply: false
+'''
+
+RETURN = r'''
+filesystems:
+  description: Per-filesystem state and validation, keyed by name.
+  returned: always
+  type: dict
+  sample:
+    fs-oa:
+      exists: true
+      action: unchanged
+      max_mds: 1
+      active_ranks: 1
+      standby: 1
+      metadata_pool: 2
+      data_pools: [3]
+      mds: {service: mds.fs-oa, expected: 1, placement: 1, running: 1, size: 1}
+      valid: true
+      problems: []
+    fs-ob:
+      exists: false
+      action: applied
+      mds: {service: mds.fs-ob, expected: 1}
+      valid: null
+      problems: []
+created:
+  description: Filesystems created by this run.
+  returned: always
+  type: list
+mds_applied:
+  description: Filesystems whose MDS placement was applied by this run.
+  returned: always
+  type: list
+valid:
+  description: Whether every validated filesystem passed (filesystems changed by this run are not counted).
+  returned: always
+  type: bool
+commands:
+  description: Number of ceph invocations made by the module.
+  returned: always
+  type: int
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError
+
+
+def fs_index(dump):
+    """`ceph fs dump` JSON -> {fs_name: {'max_mds', 'active_ranks', 'standby', 'metadata_pool', 'data_pools'}}"""
+    filesystems = (dump or {}).get('filesystems') or []
+    names = [(fs.get('mdsmap') or {}).get('fs_name') for fs in filesystems]
+    standbys = {}
+    for daemon in (dump or {}).get('standbys') or []:
+        # cephadm MDS 데몬 이름은 '<fs_name>.<host>.<id>' 형식
+        owner = next((n for n in names if daemon.get('name', '').startswith(f"{n}.")), None)
+        standbys[owner] = standbys.get(owner, 0) + 1
+    index = {}
+    for name, fs in zip(names, filesystems):
+        mdsmap = fs.get('mdsmap') or {}
+        daemons = (mdsmap.get('info') or {}).values()
+        index[name] = {
+            'max_mds': mdsmap.get('max_mds'),
+            'active_ranks': sum(1 for d in daemons if d.get('state') == 'up:active'),
+            'standby': standbys.get(name, 0) + sum(1 for d in daemons if d.get('state') == 'up:standby-replay'),
+            'metadata_pool': mdsmap.get('metadata_pool'),
+            'data_pools': mdsmap.get('data_pools') or [],
+        }
+    return index
+
+
+def mds_services(listing):
+    """`ceph orch ls --service_type mds` JSON -> {service_id: {'placement', 'running', 'size'}}"""
+    services = {}
+    for spec in listing or []:
+        if spec.get('service_type') != 'mds':
+            continue
+        status = spec.get('status') or {}
+        services[spec.get('service_id')] = {
+            'placement': (spec.get('placement') or {}).get('count'),
+            'running': status.get('running', 0),
+            'size': status.get('size', 0),
+        }
+    return services
+
+
+class CephFSReconciler:
+    """fs dump / orch ls 1회 조회로 비교, 적용, 검증"""
+
+    def __init__(self, cli):
+        self.cli = cli
+
+    def snapshot(self):
+        return (fs_index(self.cli.run_json(['fs', 'dump'])),
+                mds_services(self.cli.run_json(['orch', 'ls', '--service_type', 'mds'])))
+
+    def validate(self, name, count, fs, service):
+        problems = []
+        if fs is None:
+            problems.append('filesystem not found')
+        elif fs['active_ranks'] == 0:
+            problems.append('no active MDS rank')
+        if service is None:
+            problems.append('MDS service not deployed')
+        else:
+            if service['running'] < service['size'] or service['size'] == 0:
+                problems.append(f"MDS service {service['running']}/{service['size']} running")
+            if count is not None and service['placement'] != count:
+                problems.append(f"MDS placement {service['placement']} != {count}")
+        return problems
+
+    def apply(self, filesystems, apply=True, check_mode=False):
+        current, services = self.snapshot()
+        result = {'filesystems': {}, 'created': [], 'mds_applied': []}
+
+        for desired in filesystems:
+            name = desired.get('name')
+            if not name:
+                continue
+            count = (desired.get('mds') or {}).get('count')
+            fs, service = current.get(name), services.get(name)
+            entry = dict(fs or {}, exists=fs is not None, action='unchanged',
+                         mds={'service': f"mds.{name}", 'expected': count, **(service or {})})
+
+            create = fs is None
+            place = count is not None and (service is None or service['placement'] != count)
+            if apply and (create or place):
+                entry['action'] = 'planned' if check_mode else 'applied'
+                if not check_mode:
+                    if create:
+                        self.cli.run(['fs', 'volume', 'create', name])
+                    if place:
+                        self.cli.run(['orch', 'apply', 'mds', name, f"--placement={count}"])
+                if create:
+                    result['created'].append(name)
+                if place:
+                    result['mds_applied'].append(name)
+
+            if entry['action'] == 'unchanged':
+                entry['problems'] = self.validate(name, count, fs, service)
+                entry['valid'] = not entry['problems']
+            else:
+                # 변경 전 조회 결과로는 검증할 수 없으므로 다음 apply=false 실행까지 보류
+                entry['problems'], entry['valid'] = [], None
+            result['filesystems'][name] = entry
+
+        result['valid'] = all(e['valid'] is not False for e in result['filesystems'].values())
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            filesystems=dict(type='list', elements='dict', required=True),
+            apply=dict(type='bool', default=True),
+            ceph=dict(type='str', default='ceph'),
+        ),
+        supports_check_mode=True,
+    )
+
+    cli = CephCLI(module.run_command, module.params['ceph'])
+    try:
+        result = CephFSReconciler(cli).apply(module.params['filesystems'], module.params['apply'],
+                                            check_mode=module.check_mode)
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr, commands=cli.calls)
+
+    result['changed'] = bool(result['created'] or result['mds_applied'])
+    result['commands'] = cli.calls
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
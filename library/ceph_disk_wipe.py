@@ -0,0 +1,289 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+OSD 디스크 병렬 초기화 모듈
+
+`target_disks` 를 셸 for 루프로 하나씩 처리하며 디스크마다 ceph-volume zap, wipefs,
+dd 두 번, sgdisk, parted 를 실행하던 방식을 대체합니다. `lsblk --json` 으로 블록
+장치를 한 번에 조회해 없는 장치와 마운트된 장치는 건너뛰고, 나머지는 스레드 풀로
+동시에 초기화합니다. 앞/뒤 영역은 dd 프로세스 대신 O_DIRECT 쓰기로 0을 채우고,
+같은 패스에서 남은 시그니처를 확인해 장치별 소요 시간과 함께 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_disk_wipe
+short_description: Wipe OSD candidate disks in parallel
+description:
+  - Discovers block devices with C(lsblk --json) and skips requested devices that are
+    absent or have a mounted filesystem (on the device or any child).
+  - Wipes the remaining devices concurrently. Each device gets C(ceph-volume lvm zap --destroy)
+    when available, C(wipefs -a), direct I/O zeroing of the first and last I(zero_mb) MiB, and
+    C(sgdisk --zap-all) when available.
+  - Verifies in the same pass that no filesystem or partition-table signatures remain, and
+    reports per-device step timings.
+options:
+  devices:
+    description: Block devices to wipe, for example C(/dev/sdb). Symlinks are resolved.
+    type: list
+    elements: path
+    required: true
+  workers:
+    description: Maximum number of devices wiped concurrently.
+    type: int
+    default: 8
+  zero_mb:
+    description: MiB zeroed at the beginning and at the end of each device.
+    type: int
+    default: 10
+  ceph_volume:
+    description: Run C(ceph-volume lvm zap --destroy) first when C(ceph-volume) is installed.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Zap disks
+  ceph_disk_wipe:
+    devices: "{{ target_disks }}"
+    workers: 12
+  register: zap_result
+'''
+
+RETURN = r'''
+devices:
+  description: Per-device result in the order requested.
+  returned: always
+  type: list
+  sample:
+    - device: /dev/sdb
+      status: wiped
+      size: 480103981056
+      duration: 2.41
+      clean: true
+      signatures: []
+      steps: [{step: ceph-volume, rc: 0, duration: 1.9}, {step: wipefs, rc: 0, duration: 0.02}]
+    - {device: /dev/vdb, status: skipped, reason: absent}
+wiped:
+  description: Devices wiped and verified clean.
+  returned: always
+  type: list
+excluded:
+  description: Skipped devices with the reason (C(absent) or C(mounted)).
+  returned: always
+  type: dict
+errors:
+  description: Error message per device that failed or was not clean after wiping.
+  returned: always
+  type: dict
+'''
+
+import json
+import mmap
+import os
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import run_parallel
+
+MIB = 1024 * 1024
+LSBLK_ARGS = ['--json', '--bytes', '--paths', '--output', 'NAME,TYPE,SIZE,MOUNTPOINT']
+
+
+def _mounted(node):
+    """장치 자신이나 하위 장치(파티션, LV)에 마운트된 파일시스템이 있는지"""
+    if node.get('mountpoint') or any(node.get('mountpoints') or []):
+        return True
+    return any(_mounted(child) for child in node.get('children') or [])
+
+
+def parse_lsblk(data):
+    """lsblk --json 출력 -> {경로: {'size', 'type', 'mounted'}} (하위 장치 포함)"""
+    inventory = {}
+
+    def walk(node):
+        inventory[node['name']] = {
+            'size': int(node.get('size') or 0),
+            'type': node.get('type'),
+            'mounted': _mounted(node),
+        }
+        for child in node.get('children') or []:
+            walk(child)
+
+    for device in (data or {}).get('blockdevices') or []:
+        walk(device)
+    return inventory
+
+
+def _open_for_zeroing(path, direct):
+    if direct and hasattr(os, 'O_DIRECT'):
+        try:
+            return os.open(path, os.O_WRONLY | os.O_DIRECT), True
+        except OSError:
+            pass
+    return os.open(path, os.O_WRONLY), False
+
+
+def zero_range(path, offset, length, chunk=MIB):
+    """path 의 [offset, offset+length) 구간을 0으로 채움 (가능하면 O_DIRECT)"""
+    fd, direct = _open_for_zeroing(path, True)
+    # O_DIRECT 는 페이지 정렬 버퍼가 필요하므로 익명 mmap 사용
+    buf = mmap.mmap(-1, chunk)
+    try:
+        end = offset + length
+        while offset < end:
+            size = min(chunk, end - offset)
+            try:
+                os.pwrite(fd, memoryview(buf)[:size], offset)
+            except OSError:
+                # 정렬되지 않은 길이 등으로 O_DIRECT 쓰기가 거부되면 일반 쓰기로 계속 진행
+                if not direct:
+                    raise
+                os.close(fd)
+                fd, direct = _open_for_zeroing(path, False)
+                continue
+            offset += size
+        os.fsync(fd)
+    finally:
+        buf.close()
+        os.close(fd)
+
+
+class DiskWiper:
+    """장치 조회, 건너뛸 장치 판정, 병렬 초기화 및 검증"""
+
+    def __init__(self, run_command, wipefs='wipefs', ceph_volume=None, sgdisk=None, zero_mb=10, workers=8):
+        self.run_command = run_command
+        self.wipefs = wipefs
+        self.ceph_volume = ceph_volume
+        self.sgdisk = sgdisk
+        self.zero_bytes = zero_mb * MIB
+        self.workers = workers
+
+    def plan(self, devices, inventory):
+        """(초기화 대상 [(요청 경로, 실제 경로, 크기)], {요청 경로: 건너뛴 이유})"""
+        targets, skipped = [], {}
+        for device in devices:
+            real = os.path.realpath(device)
+            info = inventory.get(real) or inventory.get(device)
+            if info is None:
+                skipped[device] = 'absent'
+            elif info['mounted']:
+                skipped[device] = 'mounted'
+            elif any(real == t[1] for t in targets):
+                continue
+            else:
+                targets.append((device, real, info['size']))
+        return targets, skipped
+
+    def _step(self, steps, name, func):
+        start = time.perf_counter()
+        rc = func()
+        steps.append({'step': name, 'rc': rc, 'duration': round(time.perf_counter() - start, 3)})
+        return rc
+
+    def _run(self, args):
+        rc, _, _ = self.run_command(args, check_rc=False)
+        return rc
+
+    def _zero(self, path, size):
+        head = min(self.zero_bytes, size)
+        zero_range(path, 0, head)
+        # 뒤쪽 영역은 4KiB 경계에 맞춰 시작 (O_DIRECT 정렬 요건)
+        tail = max(head, (size - self.zero_bytes) // 4096 * 4096)
+        if tail < size:
+            zero_range(path, tail, size - tail)
+        return 0
+
+    def signatures(self, path):
+        """wipefs(no-act) 로 남아 있는 시그니처 종류 목록"""
+        rc, out, err = self.run_command([self.wipefs, '--no-act', '--json', path], check_rc=False)
+        if rc != 0:
+            raise RuntimeError(f"wipefs failed on {path}: {err.strip()}")
+        data = json.loads(out) if out.strip() else {}
+        return [s.get('type') for s in data.get('signatures') or []]
+
+    def wipe(self, target):
+        device, path, size = target
+        steps = []
+        start = time.perf_counter()
+        if self.ceph_volume:
+            self._step(steps, 'ceph-volume', lambda: self._run([self.ceph_volume, 'lvm', 'zap', '--destroy', path]))
+        self._step(steps, 'wipefs', lambda: self._run([self.wipefs, '--all', path]))
+        self._step(steps, 'zero', lambda: self._zero(path, size))
+        if self.sgdisk:
+            self._step(steps, 'sgdisk', lambda: self._run([self.sgdisk, '--zap-all', path]))
+        signatures = self.signatures(path)
+        return {
+            'device': device,
+            'path': path,
+            'status': 'wiped',
+            'size': size,
+            'duration': round(time.perf_counter() - start, 3),
+            'clean': not signatures,
+            'signatures': signatures,
+            'steps': steps,
+        }
+
+    def apply(self, devices, inventory, check_mode=False):
+        targets, skipped = self.plan(devices, inventory)
+        by_device = {d: {'device': d, 'status': 'skipped', 'reason': r} for d, r in skipped.items()}
+        result = {'wiped': [], 'excluded': skipped, 'errors': {}}
+
+        outcomes = [(t, {'device': t[0], 'path': t[1], 'status': 'planned', 'size': t[2]}, None)
+                    for t in targets] if check_mode else run_parallel(self.wipe, targets, self.workers)
+        for target, outcome, error in outcomes:
+            device = target[0]
+            if error is not None:
+                by_device[device] = {'device': device, 'path': target[1], 'status': 'failed', 'error': str(error)}
+                result['errors'][device] = str(error)
+                continue
+            by_device[device] = outcome
+            if check_mode:
+                continue
+            if outcome['clean']:
+                result['wiped'].append(device)
+            else:
+                result['errors'][device] = f"signatures remain after wipe: {', '.join(outcome['signatures'])}"
+
+        result['devices'] = [by_device[d] for d in dict.fromkeys(devices) if d in by_device]
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            devices=dict(type='list', elements='path', required=True),
+            workers=dict(type='int', default=8),
+            zero_mb=dict(type='int', default=10),
+            ceph_volume=dict(type='bool', default=True),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    lsblk = module.get_bin_path('lsblk', required=True)
+    rc, out, err = module.run_command([lsblk] + LSBLK_ARGS)
+    if rc != 0:
+        module.fail_json(msg=f"lsblk failed: {err.strip()}", rc=rc)
+    inventory = parse_lsblk(json.loads(out))
+
+    wiper = DiskWiper(
+        module.run_command,
+        wipefs=module.get_bin_path('wipefs', required=True),
+        ceph_volume=module.get_bin_path('ceph-volume') if params['ceph_volume'] else None,
+        sgdisk=module.get_bin_path('sgdisk'),
+        zero_mb=params['zero_mb'],
+        workers=params['workers'],
+    )
+    result = wiper.apply(params['devices'], inventory, check_mode=module.check_mode)
+    result['changed'] = bool(result['wiped']) or (module.check_mode and any(
+        d['status'] == 'planned' for d in result['devices']))
+
+    if result['errors']:
+        module.fail_json(msg=f"Failed to wipe {len(result['errors'])} device(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Ceph 클러스터 헬스 스냅샷 모듈
+
+`ceph status`, `ceph health detail`, `ceph osd stat`, `ceph mon stat` 를 각각 실행하고
+텍스트를 정규식으로 해석하던 방식을 대체합니다. `ceph status --format json` 한 번
+(또는 librados mon_command)으로 헬스 체크, OSD, MON 쿼럼, PG 상태를 모두 가져와
+`ceph_health_snapshot` 팩트로 등록하므로 다른 검증 플레이북에서 다시 조회하지 않고 재사용합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_health_snapshot
+short_description: Collect a structured Ceph health snapshot with one status query
+description:
+  - Runs C(ceph status --format json) once, or the equivalent C(status) mon command
+    through librados when python3-rados is available.
+  - Returns health checks, OSD up/in counts, MON quorum, PG states, MGR availability and
+    usage as one typed dictionary.
+  - Sets the C(ceph_health_snapshot) fact so later plays on the same host can reuse it
+    instead of querying the cluster again.
+options:
+  method:
+    description:
+      - How to query the cluster.
+      - C(auto) uses librados when it is importable and falls back to the CLI.
+    type: str
+    choices: [auto, cli, librados]
+    default: auto
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+  conffile:
+    description: Ceph configuration file used by librados.
+    type: path
+    default: /etc/ceph/ceph.conf
+  client:
+    description: Client name used by librados.
+    type: str
+    default: client.admin
+  timeout:
+    description: Connection and command timeout in seconds for librados.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: Check cluster status
+  ceph_health_snapshot:
+  register: ceph_status
+
+- name: Validate all OSDs are up
+  assert:
+    that:
+      - ceph_health_snapshot.osd.all_up
+      - ceph_health_snapshot.osd.all_in
+'''
+
+RETURN = r'''
+snapshot:
+  description: Structured cluster health, also set as the C(ceph_health_snapshot) fact.
+  returned: always
+  type: dict
+  sample:
+    fsid: 0f1e2d3c-...
+    status: HEALTH_WARN
+    healthy: false
+    checks:
+      POOL_NO_REDUNDANCY:
+        severity: HEALTH_WARN
+        message: 1 pool(s) have no replicas configured
+        count: 1
+        muted: false
+    osd: {total: 3, up: 3, in: 3, down: 0, out: 0, all_up: true, all_in: true, remapped_pgs: 0}
+    mon: {total: 3, quorum: [mon1, mon2, mon3], quorum_size: 3, out_of_quorum: 0, has_quorum: true}
+    pg: {total: 33, states: {active+clean: 33}, active_clean: 33, all_active_clean: true, inactive: 0}
+    mgr: {available: true, standbys: 1}
+    usage: {pools: 2, objects: 10, data_bytes: 1024, bytes_used: 3072, bytes_avail: 1000000, bytes_total: 1003072}
+method:
+  description: Query method actually used (C(cli) or C(librados)).
+  returned: always
+  type: str
+'''
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError
+from ansible.module_utils.ceph_health import HAS_RADOS, RADOS_IMPORT_ERROR, parse_status, rados_status
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            method=dict(type='str', default='auto', choices=['auto', 'cli', 'librados']),
+            ceph=dict(type='str', default='ceph'),
+            conffile=dict(type='path', default='/etc/ceph/ceph.conf'),
+            client=dict(type='str', default='client.admin'),
+            timeout=dict(type='int', default=10),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    method = params['method']
+    if method == 'librados' and not HAS_RADOS:
+        module.fail_json(msg=missing_required_lib('python3-rados'), exception=RADOS_IMPORT_ERROR)
+
+    status = None
+    if method == 'librados' or (method == 'auto' and HAS_RADOS):
+        try:
+            status = rados_status(params['conffile'], params['client'], params['timeout'])
+            method = 'librados'
+        except Exception as e:
+            if method == 'librados':
+                module.fail_json(msg=f"librados status query failed: {e}")
+            module.warn(f"librados status query failed, falling back to the ceph CLI: {e}")
+
+    if status is None:
+        try:
+            status = CephCLI(module.run_command, params['ceph']).run_json(['status'])
+        except CephCommandError as e:
+            module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+        method = 'cli'
+
+    snapshot = parse_status(status or {})
+    module.exit_json(changed=False, snapshot=snapshot, method=method,
+                     ansible_facts={'ceph_health_snapshot': snapshot})
+
+
+if __name__ == '__main__':
+    main()
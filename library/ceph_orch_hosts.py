@@ -0,0 +1,276 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+cephadm 호스트 일괄 등록 모듈
+
+호스트마다 `ceph orch host add`, 라벨마다 `ceph orch host label add` 를 순서대로
+실행한 뒤 호스트 수만 세며 기다리던 방식을 대체합니다. `ceph orch host ls` 한 번으로
+인벤토리와 비교해 없는 호스트만 추가하고 빠진 라벨만 붙이며, 이 명령들은 제한된
+워커 풀로 동시에 실행합니다. 이후 하나의 적응형 폴링으로 모든 호스트가 online 이
+될 때까지 기다리고 호스트별 소요 시간을 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_orch_hosts
+short_description: Add and label cephadm hosts concurrently and wait until they are online
+description:
+  - Lists orchestrator hosts once with C(ceph orch host ls --format json) and compares them with I(hosts).
+  - Adds missing hosts (with their labels) and adds missing labels to existing hosts concurrently,
+    with at most I(workers) C(ceph orch) commands in flight.
+  - Then polls C(ceph orch host ls) with adaptive backoff until every requested host is listed
+    without an C(Offline) or C(Maintenance) status, and reports per-host timings.
+  - Labels that are present on a host but not requested are left alone.
+options:
+  hosts:
+    description:
+      - Hosts to onboard. Each entry needs C(name) and C(ip) (or C(addr)); C(labels) is optional.
+    type: list
+    elements: dict
+    required: true
+  workers:
+    description: Maximum number of concurrent C(ceph orch host) commands.
+    type: int
+    default: 8
+  wait:
+    description: Wait until every requested host is online.
+    type: bool
+    default: true
+  timeout:
+    description: Maximum time to wait for the hosts in seconds.
+    type: int
+    default: 300
+  min_interval:
+    description: First and smallest poll interval in seconds.
+    type: float
+    default: 0.5
+  max_interval:
+    description: Largest poll interval in seconds.
+    type: float
+    default: 10
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+'''
+
+EXAMPLES = r'''
+- name: Add hosts to Ceph cluster
+  ceph_orch_hosts:
+    hosts: "{{ cluster_hosts }}"
+    timeout: 300
+  register: host_onboarding
+'''
+
+RETURN = r'''
+hosts:
+  description: Per-host result in the order requested.
+  returned: always
+  type: list
+  sample:
+    - name: ceph2
+      addr: 10.10.2.92
+      action: added
+      labels_added: [_admin]
+      status: online
+      add_duration: 3.12
+      label_duration: null
+      online_after: 4.8
+added:
+  description: Hosts added by this run.
+  returned: always
+  type: list
+labeled:
+  description: Labels added to hosts that already existed, keyed by host.
+  returned: always
+  type: dict
+offline:
+  description: Requested hosts that were not online when the module returned.
+  returned: always
+  type: list
+errors:
+  description: Error message per host whose add or label command failed.
+  returned: always
+  type: dict
+elapsed:
+  description: Seconds spent in the module.
+  returned: always
+  type: float
+polls:
+  description: Number of C(ceph orch host ls) calls made while waiting.
+  returned: always
+  type: int
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, poll_until, run_parallel
+
+OFFLINE_STATUSES = ('offline', 'maintenance')
+
+
+def host_index(listing):
+    """`ceph orch host ls` JSON -> {hostname: {'addr', 'labels', 'online'}}"""
+    return {
+        h['hostname']: {
+            'addr': h.get('addr'),
+            'labels': list(h.get('labels') or []),
+            'online': (h.get('status') or '').lower() not in OFFLINE_STATUSES,
+        }
+        for h in listing or []
+    }
+
+
+def desired_hosts(hosts):
+    """hosts 옵션 -> [(name, addr, labels)] (같은 이름은 마지막 정의 사용)"""
+    desired = {}
+    for host in hosts:
+        name = host.get('name') or host.get('hostname')
+        addr = host.get('ip') or host.get('addr')
+        if not name:
+            raise ValueError("host definition needs 'name'")
+        desired[name] = (addr, list(dict.fromkeys(host.get('labels') or [])))
+    return [(name, addr, labels) for name, (addr, labels) in desired.items()]
+
+
+class HostOnboarder:
+    """호스트 목록 1회 조회 후 누락 호스트/라벨만 병렬로 추가하고 online 대기"""
+
+    def __init__(self, cli, workers=8, clock=time.monotonic, sleep=time.sleep):
+        self.cli = cli
+        self.workers = workers
+        self.clock = clock
+        self.sleep = sleep
+
+    def list_hosts(self):
+        return host_index(self.cli.run_json(['orch', 'host', 'ls']))
+
+    def plan(self, hosts, current):
+        """{name: 결과 항목} 과 실행할 작업 [(name, action, addr, labels)]"""
+        entries, jobs = {}, []
+        for name, addr, labels in desired_hosts(hosts):
+            entry = {'name': name, 'addr': addr, 'action': 'unchanged', 'labels_added': [],
+                     'status': 'pending', 'add_duration': None, 'label_duration': None, 'online_after': None}
+            existing = current.get(name)
+            if existing is None:
+                if not addr:
+                    raise ValueError(f"host {name} is not in the cluster and has no 'ip'")
+                entry.update(action='added', labels_added=labels)
+                jobs.append((name, 'add', addr, labels))
+            else:
+                entry['addr'] = existing['addr']
+                missing = [label for label in labels if label not in existing['labels']]
+                if missing:
+                    entry.update(action='labeled', labels_added=missing)
+                    jobs.append((name, 'label', None, missing))
+            entries[name] = entry
+        return entries, jobs
+
+    def _run_job(self, job):
+        name, action, addr, labels = job
+        start = self.clock()
+        if action == 'add':
+            # 라벨은 host add 인자로 함께 전달해 명령 하나로 처리
+            self.cli.run(['orch', 'host', 'add', name, addr] + labels)
+        else:
+            for label in labels:
+                self.cli.run(['orch', 'host', 'label', 'add', name, label])
+        return self.clock() - start
+
+    def wait_online(self, names, start, timeout, min_interval=0.5, max_interval=10.0):
+        """모든 호스트가 online 이 될 때까지 폴링. ({name: online_after}, polls) 반환"""
+        online_at = {}
+
+        def probe():
+            try:
+                current = self.list_hosts()
+            except CephCommandError:
+                return False, sorted(online_at)
+            for name in names:
+                if name not in online_at and current.get(name, {}).get('online'):
+                    online_at[name] = round(self.clock() - start, 3)
+            return len(online_at) == len(names), sorted(online_at)
+
+        _, _, polls, _, _ = poll_until(probe, timeout, min_interval, max_interval,
+                                       clock=self.clock, sleep=self.sleep)
+        return online_at, polls
+
+    def apply(self, hosts, check_mode=False, wait=True, timeout=300, min_interval=0.5, max_interval=10.0):
+        start = self.clock()
+        current = self.list_hosts()
+        entries, jobs = self.plan(hosts, current)
+        result = {'added': [], 'labeled': {}, 'offline': [], 'errors': {}, 'polls': 0}
+
+        if check_mode:
+            for entry in entries.values():
+                entry['status'] = 'planned' if entry['action'] != 'unchanged' else \
+                    ('online' if current[entry['name']]['online'] else 'offline')
+        else:
+            for (name, action, _, labels), duration, error in run_parallel(self._run_job, jobs, self.workers):
+                entry = entries[name]
+                if error is not None:
+                    result['errors'][name] = error.stderr.strip() if isinstance(error, CephCommandError) \
+                        else str(error)
+                    entry['status'] = 'failed'
+                    continue
+                entry['add_duration' if action == 'add' else 'label_duration'] = round(duration, 3)
+                if action == 'add':
+                    result['added'].append(name)
+                else:
+                    result['labeled'][name] = labels
+
+            names = [n for n, e in entries.items() if e['status'] != 'failed']
+            if wait and names:
+                online_at, result['polls'] = self.wait_online(names, start, timeout, min_interval, max_interval)
+            else:
+                online_at = {n: None for n in names if current.get(n, {}).get('online')}
+            for name in names:
+                entry = entries[name]
+                entry['status'] = 'online' if name in online_at else 'offline'
+                entry['online_after'] = online_at.get(name)
+                if name not in online_at:
+                    result['offline'].append(name)
+
+        result['hosts'] = list(entries.values())
+        result['elapsed'] = round(self.clock() - start, 3)
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            hosts=dict(type='list', elements='dict', required=True),
+            workers=dict(type='int', default=8),
+            wait=dict(type='bool', default=True),
+            timeout=dict(type='int', default=300),
+            min_interval=dict(type='float', default=0.5),
+            max_interval=dict(type='float', default=10.0),
+            ceph=dict(type='str', default='ceph'),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    onboarder = HostOnboarder(CephCLI(module.run_command, params['ceph']), params['workers'])
+    try:
+        result = onboarder.apply(params['hosts'], check_mode=module.check_mode, wait=params['wait'],
+                                 timeout=params['timeout'], min_interval=params['min_interval'],
+                                 max_interval=params['max_interval'])
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except ValueError as e:
+        module.fail_json(msg=str(e))
+
+    result['changed'] = bool(result['added'] or result['labeled']) or (module.check_mode and any(
+        h['status'] == 'planned' for h in result['hosts']))
+    if result['errors']:
+        module.fail_json(msg=f"Failed to onboard {len(result['errors'])} host(s)", **result)
+    if params['wait'] and result['offline']:
+        module.fail_json(msg=f"Timed out waiting for hosts to come online: {', '.join(result['offline'])}",
+                         **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
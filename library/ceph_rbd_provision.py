@@ -0,0 +1,315 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RBD 풀/이미지 일괄 프로비저닝 모듈
+
+`ceph osd pool create`, `rbd pool init`, 이미지마다 `rbd create` 를 존재 여부와 상관없이
+실행하던 방식을 대체합니다. `ceph osd pool ls detail` 1회와 풀별 이미지 목록 1회로
+현재 상태를 조회해 없는 풀과 이미지만 만들고, 다른 풀 옵션(복제 수, PG 자동 조정
+힌트)만 변경하며, 이미지는 병렬로 생성합니다. 변경 내용은 JSON diff 로 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rbd_provision
+short_description: Idempotently provision RBD pools and images in bulk
+description:
+  - Reads C(ceph osd pool ls detail --format json) once and lists the images of every existing pool once.
+  - Creates missing pools, sets only the pool options that differ, initializes pools that do not have the
+    C(rbd) application yet, and creates missing images concurrently.
+  - PG autoscale hints (C(pg_autoscale_mode), C(target_size_ratio), C(target_size_bytes), C(pg_num_min),
+    C(bulk)) can be given instead of a fixed C(pool_pg_num). The PG count of existing pools is never changed.
+  - Existing images are never resized; a size that differs from the definition is reported in the diff.
+  - Uses the C(rbd) Python bindings for images when they are installed and the C(rbd) CLI otherwise.
+options:
+  pools:
+    description:
+      - Desired pools, usually C(ceph.rbd) from C(ceph-vars.yml).
+      - Each entry needs C(pool_name) and may set C(pool_pg_num), C(size), C(min_size), C(pg_autoscale_mode),
+        C(target_size_ratio), C(target_size_bytes), C(pg_num_min), C(bulk) and C(images).
+      - Each image needs C(image_name) and C(size) and may set C(image_format), C(object_size) and
+        C(image_features).
+      - As with the rbd CLI, a C(size) without a unit is read as MiB and an C(object_size) without a unit as bytes.
+    type: list
+    elements: dict
+    required: true
+  workers:
+    description: Maximum number of images created concurrently.
+    type: int
+    default: 16
+  method:
+    description: Image access method. C(auto) uses librados when the bindings are importable.
+    type: str
+    default: auto
+    choices: [auto, cli, librados]
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+  rbd:
+    description: Path to the C(rbd) executable.
+    type: str
+    default: rbd
+  conffile:
+    description: Ceph configuration file used by librados.
+    type: path
+    default: /etc/ceph/ceph.conf
+  client:
+    description: Client name used by librados.
+    type: str
+    default: client.admin
+  timeout:
+    description: Connection timeout in seconds for librados.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: Provision RBD pools and images
+  ceph_rbd_provision:
+    pools:
+      - pool_name: rbd-oa
+        pg_autoscale_mode: "on"
+        target_size_ratio: 0.2
+        images:
+          - image_name: image1
+            size: 20G
+            image_features: [layering]
+  register: rbd_provision
+'''
+
+RETURN = r'''
+diff:
+  description: Changes made (or planned in check mode) and images whose size differs.
+  returned: always
+  type: dict
+  sample:
+    pools:
+      rbd-oa:
+        action: updated
+        changes: {target_size_ratio: {before: null, after: 0.2}}
+        initialized: false
+    images:
+      rbd-oa/image1: {action: created}
+      rbd-oa/image2: {action: size_differs, size: {before: 10737418240, after: 21474836480}}
+created_pools:
+  description: Pools created by this run.
+  returned: always
+  type: list
+updated_pools:
+  description: Existing pools whose options were changed.
+  returned: always
+  type: list
+created_images:
+  description: Images created by this run, as C(pool/image).
+  returned: always
+  type: list
+existing_images:
+  description: Number of defined images that already existed.
+  returned: always
+  type: int
+errors:
+  description: Error message per pool or image that failed.
+  returned: always
+  type: dict
+elapsed:
+  description: Seconds spent in the module.
+  returned: always
+  type: float
+method:
+  description: Image access method actually used (C(cli) or C(librados)).
+  returned: always
+  type: str
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, run_parallel
+from ansible.module_utils.ceph_rbd import HAS_RBD, RBD_IMPORT_ERROR, error_message, open_backend, scan_pools, size_bytes
+
+POOL_OPTIONS = ('size', 'min_size', 'pg_autoscale_mode', 'target_size_ratio', 'target_size_bytes',
+                'pg_num_min', 'bulk')
+
+
+def pool_state(detail):
+    """`ceph osd pool ls detail` 항목 -> POOL_OPTIONS 현재 값 + rbd 애플리케이션 여부"""
+    options = detail.get('options') or {}
+    return {
+        'size': detail.get('size'),
+        'min_size': detail.get('min_size'),
+        'pg_autoscale_mode': detail.get('pg_autoscale_mode'),
+        'target_size_ratio': options.get('target_size_ratio'),
+        'target_size_bytes': options.get('target_size_bytes'),
+        'pg_num_min': options.get('pg_num_min'),
+        'bulk': 'bulk' in (detail.get('flags_names') or '').split(','),
+        'rbd': 'rbd' in (detail.get('application_metadata') or {}),
+    }
+
+
+def _same(key, want, have):
+    if key == 'bulk':
+        return bool(want) == bool(have)
+    if key == 'target_size_ratio':
+        return have is not None and abs(float(want) - float(have)) < 1e-9
+    if key == 'pg_autoscale_mode':
+        # YAML 에서 따옴표 없는 on/off 는 bool 로 읽힘
+        want = {True: 'on', False: 'off'}.get(want, want)
+    return str(want) == str(have)
+
+
+def pool_changes(desired, current):
+    """원하는 풀 옵션과 현재 값의 차이 {key: {'before', 'after'}} (새 풀이면 지정한 옵션 전부)"""
+    changes = {}
+    for key in POOL_OPTIONS:
+        want = desired.get(key)
+        if want is None:
+            continue
+        have = current.get(key) if current else None
+        if current is None or not _same(key, want, have):
+            changes[key] = {'before': have, 'after': want}
+    return changes
+
+
+def set_value(key, value):
+    if key == 'bulk':
+        return 'true' if value else 'false'
+    if key == 'pg_autoscale_mode':
+        return {True: 'on', False: 'off'}.get(value, value)
+    return str(value)
+
+
+class RBDProvisioner:
+    """풀 상태 1회 조회 후 풀 생성/옵션 변경, 누락 이미지 병렬 생성"""
+
+    def __init__(self, cli, backend, workers=16, clock=time.monotonic):
+        self.cli = cli
+        self.backend = backend
+        self.workers = workers
+        self.clock = clock
+
+    def provision_pool(self, desired, current, changes):
+        name = desired['pool_name']
+        if current is None:
+            args = ['osd', 'pool', 'create', name]
+            if desired.get('pool_pg_num'):
+                args += [str(desired['pool_pg_num'])] * 2
+            self.cli.run(args)
+        for key, change in changes.items():
+            self.cli.run(['osd', 'pool', 'set', name, key, set_value(key, change['after'])])
+        if current is None or not current['rbd']:
+            # rbd pool init 은 rbd 애플리케이션 활성화까지 함께 수행
+            self.backend.init_pool(name)
+
+    def apply(self, pools, check_mode=False):
+        start = self.clock()
+        details = {p['pool_name']: pool_state(p) for p in self.cli.run_json(['osd', 'pool', 'ls', 'detail']) or []}
+        result = {'diff': {'pools': {}, 'images': {}}, 'created_pools': [], 'updated_pools': [],
+                  'created_images': [], 'existing_images': 0, 'errors': {}}
+
+        ready = []
+        for desired in pools:
+            name = desired['pool_name']
+            current = details.get(name)
+            changes = pool_changes(desired, current)
+            init = current is None or not current['rbd']
+            if current is None or changes or init:
+                action = 'created' if current is None else 'updated'
+                result['diff']['pools'][name] = {'action': action, 'changes': changes, 'initialized': init}
+                if not check_mode:
+                    try:
+                        self.provision_pool(desired, current, changes)
+                    except Exception as e:
+                        result['errors'][name] = error_message(e)
+                        result['diff']['pools'][name]['action'] = 'failed'
+                        continue
+                result['created_pools' if current is None else 'updated_pools'].append(name)
+            ready.append((desired, current is not None))
+
+        # 새로 만든 풀은 비어 있으므로 기존 풀만 이미지 목록 조회
+        listed, list_errors = scan_pools(self.backend, [d['pool_name'] for d, exists in ready
+                                                        if exists and d.get('images')], workers=self.workers)
+        result['errors'].update(list_errors)
+        existing = {(pool, i['name']): i for pool, images in listed.items() for i in images}
+
+        jobs = []
+        for desired, _ in ready:
+            pool = desired['pool_name']
+            if pool in list_errors:
+                continue
+            for image in desired.get('images') or []:
+                spec = f"{pool}/{image['image_name']}"
+                have = existing.get((pool, image['image_name']))
+                if have is None:
+                    jobs.append((pool, image))
+                    result['diff']['images'][spec] = {'action': 'created'}
+                    continue
+                result['existing_images'] += 1
+                want = size_bytes(image['size'])
+                if have.get('size') is not None and have['size'] != want:
+                    result['diff']['images'][spec] = {'action': 'size_differs',
+                                                      'size': {'before': have['size'], 'after': want}}
+
+        if check_mode:
+            outcomes = [(job, None, None) for job in jobs]
+        else:
+            outcomes = run_parallel(lambda job: self.backend.create_image(*job), jobs, self.workers)
+        for (pool, image), _, error in outcomes:
+            spec = f"{pool}/{image['image_name']}"
+            if error is not None:
+                result['errors'][spec] = error_message(error)
+                result['diff']['images'][spec] = {'action': 'failed'}
+            else:
+                result['created_images'].append(spec)
+
+        result['elapsed'] = round(self.clock() - start, 3)
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            pools=dict(type='list', elements='dict', required=True),
+            workers=dict(type='int', default=16),
+            method=dict(type='str', default='auto', choices=['auto', 'cli', 'librados']),
+            ceph=dict(type='str', default='ceph'),
+            rbd=dict(type='str', default='rbd'),
+            conffile=dict(type='path', default='/etc/ceph/ceph.conf'),
+            client=dict(type='str', default='client.admin'),
+            timeout=dict(type='int', default=10),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    if params['method'] == 'librados' and not HAS_RBD:
+        module.fail_json(msg=missing_required_lib('python3-rbd and python3-rados'), exception=RBD_IMPORT_ERROR)
+    if any(not p.get('pool_name') for p in params['pools']):
+        module.fail_json(msg="every pool needs 'pool_name'")
+
+    try:
+        backend = open_backend(module.run_command, params['method'], params['ceph'], params['rbd'],
+                               params['conffile'], params['client'], params['timeout'], warn=module.warn)
+    except RuntimeError as e:
+        module.fail_json(msg=str(e))
+
+    cli = CephCLI(module.run_command, params['ceph'])
+    provisioner = RBDProvisioner(cli, backend, params['workers'])
+    try:
+        result = provisioner.apply(params['pools'], check_mode=module.check_mode)
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except ValueError as e:
+        module.fail_json(msg=str(e))
+    finally:
+        backend.close()
+
+    result['method'] = backend.method
+    result['changed'] = bool(result['created_pools'] or result['updated_pools'] or result['created_images'])
+    if result['errors']:
+        module.fail_json(msg=f"Failed to provision {len(result['errors'])} RBD pool(s) or image(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
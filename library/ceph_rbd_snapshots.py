@@ -0,0 +1,374 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RBD 스냅샷 일괄 생성/보존 정책 모듈
+
+`-e rbd_image=... snapshot_name=...` 로 이미지 하나에만 스냅샷을 만들거나 지우던
+방식을 대체합니다. 풀, 이미지 이름 glob, 이미지 메타데이터(라벨) 선택자로 대상을
+고르고, 풀별 인벤토리 1회 조회 후 이미지마다 스냅샷 생성과 보존 정책(개수/기간)에
+따른 삭제를 한 작업으로 묶어 병렬 실행합니다. 이미지별 소요 시간과 실패를 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rbd_snapshots
+short_description: Create and expire RBD snapshots across many images in parallel
+description:
+  - Selects images by pool, image name glob and image metadata (labels), or by explicit C(pool/image) specs.
+  - Lists every selected pool once, then creates one snapshot per image and removes snapshots expired by
+    the retention policy, running one job per image on a bounded worker pool.
+  - All snapshots of a run share one name, C(<prefix>-<UTC timestamp>) unless I(snapshot_name) is given.
+    Retention only applies to snapshots named C(<prefix>-<UTC timestamp>), so snapshots taken by
+    other tools are never expired. Protected snapshots are never removed.
+  - Uses the C(rbd)/C(rados) Python bindings when they are installed and the C(rbd) CLI otherwise.
+options:
+  selectors:
+    description:
+      - Image selectors. Each entry needs C(pool) and may set C(image), a glob on the image name
+        (default C(*)), and C(labels), a dict that must be a subset of the image metadata.
+    type: list
+    elements: dict
+    default: []
+  images:
+    description: Explicit images as C(pool/image), selected in addition to I(selectors).
+    type: list
+    elements: str
+    default: []
+  create:
+    description: Create a snapshot on every selected image.
+    type: bool
+    default: true
+  snapshot_name:
+    description: Name of the snapshot to create. Defaults to C(<prefix>-<UTC timestamp>).
+    type: str
+  prefix:
+    description: Prefix of scheduled snapshot names, used for naming and to find snapshots under retention.
+    type: str
+    default: auto
+  remove:
+    description: Snapshot names to remove from every selected image where they exist.
+    type: list
+    elements: str
+    default: []
+  retention:
+    description:
+      - Retention of scheduled snapshots. C(count) keeps the newest N, C(max_age) removes those older
+        than the given age (seconds, or a number with an C(s), C(m), C(h), C(d) or C(w) suffix).
+    type: dict
+  workers:
+    description: Maximum number of images processed concurrently.
+    type: int
+    default: 16
+  method:
+    description: Access method. C(auto) uses librados when the bindings are importable.
+    type: str
+    default: auto
+    choices: [auto, cli, librados]
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+  rbd:
+    description: Path to the C(rbd) executable.
+    type: str
+    default: rbd
+  conffile:
+    description: Ceph configuration file used by librados.
+    type: path
+    default: /etc/ceph/ceph.conf
+  client:
+    description: Client name used by librados.
+    type: str
+    default: client.admin
+  timeout:
+    description: Connection timeout in seconds for librados.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: Create hourly snapshots with retention
+  ceph_rbd_snapshots:
+    selectors:
+      - pool: rbd-oa
+        image: "vm-*"
+        labels: {backup: hourly}
+    prefix: hourly
+    retention:
+      count: 24
+      max_age: 2d
+  run_once: true
+
+- name: Remove a snapshot from a specific RBD image
+  ceph_rbd_snapshots:
+    images: [rbd-oa/vm-disk-1]
+    create: false
+    remove: [before-upgrade]
+'''
+
+RETURN = r'''
+snapshot:
+  description: Name of the snapshot created by this run.
+  returned: when I(create) is true
+  type: str
+  sample: auto-20261018T090000Z
+images:
+  description: Per-image result in inventory order.
+  returned: always
+  type: list
+  sample:
+    - spec: rbd-oa/vm-disk-1
+      status: ok
+      created: true
+      removed: [auto-20261017T090000Z]
+      protected: []
+      duration: 0.41
+      create_duration: 0.22
+      remove_duration: 0.19
+created:
+  description: Images a snapshot was created on.
+  returned: always
+  type: list
+removed:
+  description: Removed snapshot names keyed by image.
+  returned: always
+  type: dict
+errors:
+  description: Error message per image (or pool) that failed.
+  returned: always
+  type: dict
+matched:
+  description: Number of selected images.
+  returned: always
+  type: int
+elapsed:
+  description: Seconds spent in the module.
+  returned: always
+  type: float
+method:
+  description: Access method actually used (C(cli) or C(librados)).
+  returned: always
+  type: str
+'''
+
+import calendar
+import fnmatch
+import re
+import time
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.ceph_cli import CephCommandError, run_parallel
+from ansible.module_utils.ceph_rbd import HAS_RBD, RBD_IMPORT_ERROR, error_message, open_backend, scan_pools
+
+STAMP_FORMAT = '%Y%m%dT%H%M%SZ'
+AGE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_age(value):
+    """'36h' / '7d' / 3600 -> 초"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    match = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$', str(value).lower())
+    if not match:
+        raise ValueError(f"invalid age: {value}")
+    return float(match.group(1)) * AGE_UNITS[match.group(2) or 's']
+
+
+def snapshot_time(name, prefix):
+    """'<prefix>-YYYYmmddTHHMMSSZ' 이름 -> epoch 초 (예약 스냅샷이 아니면 None)"""
+    if not name.startswith(f"{prefix}-"):
+        return None
+    try:
+        return calendar.timegm(time.strptime(name[len(prefix) + 1:], STAMP_FORMAT))
+    except ValueError:
+        return None
+
+
+def expired(snapshots, prefix, now, count=None, max_age=None):
+    """보존 정책으로 삭제할 예약 스냅샷 이름 목록 (오래된 순). snapshots: [{'name', 'protected'}]"""
+    stamped = [(snapshot_time(s['name'], prefix), s) for s in snapshots]
+    managed = sorted((t for t in stamped if t[0] is not None), key=lambda t: t[0], reverse=True)
+    victims = []
+    for index, (stamp, snap) in enumerate(managed):
+        if (count is not None and index >= count) or (max_age is not None and now - stamp > max_age):
+            victims.append(snap)
+    return [s['name'] for s in reversed(victims)]
+
+
+class SnapshotScheduler:
+    """선택자로 이미지를 고른 뒤 이미지별 생성+보존 정리 작업을 병렬 실행"""
+
+    def __init__(self, backend, workers=16, clock=time.monotonic):
+        self.backend = backend
+        self.workers = workers
+        self.clock = clock
+
+    def select(self, selectors, images, errors):
+        """선택된 이미지 [(pool, 이미지 dict)] (라벨 선택자는 메타데이터를 병렬 조회)"""
+        specs = {}
+        for spec in images:
+            pool, _, name = spec.partition('/')
+            specs.setdefault(pool, set()).add(name)
+        pools = list(dict.fromkeys([s['pool'] for s in selectors] + list(specs)))
+        listed, pool_errors = scan_pools(self.backend, pools, workers=self.workers)
+        errors.update(pool_errors)
+        for pool, names in specs.items():
+            if pool in listed:
+                missing = names - {image['name'] for image in listed[pool]}
+                errors.update({f"{pool}/{name}": 'image not found' for name in sorted(missing)})
+
+        selected, need_labels = {}, []
+        for pool, found in listed.items():
+            for image in found:
+                key = (pool, image['name'])
+                if image['name'] in specs.get(pool, ()):
+                    selected[key] = image
+                    continue
+                matching = [s for s in selectors
+                            if s['pool'] == pool and fnmatch.fnmatchcase(image['name'], s.get('image') or '*')]
+                if any(not s.get('labels') for s in matching):
+                    selected[key] = image
+                elif matching:
+                    need_labels.append((key, image, [s['labels'] for s in matching]))
+
+        fetched = run_parallel(lambda c: self.backend.metadata(*c[0]), need_labels, self.workers)
+        for (key, image, wanted), meta, error in fetched:
+            if error is not None:
+                errors['/'.join(key)] = error_message(error)
+            elif any(all(str(meta.get(k)) == str(v) for k, v in labels.items()) for labels in wanted):
+                selected[key] = image
+        # 인벤토리 순서 유지
+        return [(pool, image) for pool, found in listed.items() for image in found
+                if (pool, image['name']) in selected]
+
+    def plan(self, pool, image, snapshot, remove, prefix, retention, now):
+        existing = image['snapshots']
+        names = {s['name'] for s in existing}
+        create = snapshot is not None and snapshot not in names
+        candidates = existing + ([{'name': snapshot, 'protected': False}] if create else [])
+        victims = [n for n in remove if n in names]
+        if retention:
+            victims += [n for n in expired(candidates, prefix, now, retention.get('count'),
+                                           parse_age(retention.get('max_age'))) if n not in victims]
+        protected = {s['name'] for s in existing if s['protected']}
+        return {
+            'pool': pool,
+            'image': image['name'],
+            'spec': f"{pool}/{image['name']}",
+            'create': snapshot if create else None,
+            'remove': [n for n in victims if n not in protected and n != snapshot],
+            'protected': [n for n in victims if n in protected],
+        }
+
+    def _execute(self, job):
+        entry = {'spec': job['spec'], 'status': 'ok', 'created': False, 'removed': [],
+                 'protected': job['protected'], 'create_duration': None, 'remove_duration': None}
+        start = self.clock()
+        if job['create']:
+            self.backend.create_snap(job['pool'], job['image'], job['create'])
+            entry['created'] = True
+            entry['create_duration'] = round(self.clock() - start, 3)
+        if job['remove']:
+            removing = self.clock()
+            self.backend.remove_snaps(job['pool'], job['image'], job['remove'])
+            entry['removed'] = job['remove']
+            entry['remove_duration'] = round(self.clock() - removing, 3)
+        entry['duration'] = round(self.clock() - start, 3)
+        return entry
+
+    def run(self, selectors=(), images=(), create=True, snapshot_name=None, prefix='auto', remove=(),
+            retention=None, now=None, check_mode=False):
+        start = self.clock()
+        now = time.time() if now is None else now
+        snapshot = (snapshot_name or f"{prefix}-{time.strftime(STAMP_FORMAT, time.gmtime(now))}") if create else None
+        result = {'created': [], 'removed': {}, 'errors': {}, 'images': []}
+        if snapshot:
+            result['snapshot'] = snapshot
+
+        selected = self.select(list(selectors), list(images), result['errors'])
+        jobs = [self.plan(pool, image, snapshot, list(remove), prefix, retention, now) for pool, image in selected]
+        result['matched'] = len(jobs)
+
+        if check_mode:
+            outcomes = [(job, {'spec': job['spec'], 'status': 'planned', 'created': bool(job['create']),
+                               'removed': job['remove'], 'protected': job['protected']}, None) for job in jobs]
+        else:
+            outcomes = run_parallel(self._execute, [j for j in jobs if j['create'] or j['remove'] or j['protected']],
+                                    self.workers)
+            done = {job['spec'] for job, _, _ in outcomes}
+            outcomes += [(job, {'spec': job['spec'], 'status': 'unchanged', 'created': False, 'removed': [],
+                                'protected': []}, None) for job in jobs if job['spec'] not in done]
+
+        by_spec = {}
+        for job, entry, error in outcomes:
+            if error is not None:
+                result['errors'][job['spec']] = error_message(error)
+                entry = {'spec': job['spec'], 'status': 'failed', 'error': error_message(error)}
+            by_spec[job['spec']] = entry
+            if entry['status'] == 'ok':
+                if entry['created']:
+                    result['created'].append(job['spec'])
+                if entry['removed']:
+                    result['removed'][job['spec']] = entry['removed']
+        result['images'] = [by_spec[job['spec']] for job in jobs]
+        result['elapsed'] = round(self.clock() - start, 3)
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            selectors=dict(type='list', elements='dict', default=[]),
+            images=dict(type='list', elements='str', default=[]),
+            create=dict(type='bool', default=True),
+            snapshot_name=dict(type='str'),
+            prefix=dict(type='str', default='auto'),
+            remove=dict(type='list', elements='str', default=[]),
+            retention=dict(type='dict'),
+            workers=dict(type='int', default=16),
+            method=dict(type='str', default='auto', choices=['auto', 'cli', 'librados']),
+            ceph=dict(type='str', default='ceph'),
+            rbd=dict(type='str', default='rbd'),
+            conffile=dict(type='path', default='/etc/ceph/ceph.conf'),
+            client=dict(type='str', default='client.admin'),
+            timeout=dict(type='int', default=10),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    if params['method'] == 'librados' and not HAS_RBD:
+        module.fail_json(msg=missing_required_lib('python3-rbd and python3-rados'), exception=RBD_IMPORT_ERROR)
+    if not params['selectors'] and not params['images']:
+        module.fail_json(msg="one of selectors or images is required")
+    if any('pool' not in s for s in params['selectors']):
+        module.fail_json(msg="every selector needs 'pool'")
+
+    try:
+        backend = open_backend(module.run_command, params['method'], params['ceph'], params['rbd'],
+                               params['conffile'], params['client'], params['timeout'], warn=module.warn)
+    except RuntimeError as e:
+        module.fail_json(msg=str(e))
+
+    scheduler = SnapshotScheduler(backend, params['workers'])
+    try:
+        result = scheduler.run(params['selectors'], params['images'], params['create'], params['snapshot_name'],
+                               params['prefix'], params['remove'], params['retention'],
+                               check_mode=module.check_mode)
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except (RuntimeError, ValueError) as e:
+        module.fail_json(msg=str(e))
+    finally:
+        backend.close()
+
+    result['method'] = backend.method
+    result['changed'] = bool(result['created'] or result['removed']) or (module.check_mode and any(
+        i['created'] or i['removed'] for i in result['images']))
+    if result['errors']:
+        module.fail_json(msg=f"Snapshot run failed on {len(result['errors'])} image(s) or pool(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW 버킷 일괄 검증 모듈
+
+예상 버킷마다 `radosgw-admin bucket stats --bucket=X` 를 실행하고 출력에 'owner' 가
+있는지만 확인하던 검증(첫 번째 RGW 인스턴스만 대상)을 대체합니다. 존(zone)마다
+`radosgw-admin bucket stats` 를 버킷 지정 없이 한 번만 실행해 버킷 이름으로 색인하고,
+모든 RGW 인스턴스의 버킷에 대해 존재, 소유자, 쿼터, 오브젝트 수를 같은 색인으로
+검증합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_bucket_stats
+short_description: Validate the buckets of every RGW instance from one bucket stats call
+description:
+  - Runs C(radosgw-admin bucket stats) without C(--bucket) once per distinct realm/zonegroup/zone of the given
+    instances and indexes the output by bucket name, parsing the JSON array one bucket at a time.
+  - Validates every bucket of every user of every instance from that index, checking that the bucket exists,
+    is owned by the user, has the bucket quota from C(quota)/C(max_objects), and is not over that quota.
+  - Never changes anything.
+options:
+  instances:
+    description:
+      - RGW instances, usually C(ceph.rgw) from C(ceph-vars.yml).
+      - C(realm), C(zonegroup) and C(zone) select the zone to query; values of C(default) or unset add no
+        option. Each user in C(users) needs C(user_id) and C(buckets).
+    type: list
+    elements: dict
+    required: true
+  check_quota:
+    description: Compare the bucket quota with C(quota) and C(max_objects) of each bucket definition.
+    type: bool
+    default: true
+  radosgw_admin:
+    description: Path to the C(radosgw-admin) executable.
+    type: str
+    default: radosgw-admin
+'''
+
+EXAMPLES = r'''
+- name: Validate RGW buckets from one bucket stats call
+  ceph_rgw_bucket_stats:
+    instances: "{{ ceph.rgw }}"
+  register: rgw_bucket_check
+'''
+
+RETURN = r'''
+buckets:
+  description: Per-bucket validation keyed by bucket name.
+  returned: always
+  type: dict
+  sample:
+    admin-bucket1:
+      instance: rgw-oa
+      user_id: admin
+      exists: true
+      owner: admin
+      num_objects: 12
+      size: 40960
+      quota: {expected: {enabled: true, max_size: 85899345920, max_objects: -1},
+              actual: {enabled: true, max_size: 85899345920, max_objects: -1}}
+      problems: []
+      valid: true
+instances:
+  description: Per-instance counts keyed by C(service_name) (or the instance index).
+  returned: always
+  type: dict
+  sample: {rgw-oa: {buckets: 3, invalid: 0}}
+invalid:
+  description: Names of buckets that failed validation.
+  returned: always
+  type: list
+valid:
+  description: Whether every bucket passed validation.
+  returned: always
+  type: bool
+indexed:
+  description: Number of buckets found in the bucket stats output, over all queried zones.
+  returned: always
+  type: int
+commands:
+  description: Number of radosgw-admin invocations made by the module.
+  returned: always
+  type: int
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError
+from ansible.module_utils.rgw_buckets import bucket_index, desired_quota
+
+ZONE_OPTIONS = (('realm', '--rgw-realm'), ('zonegroup', '--rgw-zonegroup'), ('zone', '--rgw-zone'))
+
+
+def zone_args(instance):
+    """인스턴스 정의 -> radosgw-admin 존 선택 인자 (default 또는 미지정은 생략)"""
+    return tuple(f"{option}={instance[key]}" for key, option in ZONE_OPTIONS
+                 if instance.get(key) not in (None, '', 'default'))
+
+
+def quota_problems(expected, summary):
+    problems = []
+    actual = summary['bucket_quota']
+    if expected is not None and expected != actual:
+        diff = [k for k in ('enabled', 'max_size', 'max_objects') if expected[k] != actual[k]]
+        problems.append('quota mismatch: ' + ', '.join(f"{k} {actual[k]} != {expected[k]}" for k in diff))
+    if actual['enabled']:
+        if actual['max_objects'] >= 0 and summary['num_objects'] > actual['max_objects']:
+            problems.append(f"over object quota ({summary['num_objects']}/{actual['max_objects']})")
+        if actual['max_size'] >= 0 and summary['size'] > actual['max_size']:
+            problems.append(f"over size quota ({summary['size']}/{actual['max_size']})")
+    return problems
+
+
+class BucketStatsValidator:
+    """존별 bucket stats 1회 조회 후 모든 인스턴스의 버킷 검증"""
+
+    def __init__(self, cli, check_quota=True):
+        self.cli = cli
+        self.check_quota = check_quota
+
+    def index(self, args):
+        return bucket_index(self.cli.iter_json(['bucket', 'stats'] + list(args)))
+
+    def validate(self, instances):
+        indexes = {}
+        result = {'buckets': {}, 'instances': {}, 'invalid': []}
+        for position, instance in enumerate(instances):
+            name = instance.get('service_name') or str(position)
+            args = zone_args(instance)
+            if args not in indexes:
+                indexes[args] = self.index(args)
+            index = indexes[args]
+            counts = result['instances'].setdefault(name, {'buckets': 0, 'invalid': 0})
+
+            for user in instance.get('users') or []:
+                for bucket in user.get('buckets') or []:
+                    summary = index.get(bucket['name'])
+                    entry = {'instance': name, 'user_id': user['user_id'], 'exists': summary is not None}
+                    if summary is None:
+                        entry['problems'] = ['bucket not found']
+                    else:
+                        expected = desired_quota(bucket) if self.check_quota else None
+                        entry.update(owner=summary['owner'], num_objects=summary['num_objects'],
+                                     size=summary['size'],
+                                     quota={'expected': expected, 'actual': summary['bucket_quota']})
+                        entry['problems'] = []
+                        if summary['owner'] != user['user_id']:
+                            entry['problems'].append(f"owned by {summary['owner']}")
+                        entry['problems'].extend(quota_problems(expected, summary))
+                    entry['valid'] = not entry['problems']
+                    result['buckets'][bucket['name']] = entry
+                    counts['buckets'] += 1
+                    if not entry['valid']:
+                        counts['invalid'] += 1
+                        result['invalid'].append(bucket['name'])
+
+        result['valid'] = not result['invalid']
+        result['indexed'] = sum(len(index) for index in indexes.values())
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            instances=dict(type='list', elements='dict', required=True),
+            check_quota=dict(type='bool', default=True),
+            radosgw_admin=dict(type='str', default='radosgw-admin'),
+        ),
+        supports_check_mode=True,
+    )
+
+    cli = CephCLI(module.run_command, module.params['radosgw_admin'], json_args=())
+    try:
+        result = BucketStatsValidator(cli, module.params['check_quota']).validate(module.params['instances'])
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except (KeyError, ValueError) as e:
+        module.fail_json(msg=f"invalid bucket definition: {e}")
+
+    module.exit_json(changed=False, commands=cli.calls, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW 버킷 일괄 생성 모듈
+
+버킷마다 `radosgw-admin bucket create` 셸 태스크를 실행하던 방식을 대체합니다.
+`radosgw-admin bucket stats` 한 번으로 기존 버킷, 소유자, 쿼터를 모두 조회한 뒤
+누락된 버킷만 병렬로 생성하고 `quota` / `max_objects` 설정을 버킷 쿼터로 적용합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_buckets
+short_description: Batch-provision RGW buckets and enforce bucket quotas
+description:
+  - Reads every existing bucket with its owner and quota in one C(radosgw-admin bucket stats) call.
+  - Creates only the buckets missing from C(rgw_instance.users[*].buckets), running the
+    C(radosgw-admin) calls concurrently inside a single remote process.
+  - Applies the C(quota) and C(max_objects) bucket fields as RGW bucket quotas, only when
+    they differ from the current quota.
+options:
+  users:
+    description:
+      - RGW user definitions with their C(buckets), usually C(rgw_instance.users) from C(ceph-vars.yml).
+      - Each bucket needs C(name); C(quota) (for example C(10GB)) and C(max_objects) are optional.
+    type: list
+    elements: dict
+    required: true
+  radosgw_admin:
+    description: Path to the C(radosgw-admin) executable.
+    type: str
+    default: radosgw-admin
+  workers:
+    description: Maximum number of concurrent C(radosgw-admin) processes.
+    type: int
+    default: 8
+  enforce_quota:
+    description: Apply C(quota) and C(max_objects) of each bucket as its RGW bucket quota.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Provision RGW buckets
+  ceph_rgw_buckets:
+    users: "{{ rgw_instance.users }}"
+  register: rgw_buckets
+'''
+
+RETURN = r'''
+buckets:
+  description: Per-bucket result keyed by bucket name.
+  returned: always
+  type: dict
+  sample:
+    admin-bucket1:
+      bucket: admin-bucket1
+      owner: admin
+      created: true
+      quota: {enabled: true, max_size: 85899345920, max_objects: -1}
+      quota_updated: true
+created:
+  description: Buckets created by this run.
+  returned: always
+  type: list
+existing:
+  description: Requested buckets that already existed.
+  returned: always
+  type: list
+quota_updated:
+  description: Buckets whose quota was changed by this run.
+  returned: always
+  type: list
+conflicts:
+  description: Requested buckets that already exist under a different owner, with that owner.
+  returned: always
+  type: dict
+errors:
+  description: Error message per bucket that could not be created or configured.
+  returned: always
+  type: dict
+commands:
+  description: Number of radosgw-admin invocations made by the module.
+  returned: always
+  type: int
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, run_parallel
+from ansible.module_utils.rgw_buckets import bucket_index, current_quota, desired_quota
+
+
+class RGWBucketProvisioner:
+    """기존 버킷 diff 후 누락 버킷 생성 및 쿼터 적용"""
+
+    def __init__(self, cli, workers=8, enforce_quota=True):
+        self.cli = cli
+        self.workers = workers
+        self.enforce_quota = enforce_quota
+
+    def list_buckets(self):
+        """bucket name -> bucket stats 요약"""
+        return bucket_index(self.cli.iter_json(['bucket', 'stats']))
+
+    def create_bucket(self, bucket, owner):
+        self.cli.run(['bucket', 'create', f"--bucket={bucket}", f"--owner={owner}"])
+
+    def set_quota(self, bucket, quota):
+        self.cli.run(['quota', 'set', '--quota-scope=bucket', f"--bucket={bucket}",
+                      f"--max-size={quota['max_size']}", f"--max-objects={quota['max_objects']}"])
+        self.cli.run(['quota', 'enable', '--quota-scope=bucket', f"--bucket={bucket}"])
+
+    def plan(self, users):
+        """버킷별 작업 목록과 소유자 충돌 계산"""
+        existing = self.list_buckets()
+        jobs, conflicts = [], {}
+        for user in users:
+            for bucket in user.get('buckets') or []:
+                name, owner = bucket['name'], user['user_id']
+                stats = existing.get(name)
+                if stats is not None and stats.get('owner') not in (None, owner):
+                    conflicts[name] = stats['owner']
+                    continue
+                quota = desired_quota(bucket) if self.enforce_quota else None
+                jobs.append({
+                    'bucket': name,
+                    'owner': owner,
+                    'create': stats is None,
+                    'quota': quota,
+                    'update_quota': quota is not None and quota != current_quota(stats),
+                })
+        return jobs, conflicts
+
+    def provision(self, job):
+        if job['create']:
+            self.create_bucket(job['bucket'], job['owner'])
+        if job['update_quota']:
+            self.set_quota(job['bucket'], job['quota'])
+
+    def apply(self, users, check_mode=False):
+        jobs, conflicts = self.plan(users)
+        result = {
+            'buckets': {},
+            'created': [j['bucket'] for j in jobs if j['create']],
+            'existing': [j['bucket'] for j in jobs if not j['create']],
+            'quota_updated': [j['bucket'] for j in jobs if j['update_quota']],
+            'conflicts': conflicts,
+            'errors': {},
+        }
+        pending = [j for j in jobs if j['create'] or j['update_quota']]
+        outcomes = [(j, None, None) for j in pending] if check_mode else \
+            run_parallel(self.provision, pending, self.workers)
+        for job, _, error in outcomes:
+            if error is not None:
+                result['errors'][job['bucket']] = error.stderr.strip() if isinstance(error, CephCommandError) \
+                    else str(error)
+
+        for job in jobs:
+            if job['bucket'] in result['errors']:
+                continue
+            result['buckets'][job['bucket']] = {
+                'bucket': job['bucket'],
+                'owner': job['owner'],
+                'created': job['create'],
+                'quota': job['quota'],
+                'quota_updated': job['update_quota'],
+            }
+
+        failed = result['errors']
+        result['created'] = [b for b in result['created'] if b not in failed]
+        result['quota_updated'] = [b for b in result['quota_updated'] if b not in failed]
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            users=dict(type='list', elements='dict', required=True),
+            radosgw_admin=dict(type='str', default='radosgw-admin'),
+            workers=dict(type='int', default=8),
+            enforce_quota=dict(type='bool', default=True),
+        ),
+        supports_check_mode=True,
+    )
+
+    users = module.params['users']
+    invalid = [u.get('user_id') for u in users
+               if not u.get('user_id') or any(not b.get('name') for b in u.get('buckets') or [])]
+    if invalid:
+        module.fail_json(msg=f"{len(invalid)} user definition(s) have no user_id or an unnamed bucket")
+
+    cli = CephCLI(module.run_command, module.params['radosgw_admin'], json_args=())
+    provisioner = RGWBucketProvisioner(cli, module.params['workers'], module.params['enforce_quota'])
+
+    try:
+        result = provisioner.apply(users, check_mode=module.check_mode)
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+    except ValueError as e:
+        module.fail_json(msg=str(e))
+
+    result['changed'] = bool(result['created'] or result['quota_updated'])
+    result['commands'] = cli.calls
+    if result['errors']:
+        module.fail_json(msg=f"Failed to provision {len(result['errors'])} RGW bucket(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW 자격 증명 CSV 병합 모듈
+
+사용자마다 lineinfile 로 CSV 파일 전체를 다시 읽고 쓰던 방식을 대체합니다.
+user_id 기준으로 병합해서 파일을 한 번만 원자적으로 기록하므로 재실행해도 중복 행이
+생기지 않습니다. 보통 delegate_to: localhost 로 컨트롤러에서 실행합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_credentials
+short_description: Merge RGW user credentials into a CSV file with one atomic write
+description:
+  - Merges access/secret keys into the RGW credential CSV keyed by C(user_id).
+  - Existing rows are streamed in, updated in memory and written back once through
+    a temporary file and C(rename), so the file is never left half-written.
+  - Duplicate rows left behind by older per-line runs are collapsed (last row wins).
+options:
+  path:
+    description: CSV file path, usually C(ceph.rgw_user_creation_result_file).
+    type: path
+    required: true
+  users:
+    description:
+      - Credentials to merge. Accepts the C(users) dict returned by M(ceph_rgw_users)
+        or a list of dicts with C(user_id), C(display_name), C(email), C(access_key), C(secret_key).
+      - Entries without C(access_key) are ignored.
+    type: raw
+    default: []
+  mode:
+    description: File permissions of the written CSV.
+    type: str
+    default: '0600'
+  return_credentials:
+    description: Return the merged credentials keyed by C(user_id).
+    type: bool
+    default: false
+'''
+
+EXAMPLES = r'''
+- name: Save user information to CSV file on local machine
+  delegate_to: localhost
+  become: false
+  ceph_rgw_credentials:
+    path: "{{ ceph.rgw_user_creation_result_file }}"
+    users: "{{ rgw_users.users }}"
+
+- name: Read RGW credentials
+  delegate_to: localhost
+  become: false
+  ceph_rgw_credentials:
+    path: "{{ ceph.rgw_user_creation_result_file }}"
+    return_credentials: true
+  register: rgw_credentials
+'''
+
+RETURN = r'''
+added:
+  description: User IDs appended to the file.
+  returned: always
+  type: list
+updated:
+  description: User IDs whose row changed.
+  returned: always
+  type: list
+total:
+  description: Number of users in the file after the merge.
+  returned: always
+  type: int
+credentials:
+  description: Merged credentials keyed by user_id.
+  returned: when return_credentials is true
+  type: dict
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.rgw_credentials import load_credentials, merge_credentials
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', required=True),
+            users=dict(type='raw', default=[]),
+            mode=dict(type='str', default='0600'),
+            return_credentials=dict(type='bool', default=False),
+        ),
+        supports_check_mode=True,
+    )
+
+    path = module.params['path']
+    users = module.params['users']
+    if not isinstance(users, (dict, list)):
+        module.fail_json(msg=f"users must be a dict or a list, got {type(users).__name__}")
+
+    try:
+        mode = int(module.params['mode'], 8)
+    except ValueError:
+        module.fail_json(msg=f"invalid mode: {module.params['mode']}")
+
+    try:
+        if users:
+            result = merge_credentials(path, users, mode=mode, check_mode=module.check_mode)
+        else:
+            credentials = load_credentials(path)
+            result = {'changed': False, 'added': [], 'updated': [], 'total': len(credentials),
+                      'credentials': credentials}
+    except (OSError, ValueError) as e:
+        module.fail_json(msg=f"Failed to update {path}: {e}")
+
+    if not module.params['return_credentials']:
+        result.pop('credentials')
+    module.exit_json(path=path, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW 테스트 오브젝트 병렬 업로드 모듈
+
+사용자/버킷 쌍마다 amazon.aws.s3_object 를 순차 호출하던 방식을 대체합니다.
+자격 증명 CSV 를 한 번만 읽어 dict 로 만들고, 사용자별로 풀링된 boto3 클라이언트로
+여러 버킷에 스레드 풀을 통해 동시에 업로드한 뒤 오브젝트별 지연 시간과 전체
+처리량을 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_objects
+short_description: Upload test objects to many RGW buckets concurrently
+description:
+  - Reads RGW user credentials once (from the credential CSV or a dict) and uploads
+    test objects to every bucket of every user through a bounded thread pool.
+  - One boto3 client with its own connection pool is kept per credential set.
+  - Returns per-object latency and overall throughput.
+requirements:
+  - boto3
+options:
+  endpoint_url:
+    description: RGW S3 endpoint, usually C(rgw_instance.gateway.s3_url).
+    type: str
+    required: true
+  users:
+    description: RGW users with their C(buckets), usually C(rgw_instance.users).
+    type: list
+    elements: dict
+    required: true
+  credentials_file:
+    description: Credential CSV written by M(ceph_rgw_credentials). Ignored when I(credentials) is set.
+    type: path
+  credentials:
+    description: Credentials keyed by user_id, each with C(access_key) and C(secret_key).
+    type: dict
+  concurrency:
+    description: Maximum number of concurrent uploads.
+    type: int
+    default: 16
+  object_size:
+    description:
+      - Size in bytes of each uploaded object.
+      - When 0, a short text describing the bucket is uploaded, as the old playbook did.
+    type: int
+    default: 0
+  objects_per_bucket:
+    description: Number of objects uploaded to each bucket.
+    type: int
+    default: 1
+  object_prefix:
+    description: Key prefix; the run timestamp and an index are appended.
+    type: str
+    default: test-object
+  region:
+    description: S3 region name.
+    type: str
+    default: default
+  validate_certs:
+    description: Verify TLS certificates of the endpoint.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Create test objects in S3 buckets
+  delegate_to: localhost
+  become: false
+  ceph_rgw_objects:
+    endpoint_url: "{{ rgw_instance.gateway.s3_url }}"
+    users: "{{ rgw_instance.users }}"
+    credentials_file: "{{ ceph.rgw_user_creation_result_file }}"
+    concurrency: 32
+    validate_certs: false
+  register: rgw_object_upload
+'''
+
+RETURN = r'''
+objects:
+  description: Per-object upload result.
+  returned: always
+  type: list
+  sample:
+    - {user_id: admin, bucket: admin-bucket1, key: test-object-1727000000-0.txt, size: 58, latency_ms: 12.4, ok: true}
+throughput:
+  description: Aggregate statistics of the run.
+  returned: always
+  type: dict
+  sample: {objects: 3, failed: 0, bytes: 174, seconds: 0.05, objects_per_second: 60.0, mib_per_second: 0.003}
+latency_ms:
+  description: Latency percentiles of successful uploads in milliseconds.
+  returned: always
+  type: dict
+skipped_users:
+  description: User IDs without credentials, whose buckets were skipped.
+  returned: always
+  type: list
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.ceph_cli import run_parallel
+from ansible.module_utils.rgw_credentials import load_credentials
+from ansible.module_utils.rgw_s3 import BOTO3_IMPORT_ERROR, HAS_BOTO3, S3ClientPool, percentiles
+
+
+class S3ObjectUploader:
+    """버킷별 업로드 작업을 만들고 스레드 풀로 실행"""
+
+    def __init__(self, pool, concurrency=16, object_size=0, objects_per_bucket=1, object_prefix='test-object'):
+        self.pool = pool
+        self.concurrency = concurrency
+        self.object_size = object_size
+        self.objects_per_bucket = objects_per_bucket
+        self.object_prefix = object_prefix
+        self.run_id = int(time.time())
+        self._payload = b'\0' * object_size if object_size else None
+
+    def plan(self, users, credentials):
+        """(작업 목록, 자격 증명 없는 사용자) 반환"""
+        jobs, skipped = [], []
+        for user in users:
+            cred = credentials.get(user['user_id'])
+            if not cred or not cred.get('access_key'):
+                skipped.append(user['user_id'])
+                continue
+            for bucket in user.get('buckets') or []:
+                for index in range(self.objects_per_bucket):
+                    jobs.append({
+                        'user_id': user['user_id'],
+                        'bucket': bucket['name'],
+                        'key': f"{self.object_prefix}-{self.run_id}-{index}.txt",
+                        'access_key': cred['access_key'],
+                        'secret_key': cred['secret_key'],
+                    })
+        return jobs, skipped
+
+    def body(self, bucket):
+        if self._payload is not None:
+            return self._payload
+        return f"This is a test object created for bucket {bucket}".encode()
+
+    def upload(self, job):
+        client = self.pool.get(job['access_key'], job['secret_key'])
+        body = self.body(job['bucket'])
+        start = time.perf_counter()
+        client.put_object(Bucket=job['bucket'], Key=job['key'], Body=body)
+        return len(body), (time.perf_counter() - start) * 1000.0
+
+    def run(self, users, credentials):
+        jobs, skipped = self.plan(users, credentials)
+        start = time.perf_counter()
+        outcomes = run_parallel(self.upload, jobs, self.concurrency)
+        elapsed = time.perf_counter() - start
+
+        objects, latencies, total_bytes = [], [], 0
+        for job, outcome, error in outcomes:
+            entry = {'user_id': job['user_id'], 'bucket': job['bucket'], 'key': job['key']}
+            if error is not None:
+                entry.update(ok=False, error=str(error))
+            else:
+                size, latency = outcome
+                entry.update(ok=True, size=size, latency_ms=round(latency, 3))
+                latencies.append(latency)
+                total_bytes += size
+            objects.append(entry)
+
+        uploaded = len(latencies)
+        throughput = {
+            'objects': uploaded,
+            'failed': len(objects) - uploaded,
+            'bytes': total_bytes,
+            'seconds': round(elapsed, 4),
+            'objects_per_second': round(uploaded / elapsed, 2) if elapsed else 0.0,
+            'mib_per_second': round(total_bytes / elapsed / 1048576.0, 4) if elapsed else 0.0,
+            'clients': len(self.pool),
+        }
+        return {
+            'objects': objects,
+            'throughput': throughput,
+            'latency_ms': {k: round(v, 3) for k, v in percentiles(latencies).items()},
+            'skipped_users': skipped,
+        }
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            endpoint_url=dict(type='str', required=True),
+            users=dict(type='list', elements='dict', required=True),
+            credentials_file=dict(type='path'),
+            credentials=dict(type='dict', no_log=True),
+            concurrency=dict(type='int', default=16),
+            object_size=dict(type='int', default=0),
+            objects_per_bucket=dict(type='int', default=1),
+            object_prefix=dict(type='str', default='test-object'),
+            region=dict(type='str', default='default'),
+            validate_certs=dict(type='bool', default=True),
+        ),
+        required_one_of=[('credentials_file', 'credentials')],
+        supports_check_mode=True,
+    )
+
+    if not HAS_BOTO3:
+        module.fail_json(msg=missing_required_lib('boto3'), exception=BOTO3_IMPORT_ERROR)
+
+    params = module.params
+    credentials = params['credentials']
+    if credentials is None:
+        credentials = load_credentials(params['credentials_file'])
+
+    pool = S3ClientPool(params['endpoint_url'], params['region'], params['validate_certs'],
+                        max_connections=params['concurrency'])
+    uploader = S3ObjectUploader(pool, params['concurrency'], params['object_size'],
+                                params['objects_per_bucket'], params['object_prefix'])
+
+    if module.check_mode:
+        jobs, skipped = uploader.plan(params['users'], credentials)
+        module.exit_json(changed=bool(jobs), objects=[{k: j[k] for k in ('user_id', 'bucket', 'key')} for j in jobs],
+                         throughput={}, latency_ms={}, skipped_users=skipped)
+
+    result = uploader.run(params['users'], credentials)
+    result['changed'] = result['throughput']['objects'] > 0
+    if result['throughput']['failed']:
+        module.fail_json(msg=f"{result['throughput']['failed']} object upload(s) failed", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW S3 접근 프로브 모듈
+
+사용자마다 `lookup('pipe')` 로 openssl 을 실행해 AWS v2 서명을 만들고 `uri` 로 한 번에
+하나씩 요청하던 검증(Date 헤더가 빠져 있어 실제로는 성공할 수 없음)을 대체합니다.
+엔드포인트당 boto3 클라이언트(커넥션 풀) 하나가 요청마다 해당 사용자의 자격 증명으로
+프로세스 안에서 SigV4 로 서명하고, 모든 사용자/버킷의 list/put/get/delete 를 스레드 풀로
+동시에 확인한 뒤 작업별 지연 시간 백분위수를 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_probe
+short_description: Probe S3 access to many RGW buckets concurrently
+description:
+  - Reads RGW user credentials once (from the credential CSV or a dict) and checks every bucket
+    of every user with a sequence of S3 operations, through a bounded thread pool.
+  - Requests are signed in-process with SigV4. One boto3 client with one connection pool is kept for the
+    endpoint and shared by all users; each request is signed with the credentials of its user.
+  - C(list) lists at most one key, C(put) writes a small probe object, C(get) reads it back and
+    compares the content, and C(delete) removes it. The probe object is removed even when C(delete) is
+    not requested or an earlier operation fails.
+  - Returns the result of every probe and latency percentiles per operation. Failed probes do not fail
+    the module; check C(ok) or C(summary.errors).
+requirements:
+  - boto3
+options:
+  endpoint_url:
+    description: RGW S3 endpoint, usually C(rgw_instance.gateway.s3_url).
+    type: str
+    required: true
+  users:
+    description: RGW users with their C(buckets), usually C(rgw_instance.users).
+    type: list
+    elements: dict
+    required: true
+  credentials_file:
+    description: Credential CSV written by M(ceph_rgw_credentials). Ignored when I(credentials) is set.
+    type: path
+  credentials:
+    description: Credentials keyed by user_id, each with C(access_key) and C(secret_key).
+    type: dict
+  operations:
+    description: Operations to run on each bucket, in this order. C(get) needs C(put).
+    type: list
+    elements: str
+    choices: [list, put, get, delete]
+    default: [list, put, get, delete]
+  concurrency:
+    description: Maximum number of buckets probed concurrently.
+    type: int
+    default: 16
+  object_prefix:
+    description: Key prefix of the probe objects.
+    type: str
+    default: probe
+  region:
+    description: S3 region name.
+    type: str
+    default: default
+  validate_certs:
+    description: Verify TLS certificates of the endpoint.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Probe S3 access for every RGW user and bucket
+  ceph_rgw_probe:
+    endpoint_url: "{{ rgw_instance.gateway.s3_url }}"
+    users: "{{ rgw_instance.users }}"
+    credentials_file: "{{ ceph.rgw_user_creation_result_file }}"
+    validate_certs: false
+  register: s3_probe
+'''
+
+RETURN = r'''
+probes:
+  description: Per-bucket probe result with per-operation latency in milliseconds.
+  returned: always
+  type: list
+  sample:
+    - {user_id: admin, bucket: admin-bucket1, ok: true, latency_ms: {list: 3.1, put: 4.2, get: 2.0, delete: 2.5}}
+    - {user_id: user1, bucket: gone, ok: false, operation: list, error: NoSuchBucket, latency_ms: {}}
+latency_ms:
+  description: Latency percentiles of successful operations in milliseconds, keyed by operation.
+  returned: always
+  type: dict
+  sample: {put: {p50: 4.1, p90: 6.0, p95: 6.3, p99: 7.0, max: 7.0, min: 2.2}}
+summary:
+  description: Aggregate counts and timing of the run.
+  returned: always
+  type: dict
+  sample: {probes: 3, ok: 2, errors: 1, requests: 10, seconds: 0.05, clients: 1}
+ok:
+  description: Whether every probe succeeded.
+  returned: always
+  type: bool
+skipped_users:
+  description: User IDs without credentials, whose buckets were not probed.
+  returned: always
+  type: list
+'''
+
+import time
+import uuid
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.ceph_cli import run_parallel
+from ansible.module_utils.rgw_credentials import load_credentials
+from ansible.module_utils.rgw_s3 import BOTO3_IMPORT_ERROR, HAS_BOTO3, S3EndpointClient, percentiles
+
+OPERATIONS = ('list', 'put', 'get', 'delete')
+
+
+def error_code(error):
+    """botocore ClientError -> S3 오류 코드 (그 외 예외는 문자열)"""
+    response = getattr(error, 'response', None) or {}
+    return (response.get('Error') or {}).get('Code') or str(error)
+
+
+class S3AccessProber:
+    """버킷별 프로브 작업을 만들고 스레드 풀로 실행"""
+
+    def __init__(self, pool, concurrency=16, operations=OPERATIONS, object_prefix='probe', clock=time.perf_counter):
+        self.pool = pool
+        self.concurrency = concurrency
+        self.operations = [op for op in OPERATIONS if op in operations]
+        self.object_prefix = object_prefix
+        self.clock = clock
+        self.run_id = uuid.uuid4().hex[:12]
+
+    def plan(self, users, credentials):
+        """(작업 목록, 자격 증명 없는 사용자) 반환"""
+        jobs, skipped = [], []
+        for user in users:
+            cred = credentials.get(user['user_id'])
+            if not cred or not cred.get('access_key'):
+                skipped.append(user['user_id'])
+                continue
+            for bucket in user.get('buckets') or []:
+                jobs.append({
+                    'user_id': user['user_id'],
+                    'bucket': bucket['name'],
+                    'access_key': cred['access_key'],
+                    'secret_key': cred['secret_key'],
+                })
+        return jobs, skipped
+
+    def _operation(self, client, op, bucket, key, body):
+        if op == 'list':
+            client.list_objects_v2(Bucket=bucket, MaxKeys=1)
+        elif op == 'put':
+            client.put_object(Bucket=bucket, Key=key, Body=body)
+        elif op == 'get':
+            if client.get_object(Bucket=bucket, Key=key)['Body'].read() != body:
+                raise ValueError('content mismatch')
+        elif op == 'delete':
+            client.delete_object(Bucket=bucket, Key=key)
+
+    def probe(self, job):
+        """버킷 하나에 operations 를 순서대로 실행. 첫 실패에서 멈추고 남은 프로브 오브젝트는 정리"""
+        client = self.pool.get(job['access_key'], job['secret_key'])
+        key = f"{self.object_prefix}-{self.run_id}-{job['user_id']}"
+        body = f"s3 access probe {self.run_id} {job['user_id']}/{job['bucket']}".encode()
+        entry = {'user_id': job['user_id'], 'bucket': job['bucket'], 'ok': True, 'latency_ms': {}}
+        stored = False
+        for op in self.operations:
+            start = self.clock()
+            try:
+                self._operation(client, op, job['bucket'], key, body)
+            except Exception as e:
+                entry.update(ok=False, operation=op, error=error_code(e))
+                break
+            entry['latency_ms'][op] = round((self.clock() - start) * 1000.0, 3)
+            if op in ('put', 'delete'):
+                stored = op == 'put'
+        if stored:
+            try:
+                client.delete_object(Bucket=job['bucket'], Key=key)
+            except Exception:
+                pass
+        return entry
+
+    def run(self, users, credentials):
+        jobs, skipped = self.plan(users, credentials)
+        start = self.clock()
+        probes = [entry for _, entry, _ in run_parallel(self.probe, jobs, self.concurrency)]
+        elapsed = self.clock() - start
+
+        latency = {}
+        for op in self.operations:
+            values = [p['latency_ms'][op] for p in probes if op in p['latency_ms']]
+            if values:
+                latency[op] = {k: round(v, 3) for k, v in percentiles(values).items()}
+        passed = sum(1 for p in probes if p['ok'])
+        summary = {
+            'probes': len(probes),
+            'ok': passed,
+            'errors': len(probes) - passed,
+            'requests': sum(len(p['latency_ms']) + (0 if p['ok'] else 1) for p in probes),
+            'seconds': round(elapsed, 4),
+            'clients': len(self.pool),
+        }
+        return {'probes': probes, 'latency_ms': latency, 'summary': summary, 'ok': passed == len(probes),
+                'skipped_users': skipped}
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            endpoint_url=dict(type='str', required=True),
+            users=dict(type='list', elements='dict', required=True),
+            credentials_file=dict(type='path'),
+            credentials=dict(type='dict', no_log=True),
+            operations=dict(type='list', elements='str', choices=list(OPERATIONS), default=list(OPERATIONS)),
+            concurrency=dict(type='int', default=16),
+            object_prefix=dict(type='str', default='probe'),
+            region=dict(type='str', default='default'),
+            validate_certs=dict(type='bool', default=True),
+        ),
+        required_one_of=[('credentials_file', 'credentials')],
+        supports_check_mode=True,
+    )
+
+    if not HAS_BOTO3:
+        module.fail_json(msg=missing_required_lib('boto3'), exception=BOTO3_IMPORT_ERROR)
+
+    params = module.params
+    if 'get' in params['operations'] and 'put' not in params['operations']:
+        module.fail_json(msg="operation 'get' needs 'put'")
+    credentials = params['credentials']
+    if credentials is None:
+        credentials = load_credentials(params['credentials_file'])
+
+    pool = S3EndpointClient(params['endpoint_url'], params['region'], params['validate_certs'],
+                            max_connections=params['concurrency'])
+    prober = S3AccessProber(pool, params['concurrency'], params['operations'], params['object_prefix'])
+
+    if module.check_mode:
+        jobs, skipped = prober.plan(params['users'], credentials)
+        module.exit_json(changed=False, probes=[{k: j[k] for k in ('user_id', 'bucket')} for j in jobs],
+                         latency_ms={}, summary={}, ok=True, skipped_users=skipped)
+
+    result = prober.run(params['users'], credentials)
+    module.exit_json(changed=False, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+RGW 사용자 일괄 생성 모듈
+
+사용자마다 `radosgw-admin user info` / `user create` / `user info` 를 SSH 태스크로
+반복 실행하던 방식을 대체합니다. 기존 사용자 목록을 한 번에 조회하고, 누락된
+사용자만 하나의 원격 프로세스 안에서 생성한 뒤 모든 키를 한 결과로 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_rgw_users
+short_description: Batch-provision RGW users with a single existence check
+description:
+  - Lists existing RGW users once with C(radosgw-admin metadata list user).
+  - Creates only the missing users, running the C(radosgw-admin) calls concurrently
+    inside a single remote process.
+  - Returns the access and secret keys of every requested user in one result.
+options:
+  users:
+    description:
+      - RGW user definitions, usually C(rgw_instance.users) from C(ceph-vars.yml).
+      - Each entry needs C(user_id) and C(display_name); C(email) and C(caps) are optional.
+    type: list
+    elements: dict
+    required: true
+  radosgw_admin:
+    description: Path to the C(radosgw-admin) executable.
+    type: str
+    default: radosgw-admin
+  workers:
+    description: Maximum number of concurrent C(radosgw-admin) processes.
+    type: int
+    default: 8
+  fetch_keys:
+    description:
+      - Fetch keys of already existing users with C(radosgw-admin user info).
+      - When false, only newly created users carry keys in the result.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Provision RGW users
+  ceph_rgw_users:
+    users: "{{ rgw_instance.users }}"
+  register: rgw_users
+'''
+
+RETURN = r'''
+users:
+  description: Per-user result keyed by user_id.
+  returned: always
+  type: dict
+  sample:
+    admin:
+      user_id: admin
+      display_name: Admin User
+      email: admin@example.com
+      access_key: AKIA...
+      secret_key: ...
+      created: true
+created:
+  description: User IDs created by this run.
+  returned: always
+  type: list
+existing:
+  description: User IDs that already existed.
+  returned: always
+  type: list
+errors:
+  description: Error message per user ID that could not be created or fetched.
+  returned: always
+  type: dict
+commands:
+  description: Number of radosgw-admin invocations made by the module.
+  returned: always
+  type: int
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, run_parallel
+
+CAPS_TYPES = ('buckets', 'metadata', 'usage', 'zone')
+
+
+def build_caps(caps):
+    """caps 리스트를 radosgw-admin --caps 문자열로 변환"""
+    grouped = {}
+    for cap in caps or []:
+        grouped.setdefault(cap['type'], []).append(cap['perm'])
+    ordered = [t for t in CAPS_TYPES if t in grouped] + sorted(t for t in grouped if t not in CAPS_TYPES)
+    return ';'.join(f"{t}={','.join(grouped[t])}" for t in ordered)
+
+
+def user_keys(info):
+    """user info JSON 에서 첫 번째 S3 키 쌍 추출"""
+    keys = (info or {}).get('keys') or []
+    if not keys:
+        return None, None
+    return keys[0].get('access_key'), keys[0].get('secret_key')
+
+
+class RGWUserProvisioner:
+    """기존 사용자 diff 후 누락 사용자만 생성하는 프로비저너"""
+
+    def __init__(self, cli, workers=8, fetch_keys=True):
+        self.cli = cli
+        self.workers = workers
+        self.fetch_keys = fetch_keys
+
+    def list_users(self):
+        return set(self.cli.run_json(['metadata', 'list', 'user']) or [])
+
+    def create_user(self, user):
+        args = [
+            'user', 'create',
+            f"--uid={user['user_id']}",
+            f"--display-name={user.get('display_name') or user['user_id']}",
+        ]
+        if user.get('email'):
+            args.append(f"--email={user['email']}")
+        caps = build_caps(user.get('caps'))
+        if caps:
+            args.append(f"--caps={caps}")
+        args.extend(['--gen-access-key', '--gen-secret'])
+        return self.cli.run_json(args)
+
+    def user_info(self, user):
+        return self.cli.run_json(['user', 'info', f"--uid={user['user_id']}"])
+
+    def plan(self, users):
+        """(생성 대상, 기존 사용자) 목록 계산"""
+        existing = self.list_users()
+        missing = [u for u in users if u['user_id'] not in existing]
+        present = [u for u in users if u['user_id'] in existing]
+        return missing, present
+
+    def apply(self, users, check_mode=False):
+        missing, present = self.plan(users)
+        result = {
+            'users': {},
+            'created': [u['user_id'] for u in missing],
+            'existing': [u['user_id'] for u in present],
+            'errors': {},
+        }
+        if check_mode:
+            return result
+
+        jobs = [(u, self.create_user, True) for u in missing]
+        if self.fetch_keys:
+            jobs.extend((u, self.user_info, False) for u in present)
+
+        for (user, _, created), info, error in run_parallel(lambda job: job[1](job[0]), jobs, self.workers):
+            if error is not None:
+                result['errors'][user['user_id']] = error.stderr.strip() if isinstance(error, CephCommandError) \
+                    else str(error)
+                continue
+            access_key, secret_key = user_keys(info)
+            result['users'][user['user_id']] = {
+                'user_id': user['user_id'],
+                'display_name': user.get('display_name', ''),
+                'email': user.get('email', ''),
+                'access_key': access_key,
+                'secret_key': secret_key,
+                'created': created,
+            }
+
+        result['created'] = [uid for uid in result['created'] if uid not in result['errors']]
+        return result
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            users=dict(type='list', elements='dict', required=True),
+            radosgw_admin=dict(type='str', default='radosgw-admin'),
+            workers=dict(type='int', default=8),
+            fetch_keys=dict(type='bool', default=True),
+        ),
+        supports_check_mode=True,
+    )
+
+    users = module.params['users']
+    missing_ids = [u for u in users if not u.get('user_id')]
+    if missing_ids:
+        module.fail_json(msg=f"{len(missing_ids)} user definition(s) have no user_id")
+
+    cli = CephCLI(module.run_command, module.params['radosgw_admin'], json_args=())
+    provisioner = RGWUserProvisioner(cli, module.params['workers'], module.params['fetch_keys'])
+
+    try:
+        result = provisioner.apply(users, check_mode=module.check_mode)
+    except CephCommandError as e:
+        module.fail_json(msg=str(e), rc=e.rc, stderr=e.stderr)
+
+    result['changed'] = bool(result['created'])
+    result['commands'] = cli.calls
+    if result['errors']:
+        module.fail_json(msg=f"Failed to provision {len(result['errors'])} RGW user(s)", **result)
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
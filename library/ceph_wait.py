@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Ceph 클러스터 상태 대기 모듈
+
+`until:` / `retries:` / `delay:` 로 고정 간격(10초)마다 새 SSH 명령을 실행하던 방식을
+대체합니다. 하나의 원격 프로세스 안에서 `ceph status --format json` 을 적응형
+백오프로 폴링하다가 요청한 헬스 수준이나 조건에 도달하는 즉시 반환하고,
+그 사이의 상태 변화 타임라인을 함께 반환합니다.
+"""
+
+DOCUMENTATION = r'''
+---
+module: ceph_wait
+short_description: Wait for a Ceph health state or condition with adaptive backoff
+description:
+  - Polls C(ceph status --format json) inside one remote process and returns as soon as
+    every requested condition holds.
+  - The poll interval starts at I(min_interval) and grows by I(backoff) up to I(max_interval)
+    while nothing changes; it drops back to I(min_interval) whenever the observed state changes.
+  - Returns the timeline of observed state transitions and sets the C(ceph_health_snapshot) fact
+    from the last poll.
+options:
+  health:
+    description: Worst acceptable health level.
+    type: str
+    choices: [HEALTH_OK, HEALTH_WARN, HEALTH_ERR]
+  absent_checks:
+    description: Health check codes (for example C(MON_CLOCK_SKEW)) that must not be raised.
+    type: list
+    elements: str
+    default: []
+  min_osds_up:
+    description: Minimum number of OSDs that must be up.
+    type: int
+  pgs_active_clean:
+    description: Require every placement group to be C(active+clean).
+    type: bool
+    default: false
+  min_hosts:
+    description: Minimum number of hosts in C(ceph orch host ls).
+    type: int
+  absent_services:
+    description: Orchestrator service names (for example C(rgw.rgw-oa)) that must no longer be listed.
+    type: list
+    elements: str
+    default: []
+  timeout:
+    description: Maximum time to wait in seconds.
+    type: int
+    default: 600
+  min_interval:
+    description: First and smallest poll interval in seconds.
+    type: float
+    default: 0.5
+  max_interval:
+    description: Largest poll interval in seconds.
+    type: float
+    default: 10
+  backoff:
+    description: Factor applied to the poll interval after each unchanged poll.
+    type: float
+    default: 1.5
+  fail_on_timeout:
+    description: Fail when the conditions are not met within I(timeout).
+    type: bool
+    default: true
+  ceph:
+    description: Path to the C(ceph) executable.
+    type: str
+    default: ceph
+'''
+
+EXAMPLES = r'''
+- name: Wait for HEALTH_OK
+  ceph_wait:
+    health: HEALTH_WARN
+    timeout: 600
+
+- name: Wait for OSDs to be deployed
+  ceph_wait:
+    min_osds_up: 3
+    fail_on_timeout: false
+'''
+
+RETURN = r'''
+reached:
+  description: Whether every condition held before the timeout.
+  returned: always
+  type: bool
+elapsed:
+  description: Seconds spent waiting.
+  returned: always
+  type: float
+polls:
+  description: Number of polls made.
+  returned: always
+  type: int
+pending:
+  description: Conditions that did not hold at the last poll.
+  returned: always
+  type: list
+timeline:
+  description: Observed state at the first poll and at every change, with the elapsed time.
+  returned: always
+  type: list
+  sample:
+    - {elapsed: 0.0, status: HEALTH_WARN, checks: [OSD_DOWN], osds_up: 2, hosts: null, pending: [health, min_osds_up]}
+    - {elapsed: 4.8, status: HEALTH_OK, checks: [], osds_up: 3, hosts: null, pending: []}
+snapshot:
+  description: Health snapshot from the last poll, also set as the C(ceph_health_snapshot) fact.
+  returned: when the cluster answered at least once
+  type: dict
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, poll_until
+from ansible.module_utils.ceph_health import health_within, parse_status
+
+
+class HealthWaiter:
+    """조건이 충족될 때까지 적응형 백오프로 클러스터 상태를 폴링"""
+
+    def __init__(self, cli, health=None, absent_checks=(), min_osds_up=None, pgs_active_clean=False,
+                 min_hosts=None, absent_services=(), clock=time.monotonic, sleep=time.sleep):
+        self.cli = cli
+        self.health = health
+        self.absent_checks = list(absent_checks or [])
+        self.min_osds_up = min_osds_up
+        self.pgs_active_clean = pgs_active_clean
+        self.min_hosts = min_hosts
+        self.absent_services = list(absent_services or [])
+        self.clock = clock
+        self.sleep = sleep
+
+    def observe(self):
+        """한 번 폴링해서 관찰 상태 dict 반환 (명령 실패도 상태로 기록)"""
+        state = {'status': None, 'checks': [], 'osds_up': None, 'hosts': None, 'services': None, 'error': None}
+        snapshot = None
+        try:
+            snapshot = parse_status(self.cli.run_json(['status']) or {})
+            state.update(status=snapshot['status'], checks=sorted(snapshot['checks']),
+                         osds_up=snapshot['osd']['up'])
+            if self.min_hosts is not None:
+                state['hosts'] = len(self.cli.run_json(['orch', 'host', 'ls']) or [])
+            if self.absent_services:
+                listed = {s.get('service_name') for s in self.cli.run_json(['orch', 'ls']) or []}
+                state['services'] = sorted(s for s in self.absent_services if s in listed)
+        except CephCommandError as e:
+            state['error'] = e.stderr.strip() or str(e)
+        state['pending'] = self.pending(state, snapshot)
+        return state, snapshot
+
+    def pending(self, state, snapshot):
+        """아직 충족되지 않은 조건 이름 목록"""
+        if snapshot is None:
+            return ['cluster']
+        pending = []
+        if self.health and not health_within(state['status'], self.health):
+            pending.append('health')
+        if any(c in state['checks'] for c in self.absent_checks):
+            pending.append('absent_checks')
+        if self.min_osds_up is not None and state['osds_up'] < self.min_osds_up:
+            pending.append('min_osds_up')
+        if self.pgs_active_clean and not snapshot['pg']['all_active_clean']:
+            pending.append('pgs_active_clean')
+        if self.min_hosts is not None and (state['hosts'] or 0) < self.min_hosts:
+            pending.append('min_hosts')
+        if self.absent_services and (state['services'] is None or state['services']):
+            pending.append('absent_services')
+        return pending
+
+    def wait(self, timeout=600, min_interval=0.5, max_interval=10.0, backoff=1.5):
+        snapshots = []
+
+        def probe():
+            state, snapshot = self.observe()
+            if snapshot is not None:
+                snapshots.append(snapshot)
+                del snapshots[:-1]
+            return not state['pending'], state
+
+        reached, state, polls, elapsed, changes = poll_until(
+            probe, timeout, min_interval, max_interval, backoff,
+            key=lambda s: {k: v for k, v in s.items() if k != 'error'},
+            clock=self.clock, sleep=self.sleep,
+        )
+        return {
+            'reached': reached,
+            'elapsed': round(elapsed, 3),
+            'polls': polls,
+            'pending': state['pending'],
+            'timeline': [dict(s, elapsed=round(t, 3)) for t, s in changes],
+            'snapshot': snapshots[-1] if snapshots else None,
+        }
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            health=dict(type='str', choices=['HEALTH_OK', 'HEALTH_WARN', 'HEALTH_ERR']),
+            absent_checks=dict(type='list', elements='str', default=[]),
+            min_osds_up=dict(type='int'),
+            pgs_active_clean=dict(type='bool', default=False),
+            min_hosts=dict(type='int'),
+            absent_services=dict(type='list', elements='str', default=[]),
+            timeout=dict(type='int', default=600),
+            min_interval=dict(type='float', default=0.5),
+            max_interval=dict(type='float', default=10.0),
+            backoff=dict(type='float', default=1.5),
+            fail_on_timeout=dict(type='bool', default=True),
+            ceph=dict(type='str', default='ceph'),
+        ),
+        supports_check_mode=True,
+    )
+
+    params = module.params
+    waiter = HealthWaiter(
+        CephCLI(module.run_command, params['ceph']),
+        health=params['health'],
+        absent_checks=params['absent_checks'],
+        min_osds_up=params['min_osds_up'],
+        pgs_active_clean=params['pgs_active_clean'],
+        min_hosts=params['min_hosts'],
+        absent_services=params['absent_services'],
+    )
+    result = waiter.wait(params['timeout'], params['min_interval'], params['max_interval'], params['backoff'])
+
+    snapshot = result.pop('snapshot')
+    if snapshot is not None:
+        result['snapshot'] = snapshot
+        result['ansible_facts'] = {'ceph_health_snapshot': snapshot}
+
+    if not result['reached'] and params['fail_on_timeout']:
+        module.fail_json(msg=f"Timed out after {result['elapsed']}s waiting for: {', '.join(result['pending'])}",
+                         changed=False, **result)
+    module.exit_json(changed=False, **result)
+
+
+if __name__ == '__main__':
+    main()
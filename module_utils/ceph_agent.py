@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+관리 호스트 상주 Ceph 명령 에이전트
+
+`ceph` CLI 를 실행할 때마다 Python 인터프리터 시작과 mon 연결/인증에 수백 ms 가
+듭니다. 에이전트는 플레이 동안 관리 호스트(mons[0])에서 librados 연결 하나를 유지하고,
+로컬 UNIX 소켓으로 줄 단위 JSON 요청을 받아 mon/mgr 명령을 실행합니다.
+
+- 서버: `serve()` / `spawn_agent()` (library/ceph_agent.py 가 데몬으로 시작)
+- 클라이언트: `AgentClient`. CephCLI 가 `ceph` 실행 파일에 대해 자동으로 사용하며,
+  소켓이 없거나 연결할 수 없으면 CLI 로, 에이전트가 처리할 수 없는 명령(tell,
+  daemon, 지원하지 않는 전역 옵션)은 그 명령만 CLI 로 실행합니다.
+
+argv -> mon 명령 변환은 ceph CLI 와 같이 ceph_argparse 와 mon 의 명령 설명
+(get_command_descriptions, 에이전트 시작 시 1회 조회)을 사용합니다.
+"""
+
+import errno
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+import traceback
+
+try:
+    import rados
+
+    HAS_RADOS = True
+    RADOS_IMPORT_ERROR = None
+except ImportError:
+    HAS_RADOS = False
+    RADOS_IMPORT_ERROR = traceback.format_exc()
+
+try:
+    import ceph_argparse
+
+    HAS_CEPH_ARGPARSE = True
+except ImportError:
+    HAS_CEPH_ARGPARSE = False
+
+DEFAULT_SOCKET = '/run/ceph-ansible/agent.sock'
+SOCKET_ENV = 'CEPH_AGENT_SOCKET'
+
+# 에이전트가 처리하지 않는 CLI 전역 옵션/명령 (CLI 로 실행)
+CLI_ONLY_OPTIONS = {
+    '-s', '--status', '-w', '--watch', '-c', '--conf', '-n', '--name', '--id', '--user', '--cluster', '-k',
+    '--keyring', '-o', '--out-file', '--connect-timeout', '-v', '--version', '-h', '--help', '--admin-daemon',
+}
+CLI_ONLY_COMMANDS = {'tell', 'daemon', 'daemonperf'}
+
+
+class AgentUnavailable(Exception):
+    """에이전트 소켓에 연결할 수 없음 (이후 명령은 모두 CLI 로 실행)"""
+
+
+class AgentFallback(Exception):
+    """에이전트가 처리할 수 없는 명령 (해당 명령만 CLI 로 실행)"""
+
+
+def agent_socket():
+    """CEPH_AGENT_SOCKET(빈 값이면 사용 안 함) 또는 기본 경로. 소켓 파일이 없으면 None"""
+    path = os.environ.get(SOCKET_ENV, DEFAULT_SOCKET)
+    return path if path and os.path.exists(path) else None
+
+
+def default_agent(executable):
+    """`ceph` 실행 파일에 대해 실행 중인 에이전트가 있으면 AgentClient, 없으면 None"""
+    if os.path.basename(executable) != 'ceph':
+        return None
+    path = agent_socket()
+    return AgentClient(path) if path else None
+
+
+def split_global_args(argv, data=None):
+    """CLI 인자 -> (명령 단어, 출력 형식, 입력 버퍼). 에이전트가 처리할 수 없으면 None
+
+    에이전트는 `/` 에서 실행되므로 `-i <파일>` 은 읽지 않습니다. 파일 입력은 호출 측
+    (AgentClient.command)에서 읽어 `-i -` 와 data 로 바꿔 보냅니다.
+    """
+    words, fmt, inbuf = [], None, b''
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--format', '-f'):
+            fmt = next(args, None)
+        elif arg.startswith('--format='):
+            fmt = arg.split('=', 1)[1]
+        elif arg in ('-i', '--in-file'):
+            if next(args, None) != '-':
+                return None
+            inbuf = (data or '').encode('utf-8')
+        elif arg in CLI_ONLY_OPTIONS or arg.split('=', 1)[0] in CLI_ONLY_OPTIONS:
+            return None
+        else:
+            words.append(arg)
+    if not words or words[0] in CLI_ONLY_COMMANDS:
+        return None
+    return words, fmt, inbuf
+
+
+def read_in_file(argv, data=None):
+    """`-i <파일>` 을 호출 측 작업 디렉터리 기준으로 읽어 (`-i -` 로 바꾼 인자, data) 반환
+
+    읽을 수 없거나 UTF-8 텍스트가 아닌 파일은 CLI 가 처리하도록 AgentFallback 을 던집니다.
+    """
+    argv = list(argv)
+    for i, arg in enumerate(argv[:-1]):
+        if arg in ('-i', '--in-file') and argv[i + 1] != '-':
+            try:
+                with open(argv[i + 1], 'rb') as f:
+                    data = f.read().decode('utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                raise AgentFallback(f"cannot send input file {argv[i + 1]}: {e}") from e
+            argv[i + 1] = '-'
+    return argv, data
+
+
+def cli_result(ret, outbuf, outs):
+    """librados 결과 -> ceph CLI 와 같은 (rc, stdout, stderr)"""
+    out = outbuf.decode('utf-8', 'replace') if isinstance(outbuf, bytes) else (outbuf or '')
+    rc = abs(ret)
+    if rc:
+        return rc, out, f"Error {errno.errorcode.get(rc, 'Unknown')}: {outs or ''}"
+    return 0, out, outs or ''
+
+
+class RadosAgentBackend:
+    """librados 연결 하나와 mon 명령 설명으로 CLI 인자를 mon/mgr 명령으로 실행"""
+
+    method = 'librados'
+
+    def __init__(self, conffile='/etc/ceph/ceph.conf', client='client.admin', timeout=10):
+        self.timeout = timeout
+        self.cluster = rados.Rados(conffile=conffile, name=client)
+        self.cluster.connect(timeout=timeout)
+        ret, out, err = ceph_argparse.json_command(self.cluster, prefix='get_command_descriptions',
+                                                   timeout=timeout)
+        if ret != 0:
+            self.cluster.shutdown()
+            raise RuntimeError(f"get_command_descriptions failed (rc={ret}): {err}")
+        self.sigdict = ceph_argparse.parse_json_funcsigs(out.decode('utf-8'), 'cli')
+
+    def command(self, argv, data=None):
+        parsed = split_global_args(argv, data)
+        if parsed is None:
+            raise AgentFallback('command is handled by the ceph CLI')
+        words, fmt, inbuf = parsed
+        try:
+            valid = ceph_argparse.validate_command(self.sigdict, words)
+        except Exception as e:
+            raise AgentFallback(f"invalid command: {e}") from e
+        if not valid:
+            # 오류 메시지는 CLI 가 만들도록 넘김
+            raise AgentFallback('invalid command')
+        if fmt:
+            valid['format'] = fmt
+        ret, outbuf, outs = ceph_argparse.json_command(self.cluster, argdict=valid, inbuf=inbuf,
+                                                       timeout=self.timeout)
+        return cli_result(ret, outbuf, outs)
+
+    def mon_command(self, cmd, inbuf=''):
+        ret, outbuf, outs = self.cluster.mon_command(json.dumps(cmd), inbuf.encode('utf-8'), timeout=self.timeout)
+        return ret, outbuf.decode('utf-8', 'replace'), outs
+
+    def close(self):
+        self.cluster.shutdown()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """연결 하나에서 줄 단위 JSON 요청을 차례로 처리"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if response.get('stopping'):
+                return
+
+
+class AgentServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """백엔드 하나를 공유하는 스레드형 UNIX 소켓 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, path, backend, clock=time.monotonic):
+        self.backend = backend
+        self.clock = clock
+        self.started = clock()
+        self.last_request = self.started
+        self.requests = 0
+        self.errors = 0
+        self.fallbacks = 0
+        self.stopping = threading.Event()
+        self._lock = threading.Lock()
+        super().__init__(path, _Handler)
+
+    def stats(self):
+        return {'pid': os.getpid(), 'method': self.backend.method, 'requests': self.requests, 'errors': self.errors,
+                'fallbacks': self.fallbacks, 'uptime': round(self.clock() - self.started, 3)}
+
+    def dispatch(self, line):
+        with self._lock:
+            self.requests += 1
+            self.last_request = self.clock()
+        try:
+            request = json.loads(line)
+            op = request.get('op')
+            if op == 'command':
+                rc, out, err = self.backend.command(request['args'], request.get('data'))
+                return {'rc': rc, 'out': out, 'err': err}
+            if op == 'mon_command':
+                ret, out, err = self.backend.mon_command(request['cmd'], request.get('inbuf') or '')
+                return {'rc': ret, 'out': out, 'err': err}
+            if op in ('ping', 'stats'):
+                return self.stats()
+            if op == 'shutdown':
+                self.stopping.set()
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return dict(self.stats(), stopping=True)
+            raise ValueError(f"unknown op: {op}")
+        except AgentFallback as e:
+            with self._lock:
+                self.fallbacks += 1
+            return {'fallback': str(e)}
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            return {'error': str(e)}
+
+    def watch_idle(self, idle_timeout, interval=1.0):
+        """idle_timeout 초 동안 요청이 없으면 서버 종료 (플레이가 끝난 뒤 남지 않도록)"""
+        while not self.stopping.wait(min(interval, idle_timeout)):
+            if self.clock() - self.last_request >= idle_timeout:
+                self.stopping.set()
+                self.shutdown()
+
+
+def serve(path, backend, idle_timeout=900, ready=None):
+    """소켓을 열고 종료 요청 또는 유휴 시간 초과까지 요청 처리"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)
+    old_umask = os.umask(0o177)
+    try:
+        server = AgentServer(path, backend)
+    finally:
+        os.umask(old_umask)
+    inode = os.stat(path).st_ino
+    try:
+        if idle_timeout:
+            threading.Thread(target=server.watch_idle, args=(idle_timeout,), daemon=True).start()
+        if ready:
+            ready()
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        # 종료 중에 새 에이전트가 같은 경로에 소켓을 만들었으면 지우지 않음
+        try:
+            if os.stat(path).st_ino == inode:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        backend.close()
+
+
+def spawn_agent(path, backend_factory, idle_timeout=900, timeout=30):
+    """이중 fork 로 에이전트 데몬을 시작하고 준비될 때까지 대기. 데몬 pid 반환
+
+    백엔드(librados 연결)는 fork 이후 데몬 안에서 만들고, 연결 실패는 파이프로
+    전달받아 RuntimeError 로 다시 던집니다.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            os.setsid()
+            if os.fork() != 0:
+                os._exit(0)
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            os.chdir('/')
+
+            def ready():
+                os.write(write_fd, f"ok {os.getpid()}\n".encode())
+                os.close(write_fd)
+
+            try:
+                backend = backend_factory()
+            except Exception as e:
+                os.write(write_fd, f"error {e}\n".encode())
+                os._exit(1)
+            serve(path, backend, idle_timeout, ready)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    deadline = time.monotonic() + timeout
+    message = b''
+    with os.fdopen(read_fd, 'rb') as pipe:
+        os.set_blocking(pipe.fileno(), False)
+        while not message.endswith(b'\n') and time.monotonic() < deadline:
+            chunk = pipe.read()
+            if chunk == b'':
+                break
+            message += chunk or b''
+            time.sleep(0.02)
+    status, _, detail = message.decode().strip().partition(' ')
+    if status != 'ok':
+        raise RuntimeError(detail or 'agent did not start in time')
+    return int(detail)
+
+
+class AgentClient:
+    """에이전트 UNIX 소켓 클라이언트 (스레드마다 연결 하나를 유지)"""
+
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sockets = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise AgentUnavailable(f"cannot connect to {self.path}: {e}") from e
+        conn = (sock, sock.makefile('rb'))
+        with self._lock:
+            self._sockets.append(sock)
+        return conn
+
+    def request(self, payload):
+        """요청 1개 전송 후 응답 반환. 끊긴 연결은 한 번 다시 연결해서 재시도"""
+        line = json.dumps(payload).encode('utf-8') + b'\n'
+        for _ in range(2):
+            conn = getattr(self._local, 'conn', None)
+            if conn is None:
+                conn = self._local.conn = self._connect()
+            sock, reader = conn
+            try:
+                sock.sendall(line)
+                response = reader.readline()
+                if response:
+                    return json.loads(response)
+            except OSError:
+                pass
+            self._local.conn = None
+            sock.close()
+        raise AgentUnavailable(f"connection to {self.path} lost")
+
+    def command(self, args, data=None):
+        """ceph CLI 인자(실행 파일 제외) -> (rc, stdout, stderr)"""
+        args, data = read_in_file(args, data)
+        response = self.request({'op': 'command', 'args': args, 'data': data})
+        if 'fallback' in response:
+            raise AgentFallback(response['fallback'])
+        if 'error' in response:
+            raise AgentFallback(response['error'])
+        return response['rc'], response['out'], response['err']
+
+    def mon_command(self, cmd, inbuf=''):
+        """mon_command 형식 dict -> (ret, outbuf, outs)"""
+        response = self.request({'op': 'mon_command', 'cmd': cmd, 'inbuf': inbuf})
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['rc'], response['out'], response['err']
+
+    def ping(self):
+        return self.request({'op': 'ping'})
+
+    def shutdown(self):
+        return self.request({'op': 'shutdown'})
+
+    def close(self):
+        with self._lock:
+            sockets, self._sockets = self._sockets, []
+        for sock in sockets:
+            sock.close()
+        self._local = threading.local()
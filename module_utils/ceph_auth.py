@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Ceph 인증(auth) 엔티티 공통 헬퍼
+
+`ceph auth ls --format json` 한 번의 결과를 entity -> {key, caps} dict 로 만들고,
+원하는 caps 와의 차이(drift)와 cap 종류별 검증 결과를 계산합니다. caps 문자열은
+Ceph 가 입력 그대로 저장하므로 공백/쉼표 표기 차이는 비교 전에 정규화합니다.
+"""
+
+import re
+
+CAP_TYPES = ('mon', 'osd', 'mgr', 'mds')
+ENTITY_TYPES = ('client', 'mon', 'osd', 'mgr', 'mds')
+
+_SPACES_RE = re.compile(r'\s+')
+_COMMA_RE = re.compile(r'\s*,\s*')
+
+
+def entity_name(name):
+    """'csi-rbd-user' -> 'client.csi-rbd-user' (이미 타입 접두어가 있으면 그대로)"""
+    return name if name.split('.', 1)[0] in ENTITY_TYPES and '.' in name else f"client.{name}"
+
+
+def normalize_cap(value):
+    """caps 문자열 비교용 정규화 ('profile rbd,  allow r' -> 'profile rbd, allow r')"""
+    return _COMMA_RE.sub(', ', _SPACES_RE.sub(' ', str(value).strip()))
+
+
+def normalize_caps(caps):
+    """빈 값을 제외하고 정규화된 {cap 종류: 문자열} 반환"""
+    return {t: normalize_cap(v) for t, v in (caps or {}).items() if v not in (None, '')}
+
+
+def auth_index(dump):
+    """`ceph auth ls` JSON -> {entity: {'key', 'caps'}}"""
+    entries = dump.get('auth_dump', []) if isinstance(dump, dict) else dump or []
+    return {e['entity']: {'key': e.get('key'), 'caps': e.get('caps') or {}} for e in entries}
+
+
+def caps_drift(desired, actual):
+    """원하는 caps 와 실제 caps 의 차이 {cap 종류: {'expected', 'actual'}} (같으면 빈 dict)"""
+    want, have = normalize_caps(desired), normalize_caps(actual)
+    return {
+        cap: {'expected': want.get(cap), 'actual': have.get(cap)}
+        for cap in sorted(set(want) | set(have))
+        if want.get(cap) != have.get(cap)
+    }
+
+
+def caps_report(desired, actual):
+    """cap 종류별 {'expected', 'actual', 'match'} (정규화 후 완전 일치 비교, 지정하지 않은 cap 도 포함)"""
+    want, have = normalize_caps(desired), normalize_caps(actual)
+    ordered = [t for t in CAP_TYPES if t in want or t in have] + sorted((set(want) | set(have)) - set(CAP_TYPES))
+    return {cap: {'expected': want.get(cap), 'actual': have.get(cap), 'match': want.get(cap) == have.get(cap)}
+            for cap in ordered}
+
+
+def caps_args(caps):
+    """caps dict -> ceph auth 명령 인자 ['mon', '...', 'osd', '...'] (mon/osd/mgr/mds 순서)"""
+    ordered = [t for t in CAP_TYPES if t in caps] + sorted(t for t in caps if t not in CAP_TYPES)
+    args = []
+    for cap in ordered:
+        if caps[cap] not in (None, ''):
+            args.extend([cap, str(caps[cap])])
+    return args
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Ceph / RGW CLI 호출 공통 헬퍼
+
+library/ 의 커스텀 모듈들이 `ceph`, `radosgw-admin`, `rbd` 명령을 실행하고
+JSON 출력을 해석할 때 사용합니다. 실행 함수는 AnsibleModule.run_command 와
+같은 시그니처(args 리스트 -> (rc, stdout, stderr))를 가지므로 모듈 밖
+(벤치마크, 테스트)에서도 subprocess 기반 함수로 대체할 수 있습니다.
+
+`ceph` 실행 파일은 관리 호스트에 ceph_agent 가 실행 중이면 프로세스를 새로 띄우지
+않고 에이전트의 librados 연결로 실행합니다 (module_utils/ceph_agent.py).
+"""
+
+import json
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.ceph_agent import AgentFallback, AgentUnavailable, default_agent
+
+
+class CephCommandError(Exception):
+    """CLI 명령이 0이 아닌 코드로 종료되었거나 JSON 해석에 실패한 경우"""
+
+    def __init__(self, cmd, rc, stdout='', stderr=''):
+        self.cmd = cmd
+        self.rc = rc
+        self.stdout = stdout
+        self.stderr = stderr
+        super().__init__(f"{' '.join(cmd)} failed (rc={rc}): {stderr.strip() or stdout.strip()}")
+
+
+_WS_RE = re.compile(r'\s*')
+
+
+def iter_json_array(text):
+    """JSON 배열 문자열의 항목을 하나씩 해석해서 생성 (전체 리스트를 만들지 않음)"""
+    decoder = json.JSONDecoder()
+    pos = _WS_RE.match(text).end()
+    if not text.startswith('[', pos):
+        if pos == len(text):
+            return
+        raise ValueError(f"expected a JSON array at position {pos}")
+    pos = _WS_RE.match(text, pos + 1).end()
+    if text.startswith(']', pos):
+        return
+    while True:
+        item, pos = decoder.raw_decode(text, pos)
+        yield item
+        pos = _WS_RE.match(text, pos).end()
+        if text.startswith(',', pos):
+            pos = _WS_RE.match(text, pos + 1).end()
+        elif text.startswith(']', pos):
+            return
+        else:
+            raise ValueError(f"expected ',' or ']' at position {pos}")
+
+
+def subprocess_runner(args, check_rc=False, data=None):
+    """AnsibleModule 없이 사용할 수 있는 run_command 호환 실행 함수"""
+    proc = subprocess.run(args, input=data, capture_output=True, text=True)
+    return proc.returncode, proc.stdout, proc.stderr
+
+
+class CephCLI:
+    """단일 CLI 실행 파일(ceph, radosgw-admin, rbd)에 대한 래퍼
+
+    agent 를 생략하면 `ceph` 에 대해 실행 중인 에이전트를 찾아 사용하고, False 면
+    항상 CLI 를 실행합니다. 에이전트에 연결할 수 없으면 이후 명령은 CLI 로 실행합니다.
+    """
+
+    def __init__(self, run_command, executable='ceph', json_args=('--format', 'json'), agent=None):
+        self.run_command = run_command
+        self.executable = executable
+        self.json_args = list(json_args)
+        self.agent = default_agent(executable) if agent is None else (agent or None)
+        self.calls = 0
+        self.agent_calls = 0
+
+    def _run_agent(self, args, data):
+        """에이전트로 실행. 에이전트가 처리하지 못하면 None"""
+        try:
+            result = self.agent.command(args, data)
+        except AgentFallback:
+            return None
+        except AgentUnavailable:
+            self.agent = None
+            return None
+        self.agent_calls += 1
+        return result
+
+    def run(self, args, check=True, data=None):
+        """명령 실행 후 (rc, stdout, stderr) 반환"""
+        cmd = [self.executable] + list(args)
+        self.calls += 1
+        result = self._run_agent(list(args), data) if self.agent is not None else None
+        rc, out, err = result or self.run_command(cmd, check_rc=False, data=data)
+        if check and rc != 0:
+            raise CephCommandError(cmd, rc, out, err)
+        return rc, out, err
+
+    def run_json(self, args, check=True, data=None):
+        """명령 실행 후 stdout 을 JSON 으로 해석해서 반환"""
+        cmd = list(args) + self.json_args
+        rc, out, err = self.run(cmd, check=check, data=data)
+        if not out.strip():
+            return None
+        try:
+            return json.loads(out)
+        except ValueError:
+            raise CephCommandError([self.executable] + cmd, rc, out, 'invalid JSON output') from None
+
+    def iter_json(self, args, check=True, data=None):
+        """명령 실행 후 stdout 의 JSON 배열 항목을 하나씩 해석해서 생성 (대량 목록용)"""
+        cmd = list(args) + self.json_args
+        rc, out, err = self.run(cmd, check=check, data=data)
+        try:
+            yield from iter_json_array(out)
+        except ValueError:
+            raise CephCommandError([self.executable] + cmd, rc, out, 'invalid JSON output') from None
+
+
+def run_parallel(func, items, workers=8):
+    """items 각각에 func 를 병렬 적용하고 입력 순서대로 (item, result, error) 반환"""
+    items = list(items)
+    if not items:
+        return []
+
+    def _call(item):
+        try:
+            return item, func(item), None
+        except Exception as e:  # 개별 실패는 호출자가 집계
+            return item, None, e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as pool:
+        return list(pool.map(_call, items))
+
+
+def poll_until(probe, timeout, min_interval=0.5, max_interval=10.0, backoff=1.5, key=None,
+               clock=time.monotonic, sleep=time.sleep):
+    """probe() -> (done, state) 를 done 이 될 때까지 적응형 백오프로 반복 호출
+
+    상태가 그대로면 간격을 backoff 배씩 max_interval 까지 늘리고, 상태가 바뀌면
+    min_interval 로 되돌립니다. key(state) 로 비교할 부분을 지정할 수 있습니다.
+    (done, 마지막 state, 폴링 횟수, 경과 시간, [(경과 시간, state), ...] 변화 기록) 반환
+    """
+    key = key or (lambda state: state)
+    start = clock()
+    interval = min_interval
+    timeline, last, polls = [], object(), 0
+    while True:
+        done, state = probe()
+        polls += 1
+        elapsed = clock() - start
+        if key(state) != last:
+            timeline.append((elapsed, state))
+            last = key(state)
+            interval = min_interval
+        else:
+            interval = min(interval * backoff, max_interval)
+        if done or elapsed >= timeout:
+            return done, state, polls, clock() - start, timeline
+        sleep(min(interval, max(0.0, timeout - elapsed)))
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Ceph 클러스터 상태 스냅샷 헬퍼
+
+`ceph status --format json` 출력 하나를 헬스 체크, OSD up/in, MON 쿼럼, PG 상태를
+담은 dict 로 정리합니다. 텍스트 출력(`ceph osd stat` 등)을 정규식으로 해석하지
+않으므로 Ceph 버전별 출력 형식 차이에 영향을 받지 않습니다.
+
+python3-rados 가 설치된 호스트에서는 CLI 프로세스 대신 librados 의 mon_command 로
+같은 JSON 을 직접 가져올 수 있습니다.
+"""
+
+import json
+import traceback
+
+try:
+    import rados
+
+    HAS_RADOS = True
+    RADOS_IMPORT_ERROR = None
+except ImportError:
+    HAS_RADOS = False
+    RADOS_IMPORT_ERROR = traceback.format_exc()
+
+HEALTH_ORDER = ('HEALTH_OK', 'HEALTH_WARN', 'HEALTH_ERR')
+
+
+def _osd_section(status):
+    osdmap = status.get('osdmap') or {}
+    # Nautilus 이전 버전은 osdmap.osdmap 아래에 값이 중첩됨
+    osdmap = osdmap.get('osdmap', osdmap)
+    total = osdmap.get('num_osds', 0)
+    up = osdmap.get('num_up_osds', 0)
+    in_ = osdmap.get('num_in_osds', 0)
+    return {
+        'total': total,
+        'up': up,
+        'in': in_,
+        'down': total - up,
+        'out': total - in_,
+        'all_up': up == total,
+        'all_in': in_ == total,
+        'remapped_pgs': osdmap.get('num_remapped_pgs', 0),
+    }
+
+
+def _mon_section(status):
+    quorum = status.get('quorum_names') or []
+    total = (status.get('monmap') or {}).get('num_mons')
+    if total is None:
+        total = len((status.get('monmap') or {}).get('mons') or []) or len(quorum)
+    return {
+        'total': total,
+        'quorum': quorum,
+        'quorum_size': len(quorum),
+        'out_of_quorum': total - len(quorum),
+        'has_quorum': len(quorum) > total // 2,
+    }
+
+
+def _pg_section(status):
+    pgmap = status.get('pgmap') or {}
+    states = {s['state_name']: s['count'] for s in pgmap.get('pgs_by_state') or []}
+    total = pgmap.get('num_pgs', sum(states.values()))
+    active_clean = sum(c for s, c in states.items() if set(s.split('+')) == {'active', 'clean'})
+    return {
+        'total': total,
+        'states': states,
+        'active_clean': active_clean,
+        'all_active_clean': active_clean == total,
+        'inactive': sum(c for s, c in states.items() if 'active' not in s.split('+')),
+    }
+
+
+def parse_status(status):
+    """`ceph status --format json` dict 를 헬스 스냅샷 dict 로 변환"""
+    health = status.get('health') or {}
+    level = health.get('status') or health.get('overall_status') or 'HEALTH_ERR'
+    checks = {}
+    for name, check in (health.get('checks') or {}).items():
+        summary = check.get('summary') or {}
+        checks[name] = {
+            'severity': check.get('severity'),
+            'message': summary.get('message', ''),
+            'count': summary.get('count', 0),
+            'muted': bool(check.get('muted', False)),
+        }
+    pgmap = status.get('pgmap') or {}
+    mgrmap = status.get('mgrmap') or {}
+    return {
+        'fsid': status.get('fsid'),
+        'status': level,
+        'healthy': level == 'HEALTH_OK',
+        'checks': checks,
+        'osd': _osd_section(status),
+        'mon': _mon_section(status),
+        'pg': _pg_section(status),
+        'mgr': {
+            'available': bool(mgrmap.get('available', False)),
+            'standbys': mgrmap.get('num_standbys', len(mgrmap.get('standbys') or [])),
+        },
+        'usage': {
+            'pools': pgmap.get('num_pools', 0),
+            'objects': pgmap.get('num_objects', 0),
+            'data_bytes': pgmap.get('data_bytes', 0),
+            'bytes_used': pgmap.get('bytes_used', 0),
+            'bytes_avail': pgmap.get('bytes_avail', 0),
+            'bytes_total': pgmap.get('bytes_total', 0),
+        },
+    }
+
+
+def health_within(level, worst='HEALTH_WARN'):
+    """level 이 worst 보다 나쁘지 않은지 (HEALTH_OK < HEALTH_WARN < HEALTH_ERR)"""
+    rank = {name: i for i, name in enumerate(HEALTH_ORDER)}
+    return rank.get(level, len(HEALTH_ORDER)) <= rank.get(worst, 0)
+
+
+def rados_status(conffile='/etc/ceph/ceph.conf', client='client.admin', timeout=10):
+    """librados mon_command 로 `status` JSON 조회 (실패 시 RuntimeError)"""
+    cluster = rados.Rados(conffile=conffile, name=client)
+    cluster.connect(timeout=timeout)
+    try:
+        ret, out, err = cluster.mon_command(json.dumps({'prefix': 'status', 'format': 'json'}), b'',
+                                            timeout=timeout)
+    finally:
+        cluster.shutdown()
+    if ret != 0:
+        raise RuntimeError(f"mon_command status failed (rc={ret}): {err}")
+    return json.loads(out)
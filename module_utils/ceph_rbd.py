@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+RBD 이미지/스냅샷 인벤토리 헬퍼
+
+풀마다 이미지와 스냅샷을 한 번에 열거합니다. python3-rbd / python3-rados 가 있으면
+librados 연결 하나로 풀별 ioctx 를 열어 조회하고, 없으면 `rbd ls -l --format json`
+한 번으로 이미지와 스냅샷을 함께 가져옵니다. 두 방식 모두 같은 형태의 dict 를
+반환하므로 호출하는 쪽은 조회 방식을 신경 쓰지 않아도 됩니다.
+
+풀 초기화, 이미지 생성, 스냅샷 생성/삭제와 이미지 메타데이터 조회도 같은 백엔드
+인터페이스로 제공합니다.
+"""
+
+import json
+import math
+import re
+import time
+import traceback
+
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, run_parallel
+
+try:
+    import rados
+    import rbd
+
+    HAS_RBD = True
+    RBD_IMPORT_ERROR = None
+except ImportError:
+    HAS_RBD = False
+    RBD_IMPORT_ERROR = traceback.format_exc()
+
+# `rbd snap ls` 텍스트/JSON 출력의 시각 형식 (예: 'Thu Mar 14 10:01:02 2024')
+CLI_TIME_FORMAT = '%a %b %d %H:%M:%S %Y'
+ISO_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# rbd CLI 와 같은 2진 단위 (--size 20G == 20 GiB)
+SIZE_UNITS = {'': 1024 ** 2, 'b': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4, 'p': 1024 ** 5}
+# --image-feature 이름 -> python-rbd 상수 이름
+FEATURE_CONSTANTS = {
+    'layering': 'RBD_FEATURE_LAYERING',
+    'striping': 'RBD_FEATURE_STRIPINGV2',
+    'exclusive-lock': 'RBD_FEATURE_EXCLUSIVE_LOCK',
+    'object-map': 'RBD_FEATURE_OBJECT_MAP',
+    'fast-diff': 'RBD_FEATURE_FAST_DIFF',
+    'deep-flatten': 'RBD_FEATURE_DEEP_FLATTEN',
+    'journaling': 'RBD_FEATURE_JOURNALING',
+    'data-pool': 'RBD_FEATURE_DATA_POOL',
+}
+
+
+def _bool(value):
+    """rbd JSON 의 'true'/'false' 문자열 또는 bool -> bool"""
+    return value is True or str(value).lower() == 'true'
+
+
+def snap_timestamp(value):
+    """CLI 시각 문자열 -> ISO 8601 문자열 (해석할 수 없으면 그대로)"""
+    if not value:
+        return None
+    try:
+        return time.strftime(ISO_TIME_FORMAT, time.strptime(value.strip(), CLI_TIME_FORMAT))
+    except ValueError:
+        return value
+
+
+def size_bytes(value, default_unit=''):
+    """'20G' / '4M' / 1024 -> 바이트
+
+    단위가 없으면 rbd CLI 처럼 MiB 로 읽습니다. `--object-size` 처럼 CLI 가 바이트로 읽는
+    값은 default_unit='b' 로 넘깁니다.
+    """
+    match = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([bkmgtp]?)(?:i?b)?\s*$', str(value).lower())
+    if not match:
+        raise ValueError(f"invalid size: {value}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2) or default_unit])
+
+
+def create_args(spec, image):
+    """이미지 정의 -> `rbd create` 인자 목록"""
+    args = ['create', spec, '--size', str(image['size'])]
+    if image.get('image_format') is not None:
+        args += ['--image-format', str(image['image_format'])]
+    if image.get('object_size') is not None:
+        args += ['--object-size', str(image['object_size'])]
+    for feature in image.get('image_features') or []:
+        args += ['--image-feature', feature]
+    return args
+
+
+def rbd_pools(pool_detail):
+    """`ceph osd pool ls detail --format json` -> rbd 애플리케이션이 켜진 풀 이름 목록"""
+    return [p['pool_name'] for p in pool_detail or [] if 'rbd' in (p.get('application_metadata') or {})]
+
+
+def parse_ls_long(entries):
+    """`rbd ls -l --format json` 출력 -> 이미지 목록 (스냅샷 항목은 이미지 아래로 모음)"""
+    images = {}
+    for entry in entries or []:
+        name = entry.get('image')
+        if name is None:
+            continue
+        image = images.setdefault(name, {'name': name, 'size': None, 'format': None, 'snapshots': []})
+        if 'snapshot' in entry:
+            image['snapshots'].append({
+                'name': entry['snapshot'],
+                'id': entry.get('snapshot_id'),
+                'size': entry.get('size'),
+                'protected': _bool(entry.get('protected')),
+                'timestamp': None,
+            })
+        else:
+            image.update(size=entry.get('size'), format=entry.get('format'))
+    return list(images.values())
+
+
+def parse_snap_ls(entries):
+    """`rbd snap ls --format json` 출력 -> 스냅샷 목록"""
+    return [{
+        'name': s['name'],
+        'id': s.get('id'),
+        'size': s.get('size'),
+        'protected': _bool(s.get('protected')),
+        'timestamp': snap_timestamp(s.get('timestamp')),
+    } for s in entries or []]
+
+
+class CLIBackend:
+    """rbd CLI 백엔드 (풀 하나의 이미지+스냅샷은 `rbd ls -l` 1회)"""
+
+    method = 'cli'
+
+    def __init__(self, ceph_cli, rbd_cli):
+        self.ceph = ceph_cli
+        self.rbd = rbd_cli
+
+    def pools(self):
+        return rbd_pools(self.ceph.run_json(['osd', 'pool', 'ls', 'detail']))
+
+    def images(self, pool, names=None, timestamps=False):
+        images = parse_ls_long(self.rbd.run_json(['ls', '-l', '-p', pool]))
+        if names is not None:
+            images = [i for i in images if i['name'] in names]
+        if timestamps:
+            # ls -l 에는 생성 시각이 없으므로 스냅샷이 있는 이미지만 추가 조회
+            for image in images:
+                if image['snapshots']:
+                    image['snapshots'] = parse_snap_ls(
+                        self.rbd.run_json(['snap', 'ls', f"{pool}/{image['name']}"]))
+        return images
+
+    def metadata(self, pool, image):
+        return self.rbd.run_json(['image-meta', 'list', f"{pool}/{image}"]) or {}
+
+    def init_pool(self, pool):
+        self.rbd.run(['pool', 'init', pool])
+
+    def create_image(self, pool, image):
+        self.rbd.run(create_args(f"{pool}/{image['image_name']}", image))
+
+    def create_snap(self, pool, image, name):
+        self.rbd.run(['snap', 'create', f"{pool}/{image}@{name}"])
+
+    def remove_snaps(self, pool, image, names):
+        for name in names:
+            self.rbd.run(['snap', 'rm', f"{pool}/{image}@{name}"])
+
+    def close(self):
+        pass
+
+
+class RadosBackend:
+    """librados 연결 하나로 풀별 ioctx 를 열어 조회 (스레드 간 연결 공유)"""
+
+    method = 'librados'
+
+    def __init__(self, conffile='/etc/ceph/ceph.conf', client='client.admin', timeout=10):
+        self.cluster = rados.Rados(conffile=conffile, name=client)
+        self.cluster.connect(timeout=timeout)
+        self.timeout = timeout
+
+    def pools(self):
+        cmd = json.dumps({'prefix': 'osd pool ls', 'detail': 'detail', 'format': 'json'})
+        ret, out, err = self.cluster.mon_command(cmd, b'', timeout=self.timeout)
+        if ret != 0:
+            raise RuntimeError(f"mon_command osd pool ls failed (rc={ret}): {err}")
+        return rbd_pools(json.loads(out))
+
+    def _image(self, ioctx, name, timestamps):
+        with rbd.Image(ioctx, name, read_only=True) as image:
+            snapshots = []
+            for snap in image.list_snaps():
+                stamp = image.get_snap_timestamp(snap['id']) if timestamps else None
+                snapshots.append({
+                    'name': snap['name'],
+                    'id': snap['id'],
+                    'size': snap['size'],
+                    'protected': image.is_protected_snap(snap['name']),
+                    'timestamp': stamp.strftime(ISO_TIME_FORMAT) if stamp else None,
+                })
+            return {'name': name, 'size': image.size(), 'format': 1 if image.old_format() else 2,
+                    'snapshots': snapshots}
+
+    def images(self, pool, names=None, timestamps=False):
+        with self.cluster.open_ioctx(pool) as ioctx:
+            listed = rbd.RBD().list(ioctx)
+            return [self._image(ioctx, name, timestamps) for name in listed if names is None or name in names]
+
+    def metadata(self, pool, image):
+        with self.cluster.open_ioctx(pool) as ioctx, rbd.Image(ioctx, image, read_only=True) as img:
+            return dict(img.metadata_list())
+
+    def init_pool(self, pool):
+        with self.cluster.open_ioctx(pool) as ioctx:
+            rbd.RBD().pool_init(ioctx, False)
+
+    def create_image(self, pool, image):
+        kwargs = {'old_format': str(image.get('image_format', 2)) == '1'}
+        if image.get('object_size') is not None:
+            kwargs['order'] = int(math.log2(size_bytes(image['object_size'], 'b')))
+        if image.get('image_features'):
+            kwargs['features'] = sum(getattr(rbd, FEATURE_CONSTANTS[f]) for f in image['image_features'])
+        with self.cluster.open_ioctx(pool) as ioctx:
+            rbd.RBD().create(ioctx, image['image_name'], size_bytes(image['size']), **kwargs)
+
+    def create_snap(self, pool, image, name):
+        with self.cluster.open_ioctx(pool) as ioctx, rbd.Image(ioctx, image) as img:
+            img.create_snap(name)
+
+    def remove_snaps(self, pool, image, names):
+        # 이미지를 한 번만 열고 스냅샷을 차례로 삭제
+        with self.cluster.open_ioctx(pool) as ioctx, rbd.Image(ioctx, image) as img:
+            for name in names:
+                img.remove_snap(name)
+
+    def close(self):
+        self.cluster.shutdown()
+
+
+def open_backend(run_command, method='auto', ceph='ceph', rbd_exe='rbd', conffile='/etc/ceph/ceph.conf',
+                 client='client.admin', timeout=10, warn=None):
+    """method 에 맞는 백엔드 생성. auto 는 librados 연결 실패 시 CLI 로 대체 (warn 으로 알림)"""
+    if method == 'librados' or (method == 'auto' and HAS_RBD):
+        try:
+            return RadosBackend(conffile, client, timeout)
+        except Exception as e:
+            if method == 'librados':
+                raise RuntimeError(f"librados connection failed: {e}") from e
+            if warn:
+                warn(f"librados connection failed, falling back to the rbd CLI: {e}")
+    return CLIBackend(CephCLI(run_command, ceph), CephCLI(run_command, rbd_exe))
+
+
+def error_message(error):
+    """백엔드 예외 -> 결과에 기록할 메시지"""
+    return error.stderr.strip() if isinstance(error, CephCommandError) else str(error)
+
+
+def scan_pools(backend, pools, names_for=None, timestamps=False, workers=4):
+    """풀별 이미지 조회를 병렬 실행. ({pool: [이미지]}, {pool: 오류 메시지}) 반환"""
+    names_for = names_for or (lambda pool: None)
+    listed, errors = {}, {}
+    scans = run_parallel(lambda p: backend.images(p, names_for(p), timestamps), list(dict.fromkeys(pools)), workers)
+    for pool, found, error in scans:
+        if error is not None:
+            errors[pool] = error_message(error)
+        else:
+            listed[pool] = found
+    return listed, errors
+
+
+def summarize(pools):
+    """{pool: [이미지]} -> 풀별/전체 집계가 포함된 인벤토리 dict"""
+    inventory = {'pools': {}, 'images': [], 'totals': {'pools': 0, 'images': 0, 'snapshots': 0, 'protected': 0}}
+    for pool, images in pools.items():
+        snaps = [s for i in images for s in i['snapshots']]
+        inventory['pools'][pool] = {
+            'images': len(images),
+            'snapshots': len(snaps),
+            'protected': sum(1 for s in snaps if s['protected']),
+            'provisioned_bytes': sum(i['size'] or 0 for i in images),
+        }
+        inventory['images'].extend(dict(image, pool=pool, spec=f"{pool}/{image['name']}") for image in images)
+        for key in ('images', 'snapshots', 'protected'):
+            inventory['totals'][key] += inventory['pools'][pool][key]
+    inventory['totals']['pools'] = len(pools)
+    return inventory
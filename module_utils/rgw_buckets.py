@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+RGW 버킷 쿼터/통계 공통 헬퍼
+
+ceph-vars.yml 의 버킷 정의(quota, max_objects)를 RGW 버킷 쿼터로 바꾸고,
+`radosgw-admin bucket stats` (버킷 지정 없이 전체) 출력을 버킷 이름 -> 요약 dict
+색인으로 만듭니다. CephCLI.iter_json 과 함께 쓰면 출력 배열을 항목 단위로 해석해서
+필요한 필드만 남기므로 수만 개 버킷에서도 전체 JSON 트리를 한꺼번에 들고 있지 않습니다.
+"""
+
+import re
+
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4, 'P': 1024 ** 5}
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGTP]?)(?:I?B)?\s*$', re.IGNORECASE)
+
+
+def parse_size(value):
+    """'80GB', '10G', '512MiB', 1024 형태의 크기를 바이트로 변환 (Ceph 관례대로 1024 단위)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, int):
+        return value
+    match = SIZE_RE.match(str(value))
+    if not match:
+        raise ValueError(f"invalid size: {value}")
+    number, unit = match.groups()
+    return int(float(number) * SIZE_UNITS[unit.upper()])
+
+
+def desired_quota(bucket):
+    """버킷 정의에서 목표 쿼터 계산 (쿼터 필드가 없으면 None)"""
+    max_size = parse_size(bucket.get('quota'))
+    max_objects = bucket.get('max_objects')
+    if max_size is None and max_objects is None:
+        return None
+    return {
+        'enabled': True,
+        'max_size': max_size if max_size is not None else -1,
+        'max_objects': int(max_objects) if max_objects is not None else -1,
+    }
+
+
+def current_quota(stats):
+    """bucket stats 항목의 bucket_quota 를 비교 가능한 형태로 정리"""
+    quota = (stats or {}).get('bucket_quota') or {}
+    return {
+        'enabled': bool(quota.get('enabled', False)),
+        'max_size': quota.get('max_size', -1),
+        'max_objects': quota.get('max_objects', -1),
+    }
+
+
+def bucket_summary(stats):
+    """bucket stats 항목 -> {'bucket', 'owner', 'bucket_quota', 'num_objects', 'size'}"""
+    usage = (stats.get('usage') or {}).get('rgw.main') or {}
+    return {
+        'bucket': stats.get('bucket'),
+        'owner': stats.get('owner'),
+        'bucket_quota': current_quota(stats),
+        'num_objects': usage.get('num_objects', 0),
+        'size': usage.get('size_actual', usage.get('size', 0)),
+    }
+
+
+def bucket_index(entries):
+    """`radosgw-admin bucket stats` 항목들(CephCLI.iter_json) -> {bucket 이름: bucket_summary}"""
+    index = {}
+    for stats in entries or []:
+        summary = bucket_summary(stats)
+        index[summary['bucket']] = summary
+    return index
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+RGW 사용자 자격 증명 CSV 파일 헬퍼
+
+rgw-users.yml 이 남기는 `ceph.rgw_user_creation_result_file` 을 읽고 쓰는 함수 모음입니다.
+읽기는 한 줄씩 스트리밍으로 처리하고, 쓰기는 같은 디렉토리의 임시 파일에 전체를
+기록한 뒤 rename 으로 교체하므로 중간에 중단되어도 기존 파일이 깨지지 않습니다.
+"""
+
+import csv
+import os
+import tempfile
+
+CSV_HEADER = ['User ID', 'Display Name', 'Email', 'Access Key', 'Secret Key']
+CSV_FIELDS = ['user_id', 'display_name', 'email', 'access_key', 'secret_key']
+
+
+def iter_credentials(path):
+    """CSV 파일에서 자격 증명 dict 를 한 행씩 생성 (헤더/빈 줄/형식이 다른 행은 건너뜀)"""
+    if not os.path.exists(path):
+        return
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) != len(CSV_FIELDS) or row == CSV_HEADER:
+                continue
+            row = [col.strip() for col in row]
+            if not row[0]:
+                continue
+            yield dict(zip(CSV_FIELDS, row))
+
+
+def load_credentials(path):
+    """user_id -> 자격 증명 dict (같은 user_id 가 여러 번 나오면 마지막 행 사용)"""
+    return {cred['user_id']: cred for cred in iter_credentials(path)}
+
+
+def normalize_users(users):
+    """ceph_rgw_users 결과(dict) 또는 리스트를 CSV 행 dict 리스트로 변환 (키 없는 사용자 제외)"""
+    if isinstance(users, dict):
+        users = users.values()
+    rows = []
+    for user in users or []:
+        if not user.get('user_id') or not user.get('access_key'):
+            continue
+        rows.append({field: str(user.get(field) or '') for field in CSV_FIELDS})
+    return rows
+
+
+def merge_credentials(path, users, mode=0o600, check_mode=False):
+    """users 를 user_id 기준으로 기존 CSV 에 병합하고 변경이 있을 때만 원자적으로 한 번 기록
+
+    반환값: {'changed', 'added', 'updated', 'total', 'credentials'}
+    """
+    existing = {}
+    raw_rows = 0
+    for cred in iter_credentials(path):
+        existing[cred['user_id']] = cred
+        raw_rows += 1
+
+    added, updated = [], []
+    merged = dict(existing)
+    for row in normalize_users(users):
+        current = merged.get(row['user_id'])
+        if current is None:
+            added.append(row['user_id'])
+        elif current != row:
+            updated.append(row['user_id'])
+        merged[row['user_id']] = row
+
+    # 중복 행 정리(기존 lineinfile 재실행으로 생긴 행)나 권한 변경도 변경으로 취급
+    changed = bool(added or updated) or raw_rows != len(existing) or not os.path.exists(path)
+    if os.path.exists(path) and (os.stat(path).st_mode & 0o777) != mode:
+        changed = True
+
+    if changed and not check_mode:
+        write_atomic(path, merged.values(), mode)
+
+    return {'changed': changed, 'added': added, 'updated': updated, 'total': len(merged), 'credentials': merged}
+
+
+def write_atomic(path, rows, mode=0o600):
+    """임시 파일에 CSV 를 기록하고 fsync 후 rename 으로 교체"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.rgw-credentials-', suffix='.tmp', dir=directory)
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(CSV_HEADER)
+            writer.writerows([row[field] for field in CSV_FIELDS] for row in rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+RGW S3 클라이언트 공통 헬퍼
+
+S3ClientPool 은 자격 증명(access/secret key) 쌍마다 boto3 클라이언트를 한 번만 만들어
+재사용합니다. 클라이언트는 모두 풀의 boto3 세션 하나에서 만들고, boto3 클라이언트는
+스레드 간 공유가 가능하므로 같은 사용자의 여러 버킷 작업이 하나의 커넥션 풀을 함께
+사용합니다.
+
+S3EndpointClient 는 엔드포인트당 클라이언트(커넥션 풀) 하나만 두고, 요청하는 스레드마다
+사용할 자격 증명만 바꿉니다. 사용자가 많아도 클라이언트와 커넥션 풀은 하나입니다.
+
+두 방식 모두 요청은 프로세스 안에서 SigV4 로 서명하며, 지연 시간 통계 함수도 함께
+제공합니다.
+"""
+
+import math
+import threading
+import traceback
+
+try:
+    import boto3
+    import botocore.session
+    from botocore.config import Config
+    from botocore.credentials import CredentialProvider, Credentials, ReadOnlyCredentials
+
+    HAS_BOTO3 = True
+    BOTO3_IMPORT_ERROR = None
+except ImportError:
+    # 아래 클래스 정의가 import 단계에서 실패하지 않도록 하는 자리표시자
+    CredentialProvider = Credentials = object
+    HAS_BOTO3 = False
+    BOTO3_IMPORT_ERROR = traceback.format_exc()
+
+
+def s3_config(max_connections):
+    return Config(
+        signature_version='s3v4',
+        max_pool_connections=max_connections,
+        s3={'addressing_style': 'path'},
+        retries={'max_attempts': 2, 'mode': 'standard'},
+    )
+
+
+class S3ClientPool:
+    """(access_key, secret_key) 별 boto3 S3 클라이언트 캐시"""
+
+    def __init__(self, endpoint_url, region='default', validate_certs=True, max_connections=10):
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.validate_certs = validate_certs
+        self.config = s3_config(max_connections)
+        # 세션 생성은 botocore 데이터를 다시 읽어 수백 ms 가 걸리므로 풀 전체에서 하나만 사용
+        self.session = boto3.session.Session()
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, access_key, secret_key):
+        key = (access_key, secret_key)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                # Session.client() 는 스레드 안전하지 않으므로 잠금 안에서 생성 (만든 클라이언트는 공유 가능)
+                client = self.session.client(
+                    's3',
+                    endpoint_url=self.endpoint_url,
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=self.region,
+                    verify=self.validate_certs,
+                    config=self.config,
+                )
+                self._clients[key] = client
+        return client
+
+    def __len__(self):
+        return len(self._clients)
+
+
+class ThreadCredentials(Credentials):
+    """서명하는 스레드가 use() 로 고른 자격 증명을 돌려주는 botocore 자격 증명"""
+
+    method = 'rgw-thread'
+
+    def __init__(self):
+        super().__init__('', '')
+        self._local = threading.local()
+
+    def use(self, access_key, secret_key):
+        self._local.frozen = ReadOnlyCredentials(access_key, secret_key, None)
+
+    def get_frozen_credentials(self):
+        return getattr(self._local, 'frozen', None)
+
+
+class _ThreadCredentialProvider(CredentialProvider):
+    METHOD = ThreadCredentials.method
+
+    def __init__(self, credentials):
+        super().__init__()
+        self.credentials = credentials
+
+    def load(self):
+        return self.credentials
+
+
+class S3EndpointClient:
+    """엔드포인트 하나에 boto3 클라이언트(커넥션 풀) 하나, 자격 증명은 요청마다 지정
+
+    get() 은 호출 스레드의 자격 증명을 바꾸고 공유 클라이언트를 돌려주므로, 한 스레드 안에서
+    get() 다음에 이어지는 요청이 그 자격 증명으로 서명됩니다. S3ClientPool 과 같은 인터페이스입니다.
+    """
+
+    def __init__(self, endpoint_url, region='default', validate_certs=True, max_connections=10):
+        self.endpoint_url = endpoint_url
+        self.credentials = ThreadCredentials()
+        core = botocore.session.Session()
+        core.get_component('credential_provider').providers.insert(0, _ThreadCredentialProvider(self.credentials))
+        self.session = boto3.session.Session(botocore_session=core)
+        self.client = self.session.client('s3', endpoint_url=endpoint_url, region_name=region,
+                                          verify=validate_certs, config=s3_config(max_connections))
+
+    def get(self, access_key, secret_key):
+        self.credentials.use(access_key, secret_key)
+        return self.client
+
+    def __len__(self):
+        return 1
+
+
+def percentiles(values, points=(50, 90, 95, 99)):
+    """nearest-rank 방식 백분위수 {'p50': ..., 'max': ...} 반환 (값이 없으면 빈 dict)"""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    stats = {f"p{p}": ordered[max(0, math.ceil(p / 100.0 * len(ordered)) - 1)] for p in points}
+    stats['max'] = ordered[-1]
+    stats['min'] = ordered[0]
+    return stats
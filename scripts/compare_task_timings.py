@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+task_timing 콜백 실행 기록 비교 도구
+
+callback_plugins/task_timing.py 가 남긴 두 JSON lines 파일(기준 실행, 새 실행)을
+태스크 키('플레이 | 태스크', 같은 이름이 반복되면 '#n')로 맞춰 비교합니다.
+
+- slowest:      새 실행에서 가장 오래 걸린 태스크 (모든 호스트의 첫 시작 ~ 마지막 종료)
+- regressions:  기준 대비 --min-delta 초 이상, --min-ratio 배 이상 느려진 태스크
+- loops:        --min-items 개 이상 항목을 도는 loop 태스크와 항목당 비용.
+                두 실행의 항목 수가 다르면 시간 증가 지수(log 시간비 / log 항목비)를 계산해
+                --scaling 이상이면 항목 수에 비례해 느려지는 loop 로 표시합니다.
+
+사용법:
+    python scripts/compare_task_timings.py base.jsonl new.jsonl [--top 10] [--json] [--fail-on-regression]
+"""
+
+import argparse
+import json
+import math
+import sys
+
+
+def load_run(path):
+    """JSON lines 파일 -> {'run': run 레코드, 'tasks': {task_key: 집계}}"""
+    run, hosts = {}, {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get('type') == 'run':
+                run = record
+            elif record.get('type') == 'task':
+                hosts.setdefault(record['task_key'], []).append(record)
+
+    tasks = {}
+    for key, records in hosts.items():
+        items = max(r.get('items') or 0 for r in records)
+        commands = [r['command_s'] for r in records if r.get('command_s') is not None]
+        tasks[key] = {
+            'action': records[0].get('action'),
+            'hosts': len(records),
+            'wall_s': max(r['end'] for r in records) - min(r['start'] for r in records),
+            'host_max_s': max(r['wall_s'] for r in records),
+            'command_s': max(commands) if commands else None,
+            'items': items,
+            'per_item_s': max(r['wall_s'] / r['items'] for r in records if r.get('items')) if items else None,
+        }
+    return {'run': run, 'tasks': tasks}
+
+
+def scaling_exponent(base, new):
+    """항목 수 대비 시간 증가 지수 (1 이면 항목 수에 선형, 계산할 수 없으면 None)"""
+    if not base or not base['items'] or not new['items'] or base['items'] == new['items']:
+        return None
+    if base['wall_s'] <= 0 or new['wall_s'] <= 0:
+        return None
+    return math.log(new['wall_s'] / base['wall_s']) / math.log(new['items'] / base['items'])
+
+
+def compare(base, new, top=10, min_delta=1.0, min_ratio=1.2, min_items=10, scaling=0.8):
+    base_tasks, new_tasks = base['tasks'], new['tasks']
+
+    def row(key):
+        current, previous = new_tasks[key], base_tasks.get(key)
+        entry = dict(current, task_key=key, base_wall_s=previous['wall_s'] if previous else None)
+        entry['delta_s'] = None if previous is None else current['wall_s'] - previous['wall_s']
+        return entry
+
+    slowest = [row(k) for k in sorted(new_tasks, key=lambda k: new_tasks[k]['wall_s'], reverse=True)[:top]]
+
+    regressions = []
+    for key in new_tasks.keys() & base_tasks.keys():
+        entry = row(key)
+        previous = base_tasks[key]['wall_s']
+        if entry['delta_s'] >= min_delta and (previous <= 0 or entry['wall_s'] / previous >= min_ratio):
+            regressions.append(entry)
+    regressions.sort(key=lambda e: e['delta_s'], reverse=True)
+
+    loops = []
+    for key, current in new_tasks.items():
+        if current['items'] < min_items:
+            continue
+        entry = row(key)
+        previous = base_tasks.get(key)
+        entry['base_items'] = previous['items'] if previous else None
+        entry['exponent'] = scaling_exponent(previous, current)
+        entry['scales_with_items'] = entry['exponent'] is not None and entry['exponent'] >= scaling
+        loops.append(entry)
+    loops.sort(key=lambda e: (e['scales_with_items'], e['wall_s']), reverse=True)
+
+    return {
+        'base': {'run_id': base['run'].get('run_id'), 'duration_s': base['run'].get('duration_s')},
+        'new': {'run_id': new['run'].get('run_id'), 'duration_s': new['run'].get('duration_s')},
+        'slowest': slowest,
+        'regressions': regressions,
+        'loops': loops,
+        'added': sorted(new_tasks.keys() - base_tasks.keys()),
+        'removed': sorted(base_tasks.keys() - new_tasks.keys()),
+    }
+
+
+def _seconds(value):
+    return '-' if value is None else f'{value:.2f}'
+
+
+def _table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    lines = ['  '.join(str(h).ljust(w) for h, w in zip(headers, widths))]
+    lines.append('-' * len(lines[0]))
+    lines += ['  '.join(str(c).ljust(w) for c, w in zip(r, widths)) for r in rows]
+    return '\n'.join(lines)
+
+
+def render(report):
+    out = [f"base {report['base']['run_id']} ({_seconds(report['base']['duration_s'])}s) -> "
+           f"new {report['new']['run_id']} ({_seconds(report['new']['duration_s'])}s)", '']
+    out += ['Slowest tasks', _table(
+        ['task', 'hosts', 'wall s', 'base s', 'delta s', 'command s'],
+        [[e['task_key'], e['hosts'], _seconds(e['wall_s']), _seconds(e['base_wall_s']), _seconds(e['delta_s']),
+          _seconds(e['command_s'])] for e in report['slowest']]) if report['slowest'] else '(none)', '']
+    out += ['Regressions', _table(
+        ['task', 'base s', 'wall s', 'delta s'],
+        [[e['task_key'], _seconds(e['base_wall_s']), _seconds(e['wall_s']), _seconds(e['delta_s'])]
+         for e in report['regressions']]) if report['regressions'] else '(none)', '']
+    out += ['Loops', _table(
+        ['task', 'items', 'base items', 'wall s', 'per item s', 'exponent', 'scales'],
+        [[e['task_key'], e['items'], '-' if e['base_items'] is None else e['base_items'], _seconds(e['wall_s']),
+          f"{e['per_item_s']:.3f}", '-' if e['exponent'] is None else f"{e['exponent']:.2f}",
+          'yes' if e['scales_with_items'] else ''] for e in report['loops']]) if report['loops'] else '(none)']
+    if report['added'] or report['removed']:
+        out += ['', f"added: {len(report['added'])}, removed: {len(report['removed'])}"]
+    return '\n'.join(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base', help='기준 실행 JSON lines 파일')
+    parser.add_argument('new', help='비교할 실행 JSON lines 파일')
+    parser.add_argument('--top', type=int, default=10, help='slowest 에 표시할 태스크 수')
+    parser.add_argument('--min-delta', type=float, default=1.0, help='회귀로 볼 최소 증가 시간(초)')
+    parser.add_argument('--min-ratio', type=float, default=1.2, help='회귀로 볼 최소 증가 배율')
+    parser.add_argument('--min-items', type=int, default=10, help='loops 에 포함할 최소 항목 수')
+    parser.add_argument('--scaling', type=float, default=0.8, help='항목 수 비례로 볼 최소 증가 지수')
+    parser.add_argument('--json', action='store_true', help='JSON 으로 출력')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    args = parser.parse_args(argv)
+
+    report = compare(load_run(args.base), load_run(args.new), args.top, args.min_delta, args.min_ratio,
+                     args.min_items, args.scaling)
+    print(json.dumps(report, indent=2, sort_keys=True) if args.json else render(report))
+    return 1 if args.fail_on_regression and report['regressions'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+"""
+플레이북 원격 왕복 비용 정적 분석 도구
+
+테스트와 같은 플레이북 YAML 모델(tests/fixtures/playbook_index.py)로 플레이, 태스크,
+block, loop / with_* (with_subelements, subelements 필터 포함), import_playbook,
+include_tasks / import_tasks 를 따라가며 플레이북마다 모듈 실행 횟수를 기호 식으로 계산합니다.
+
+    remote = 3·|ceph.rgw[].users| + 2     관리 대상 호스트에서의 모듈 실행 (원격 왕복)
+    local  = |ceph.rgw[].users[].buckets|  delegate_to: localhost / connection: local 실행
+
+|x| 는 loop 대상 변수 x 의 길이, |hosts:mons| 는 mons 그룹의 호스트 수입니다. include_tasks 를
+loop_var 로 돌면 안쪽 식의 loop_var.y 는 바깥 목록 기준 x[].y 로 바뀝니다. when 조건과
+handler 는 보지 않으므로 식은 상한입니다. debug, set_fact, assert 같은 컨트롤러 전용 모듈은
+세지 않습니다.
+
+함께 표시하는 개선 후보:
+
+- n+1:      loop 항목마다 command/shell 을 실행하는 태스크. 조회 명령이면 JSON 출력 한 번으로
+            모든 항목을 처리할 수 있습니다.
+- fan-out:  그룹 전체(hosts: mons 등)에서 run_once 없이 같은 클러스터 전역 명령
+            (ceph, radosgw-admin, rbd, rados, 클러스터 모듈)을 호스트마다 반복하는 태스크.
+- unresolved: 찾을 수 없거나 템플릿 경로인 import/include, 역할.
+
+--vars 로 ceph-vars.yml, --group 으로 그룹 호스트 수를 주면 식의 값을 계산해 실제 규모 순으로
+정렬합니다.
+
+사용법:
+    python scripts/playbook_cost.py playbooks/ [--vars ceph-vars.yml] [--group mons=3] [--json]
+"""
+
+import argparse
+import json
+import re
+import shlex
+import sys
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.fixtures.playbook_index import PlaybookIndex, include_target, task_module  # noqa: E402
+
+# 원격 호스트에 모듈을 보내지 않는 (컨트롤러에서 끝나는) 모듈
+CONTROLLER_MODULES = {
+    'debug', 'set_fact', 'assert', 'fail', 'meta', 'include_vars', 'add_host', 'group_by', 'pause', 'set_stats',
+}
+TASK_INCLUDES = {'include_tasks', 'import_tasks', 'include'}
+ROLE_INCLUDES = {'include_role', 'import_role'}
+COMMAND_MODULES = {'command', 'shell', 'raw'}
+CLUSTER_TOOLS = {'ceph', 'radosgw-admin', 'rbd', 'rados'}
+# ceph 하위 명령 중 대상 호스트의 데몬/디스크만 보는 것
+HOST_LOCAL_SUBCOMMANDS = {'daemon', 'ceph-volume'}
+# 클러스터 전체 상태를 읽거나 바꾸는 library/ 모듈
+CLUSTER_MODULES = {
+    'ceph_auth_clients', 'ceph_cephfs', 'ceph_health_snapshot', 'ceph_orch_hosts', 'ceph_rbd_inventory',
+    'ceph_rbd_provision', 'ceph_rbd_snapshots', 'ceph_rgw_bucket_stats', 'ceph_rgw_buckets', 'ceph_rgw_users',
+    'ceph_wait',
+}
+READ_VERBS = {
+    'ls', 'list', 'info', 'get', 'stat', 'stats', 'status', 'df', 'dump', 'show', 'health', 'versions', 'query',
+    'detail', 'tree', '-s',
+}
+LOCALHOST = {'localhost', '127.0.0.1'}
+
+_TEMPLATE_RE = re.compile(r'^\s*\{\{\s*(.*?)\s*\}\}\s*$', re.S)
+_SUBELEMENTS_RE = re.compile(r"subelements\(\s*['\"]([^'\"]+)['\"]")
+_NAME_RE = re.compile(r'^[A-Za-z_][\w.]*(\[\]\.[\w.]+)*$')
+_INDEXED_HOST_RE = re.compile(r'^[^\s,:]+\[\d+\]$')
+_GROUPS_RE = re.compile(r'''^groups(?:\[['"]([\w-]+)['"]\]|\.(\w+))$''')
+
+
+class Cost:
+    """기호 다항식: 인자(기호) 튜플 -> 계수"""
+
+    def __init__(self, terms=None):
+        self.terms = {}
+        for factors, coefficient in (terms or {}).items():
+            if coefficient:
+                key = tuple(sorted(factors))
+                self.terms[key] = self.terms.get(key, 0) + coefficient
+
+    @classmethod
+    def const(cls, value=1):
+        return cls({(): value})
+
+    @classmethod
+    def symbol(cls, name):
+        return cls({(name,): 1})
+
+    def __add__(self, other):
+        terms = dict(self.terms)
+        for factors, coefficient in other.terms.items():
+            terms[factors] = terms.get(factors, 0) + coefficient
+        return Cost(terms)
+
+    def __mul__(self, other):
+        terms = {}
+        for left, a in self.terms.items():
+            for right, b in other.terms.items():
+                key = tuple(sorted(left + right))
+                terms[key] = terms.get(key, 0) + a * b
+        return Cost(terms)
+
+    def __eq__(self, other):
+        return isinstance(other, Cost) and self.terms == other.terms
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    @property
+    def degree(self):
+        return max((len(factors) for factors in self.terms), default=0)
+
+    @property
+    def symbols(self):
+        return sorted({factor for factors in self.terms for factor in factors})
+
+    def sort_key(self):
+        """규모 순 정렬용 (차수, 최고차항 계수 합, 상수항)"""
+        top = self.degree
+        return top, sum(c for f, c in self.terms.items() if len(f) == top), self.terms.get((), 0)
+
+    def evaluate(self, size):
+        """size(기호) -> 길이 (모르면 None), 하나라도 모르면 None"""
+        total = 0
+        for factors, coefficient in self.terms.items():
+            value = coefficient
+            for factor in factors:
+                length = size(factor)
+                if length is None:
+                    return None
+                value *= length
+            total += value
+        return total
+
+    def __str__(self):
+        if not self.terms:
+            return '0'
+        parts = []
+        for factors in sorted(self.terms, key=lambda f: (-len(f), f)):
+            coefficient = self.terms[factors]
+            symbols = '·'.join(f'|{f}|' for f in factors)
+            if not symbols:
+                parts.append(str(coefficient))
+            else:
+                parts.append(symbols if coefficient == 1 else f'{coefficient}·{symbols}')
+        return ' + '.join(parts)
+
+    __repr__ = __str__
+
+
+class Loop:
+    """태스크 loop 하나: 반복 횟수 식과 (단일 변수이면) 그 이름, loop_var"""
+
+    def __init__(self, cost, name=None, var='item'):
+        self.cost = cost
+        self.name = name
+        self.var = var
+
+    def apply(self, inner):
+        """안쪽 식 x 항목 수. loop_var 에 의존하는 항은 바깥 목록 기준 합으로 바꿈"""
+        if self.name is None:
+            return inner * self.cost
+        prefix = f'{self.var}.'
+        terms = {}
+        for factors, coefficient in inner.terms.items():
+            dependent = [f for f in factors if f.startswith(prefix)]
+            if dependent:
+                rewritten = [f'{self.name}[].{f[len(prefix):]}' if f in dependent else f for f in factors]
+                key = tuple(sorted(rewritten))
+            else:
+                key = tuple(sorted(factors + (self.name,)))
+            terms[key] = terms.get(key, 0) + coefficient
+        return Cost(terms)
+
+
+class TaskCost:
+    """실행되는 태스크 하나의 비용"""
+
+    def __init__(self, file, play, name, module, remote, local, command=None):
+        self.file = file
+        self.play = play
+        self.name = name
+        self.module = module
+        self.remote = remote
+        self.local = local
+        self.command = command
+
+    def as_dict(self):
+        return {'file': self.file, 'play': self.play, 'task': self.name, 'module': self.module,
+                'remote': str(self.remote), 'local': str(self.local), 'command': self.command}
+
+
+class Finding:
+    """개선 후보 (n+1, fan-out, unresolved)"""
+
+    def __init__(self, kind, file, play, task, cost, message):
+        self.kind = kind
+        self.file = file
+        self.play = play
+        self.task = task
+        self.cost = cost
+        self.message = message
+
+    @property
+    def key(self):
+        return self.kind, self.file, self.task
+
+    def as_dict(self, size=None):
+        return {'kind': self.kind, 'file': self.file, 'play': self.play, 'task': self.task,
+                'cost': str(self.cost), 'value': self.cost.evaluate(size) if size else None,
+                'message': self.message}
+
+
+class PlaybookCost:
+    """플레이북 하나 (import_playbook 포함) 의 분석 결과"""
+
+    def __init__(self, path):
+        self.path = path
+        self.tasks = []
+        self.findings = []
+
+    @property
+    def remote(self):
+        return sum((t.remote for t in self.tasks), Cost())
+
+    @property
+    def local(self):
+        return sum((t.local for t in self.tasks), Cost())
+
+    def as_dict(self, size=None):
+        return {
+            'playbook': self.path,
+            'remote': str(self.remote),
+            'local': str(self.local),
+            'remote_value': self.remote.evaluate(size) if size else None,
+            'local_value': self.local.evaluate(size) if size else None,
+            'tasks': [t.as_dict() for t in self.tasks],
+            'findings': [f.as_dict(size) for f in self.findings],
+        }
+
+
+def template_expression(value):
+    """'{{ expr }}' -> 'expr' (템플릿이 아니면 None)"""
+    match = _TEMPLATE_RE.match(value) if isinstance(value, str) else None
+    return match.group(1) if match else None
+
+
+def loop_source(expr, registers, subkey=None):
+    """loop 식 -> Loop 의 (cost, name). 등록 변수의 .results 는 그 태스크의 loop 식을 씀"""
+    base = expr.split('|')[0].strip().strip('()').strip()
+    sub = subkey or (_SUBELEMENTS_RE.search(expr).group(1) if _SUBELEMENTS_RE.search(expr) else None)
+    group = _GROUPS_RE.match(base)
+    if group:
+        return Cost.symbol(f"hosts:{group.group(1) or group.group(2)}"), None
+    registered = re.match(r'^(\w+)\.results$', base)
+    if registered and registered.group(1) in registers and not sub:
+        return registers[registered.group(1)], None
+    if _NAME_RE.match(base):
+        name = f'{base}[].{sub}' if sub else base
+        return Cost.symbol(name), name
+    normalized = ' '.join(expr.split())
+    return Cost.symbol(normalized), None
+
+
+def task_loop(task, registers):
+    """태스크 -> Loop (loop 가 없으면 None)"""
+    var = (task.get('loop_control') or {}).get('loop_var', 'item')
+    key = 'loop' if 'loop' in task else next((k for k in task if k.startswith('with_')), None)
+    if key is None:
+        return None
+    value = task[key]
+    subkey = None
+    if key == 'with_subelements' and isinstance(value, list) and len(value) >= 2:
+        value, subkey = value[0], value[1]
+    if isinstance(value, dict):
+        return Loop(Cost.const(len(value)), var=var)
+    if isinstance(value, list):
+        # with_items 는 템플릿 항목의 목록을 펼침
+        cost = Cost()
+        for element in value:
+            expr = template_expression(element)
+            cost = cost + (loop_source(expr, registers)[0] if expr and key == 'with_items' else Cost.const(1))
+        return Loop(cost, var=var)
+    expr = template_expression(value)
+    if expr is None:
+        if key == 'with_subelements' and isinstance(value, str):
+            # 예전 형식: with_subelements: [ceph.rbd, images] 의 첫 항목이 맨 이름
+            expr = value
+        else:
+            return Loop(Cost.const(1), var=var)
+    cost, name = loop_source(expr, registers, subkey)
+    return Loop(cost, name, var)
+
+
+def host_cost(pattern):
+    """플레이 hosts -> 호스트 수 식 (단일 호스트이면 1)"""
+    if isinstance(pattern, list):
+        pattern = ','.join(str(p) for p in pattern)
+    pattern = str(pattern or 'all').strip()
+    if pattern in LOCALHOST or _INDEXED_HOST_RE.match(pattern):
+        return Cost.const(1)
+    expr = template_expression(pattern)
+    return Cost.symbol(f'hosts:{expr or pattern}')
+
+
+def command_line(task, module):
+    """command/shell/raw 태스크의 명령 문자열 (여러 줄 shell 은 첫 명령 줄)"""
+    value = task.get(module)
+    if isinstance(value, dict):
+        value = value.get('cmd') or (' '.join(value['argv']) if value.get('argv') else None)
+    if not value and isinstance(task.get('args'), dict):
+        value = task['args'].get('cmd')
+    if not isinstance(value, str):
+        return None
+    for line in value.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            return ' '.join(line.split())
+    return None
+
+
+def command_words(command):
+    """명령 -> 도구와 하위 명령 단어 (옵션/템플릿 전까지, sudo / 환경 변수 / cephadm shell 제외)"""
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        tokens = command.split()
+    while tokens and (tokens[0] == 'sudo' or re.match(r'^\w+=', tokens[0])):
+        tokens = tokens[1:]
+    if tokens[:2] == ['cephadm', 'shell']:
+        tokens = tokens[tokens.index('--') + 1:] if '--' in tokens else tokens[2:]
+    words = []
+    for token in tokens:
+        if '{{' in token or (words and token.startswith('-') and token != '-s') or token in ('|', '&&', ';'):
+            break
+        words.append(token)
+    return words
+
+
+def is_cluster_command(words):
+    return bool(words) and words[0] in CLUSTER_TOOLS and not (len(words) > 1 and words[1] in HOST_LOCAL_SUBCOMMANDS)
+
+
+def is_read_only(words):
+    return any(word in READ_VERBS for word in words[1:])
+
+
+class CostAnalyzer:
+    """플레이북 YAML 모델을 따라가며 PlaybookCost 계산"""
+
+    def __init__(self, index=None, root=PROJECT_ROOT):
+        self.index = index or PlaybookIndex(PROJECT_ROOT / 'playbooks')
+        self.root = Path(root)
+
+    def _relative(self, path):
+        try:
+            return str(Path(path).resolve().relative_to(self.root.resolve()))
+        except ValueError:
+            return str(path)
+
+    def analyze(self, path):
+        result = PlaybookCost(self._relative(path))
+        self._playbook(Path(path), result, [])
+        return result
+
+    def _unresolved(self, result, file, play, task, target, reason):
+        result.findings.append(Finding('unresolved', self._relative(file), play, task, Cost(),
+                                       f"{target}: {reason}, not included in the cost"))
+
+    def _load(self, path):
+        entry = self.index.get(path)
+        if entry.error:
+            raise yaml.YAMLError(entry.error)
+        return entry.content
+
+    def _playbook(self, path, result, stack):
+        stack = stack + [path.resolve()]
+        for play in self._load(path) or []:
+            if not isinstance(play, dict):
+                continue
+            target = play.get('import_playbook') or play.get('ansible.builtin.import_playbook')
+            if target:
+                resolved = path.parent / str(target)
+                if '{{' in str(target) or not resolved.exists():
+                    self._unresolved(result, path, play.get('name'), None, target, 'playbook not found')
+                elif resolved.resolve() not in stack:
+                    self._playbook(resolved, result, stack)
+                continue
+            name = play.get('name') or f"hosts: {play.get('hosts')}"
+            context = {
+                'file': path, 'dir': path.parent, 'play': name, 'hosts': host_cost(play.get('hosts')),
+                'local': play.get('connection') == 'local' or str(play.get('hosts')).strip() in LOCALHOST,
+                'run_once': bool(play.get('run_once')), 'delegate_to': None, 'registers': {}, 'stack': stack,
+            }
+            for section in ('pre_tasks', 'tasks', 'post_tasks'):
+                self._tasks(play.get(section) or [], context, [], result)
+            for role in play.get('roles') or []:
+                role_name = role.get('role') or role.get('name') if isinstance(role, dict) else role
+                self._unresolved(result, path, name, None, f'role {role_name}', 'roles are not analyzed')
+
+    def _tasks(self, tasks, context, loops, result):
+        for task in tasks:
+            if isinstance(task, dict):
+                self._task(task, context, loops, result)
+
+    def _task(self, task, context, loops, result):
+        if any(isinstance(task.get(s), list) for s in ('block', 'rescue', 'always')):
+            inner = dict(context)
+            if 'run_once' in task:
+                inner['run_once'] = bool(task['run_once'])
+            if 'delegate_to' in task:
+                inner['delegate_to'] = task['delegate_to']
+            for section in ('block', 'rescue', 'always'):
+                self._tasks(task.get(section) or [], inner, loops, result)
+            return
+
+        module = task_module(task)
+        if module is None:
+            return
+        short = module.rsplit('.', 1)[-1]
+        name = task.get('name', short)
+        loop = task_loop(task, context['registers'])
+        nested = loops + [loop] if loop else loops
+
+        if short in TASK_INCLUDES:
+            self._include(task, module, context, nested, result)
+            return
+        if short in ROLE_INCLUDES:
+            self._unresolved(result, context['file'], context['play'], name, f'role {include_target(task, module)}',
+                             'roles are not analyzed')
+            return
+
+        if 'register' in task:
+            if loop:
+                context['registers'][task['register']] = loop.cost
+            else:
+                context['registers'].pop(task['register'], None)
+        if short in CONTROLLER_MODULES:
+            return
+
+        run_once = bool(task.get('run_once', context['run_once']))
+        delegate_to = task.get('delegate_to', context['delegate_to'])
+        local = context['local'] or str(delegate_to).strip() in LOCALHOST or 'local_action' in task
+        executions = Cost.const(1) if run_once else context['hosts']
+        for outer in reversed(nested):
+            executions = outer.apply(executions)
+
+        command = command_line(task, module) if short in COMMAND_MODULES else None
+        file = self._relative(context['file'])
+        remote, local_cost = (Cost(), executions) if local else (executions, Cost())
+        result.tasks.append(TaskCost(file, context['play'], name, module, remote, local_cost, command))
+
+        words = command_words(command) if command else []
+        if command and loop and loop.cost.degree:
+            label = ' '.join(words) or command
+            if is_cluster_command(words) and is_read_only(words):
+                message = (f"`{label}` runs once per item; one JSON listing (--format json) could serve "
+                           f"every item")
+            else:
+                message = f"`{label}` runs once per item; batch the items in one module call"
+            result.findings.append(Finding('n+1', file, context['play'], name, executions, message))
+        if not local and not run_once and context['hosts'].degree and \
+                (is_cluster_command(words) or short in CLUSTER_MODULES):
+            label = ' '.join(words) if words else module
+            hosts = ', '.join(s[len('hosts:'):] for s in context['hosts'].symbols)
+            result.findings.append(Finding(
+                'fan-out', file, context['play'], name, executions,
+                f"cluster-wide `{label}` repeats on every host of {hosts}; use run_once or a single host"))
+
+    def _include(self, task, module, context, loops, result):
+        target = include_target(task, module)
+        name = task.get('name', module)
+        candidates = [Path(context['file']).parent / str(target), context['dir'] / str(target)]
+        path = next((p for p in candidates if p.exists()), None)
+        if not target or '{{' in str(target) or path is None:
+            self._unresolved(result, context['file'], context['play'], name, target, 'task file not found')
+            return
+        if path.resolve() in context['stack']:
+            return
+        inner = dict(context, file=path, stack=context['stack'] + [path.resolve()])
+        self._tasks(self._load(path) or [], inner, loops, result)
+
+
+def expand_paths(paths):
+    """디렉토리는 하위 *.yml 플레이북 목록으로 펼침 (tasks/ 디렉토리의 태스크 파일 제외)"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(p for p in sorted(path.glob('**/*.yml')) if 'tasks' not in p.relative_to(path).parts)
+        else:
+            files.append(path)
+    return files
+
+
+def symbol_size(variables, groups):
+    """기호 -> 길이 함수. 'a.b[].c' 는 a.b 각 항목의 c 길이 합, 'hosts:g' 는 그룹 호스트 수"""
+
+    def size(symbol):
+        if symbol.startswith('hosts:'):
+            parts = [p for p in re.split(r'[,:]', symbol[len('hosts:'):]) if p and not p.startswith('!')]
+            if len(parts) == 1:
+                return groups.get(parts[0])
+            # 그룹이 아닌 이름은 호스트 하나
+            return sum(groups.get(p, 1) for p in parts)
+        values = None
+        for i, segment in enumerate(symbol.split('[].')):
+            keys = segment.split('.')
+            values = [variables] if i == 0 else [v for value in values for v in value if isinstance(value, list)]
+            if not values:
+                return 0
+            for key in keys:
+                values = [v.get(key) for v in values if isinstance(v, dict)]
+            if not values or any(v is None for v in values):
+                return None
+        return sum(len(v) for v in values if isinstance(v, (list, dict)))
+
+    return size
+
+
+def render(results, size=None):
+    lines = []
+    headers = ['playbook', 'remote', 'local']
+    rows = []
+    for r in results:
+        row = [r.path, str(r.remote), str(r.local)]
+        if size:
+            row += [_value(r.remote.evaluate(size)), _value(r.local.evaluate(size))]
+        rows.append(row)
+    if size:
+        headers += ['remote #', 'local #']
+    widths = [max(len(h), *(len(row[i]) for row in rows)) for i, h in enumerate(headers)]
+    lines.append('  '.join(h.ljust(w) for h, w in zip(headers, widths)).rstrip())
+    lines.append('-' * len(lines[0]))
+    lines.extend('  '.join(c.ljust(w) for c, w in zip(row, widths)).rstrip() for row in rows)
+
+    findings = unique_findings(results, size)
+    if findings:
+        lines.append('')
+        lines.append('findings (largest fan-out first):')
+    for finding in findings:
+        value = f" = {_value(finding.cost.evaluate(size))}" if size and finding.cost else ''
+        cost = f" [{finding.cost}{value}]" if finding.cost else ''
+        lines.append(f"  {finding.kind:<10} {finding.file} :: {finding.task or finding.play}{cost}")
+        lines.append(f"  {'':<10} {finding.message}")
+    return '\n'.join(lines)
+
+
+def _value(value):
+    return '-' if value is None else str(value)
+
+
+def unique_findings(results, size=None):
+    """import_playbook / include 로 여러 번 나온 항목을 하나로 합치고 규모 순 정렬"""
+    def rank(finding):
+        value = finding.cost.evaluate(size) if size else None
+        return value is not None, value or 0, finding.cost.sort_key()
+
+    findings = {}
+    for result in results:
+        for finding in result.findings:
+            # 같은 태스크 파일을 여러 플레이북이 include 하면 가장 큰 식을 남김
+            if finding.key not in findings or rank(finding) > rank(findings[finding.key]):
+                findings[finding.key] = finding
+
+    return sorted(findings.values(), key=rank, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='플레이북 파일 또는 디렉토리')
+    parser.add_argument('--vars', help='기호 값을 계산할 변수 파일 (예: ceph-vars.yml)')
+    parser.add_argument('--group', action='append', default=[], metavar='NAME=N', help='그룹 호스트 수 (반복 가능)')
+    parser.add_argument('--json', action='store_true', help='JSON 으로 출력')
+    parser.add_argument('--fail-on-finding', action='store_true', help='n+1 / fan-out 항목이 있으면 종료 코드 1')
+    args = parser.parse_args(argv)
+
+    size = None
+    if args.vars or args.group:
+        variables = {}
+        if args.vars:
+            with open(args.vars) as f:
+                variables = yaml.safe_load(f) or {}
+        groups = {}
+        for item in args.group:
+            group, _, count = item.partition('=')
+            groups[group] = int(count)
+        size = symbol_size(variables, groups)
+
+    analyzer = CostAnalyzer()
+    results = [analyzer.analyze(path) for path in expand_paths(args.paths)]
+    if args.json:
+        print(json.dumps([r.as_dict(size) for r in results], indent=2, ensure_ascii=False))
+    else:
+        print(render(results, size))
+    actionable = [f for f in unique_findings(results) if f.kind != 'unresolved']
+    return 1 if args.fail_on_finding and actionable else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
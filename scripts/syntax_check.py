@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+프로세스 하나에서 여러 플레이북을 문법 검사하는 도구
+
+`ansible-playbook --syntax-check` 는 호출마다 Ansible import 와 플러그인 로더 초기화에
+1-2 초를 씁니다. SyntaxChecker 는 PlaybookCLI 의 인자 해석, DataLoader, InventoryManager,
+VariableManager 를 한 번만 만들고, 플레이북마다 PlaybookExecutor 를 syntax 모드로 실행해
+ansible-playbook 과 같은 검사(플레이/태스크 로드, 모듈 이름 해석, import 대상 확인,
+플레이 post_validate)를 합니다.
+
+플레이북이 많으면(--workers 또는 PARALLEL_THRESHOLD 초과) 프로세스 풀에 나눠 검사하고,
+워커마다 SyntaxChecker 를 한 번씩 만듭니다. 결과는 플레이북마다 dict 하나입니다:
+
+    {'path': ..., 'ok': False, 'type': 'AnsibleParserError', 'error': ...,
+     'file': 오류가 난 파일(import 된 파일일 수 있음), 'line': 3, 'column': 7}
+
+ansible.cfg 는 ansible-playbook 과 마찬가지로 현재 디렉토리(또는 ANSIBLE_CONFIG)에서 읽습니다.
+
+사용법:
+    python scripts/syntax_check.py [-i inventory] [--workers N] [--json] playbooks/ [file.yml ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from ansible._internal._datatag._tags import Origin
+except ImportError:  # ansible-core < 2.19
+    Origin = None
+
+# 이 개수를 넘으면 workers='auto' 일 때 프로세스 풀 사용 (검사 1건은 수십 ms)
+PARALLEL_THRESHOLD = 64
+PLAYBOOKS_PER_WORKER = 32
+
+
+def expand_paths(paths):
+    """디렉토리는 하위 *.yml 파일 목록으로 펼침 (경로 순)"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        files.extend(sorted(path.glob('**/*.yml')) if path.is_dir() else [path])
+    return [str(f) for f in files]
+
+
+def error_location(error):
+    """AnsibleError -> (파일, 줄, 칸), 위치 정보가 없으면 (None, None, None)"""
+    obj = getattr(error, 'obj', None)
+    if obj is None:
+        return None, None, None
+    if Origin is not None:
+        origin = Origin.get_tag(obj)
+        if origin is not None:
+            return origin.path, origin.line_num, origin.col_num
+    pos = getattr(obj, 'ansible_pos', None)
+    return pos if pos else (None, None, None)
+
+
+_context = None
+
+
+def ansible_context():
+    """CLI 인자, 플러그인 로더와 DataLoader(vault 설정 포함)
+
+    ansible-core 2.19 는 vault 설정(VaultSecretsContext)을 프로세스당 한 번만 초기화할 수 있으므로
+    모든 SyntaxChecker 가 이 로더를 공유하고 인벤토리만 따로 만듭니다. ansible.cfg 기본 인벤토리는
+    -i 없이 검사할 때만 읽도록 여기서 만들지 않습니다.
+    """
+    global _context
+    if _context is None:
+        from ansible import constants as C
+        from ansible import context
+        from ansible.cli import CLI
+        from ansible.cli.playbook import PlaybookCLI
+        from ansible.parsing.dataloader import DataLoader
+        from ansible.plugins.loader import init_plugin_loader
+
+        # 인자 해석용 자리표시자, 실제 플레이북은 check() 에서 하나씩 넘김
+        PlaybookCLI(['ansible-playbook', '--syntax-check', 'playbook.yml']).parse()
+        init_plugin_loader([])
+        options = context.CLIARGS
+        loader = DataLoader()
+        loader.set_vault_secrets(CLI.setup_vault_secrets(
+            loader, vault_ids=C.DEFAULT_VAULT_IDENTITY_LIST + list(options['vault_ids']),
+            vault_password_files=list(options['vault_password_files']), ask_vault_pass=options['ask_vault_pass'],
+            auto_prompt=False))
+        _context = (loader, options['inventory'])
+    return _context
+
+
+class SyntaxChecker:
+    """공유 로더 위에 인벤토리를 한 번만 만들고 플레이북을 반복 검사"""
+
+    def __init__(self, inventory=None):
+        from ansible.cli import CLI
+        from ansible.inventory.manager import InventoryManager
+        from ansible.vars.manager import VariableManager
+
+        self.loader, default_inventory = ansible_context()
+        sources = [str(inventory)] if inventory else default_inventory
+        self.inventory = InventoryManager(loader=self.loader, sources=sources)
+        self.variable_manager = VariableManager(loader=self.loader, inventory=self.inventory,
+                                                version_info=CLI.version_info(gitinfo=False))
+        self._plugin_dirs = set()
+
+    def _prepare(self, path):
+        """ansible-playbook 처럼 플레이북 옆 플러그인 디렉토리(library/ 등)를 등록"""
+        from ansible.plugins.loader import add_all_plugin_dirs
+        from ansible.utils.collection_loader import AnsibleCollectionConfig
+
+        b_dir = os.path.dirname(os.path.abspath(path)).encode()
+        if b_dir not in self._plugin_dirs:
+            add_all_plugin_dirs(b_dir)
+            self._plugin_dirs.add(b_dir)
+        AnsibleCollectionConfig.playbook_paths = [b_dir]
+
+    def check(self, path):
+        """플레이북 하나 검사 -> 결과 dict"""
+        from ansible.errors import AnsibleError
+        from ansible.executor.playbook_executor import PlaybookExecutor
+
+        path = str(path)
+        result = {'path': path, 'ok': True, 'type': None, 'error': None, 'file': None, 'line': None, 'column': None}
+        if not os.path.isfile(path):
+            result.update(ok=False, type='AnsibleError', error=f"the playbook: {path} could not be found")
+            return result
+
+        self._prepare(path)
+        try:
+            PlaybookExecutor(playbooks=[path], inventory=self.inventory, variable_manager=self.variable_manager,
+                             loader=self.loader, passwords={}).run()
+        except AnsibleError as e:
+            file, line, column = error_location(e)
+            result.update(ok=False, type=type(e).__name__, error=getattr(e, 'message', None) or str(e),
+                          file=file, line=line, column=column)
+        return result
+
+    def check_all(self, paths):
+        return [self.check(path) for path in paths]
+
+
+_checkers = {}
+
+
+def shared_checker(inventory=None):
+    """인벤토리별로 프로세스 안에서 한 번만 만든 SyntaxChecker (상대/절대 경로는 같은 인벤토리)"""
+    key = str(Path(inventory).resolve()) if inventory else None
+    if key not in _checkers:
+        _checkers[key] = SyntaxChecker(inventory)
+    return _checkers[key]
+
+
+def _check_in_worker(args):
+    inventory, path = args
+    return shared_checker(inventory).check(path)
+
+
+def resolve_workers(workers, count):
+    """'auto' -> 플레이북 수와 CPU 수에 맞춘 워커 수"""
+    if workers != 'auto':
+        return max(1, int(workers))
+    if count <= PARALLEL_THRESHOLD:
+        return 1
+    return max(1, min(os.cpu_count() or 1, -(-count // PLAYBOOKS_PER_WORKER)))
+
+
+def check_playbooks(paths, inventory=None, workers='auto'):
+    """플레이북 목록 검사 -> 입력 순서의 결과 dict 목록"""
+    paths = [str(p) for p in paths]
+    workers = resolve_workers(workers, len(paths))
+    if workers == 1:
+        return shared_checker(inventory).check_all(paths)
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_check_in_worker, [(inventory, p) for p in paths], chunksize=chunksize))
+
+
+def format_result(result):
+    if result['ok']:
+        return f"ok    {result['path']}"
+    location = result['file'] or result['path']
+    if result['line']:
+        location += f":{result['line']}:{result['column']}"
+    message = ' '.join(line.strip() for line in (result['error'] or '').splitlines() if line.strip())
+    return f"FAIL  {result['path']}: {result['type']} at {location}: {message}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='플레이북 파일 또는 디렉토리')
+    parser.add_argument('-i', '--inventory', help='인벤토리 (기본: ansible.cfg 설정)')
+    parser.add_argument('--workers', default='auto', help="프로세스 수 또는 'auto'")
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    args = parser.parse_args(argv)
+
+    results = check_playbooks(expand_paths(args.paths), args.inventory, args.workers)
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        for result in results:
+            print(format_result(result))
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
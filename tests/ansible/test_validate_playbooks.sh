@@ -99,20 +99,38 @@ MAIN_PLAYBOOKS=(
     "02-services/configure-global.yml"
 )
 
+# 플레이북마다 ansible-playbook 을 띄우지 않고 한 프로세스에서 검사 (scripts/syntax_check.py)
+syntax_targets=()
 for playbook_path in "${MAIN_PLAYBOOKS[@]}"; do
-    full_path="$PLAYBOOK_DIR/$playbook_path"
-    if [ -f "$full_path" ]; then
-        if $ANSIBLE_PLAYBOOK --syntax-check -i "$TEST_INVENTORY" "$full_path" >/dev/null 2>&1; then
-            print_result "pass" "문법 검사 통과: $playbook_path"
-        else
-            print_result "fail" "문법 검사 실패: $playbook_path"
-            ((ansible_errors++))
-        fi
+    if [ -f "$PLAYBOOK_DIR/$playbook_path" ]; then
+        syntax_targets+=("$PLAYBOOK_DIR/$playbook_path")
     else
         print_result "warn" "파일 없음: $playbook_path"
     fi
 done
 
+if [ ${#syntax_targets[@]} -gt 0 ]; then
+    # stderr 는 그대로 보여주고, 종료 코드로 검사기 자체의 실패(ImportError 등)를 구분
+    syntax_output=$(cd "$PROJECT_ROOT" && $PYTHON scripts/syntax_check.py -i "$TEST_INVENTORY" "${syntax_targets[@]}")
+    syntax_status=$?
+    syntax_failures=0
+    while read -r status playbook detail; do
+        [ -z "$status" ] && continue
+        playbook=${playbook%:}
+        if [ "$status" = "ok" ]; then
+            print_result "pass" "문법 검사 통과: ${playbook#$PLAYBOOK_DIR/}"
+        else
+            print_result "fail" "문법 검사 실패: ${playbook#$PLAYBOOK_DIR/} - $detail"
+            ((syntax_failures++))
+            ((ansible_errors++))
+        fi
+    done <<< "$syntax_output"
+    if [ $syntax_status -ne 0 ] && [ $syntax_failures -eq 0 ]; then
+        print_result "fail" "scripts/syntax_check.py 실행 실패 (종료 코드 $syntax_status)"
+        ((ansible_errors++))
+    fi
+fi
+
 # 4. 보안 검사 (하드코딩된 패스워드)
 echo ""
 echo "🔒 보안 검사..."
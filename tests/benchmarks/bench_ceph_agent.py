@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Ceph 명령 실행 벤치마크: 명령마다 ceph CLI 프로세스 vs ceph_agent 상주 연결
+
+스텁 ceph(tests/fixtures/bin/ceph)를 대상으로 같은 조회 명령 N 개를 순차 실행합니다.
+
+- cli:   명령마다 `ceph ... --format json` 프로세스 생성 (CephCLI, agent=False)
+- agent: spawn_agent 로 띄운 에이전트에 UNIX 소켓으로 요청 (CephCLI, agent=AgentClient)
+         에이전트 백엔드는 스텁과 같은 가짜 클러스터(tests/fixtures/fake_ceph)를 프로세스
+         안에서 사용합니다.
+
+--connect-latency 로 실제 CLI 의 mon 연결/인증 비용을 흉내냅니다. CLI 는 명령마다,
+에이전트는 시작할 때 한 번만 이 비용을 냅니다.
+
+사용법:
+    python tests/benchmarks/bench_ceph_agent.py --commands 1000 --connect-latency 0.3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from common import STUB_BIN, print_table, setup_paths, timed
+
+setup_paths()
+sys.path.insert(0, str(STUB_BIN.parent))
+
+from ansible.module_utils.ceph_agent import AgentClient, spawn_agent, split_global_args  # noqa: E402
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from fake_ceph import FakeCluster, open_store  # noqa: E402
+
+STUB = str(STUB_BIN / "ceph")
+COMMANDS = [["status"], ["health", "detail"], ["osd", "pool", "ls", "detail"], ["df"], ["mon", "dump"]]
+
+
+class StubBackend:
+    """스텁과 같은 가짜 클러스터를 쓰는 에이전트 백엔드 (연결 비용은 생성 시 1회)"""
+
+    method = "stub"
+
+    def __init__(self, state, connect_latency):
+        time.sleep(connect_latency)
+        self.cluster = FakeCluster(open_store(state))
+
+    def command(self, argv, data=None):
+        words, fmt, _ = split_global_args(argv, data)
+        return self.cluster.run("ceph", words + (["--format", fmt] if fmt else []))
+
+    def mon_command(self, cmd, inbuf=""):
+        return self.cluster.run("ceph", cmd["prefix"].split() + ["--format", cmd.get("format", "json")])
+
+    def close(self):
+        pass
+
+
+def run_commands(cli, count):
+    for i in range(count):
+        cli.run_json(COMMANDS[i % len(COMMANDS)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--connect-latency", type=float, default=0.0, help="mon 연결/인증 비용(초)")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "agent.sock")
+        state = os.path.join(tmp, "cluster.db")
+        os.environ["FAKE_CEPH_STATE"] = state
+        os.environ["FAKE_CEPH_LATENCY"] = f"ceph={args.connect_latency}"
+        for count in args.commands:
+            timings = {}
+            cli = CephCLI(subprocess_runner, STUB, agent=False)
+            with timed(timings, "cli"):
+                run_commands(cli, count)
+
+            with timed(timings, "agent"):
+                spawn_agent(path, lambda: StubBackend(state, args.connect_latency), idle_timeout=60)
+                client = AgentClient(path)
+                agent_cli = CephCLI(subprocess_runner, STUB, agent=client)
+                run_commands(agent_cli, count)
+                client.shutdown()
+                client.close()
+            assert agent_cli.agent_calls == count
+
+            rows.append([count, cli.calls, f"{timings['cli']:.2f}", f"{timings['cli'] / count * 1000:.1f}",
+                         agent_cli.agent_calls, f"{timings['agent']:.2f}",
+                         f"{timings['agent'] / count * 1000:.2f}", f"{timings['cli'] / timings['agent']:.1f}x"])
+
+    print_table(["commands", "cli procs", "cli s", "cli ms/cmd", "agent reqs", "agent s", "agent ms/cmd", "speedup"],
+                rows)
+
+
+if __name__ == "__main__":
+    main()
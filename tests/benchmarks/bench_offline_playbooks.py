@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+가짜 클러스터 대상 플레이북 처리량 벤치마크
+
+tests/fixtures/fake_ceph 의 OfflineCluster 로 실제 플레이북을 localhost 에서 실행합니다.
+모듈과 command 태스크가 가짜 `ceph` / `radosgw-admin` / `rbd` 프로세스를 실행하므로
+플레이북 실행 시간, CLI 명령 수, 명령당 시간을 클러스터 없이 측정할 수 있습니다.
+
+- rgw-users (new):      빈 클러스터에 사용자 N 명 생성
+- rgw-users (existing): 사용자 N 명이 이미 있는 클러스터에서 재실행 (조회만)
+- list-rbd-images:      rbd 풀 하나에 이미지 M 개가 있는 클러스터 조회
+- configure-rbd:        이미지 M 개를 선언하고 모두 이미 있는 클러스터에서 프로비저닝
+
+--latency 는 FAKE_CEPH_LATENCY 형식(예: 'radosgw-admin=0.02,rbd=0.01')의 명령별 지연입니다.
+
+사용법:
+    python tests/benchmarks/bench_offline_playbooks.py --users 1000 10000 --images 10000 50000
+"""
+
+import argparse
+import sys
+import tempfile
+
+from common import STUB_BIN, print_table, synthetic_rgw_users, timed
+
+sys.path.insert(0, str(STUB_BIN.parent))
+
+from fake_ceph.offline import OfflineCluster, ansible_playbook  # noqa: E402
+
+POOL = "rbd-bench"
+
+
+def ceph_vars(users=(), images=()):
+    return {
+        "rgw_instance": {"users": list(users)},
+        "ceph": {
+            "rgw_user_creation_result_file": "rgw-users.csv",
+            "rbd": [{"pool_name": POOL, "images": [{"image_name": name, "size": "1G"} for name in images]}],
+        },
+    }
+
+
+def run_case(label, size, playbook, vars_, latency, seed=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        offline = OfflineCluster(tmp, vars_, latency=latency)
+        if seed:
+            offline.seed(**seed)
+        timings = {}
+        with timed(timings, "elapsed"):
+            result = offline.run(playbook)
+        if result.returncode != 0:
+            sys.exit(f"{playbook} failed:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}")
+        commands = offline.commands()
+    cli_seconds = sum(c["elapsed"] for c in commands)
+    return [label, size, f"{timings['elapsed']:.2f}", len(commands), f"{cli_seconds:.2f}",
+            f"{size / timings['elapsed']:.0f}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="*", default=[100, 1000])
+    parser.add_argument("--images", type=int, nargs="*", default=[1000, 10000])
+    parser.add_argument("--latency", default="", help="명령별 지연 (FAKE_CEPH_LATENCY 형식)")
+    args = parser.parse_args()
+
+    if ansible_playbook() is None:
+        sys.exit("ansible-playbook not found")
+
+    rows = []
+    for count in args.users:
+        users = synthetic_rgw_users(count)
+        rows.append(run_case("rgw-users (new)", count, "02-services/rgw-users.yml", ceph_vars(users),
+                             args.latency))
+        rows.append(run_case("rgw-users (existing)", count, "02-services/rgw-users.yml", ceph_vars(users),
+                             args.latency, seed={"users": users}))
+    for count in args.images:
+        names = [f"vm-{i:05d}" for i in range(count)]
+        rows.append(run_case("list-rbd-images", count, "03-operations/list-rbd-images.yml", ceph_vars(),
+                             args.latency, seed={"images": {POOL: names}}))
+        rows.append(run_case("configure-rbd", count, "02-services/configure-rbd.yml", ceph_vars(images=names),
+                             args.latency, seed={"images": {POOL: names}}))
+
+    print_table(["playbook", "items", "wall s", "cli cmds", "cli s", "items/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
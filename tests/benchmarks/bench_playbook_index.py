@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+플레이북 해석 벤치마크: 테스트마다 yaml.safe_load vs 세션 공용 색인
+
+합성 플레이북 N 개를 만들고, 단위 테스트처럼 전체 플레이북을 여러 번(--passes) 훑습니다.
+
+- legacy: 훑을 때마다 파일을 열어 yaml.safe_load (순수 Python 로더)
+- cold:   PlaybookIndex 로 파일마다 한 번만 CSafeLoader 로 해석 (디스크 캐시 없음)
+- warm:   이전 세션이 저장한 디스크 캐시에서 시작 (바뀐 파일이 없으면 해석 0 회)
+
+사용법:
+    python tests/benchmarks/bench_playbook_index.py --playbooks 50 500 --passes 6
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+from common import PROJECT_ROOT, print_table, timed
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.fixtures.playbook_index import PlaybookIndex  # noqa: E402
+
+
+def synthetic_playbook(i, tasks=40):
+    """검증 플레이북과 비슷한 크기/구조의 합성 플레이북"""
+    lines = [f"- name: Synthetic play {i}", "  hosts: mons", "  gather_facts: false", "  tasks:"]
+    for t in range(tasks):
+        lines += [
+            f"    - name: Check item {t}",
+            "      ansible.builtin.command: ceph osd pool ls detail --format json",
+            f"      register: result_{t}",
+            "      changed_when: false",
+            "      loop: \"{{ ceph_pools | default([]) }}\"",
+            "      when: item.name is defined",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def scan_legacy(root, passes):
+    for _ in range(passes):
+        for path in sorted(root.glob("**/*.yml")):
+            with open(path) as f:
+                yaml.safe_load(f)
+
+
+def scan_index(index, passes):
+    for _ in range(passes):
+        for entry in index.glob():
+            _ = entry.modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--playbooks", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--passes", type=int, default=6, help="세션 동안 전체 플레이북을 훑는 테스트 수")
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.playbooks:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "playbooks"
+            root.mkdir()
+            for i in range(count):
+                (root / f"playbook-{i:04d}.yml").write_text(synthetic_playbook(i))
+            cache_file = Path(tmp) / "index.pickle"
+
+            timings = {}
+            with timed(timings, "legacy"):
+                scan_legacy(root, args.passes)
+            with timed(timings, "cold"):
+                cold = PlaybookIndex(root, cache_file)
+                scan_index(cold, args.passes)
+                cold.save()
+            with timed(timings, "warm"):
+                warm = PlaybookIndex(root, cache_file)
+                scan_index(warm, args.passes)
+
+            rows.append([count, args.passes, count * args.passes, f"{timings['legacy']:.2f}", cold.parsed,
+                         f"{timings['cold']:.2f}", warm.parsed, f"{timings['warm']:.2f}",
+                         f"{timings['legacy'] / timings['warm']:.0f}x"])
+
+    print_table(["playbooks", "passes", "legacy parses", "legacy s", "cold parses", "cold s", "warm parses",
+                 "warm s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
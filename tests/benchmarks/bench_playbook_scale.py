@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+합성 규모별 플레이북 컨트롤러 비용 벤치마크 (회귀 기준선 포함)
+
+common.synthetic_ceph_vars 로 RGW 사용자 N x 버킷 M, RBD 풀 K x 이미지, CSI 사용자 C 규모의
+ceph-vars 를 만들고, 02-services 와 04-validation 플레이북을 가짜 클러스터(OfflineCluster)와
+가짜 S3(FakeS3Server) 대상으로 순서대로 실행합니다. 필요한 컬렉션이 설치되지 않은 플레이북
+(REQUIRES)은 건너뛰고, 0 이 아닌 rc 로 끝난 플레이북이 있으면 출력 끝부분을 보여 주고 기준선을
+쓰거나 비교하지 않고 1 로 종료합니다. 실패한 실행을 기대값으로 기록하지 않기 위해서입니다.
+플레이북마다 기록하는 값:
+
+- cpu_s:        ansible-playbook 프로세스 트리 전체 CPU 시간 (wait4 rusage)
+- remote_cpu_s: 모듈 실행(원격 측) CPU 시간 합계 (인터프리터 래퍼 기록)
+- controller_s: cpu_s - remote_cpu_s, 템플릿/변수 처리 같은 컨트롤러 측 비용
+- rss_mb:       최대 RSS
+- tasks/items:  task_timing 콜백의 태스크 결과 수와 루프 항목 수
+- remote:       모듈 실행 횟수 (원격 왕복 수)
+- cli:          가짜 ceph / radosgw-admin / rbd 명령 수
+
+기준선(baselines/playbook_scale.json)과 비교해 다음 중 하나면 회귀로 보고 1 로 종료합니다.
+
+- rc, tasks, items, remote, cli 중 하나라도 기준선과 다름 (결정적인 값)
+- controller_s / rss_mb 가 기준선보다 --threshold 비율 이상 증가 (--min-delta 초 이하 차이는 무시)
+- 가장 작은 규모와 가장 큰 규모 사이 controller_s 의 log-log 기울기(규모 지수)가
+  기준선보다 --exponent-slack 이상 커짐. 기계 속도와 무관하게 루프 안의 이차 템플릿
+  비용 같은 증가 추세를 잡아냅니다.
+
+사용법:
+    python tests/benchmarks/bench_playbook_scale.py                    # 기준선과 비교
+    python tests/benchmarks/bench_playbook_scale.py --update-baseline  # 기준선 갱신
+    python tests/benchmarks/bench_playbook_scale.py --scale s=2,2,1,2,1 --scale l=40,4,4,40,20 \\
+        --playbook 02-services/rgw-users.yml --no-baseline
+"""
+
+import argparse
+import json
+import math
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from common import PROJECT_ROOT, STUB_BIN, print_table, synthetic_ceph_vars
+
+sys.path.insert(0, str(STUB_BIN.parent))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from fake_ceph.offline import OfflineCluster, ansible_playbook  # noqa: E402
+
+from tests.fixtures.fake_s3 import FakeS3Server  # noqa: E402
+
+BASELINE = PROJECT_ROOT / "tests" / "benchmarks" / "baselines" / "playbook_scale.json"
+
+# 이름: (users, buckets, pools, images, csi)
+SCALES = {
+    "s": (4, 2, 2, 4, 2),
+    "m": (16, 2, 2, 16, 8),
+}
+SCALE_FIELDS = ("users", "buckets", "pools", "images", "csi")
+
+# 앞 플레이북이 만든 상태를 뒤 플레이북이 쓰므로 순서가 중요합니다.
+SERVICES = [
+    "02-services/configure-global.yml",
+    "02-services/configure-rgw.yml",
+    "02-services/rgw-users.yml",
+    "02-services/rgw-buckets.yml",
+    "02-services/rgw-objects.yml",
+    "02-services/configure-rbd.yml",
+    "02-services/configure-cephfs.yml",
+    "02-services/csi-users.yml",
+]
+# 플레이북: 실행에 필요한 컬렉션 (설치되지 않았으면 건너뜀)
+REQUIRES = {
+    "02-services/rgw-objects.yml": "amazon.aws",
+}
+VALIDATION = sorted(f"04-validation/{p.name}" for p in (PROJECT_ROOT / "playbooks" / "04-validation").glob("*.yml"))
+
+EXACT = ("rc", "tasks", "items", "remote", "cli")
+
+
+def parse_scale(text):
+    name, _, values = text.partition("=")
+    numbers = tuple(int(v) for v in values.split(","))
+    if len(numbers) != len(SCALE_FIELDS):
+        raise argparse.ArgumentTypeError(f"expected NAME={','.join(SCALE_FIELDS)}: {text}")
+    return name, numbers
+
+
+def installed_collections():
+    """ansible-galaxy 로 조회한 설치된 컬렉션 이름 집합"""
+    galaxy = str(Path(ansible_playbook()).with_name("ansible-galaxy"))
+    proc = subprocess.run([galaxy, "collection", "list", "--format", "json"], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return set()
+    return {name for collections in json.loads(proc.stdout or "{}").values() for name in collections}
+
+
+def scale_size(numbers):
+    """규모 지수 계산에 쓰는 대표 크기 (선언된 객체 수 합계)"""
+    users, buckets, pools, images, csi = numbers
+    return users * (1 + buckets) + pools * (1 + images) + csi
+
+
+def measure(run):
+    remote_cpu = sum(r["cpu_s"] for r in run.remote)
+    return {
+        "rc": run.returncode,
+        "wall_s": round(run.elapsed, 3),
+        "cpu_s": round(run.cpu_s, 3),
+        "remote_cpu_s": round(remote_cpu, 3),
+        "controller_s": round(run.cpu_s - remote_cpu, 3),
+        "rss_mb": round(run.max_rss_kb / 1024, 1),
+        "tasks": len(run.tasks),
+        "items": sum(t["items"] for t in run.tasks),
+        "remote": len(run.remote),
+        "cli": len(run.commands),
+    }
+
+
+def run_scale(numbers, playbooks):
+    """규모 하나를 실행해 (플레이북별 측정값, 실패한 플레이북별 출력 끝부분) 반환"""
+    params = dict(zip(SCALE_FIELDS, numbers))
+    bucket_names = [f"tenant{i:05d}-bucket{j}" for i in range(params["users"]) for j in range(params["buckets"])]
+    results, failures = {}, {}
+    with FakeS3Server(buckets=bucket_names) as s3, tempfile.TemporaryDirectory() as tmp:
+        offline = OfflineCluster(tmp, synthetic_ceph_vars(s3_url=s3.endpoint_url, **params), profile_remote=True)
+        for playbook in playbooks:
+            run = offline.run(playbook)
+            results[playbook] = measure(run)
+            if run.returncode != 0:
+                failures[playbook] = (run.stdout + run.stderr)[-2000:]
+    return results, failures
+
+
+def exponents(scales, results):
+    """가장 작은 규모와 가장 큰 규모 사이 플레이북별 controller_s 의 log-log 기울기"""
+    ordered = sorted(scales, key=lambda name: scale_size(scales[name]))
+    small, large = ordered[0], ordered[-1]
+    ratio = math.log(scale_size(scales[large]) / scale_size(scales[small]))
+    if ratio <= 0:
+        return {}
+    slopes = {}
+    for playbook, metrics in results[large].items():
+        before = results[small].get(playbook)
+        if before and before["controller_s"] > 0 and metrics["controller_s"] > 0:
+            slopes[playbook] = round(math.log(metrics["controller_s"] / before["controller_s"]) / ratio, 3)
+    return slopes
+
+
+def compare(current, baseline, threshold, min_delta, exponent_slack):
+    problems = []
+    for scale, playbooks in current["results"].items():
+        for playbook, metrics in playbooks.items():
+            base = baseline["results"].get(scale, {}).get(playbook)
+            if base is None:
+                continue
+            for key in EXACT:
+                if metrics[key] != base[key]:
+                    problems.append(f"{scale} {playbook}: {key} {base[key]} -> {metrics[key]}")
+            for key, floor in (("controller_s", min_delta), ("rss_mb", 0)):
+                if metrics[key] - base[key] > floor and metrics[key] > base[key] * (1 + threshold):
+                    problems.append(f"{scale} {playbook}: {key} {base[key]} -> {metrics[key]}")
+    for playbook, slope in current["exponents"].items():
+        base = baseline["exponents"].get(playbook)
+        if base is not None and slope > base + exponent_slack:
+            problems.append(f"{playbook}: scaling exponent {base} -> {slope}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=parse_scale, action="append",
+                        help=f"NAME={','.join(SCALE_FIELDS)} (반복 가능, 기본: 기준선 또는 내장 규모)")
+    parser.add_argument("--playbook", action="append", help="playbooks/ 기준 경로 (기본: 전체 순서)")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--no-baseline", action="store_true", help="비교하지 않고 결과만 출력")
+    parser.add_argument("--threshold", type=float, default=0.5, help="controller_s/rss_mb 허용 증가 비율")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="무시할 controller_s 증가 (초)")
+    parser.add_argument("--exponent-slack", type=float, default=0.3, help="허용 규모 지수 증가")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if ansible_playbook() is None:
+        sys.exit("ansible-playbook not found")
+
+    baseline = None
+    if not args.no_baseline and not args.update_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if args.scale:
+        scales = dict(args.scale)
+    elif baseline:
+        scales = {name: tuple(values) for name, values in baseline["scales"].items()}
+    else:
+        scales = dict(SCALES)
+    playbooks = args.playbook or SERVICES + VALIDATION
+    if any(playbook in REQUIRES for playbook in playbooks):
+        collections = installed_collections()
+        missing = [p for p in playbooks if p in REQUIRES and REQUIRES[p] not in collections]
+        for playbook in missing:
+            print(f"skipped {playbook}: collection {REQUIRES[playbook]} not installed")
+        playbooks = [p for p in playbooks if p not in missing]
+
+    current = {"scales": scales, "results": {}}
+    rows = []
+    failures = {}
+    for name, numbers in scales.items():
+        current["results"][name], failed = run_scale(numbers, playbooks)
+        failures.update({f"{name} {playbook}": output for playbook, output in failed.items()})
+        for playbook, m in current["results"][name].items():
+            rows.append([name, playbook, m["rc"], m["wall_s"], m["cpu_s"], m["remote_cpu_s"], m["controller_s"],
+                         m["rss_mb"], m["tasks"], m["items"], m["remote"], m["cli"]])
+    current["exponents"] = exponents(scales, current["results"])
+
+    print_table(["scale", "playbook", "rc", "wall s", "cpu s", "remote s", "ctrl s", "rss MB", "tasks", "items",
+                 "remote", "cli"], rows)
+    if current["exponents"]:
+        print()
+        print_table(["playbook", "ctrl exponent"], sorted(current["exponents"].items()))
+
+    if failures:
+        for run, output in failures.items():
+            print(f"\n{run} failed:\n{output}")
+        sys.exit(f"\n{len(failures)} playbook run(s) failed; fix them before recording or comparing a baseline")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"\nbaseline written: {args.baseline}")
+        return
+    if baseline is None:
+        return
+
+    problems = compare(current, baseline, args.threshold, args.min_delta, args.exponent_slack)
+    if problems:
+        print("\nregressions:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
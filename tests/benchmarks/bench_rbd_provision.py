@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+RBD 프로비저닝 벤치마크: 이미지별 `rbd create` 태스크 루프 vs ceph_rbd_provision 모듈
+
+명령마다 --latency 만큼 지연되는 메모리 백엔드를 대상으로 다음 두 방식을 비교합니다.
+
+- loop:   기존 configure-rbd.yml. 풀 생성/초기화 후 이미지마다 rbd create 태스크 1개를 순차 실행
+- module: osd pool ls detail 1회 + 이미지 목록 1회 후 누락 이미지를 워커 풀로 병렬 생성 (원격 태스크 1개)
+
+--existing 비율만큼 이미지가 이미 있는 상태에서 다시 실행하는 경우도 함께 측정합니다.
+
+사용법:
+    python tests/benchmarks/bench_rbd_provision.py --images 1000 5000 --latency 0.02 --workers 32
+"""
+
+import argparse
+import json
+import time
+
+from common import print_table, setup_paths, timed
+
+setup_paths()
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ceph_rbd_provision import RBDProvisioner  # noqa: E402
+
+
+class LatencyCluster:
+    """명령 1회마다 latency 초를 소비하는 메모리 ceph CLI + rbd 백엔드"""
+
+    method = "bench"
+
+    def __init__(self, pool, existing, latency):
+        self.pool = pool
+        self.state = {f"vm-{i:05d}": 1024 ** 3 for i in range(existing)}
+        self.latency = latency
+        self.calls = 0
+
+    def _cmd(self):
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def run_command(self, cmd, check_rc=False, data=None):
+        self._cmd()
+        detail = {"pool_name": self.pool, "size": 3, "min_size": 2, "pg_autoscale_mode": "on", "options": {},
+                  "flags_names": "hashpspool", "application_metadata": {"rbd": {}}}
+        return 0, json.dumps([detail]), ""
+
+    def init_pool(self, pool):
+        self._cmd()
+
+    def images(self, pool, names=None, timestamps=False):
+        self._cmd()
+        return [{"name": n, "size": s, "format": 2, "snapshots": []} for n, s in self.state.items()]
+
+    def create_image(self, pool, image):
+        self._cmd()
+        self.state[image["image_name"]] = 1024 ** 3
+
+
+def run_case(images, existing, workers, latency, ssh_rtt):
+    row = {"images": images, "existing": existing}
+    definitions = [{"image_name": f"vm-{i:05d}", "size": "1G"} for i in range(images)]
+
+    cluster = LatencyCluster("rbd-bench", existing, latency)
+    timings = {}
+    with timed(timings, "elapsed"):
+        cluster._cmd()  # ceph osd pool create
+        cluster.init_pool(cluster.pool)
+        for definition in definitions:
+            cluster.create_image(cluster.pool, definition)
+    tasks = 2 + images
+    row["loop_calls"], row["loop_s"] = cluster.calls, timings["elapsed"] + tasks * ssh_rtt
+
+    cluster = LatencyCluster("rbd-bench", existing, latency)
+    provisioner = RBDProvisioner(CephCLI(cluster.run_command, "ceph"), cluster, workers=workers)
+    with timed(timings, "elapsed"):
+        result = provisioner.apply([{"pool_name": cluster.pool, "images": definitions}])
+    assert len(result["created_images"]) == images - existing and not result["errors"]
+    row["module_calls"], row["module_s"] = cluster.calls, timings["elapsed"] + ssh_rtt
+    row["speedup"] = row["loop_s"] / row["module_s"] if row["module_s"] else float("inf")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--existing", type=float, default=0.5, help="재실행 케이스에서 이미 존재하는 이미지 비율")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01, help="ceph/rbd 명령당 지연(초)")
+    parser.add_argument("--ssh-rtt", type=float, default=0.0, help="원격 태스크당 추가 지연(초)")
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.images:
+        rows.append(run_case(n, 0, args.workers, args.latency, args.ssh_rtt))
+        rows.append(run_case(n, int(n * args.existing), args.workers, args.latency, args.ssh_rtt))
+    print_table(
+        ["images", "existing", "loop calls", "loop s", "module calls", "module s", "speedup"],
+        [[r["images"], r["existing"], r["loop_calls"], f"{r['loop_s']:.2f}", r["module_calls"],
+          f"{r['module_s']:.2f}", f"{r['speedup']:.1f}x"] for r in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+RBD 스냅샷 스윕 벤치마크: 이미지별 create-rbd-snapshot.yml 실행 vs ceph_rbd_snapshots 모듈
+
+명령마다 --latency 만큼 지연되는 메모리 백엔드를 대상으로 다음 두 방식을 비교합니다.
+
+- loop:   기존 방식. 이미지마다 플레이북(snap create + snap ls 태스크 2개)을 mons 호스트 수만큼 실행
+- module: 풀 목록 1회 + 이미지별 생성/보존 정리 작업을 워커 풀로 병렬 실행 (원격 태스크 1개)
+
+사용법:
+    python tests/benchmarks/bench_rbd_snapshots.py --images 500 5000 --latency 0.02 --workers 32
+"""
+
+import argparse
+import time
+
+from common import print_table, setup_paths, timed
+
+setup_paths()
+
+from ceph_rbd_snapshots import SnapshotScheduler  # noqa: E402
+
+
+class LatencyBackend:
+    """명령 1회마다 latency 초를 소비하는 메모리 백엔드"""
+
+    method = "bench"
+
+    def __init__(self, pool, images, latency):
+        self.pool = pool
+        self.snaps = {f"vm-{i:05d}": [] for i in range(images)}
+        self.latency = latency
+        self.calls = 0
+
+    def _cmd(self):
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def images(self, pool, names=None, timestamps=False):
+        self._cmd()
+        return [{"name": n, "size": 1, "format": 2, "snapshots": [{"name": s, "protected": False} for s in snaps]}
+                for n, snaps in self.snaps.items()]
+
+    def create_snap(self, pool, image, name):
+        self._cmd()
+        self.snaps[image].append(name)
+
+    def remove_snaps(self, pool, image, names):
+        for name in names:
+            self._cmd()
+            self.snaps[image].remove(name)
+
+
+def run_case(images, workers, latency, ssh_rtt, mons):
+    row = {"images": images}
+
+    backend = LatencyBackend("rbd-bench", images, latency)
+    timings = {}
+    with timed(timings, "elapsed"):
+        for image in backend.snaps:
+            for _ in range(mons):
+                backend.create_snap(backend.pool, image, "manual")
+                backend._cmd()  # rbd snap ls 확인 태스크
+    tasks = images * 2 * mons
+    row["loop_calls"], row["loop_s"] = backend.calls, timings["elapsed"] + tasks * ssh_rtt
+
+    backend = LatencyBackend("rbd-bench", images, latency)
+    scheduler = SnapshotScheduler(backend, workers=workers)
+    with timed(timings, "elapsed"):
+        result = scheduler.run(selectors=[{"pool": backend.pool}], retention={"count": 24})
+    assert len(result["created"]) == images
+    row["module_calls"], row["module_s"] = backend.calls, timings["elapsed"] + ssh_rtt
+    row["speedup"] = row["loop_s"] / row["module_s"] if row["module_s"] else float("inf")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01, help="rbd 명령당 지연(초)")
+    parser.add_argument("--ssh-rtt", type=float, default=0.0, help="원격 태스크당 추가 지연(초)")
+    parser.add_argument("--mons", type=int, default=3, help="기존 플레이북이 실행되던 mons 호스트 수")
+    args = parser.parse_args()
+
+    rows = [run_case(n, args.workers, args.latency, args.ssh_rtt, args.mons) for n in args.images]
+    print_table(
+        ["images", "loop calls", "loop s", "module calls", "module s", "speedup"],
+        [[r["images"], r["loop_calls"], f"{r['loop_s']:.2f}", r["module_calls"], f"{r['module_s']:.2f}",
+          f"{r['speedup']:.1f}x"] for r in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
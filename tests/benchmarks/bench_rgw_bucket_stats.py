@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+RGW 버킷 검증 벤치마크: 기존 버킷별 bucket stats loop vs ceph_rgw_bucket_stats 모듈
+
+스텁 radosgw-admin(tests/fixtures/bin/radosgw-admin)을 대상으로 다음 두 방식을 비교합니다.
+
+- loop:   validate-rgw-buckets.yml 의 기존 방식. 버킷마다 bucket stats --bucket=X 셸 태스크 1개
+- module: 버킷 지정 없는 bucket stats 1회를 스트리밍 색인 후 전체 검증 (원격 태스크 1개)
+
+--ssh-rtt 로 원격 태스크 1개당 SSH 왕복 비용을 더해 실제 환경을 근사할 수 있습니다.
+
+사용법:
+    python tests/benchmarks/bench_rgw_bucket_stats.py --users 100 1000 --buckets-per-user 20
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from common import STUB_BIN, print_table, setup_paths, synthetic_rgw_users, timed
+
+setup_paths()
+
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from ansible.module_utils.rgw_buckets import desired_quota  # noqa: E402
+from ceph_rgw_bucket_stats import BucketStatsValidator  # noqa: E402
+
+STUB = str(STUB_BIN / "radosgw-admin")
+
+
+def stub_state(users):
+    """모든 버킷이 쿼터까지 적용된 상태의 스텁 JSON"""
+    buckets = {}
+    for user in users:
+        for bucket in user["buckets"]:
+            quota = desired_quota(bucket)
+            buckets[bucket["name"]] = {
+                "bucket": bucket["name"],
+                "owner": user["user_id"],
+                "usage": {"rgw.main": {"size": 4096, "size_actual": 4096, "num_objects": 1}},
+                "bucket_quota": dict(quota, check_on_raw=False, max_size_kb=max(quota["max_size"], 0) // 1024),
+            }
+    return {"users": {u["user_id"]: {} for u in users}, "buckets": buckets}
+
+
+def legacy_loop(cli, users):
+    """기존 플레이북의 버킷별 bucket stats loop 재현 (stdout 에 'owner' 포함 여부만 확인)"""
+    tasks = 0
+    for user in users:
+        for bucket in user["buckets"]:
+            assert "owner" in cli.run(["bucket", "stats", f"--bucket={bucket['name']}"], check=False)[1]
+            tasks += 1
+    return tasks
+
+
+def module_run(cli, users):
+    assert BucketStatsValidator(cli).validate([{"service_name": "rgw-bench", "users": users}])["valid"]
+    return 1
+
+
+def run_case(size, buckets_per_user, ssh_rtt, skip_loop):
+    users = synthetic_rgw_users(size, buckets_per_user)
+    row = {"buckets": size * buckets_per_user}
+    cases = [("module", lambda c: module_run(c, users))]
+    if not skip_loop:
+        cases.insert(0, ("loop", lambda c: legacy_loop(c, users)))
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as state:
+        json.dump(stub_state(users), state)
+        state.flush()
+        os.environ["RGW_STUB_STATE"] = state.name
+        for label, func in cases:
+            cli = CephCLI(subprocess_runner, STUB, json_args=())
+            timings = {}
+            with timed(timings, "elapsed"):
+                remote_tasks = func(cli)
+            row[f"{label}_calls"] = cli.calls
+            row[f"{label}_tasks"] = remote_tasks
+            row[f"{label}_s"] = timings["elapsed"] + remote_tasks * ssh_rtt
+    if skip_loop:
+        row.update(loop_calls="-", loop_tasks="-", loop_s=None, speedup=None)
+    else:
+        row["speedup"] = row["loop_s"] / row["module_s"] if row["module_s"] else float("inf")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--buckets-per-user", type=int, default=10)
+    parser.add_argument("--ssh-rtt", type=float, default=0.0, help="원격 태스크당 추가 지연(초)")
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 명령당 지연(초)")
+    parser.add_argument("--skip-loop-above", type=int, default=5000,
+                        help="버킷 수가 이보다 많으면 기존 loop 측정 생략")
+    args = parser.parse_args()
+
+    os.environ["RGW_STUB_LATENCY"] = str(args.latency)
+    rows = [run_case(size, args.buckets_per_user, args.ssh_rtt, size * args.buckets_per_user > args.skip_loop_above)
+            for size in args.users]
+    print_table(
+        ["buckets", "loop calls", "loop tasks", "loop s", "module calls", "module tasks", "module s", "speedup"],
+        [[r["buckets"], r["loop_calls"], r["loop_tasks"], "-" if r["loop_s"] is None else f"{r['loop_s']:.2f}",
+          r["module_calls"], r["module_tasks"], f"{r['module_s']:.2f}",
+          "-" if r["speedup"] is None else f"{r['speedup']:.1f}x"] for r in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
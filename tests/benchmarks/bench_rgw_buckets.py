@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+RGW 버킷 생성 벤치마크: 기존 버킷별 shell loop vs ceph_rgw_buckets 모듈
+
+스텁 radosgw-admin(tests/fixtures/bin/radosgw-admin)을 대상으로 다음 두 방식을 비교합니다.
+
+- loop:   rgw-buckets.yml 의 기존 방식. 버킷마다 bucket create 셸 태스크 1개
+- module: bucket stats 1회 + 누락 버킷만 병렬 생성 및 쿼터 적용 (원격 태스크 1개)
+
+--ssh-rtt 로 원격 태스크 1개당 SSH 왕복 비용을 더해 실제 환경을 근사할 수 있습니다.
+
+사용법:
+    python tests/benchmarks/bench_rgw_buckets.py --users 100 --buckets-per-user 10
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from common import STUB_BIN, print_table, setup_paths, synthetic_rgw_users, timed
+
+setup_paths()
+
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from ceph_rgw_buckets import RGWBucketProvisioner  # noqa: E402
+
+STUB = str(STUB_BIN / "radosgw-admin")
+
+
+def legacy_loop(cli, users):
+    """기존 플레이북의 버킷별 bucket create loop 재현 (쿼터 미적용)"""
+    tasks = 0
+    for user in users:
+        for bucket in user["buckets"]:
+            cli.run(["bucket", "create", f"--bucket={bucket['name']}", f"--owner={user['user_id']}"], check=False)
+            tasks += 1
+    return tasks
+
+
+def module_run(cli, users, workers):
+    RGWBucketProvisioner(cli, workers=workers).apply(users)
+    return 1
+
+
+def run_case(size, buckets_per_user, workers, ssh_rtt):
+    users = synthetic_rgw_users(size, buckets_per_user)
+    row = {"buckets": size * buckets_per_user}
+    for label, func in (("loop", lambda c: legacy_loop(c, users)),
+                        ("module", lambda c: module_run(c, users, workers))):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as state:
+            json.dump({"users": {u["user_id"]: {} for u in users}}, state)
+            state.flush()
+            os.environ["RGW_STUB_STATE"] = state.name
+            cli = CephCLI(subprocess_runner, STUB, json_args=())
+            timings = {}
+            with timed(timings, "elapsed"):
+                remote_tasks = func(cli)
+            row[f"{label}_calls"] = cli.calls
+            row[f"{label}_tasks"] = remote_tasks
+            row[f"{label}_s"] = timings["elapsed"] + remote_tasks * ssh_rtt
+    row["speedup"] = row["loop_s"] / row["module_s"] if row["module_s"] else float("inf")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--buckets-per-user", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--ssh-rtt", type=float, default=0.0, help="원격 태스크당 추가 지연(초)")
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 명령당 지연(초)")
+    args = parser.parse_args()
+
+    os.environ["RGW_STUB_LATENCY"] = str(args.latency)
+    rows = [run_case(size, args.buckets_per_user, args.workers, args.ssh_rtt) for size in args.users]
+    print_table(
+        ["buckets", "loop calls", "loop tasks", "loop s", "module calls", "module tasks", "module s", "speedup"],
+        [[r["buckets"], r["loop_calls"], r["loop_tasks"], f"{r['loop_s']:.2f}",
+          r["module_calls"], r["module_tasks"], f"{r['module_s']:.2f}", f"{r['speedup']:.1f}x"] for r in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
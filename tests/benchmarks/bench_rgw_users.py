@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+RGW 사용자 생성 벤치마크: 기존 사용자별 loop vs ceph_rgw_users 모듈
+
+스텁 radosgw-admin(tests/fixtures/bin/radosgw-admin)을 대상으로 다음 두 방식을 비교합니다.
+
+- loop:   rgw-users.yml 의 기존 방식. 사용자마다 user info -> user create -> user info
+          (원격 태스크 3개 x 사용자 수)
+- module: metadata list user 1회 + 누락 사용자만 병렬 생성 (원격 태스크 1개)
+
+--ssh-rtt 로 원격 태스크 1개당 SSH 왕복 비용을 더해 실제 환경을 근사할 수 있습니다.
+
+사용법:
+    python tests/benchmarks/bench_rgw_users.py --sizes 10 100 1000
+"""
+
+import argparse
+import os
+import tempfile
+
+from common import STUB_BIN, print_table, setup_paths, synthetic_rgw_users, timed
+
+setup_paths()
+
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from ceph_rgw_users import RGWUserProvisioner  # noqa: E402
+
+STUB = str(STUB_BIN / "radosgw-admin")
+
+
+def legacy_loop(cli, users):
+    """기존 플레이북의 3단계 사용자별 loop 재현"""
+    exists = {}
+    for user in users:
+        rc, _, _ = cli.run(["user", "info", f"--uid={user['user_id']}"], check=False)
+        exists[user["user_id"]] = rc == 0
+    for user in users:
+        if not exists[user["user_id"]]:
+            cli.run(["user", "create", f"--uid={user['user_id']}",
+                     f"--display-name={user['display_name']}", f"--email={user['email']}",
+                     "--gen-access-key", "--gen-secret"], check=False)
+    for user in users:
+        cli.run_json(["user", "info", f"--uid={user['user_id']}"], check=False)
+    return 3
+
+
+def module_run(cli, users, workers):
+    RGWUserProvisioner(cli, workers=workers).apply(users)
+    return 1
+
+
+def run_case(size, workers, ssh_rtt):
+    users = synthetic_rgw_users(size)
+    row = {"users": size}
+    for label, func in (("loop", lambda c: legacy_loop(c, users)),
+                        ("module", lambda c: module_run(c, users, workers))):
+        with tempfile.NamedTemporaryFile(suffix=".json") as state:
+            os.environ["RGW_STUB_STATE"] = state.name
+            cli = CephCLI(subprocess_runner, STUB, json_args=())
+            timings = {}
+            with timed(timings, "elapsed"):
+                tasks_per_user = func(cli)
+            remote_tasks = tasks_per_user * size if label == "loop" else 1
+            row[f"{label}_calls"] = cli.calls
+            row[f"{label}_tasks"] = remote_tasks
+            row[f"{label}_s"] = timings["elapsed"] + remote_tasks * ssh_rtt
+    row["speedup"] = row["loop_s"] / row["module_s"] if row["module_s"] else float("inf")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--ssh-rtt", type=float, default=0.0, help="원격 태스크당 추가 지연(초)")
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 명령당 지연(초)")
+    args = parser.parse_args()
+
+    os.environ["RGW_STUB_LATENCY"] = str(args.latency)
+    rows = [run_case(size, args.workers, args.ssh_rtt) for size in args.sizes]
+    print_table(
+        ["users", "loop calls", "loop tasks", "loop s", "module calls", "module tasks", "module s", "speedup"],
+        [[r["users"], r["loop_calls"], r["loop_tasks"], f"{r['loop_s']:.2f}",
+          r["module_calls"], r["module_tasks"], f"{r['module_s']:.2f}", f"{r['speedup']:.1f}x"] for r in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
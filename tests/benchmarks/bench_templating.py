@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+템플릿 조회 비용 마이크로 벤치마크: 선형 검색 vs index_by
+
+사용자 수(N)에 따라 다음 두 패턴의 Jinja2 렌더링 시간을 비교합니다.
+
+- scan:  loop 항목마다 `results | selectattr('item.user_id', 'equalto', uid) | first`
+         (또는 CSV 행에 `select('search', uid) | first`) -> N번 x O(N) = O(N²)
+- index: `results | index_by` 로 한 번 색인 후 항목마다 dict 조회 -> O(N)
+
+Ansible Templar 대신 같은 필터를 등록한 Jinja2 환경을 사용하므로 절대값보다는
+N 증가에 따른 증가율을 비교하는 용도입니다.
+
+사용법:
+    python tests/benchmarks/bench_templating.py --sizes 100 500 1000 2000
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from common import PROJECT_ROOT, print_table, synthetic_rgw_users
+
+sys.path.insert(0, str(PROJECT_ROOT / "filter_plugins"))
+
+import jinja2  # noqa: E402
+from ceph_filters import index_by  # noqa: E402
+
+
+def make_env():
+    env = jinja2.Environment()
+    env.filters["index_by"] = index_by
+    env.filters["split"] = lambda s, sep=None: s.split(sep)
+    env.tests["search"] = lambda value, pattern: re.search(pattern, value) is not None
+    return env
+
+
+def registered_results(users):
+    """`register` 된 loop 결과 형태의 합성 데이터"""
+    return {"results": [{"item": u, "rc": 0, "stdout": "{}"} for u in users]}
+
+
+def bench_registered(env, users):
+    data = registered_results(users)
+    scan = env.from_string("{{ (user_info.results | selectattr('item.user_id', 'equalto', uid) | first).rc }}")
+    build = env.from_string("{{ user_info | index_by }}")
+    lookup = env.compile_expression("idx[uid].rc")
+
+    start = time.perf_counter()
+    for u in users:
+        scan.render(user_info=data, uid=u["user_id"])
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build.render(user_info=data)  # set_fact 1회에 해당
+    idx = index_by(data)
+    for u in users:
+        lookup(idx=idx, uid=u["user_id"])
+    index_s = time.perf_counter() - start
+    return scan_s, index_s
+
+
+def bench_csv(env, users):
+    rows = [f"{u['user_id']},{u['display_name']},{u['email']},AK{i},SK{i}" for i, u in enumerate(users)]
+    scan = env.from_string("{{ (keys | select('search', uid) | first).split(',')[3] }}")
+    lookup = env.compile_expression("idx[uid][3]")
+
+    start = time.perf_counter()
+    for u in users:
+        scan.render(keys=rows, uid=u["user_id"])
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    idx = index_by([r.split(",") for r in rows], 0)
+    for u in users:
+        lookup(idx=idx, uid=u["user_id"])
+    index_s = time.perf_counter() - start
+    return scan_s, index_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    env = make_env()
+    rows = []
+    for size in args.sizes:
+        users = synthetic_rgw_users(size)
+        reg_scan, reg_index = bench_registered(env, users)
+        csv_scan, csv_index = bench_csv(env, users)
+        rows.append([size, f"{reg_scan * 1000:.1f}", f"{reg_index * 1000:.1f}",
+                     f"{csv_scan * 1000:.1f}", f"{csv_index * 1000:.1f}"])
+    print_table(["users", "results scan ms", "results index ms", "csv scan ms", "csv index ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
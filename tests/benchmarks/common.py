@@ -0,0 +1,111 @@
+"""
+벤치마크 공통 헬퍼
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+STUB_BIN = PROJECT_ROOT / "tests" / "fixtures" / "bin"
+
+
+def setup_paths():
+    """library/ 모듈과 module_utils 를 Ansible 밖에서 import 할 수 있도록 경로 설정"""
+    import ansible.module_utils
+
+    module_utils = str(PROJECT_ROOT / "module_utils")
+    if module_utils not in ansible.module_utils.__path__:
+        ansible.module_utils.__path__.append(module_utils)
+    for sub in ("library",):
+        path = str(PROJECT_ROOT / sub)
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def synthetic_rgw_users(count, buckets_per_user=0):
+    """ceph-vars.yml 의 rgw_instance.users 형식을 따르는 합성 사용자 목록"""
+    caps = [
+        {"type": "buckets", "perm": "read, write, delete"},
+        {"type": "metadata", "perm": "read"},
+        {"type": "usage", "perm": "read"},
+        {"type": "zone", "perm": "read"},
+    ]
+    return [
+        {
+            "user_id": f"tenant{i:05d}",
+            "display_name": f"Tenant {i}",
+            "email": f"tenant{i}@example.com",
+            "caps": caps,
+            "buckets": [
+                {"name": f"tenant{i:05d}-bucket{j}", "permissions": "read, write, delete", "quota": "10GB"}
+                for j in range(buckets_per_user)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_ceph_vars(users=0, buckets=0, pools=0, images=0, csi=0, s3_url="http://127.0.0.1:8080"):
+    """02-services / 04-validation 플레이북이 모두 읽을 수 있는 합성 ceph-vars
+
+    users x buckets RGW 사용자/버킷, pools x images RBD 이미지, csi 명의 CSI 사용자.
+    결과 파일 경로는 OfflineCluster 작업 디렉토리 기준입니다.
+    """
+    rgw = {
+        "realm": "bench",
+        "zonegroup": "bench",
+        "zone": "bench",
+        "service_name": "rgw-bench",
+        "count": 2,
+        "gateway": {"s3_url": s3_url},
+        "users": synthetic_rgw_users(users, buckets),
+    }
+    return {
+        "ceph": {
+            "global": {"mon_max_pg_per_osd": 300},
+            "cephfs": [{"name": "fs-bench", "mds": {"count": 1}}],
+            "rgw": [rgw],
+            # 로컬 모듈은 플레이북 디렉터리 기준으로 상대 경로를 풀므로, 02-services 와 04-validation
+            # 양쪽에서 같은 파일을 가리키도록 ../02-services 기준 경로를 씁니다.
+            "rgw_user_creation_result_file": "../02-services/rgw-users.csv",
+            "rgw_bucket_creation_result_file": "../02-services/rgw-buckets.txt",
+            "rbd": [
+                {
+                    "pool_name": f"rbd-{p:03d}",
+                    "pool_pg_num": 16,
+                    "images": [{"image_name": f"vm-{i:05d}", "size": "1G"} for i in range(images)],
+                }
+                for p in range(pools)
+            ],
+            "csi": [
+                {
+                    "cluster_name": "k8s",
+                    "ceph_csi_user": f"csi-{i:05d}",
+                    "caps": {"mon": "profile rbd", "osd": "profile rbd pool=rbd-000"},
+                }
+                for i in range(csi)
+            ],
+            "csi_user_creation_result_file": "../02-services/csi.txt",
+        },
+        "rgw_instance": rgw,
+    }
+
+
+@contextmanager
+def timed(results, key):
+    """블록 실행 시간을 results[key] 에 기록"""
+    start = time.perf_counter()
+    yield
+    results[key] = time.perf_counter() - start
+
+
+def print_table(headers, rows):
+    """간단한 고정폭 표 출력"""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = "  ".join(str(h).rjust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths)))
@@ -11,6 +11,38 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# library/ 커스텀 모듈, filter_plugins, callback_plugins, scripts, module_utils 를
+# Ansible 밖에서 import 할 수 있도록 경로 추가
+sys.path.insert(0, str(project_root / "library"))
+sys.path.insert(0, str(project_root / "filter_plugins"))
+sys.path.insert(0, str(project_root / "callback_plugins"))
+sys.path.insert(0, str(project_root / "scripts"))
+try:
+    import ansible.module_utils
+
+    ansible.module_utils.__path__.append(str(project_root / "module_utils"))
+except ImportError:
+    pass
+
+from tests.fixtures import playbook_index as _playbook_index  # noqa: E402
+
+
+def pytest_configure(config):
+    """세션 공용 플레이북 색인 생성 (pytest 캐시가 켜져 있으면 해석 결과를 디스크에 유지)"""
+    cache = getattr(config, "cache", None)
+    cache_file = cache.mkdir("playbook-index") / "index.pickle" if cache is not None else None
+    _playbook_index.configure(cache_file)
+
+
+def pytest_sessionfinish(session):
+    _playbook_index.shared_index().save()
+
+
+@pytest.fixture(scope="session")
+def playbook_index():
+    """파일마다 한 번만 해석한 플레이북 색인 (내용은 테스트 간 공유되므로 수정 금지)"""
+    return _playbook_index.shared_index()
+
 
 @pytest.fixture
 def project_root():
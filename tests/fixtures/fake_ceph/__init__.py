@@ -0,0 +1,59 @@
+"""
+상태를 가진 가짜 Ceph / RGW CLI 에뮬레이터
+
+실제 클러스터 없이 플레이북과 커스텀 모듈을 끝까지 실행하기 위한 테스트 픽스처입니다.
+tests/fixtures/bin 의 `ceph`, `radosgw-admin`, `rbd` 는 이 패키지의 main() 을 부르는
+얇은 래퍼이며, 세 명령이 같은 저장소(풀, 이미지, 스냅샷, auth, 사용자, 버킷, 서비스)를
+공유하므로 `ceph osd pool create` 로 만든 풀에 `rbd create` 가 이미지를 만들 수 있습니다.
+
+환경 변수:
+    FAKE_CEPH_STATE    상태 파일 (*.db: SQLite, *.json: JSON, ':memory:' 은 프로세스 안에서만)
+                       기존 스텁의 RGW_STUB_STATE / CEPH_STUB_STATE 는 JSON 파일로 취급
+    FAKE_CEPH_LATENCY  명령별 지연 (예: 'ceph=0.3,rbd snap create=0.05,0.001')
+                       기존 스텁의 CEPH_STUB_LATENCY / RGW_STUB_LATENCY 도 도구별 기본값으로 사용
+    FAKE_CEPH_LOG      실행한 명령을 JSON lines 로 기록할 파일
+
+프로세스 안에서 쓰려면 FakeCluster 를 직접 만듭니다 (에이전트 백엔드, 벤치마크):
+
+    cluster = FakeCluster(open_store('/tmp/cluster.db'))
+    rc, out, err = cluster.run('rbd', ['ls', '-l', '-p', 'rbd', '--format', 'json'])
+"""
+
+import os
+import sys
+import tempfile
+
+from .cluster import CommandError, FakeCluster, Latency, default_state
+from .store import JSONStore, MemoryStore, SQLiteStore, open_store
+
+__all__ = ['CommandError', 'FakeCluster', 'JSONStore', 'Latency', 'MemoryStore', 'SQLiteStore', 'default_state',
+           'main', 'open_store', 'state_store']
+
+DEFAULT_STATE = os.path.join(tempfile.gettempdir(), 'fake-ceph.db')
+
+
+def state_store(environ=None):
+    """환경 변수 -> 저장소"""
+    environ = os.environ if environ is None else environ
+    if environ.get('FAKE_CEPH_STATE'):
+        return open_store(environ['FAKE_CEPH_STATE'])
+    for legacy in ('RGW_STUB_STATE', 'CEPH_STUB_STATE'):
+        if environ.get(legacy):
+            return JSONStore(environ[legacy])
+    return open_store(DEFAULT_STATE)
+
+
+def main(tool, argv=None):
+    """CLI 진입점: 명령 실행 결과를 stdout/stderr 로 출력하고 종료 코드 반환"""
+    argv = sys.argv[1:] if argv is None else argv
+    store = state_store()
+    try:
+        cluster = FakeCluster(store, Latency.from_env(), log=os.environ.get('FAKE_CEPH_LOG'))
+        rc, out, err = cluster.run(tool, argv)
+    finally:
+        store.close()
+    if out:
+        print(out)
+    if err:
+        print(err, file=sys.stderr)
+    return rc
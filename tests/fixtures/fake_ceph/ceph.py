@@ -0,0 +1,668 @@
+"""
+ceph 명령 처리기
+
+클러스터 상태(status/health/df/mon/mgr), OSD 트리, 풀, auth, config, CephFS 볼륨,
+오케스트레이터 호스트/서비스/데몬 명령을 흉내냅니다. 오케스트레이터는 이상적으로
+동작해서 `orch apply` 직후 배치 수만큼의 데몬이 running 상태가 됩니다.
+"""
+
+import hashlib
+import json
+
+from .cluster import (
+    EINVAL,
+    ENOENT,
+    CommandError,
+    Message,
+    command,
+    new_key,
+    new_pool,
+    table,
+)
+
+POOL_TOP_LEVEL = {'size', 'min_size', 'pg_num', 'pg_autoscale_mode'}
+POOL_INT = {'size', 'min_size', 'pg_num', 'pgp_num', 'pg_num_min', 'target_size_bytes'}
+CAP_ORDER = ('mon', 'osd', 'mgr', 'mds')
+
+
+def _words(args, count, usage):
+    if len(args) < count:
+        raise CommandError(EINVAL, f"Invalid command: missing required parameter ({usage})")
+    return args
+
+
+# 클러스터 상태
+
+def _health(c):
+    return {'status': c.setting('health', 'HEALTH_OK'), 'checks': c.setting('health_checks', {}), 'mutes': []}
+
+
+def _osd_counts(c):
+    osds = [o for _, o in c.store.items('osds')]
+    return len(osds), sum(1 for o in osds if o['up']), sum(1 for o in osds if o['in'])
+
+
+def _pgs(c):
+    return sum(p['pg_num'] for _, p in c.store.items('pools'))
+
+
+def _text_status(body):
+    osd = body['osdmap']
+    return '\n'.join([
+        '  cluster:',
+        f"    id:     {body['fsid']}",
+        f"    health: {body['health']['status']}",
+        '',
+        '  services:',
+        f"    mon: {body['monmap']['num_mons']} daemons, quorum {','.join(body['quorum_names'])}",
+        f"    osd: {osd['num_osds']} osds: {osd['num_up_osds']} up, {osd['num_in_osds']} in",
+        '',
+        '  data:',
+        f"    pools:   {body['pgmap']['num_pools']} pools, {body['pgmap']['num_pgs']} pgs",
+        f"    pgs:     {body['pgmap']['num_pgs']} active+clean",
+    ])
+
+
+@command('ceph', 'status', text=_text_status)
+@command('ceph', 's', text=_text_status)
+def status(c, args, opts):
+    total, up, in_ = _osd_counts(c)
+    pgs = _pgs(c)
+    mons = c.setting('mons', [])
+    return {
+        'fsid': c.setting('fsid'),
+        'health': _health(c),
+        'quorum_names': mons,
+        'monmap': {'num_mons': len(mons)},
+        'osdmap': {'num_osds': total, 'num_up_osds': up, 'num_in_osds': in_, 'num_remapped_pgs': 0},
+        'pgmap': {'num_pgs': pgs, 'num_pools': len(c.store.keys('pools')), 'num_objects': 0,
+                  'pgs_by_state': [{'state_name': 'active+clean', 'count': pgs}] if pgs else [],
+                  'bytes_used': 0, 'bytes_avail': total * 2 ** 40, 'bytes_total': total * 2 ** 40},
+        'mgrmap': {'available': True, 'num_standbys': 1},
+    }
+
+
+def _text_health(body):
+    lines = [body['status']]
+    for name, check in body['checks'].items():
+        lines.append(f"[{check.get('severity', 'WRN')[:3]}] {name}: {check.get('summary', {}).get('message', '')}")
+    return '\n'.join(lines)
+
+
+@command('ceph', 'health', text=_text_health)
+def health(c, args, opts):
+    return _health(c)
+
+
+@command('ceph', 'fsid', text=lambda body: body['fsid'])
+def fsid(c, args, opts):
+    return {'fsid': c.setting('fsid')}
+
+
+def _text_df(body):
+    return table(['POOL', 'ID', 'STORED', 'OBJECTS'],
+                 [[p['name'], p['id'], p['stats']['stored'], p['stats']['objects']] for p in body['pools']])
+
+
+@command('ceph', 'df', text=_text_df)
+def df(c, args, opts):
+    total = len(c.store.keys('osds')) * 2 ** 40
+    pools = []
+    for name, pool in c.store.items('pools'):
+        images = c.store.keys('images', f"{name}/")
+        pools.append({'name': name, 'id': pool['pool_id'],
+                      'stats': {'stored': 0, 'objects': len(images), 'percent_used': 0.0}})
+    return {'stats': {'total_bytes': total, 'total_used_bytes': 0, 'total_avail_bytes': total}, 'pools': pools}
+
+
+@command('ceph', 'mon dump')
+def mon_dump(c, args, opts):
+    mons = c.setting('mons', [])
+    return {'epoch': 1, 'fsid': c.setting('fsid'), 'quorum': list(range(len(mons))),
+            'mons': [{'rank': i, 'name': name, 'addr': f"10.0.0.{i + 1}:6789/0"} for i, name in enumerate(mons)]}
+
+
+@command('ceph', 'mon stat', text=lambda b: f"e1: {b['num_mons']} mons, quorum {','.join(b['quorum_names'])}")
+def mon_stat(c, args, opts):
+    mons = c.setting('mons', [])
+    return {'epoch': 1, 'num_mons': len(mons), 'quorum_names': mons, 'leader': mons[0] if mons else None}
+
+
+@command('ceph', 'mgr stat', text=lambda b: f"active: {b['active_name']}, {b['num_standby']} standby")
+def mgr_stat(c, args, opts):
+    return {'epoch': 1, 'available': True, 'active_name': c.setting('mons', ['mgr'])[0], 'num_standby': 1}
+
+
+# OSD
+
+@command('ceph', 'osd stat', text=lambda b: f"{b['num_osds']} osds: {b['num_up_osds']} up, {b['num_in_osds']} in")
+def osd_stat(c, args, opts):
+    total, up, in_ = _osd_counts(c)
+    return {'epoch': 1, 'num_osds': total, 'num_up_osds': up, 'num_in_osds': in_, 'num_remapped_pgs': 0}
+
+
+def _tree_nodes(c):
+    osds = sorted((o for _, o in c.store.items('osds')), key=lambda o: o['id'])
+    hosts = sorted({o['host'] for o in osds})
+    host_ids = {h: -(i + 2) for i, h in enumerate(hosts)}
+    nodes = [{'id': -1, 'name': 'default', 'type': 'root', 'type_id': 11, 'children': [host_ids[h] for h in hosts]}]
+    for host in hosts:
+        nodes.append({'id': host_ids[host], 'name': host, 'type': 'host', 'type_id': 1,
+                      'children': [o['id'] for o in osds if o['host'] == host]})
+    for osd in osds:
+        nodes.append({'id': osd['id'], 'name': f"osd.{osd['id']}", 'type': 'osd', 'type_id': 0,
+                      'device_class': osd['device_class'], 'crush_weight': osd['crush_weight'], 'depth': 2,
+                      'status': 'up' if osd['up'] else 'down', 'reweight': 1.0 if osd['in'] else 0.0})
+    return nodes
+
+
+def _text_tree(body):
+    return table(['ID', 'CLASS', 'WEIGHT', 'TYPE NAME', 'STATUS', 'REWEIGHT'],
+                 [[n['id'], n.get('device_class', ''), n.get('crush_weight', ''),
+                   f"{'    ' * (0 if n['type'] == 'root' else 1 if n['type'] == 'host' else 2)}{n['type']} {n['name']}",
+                   n.get('status', ''), n.get('reweight', '')] for n in body['nodes']])
+
+
+@command('ceph', 'osd tree', text=_text_tree)
+def osd_tree(c, args, opts):
+    return {'nodes': _tree_nodes(c), 'stray': []}
+
+
+def _text_osd_df(body):
+    return table(['ID', 'CLASS', 'WEIGHT', 'SIZE', 'USE', '%USE', 'TYPE NAME'],
+                 [[n['id'], n.get('device_class', ''), n.get('crush_weight', ''), n.get('kb', 0), n.get('kb_used', 0),
+                   n.get('utilization', 0), f"{n['type']} {n['name']}"] for n in body['nodes']])
+
+
+@command('ceph', 'osd df', text=_text_osd_df)
+def osd_df(c, args, opts):
+    osds = {str(o['id']): o for _, o in c.store.items('osds')}
+    nodes = []
+    for node in _tree_nodes(c) if args[:1] == ['tree'] else [n for n in _tree_nodes(c) if n['type'] == 'osd']:
+        osd = osds.get(str(node['id']))
+        if osd:
+            node = dict(node, kb=osd['kb'], kb_used=osd['kb_used'], utilization=0.0)
+        nodes.append(node)
+    return {'nodes': nodes, 'summary': {'total_kb': sum(o['kb'] for o in osds.values()), 'total_kb_used': 0}}
+
+
+# 풀
+
+@command('ceph', 'osd lspools', text=lambda b: '\n'.join(f"{p['poolnum']} {p['poolname']}" for p in b))
+def osd_lspools(c, args, opts):
+    return [{'poolnum': p['pool_id'], 'poolname': name} for name, p in c.store.items('pools')]
+
+
+def _text_pool_ls(body):
+    if body and isinstance(body[0], dict):
+        return '\n'.join(f"pool {p['pool_id']} '{p['pool_name']}' replicated size {p['size']} "
+                         f"min_size {p['min_size']} pg_num {p['pg_num']} autoscale_mode {p['pg_autoscale_mode']} "
+                         f"application {','.join(p['application_metadata'])}" for p in body)
+    return '\n'.join(body)
+
+
+@command('ceph', 'osd pool ls', text=_text_pool_ls)
+def osd_pool_ls(c, args, opts):
+    pools = [p for _, p in c.store.items('pools')]
+    return pools if args[:1] == ['detail'] else [p['pool_name'] for p in pools]
+
+
+@command('ceph', 'osd pool create', write=True)
+def osd_pool_create(c, args, opts):
+    name = _words(args, 1, 'pool')[0]
+    if c.store.get('pools', name) is not None:
+        return Message(f"pool '{name}' already exists")
+    pg_num = int(args[1]) if len(args) > 1 and args[1].isdigit() else 32
+    c.store.put('pools', name, new_pool(c.next_id('next_pool_id'), name, pg_num))
+    return Message(f"pool '{name}' created")
+
+
+def _pool_value(key, value):
+    if key in POOL_INT:
+        return int(value)
+    if key == 'target_size_ratio':
+        return float(value)
+    return value
+
+
+@command('ceph', 'osd pool set', write=True)
+def osd_pool_set(c, args, opts):
+    name, key, value = _words(args, 3, 'pool var val')[:3]
+    pool = c.pool(name)
+    if key == 'bulk':
+        flags = [f for f in pool['flags_names'].split(',') if f and f != 'bulk']
+        if value.lower() in ('true', '1', 'yes', 'on'):
+            flags.append('bulk')
+        pool['flags_names'] = ','.join(flags)
+    elif key == 'pgp_num':
+        pool['pg_placement_num'] = int(value)
+    elif key in POOL_TOP_LEVEL:
+        pool[key] = _pool_value(key, value)
+    elif key in ('target_size_ratio', 'target_size_bytes', 'pg_num_min', 'compression_mode'):
+        pool['options'][key] = _pool_value(key, value)
+    else:
+        raise CommandError(EINVAL, f"Error EINVAL: unrecognized variable '{key}'")
+    c.store.put('pools', name, pool)
+    return Message(f"set pool {pool['pool_id']} {key} to {value}")
+
+
+@command('ceph', 'osd pool get', text=lambda b: '\n'.join(f"{k}: {v}" for k, v in b.items() if k != 'pool_id'))
+def osd_pool_get(c, args, opts):
+    name, key = _words(args, 2, 'pool var')[:2]
+    pool = c.pool(name)
+    value = pool.get(key, pool['options'].get(key))
+    if value is None:
+        raise CommandError(ENOENT, f"Error ENOENT: option '{key}' is not set on pool '{name}'")
+    return {'pool': name, 'pool_id': pool['pool_id'], key: value}
+
+
+@command('ceph', 'osd pool rm', write=True)
+@command('ceph', 'osd pool delete', write=True)
+def osd_pool_rm(c, args, opts):
+    name = _words(args, 1, 'pool')[0]
+    if c.store.get('pools', name) is None:
+        return Message(f"pool '{name}' does not exist")
+    if args[1:2] != [name] or not opts.flag('yes-i-really-really-mean-it'):
+        raise CommandError(1, 'Error EPERM: WARNING: this will *PERMANENTLY DESTROY* all data stored in pool '
+                              f"{name}.  If you are *ABSOLUTELY CERTAIN* that is what you want, pass the pool name "
+                              '*twice*, followed by --yes-i-really-really-mean-it.')
+    c.store.delete('pools', name)
+    for key in c.store.keys('images', f"{name}/"):
+        c.store.delete('images', key)
+    return Message(f"pool '{name}' removed")
+
+
+@command('ceph', 'osd pool application enable', write=True)
+def osd_pool_application_enable(c, args, opts):
+    name, app = _words(args, 2, 'pool app')[:2]
+    pool = c.pool(name)
+    pool['application_metadata'].setdefault(app, {})
+    c.store.put('pools', name, pool)
+    return Message(f"enabled application '{app}' on pool '{name}'")
+
+
+@command('ceph', 'osd pool application disable', write=True)
+def osd_pool_application_disable(c, args, opts):
+    name, app = _words(args, 2, 'pool app')[:2]
+    pool = c.pool(name)
+    pool['application_metadata'].pop(app, None)
+    c.store.put('pools', name, pool)
+    return Message(f"disable application '{app}' on pool '{name}'")
+
+
+@command('ceph', 'osd pool application get', text=lambda b: json.dumps(b, indent=4))
+def osd_pool_application_get(c, args, opts):
+    pool = c.pool(_words(args, 1, 'pool')[0])
+    apps = pool['application_metadata']
+    return apps.get(args[1], {}) if len(args) > 1 else apps
+
+
+def _text_pool_stats(body):
+    return '\n'.join(f"pool {p['pool_name']} id {p['pool_id']}\n  nothing is going on\n" for p in body)
+
+
+@command('ceph', 'osd pool stats', text=_text_pool_stats)
+def osd_pool_stats(c, args, opts):
+    pools = [c.pool(args[0])] if args else [p for _, p in c.store.items('pools')]
+    return [{'pool_name': p['pool_name'], 'pool_id': p['pool_id'], 'recovery': {}, 'recovery_rate': {},
+             'client_io_rate': {}} for p in pools]
+
+
+# auth
+
+def _auth_pairs(args):
+    if len(args) % 2:
+        raise CommandError(EINVAL, 'Error EINVAL: caps must be given as <type> <spec> pairs')
+    return {args[i]: args[i + 1] for i in range(0, len(args), 2)}
+
+
+def _keyring(entries):
+    lines = []
+    for entry in entries:
+        lines += [f"[{entry['entity']}]", f"\tkey = {entry['key']}"]
+        lines += [f'\tcaps {t} = "{v}"' for t, v in sorted(entry['caps'].items())]
+    return '\n'.join(lines)
+
+
+def _entity(c, name):
+    entry = c.store.get('auth', name)
+    if entry is None:
+        raise CommandError(ENOENT, f"Error ENOENT: failed to find {name} in keyring")
+    return entry
+
+
+@command('ceph', 'auth ls', text=lambda b: _keyring(b['auth_dump']))
+@command('ceph', 'auth list', text=lambda b: _keyring(b['auth_dump']))
+def auth_ls(c, args, opts):
+    return {'auth_dump': [entry for _, entry in c.store.items('auth')]}
+
+
+@command('ceph', 'auth get', text=_keyring)
+def auth_get(c, args, opts):
+    return [_entity(c, _words(args, 1, 'entity')[0])]
+
+
+@command('ceph', 'auth get-key', text=lambda b: b['key'])
+def auth_get_key(c, args, opts):
+    return {'key': _entity(c, _words(args, 1, 'entity')[0])['key']}
+
+
+@command('ceph', 'auth get-or-create', write=True, text=_keyring)
+def auth_get_or_create(c, args, opts):
+    name = _words(args, 1, 'entity')[0]
+    caps = _auth_pairs(args[1:])
+    entry = c.store.get('auth', name)
+    if entry is not None:
+        for cap, spec in caps.items():
+            if entry['caps'].get(cap) != spec:
+                raise CommandError(EINVAL, f"Error EINVAL: key for {name} exists but cap {cap} does not match")
+        return [entry]
+    entry = {'entity': name, 'key': new_key(), 'caps': caps}
+    c.store.put('auth', name, entry)
+    return [entry]
+
+
+@command('ceph', 'auth caps', write=True)
+def auth_caps(c, args, opts):
+    name = _words(args, 3, 'entity caps')[0]
+    entry = _entity(c, name)
+    entry['caps'] = _auth_pairs(args[1:])
+    c.store.put('auth', name, entry)
+    return Message(f"updated caps for {name}")
+
+
+@command('ceph', 'auth del', write=True)
+@command('ceph', 'auth rm', write=True)
+def auth_del(c, args, opts):
+    name = _words(args, 1, 'entity')[0]
+    _entity(c, name)
+    c.store.delete('auth', name)
+    return Message('updated')
+
+
+# config
+
+@command('ceph', 'config set', write=True)
+def config_set(c, args, opts):
+    who, key, value = _words(args, 3, 'who name value')[:3]
+    c.store.put('config', f"{who}/{key}", value)
+    return None
+
+
+@command('ceph', 'config get', text=str)
+def config_get(c, args, opts):
+    who, key = _words(args, 2, 'who key')[:2]
+    value = c.store.get('config', f"{who}/{key}")
+    if value is None:
+        raise CommandError(ENOENT, f"Error ENOENT: unrecognized key '{key}'")
+    return value
+
+
+@command('ceph', 'config dump', text=lambda b: table(['WHO', 'OPTION', 'VALUE'],
+                                                     [[e['section'], e['name'], e['value']] for e in b]))
+def config_dump(c, args, opts):
+    return [dict(zip(('section', 'name'), key.split('/', 1)), value=value) for key, value in c.store.items('config')]
+
+
+# 오케스트레이터
+
+def _hosts(c):
+    return [h for _, h in c.store.items('hosts')]
+
+
+def _placement_count(c, placement):
+    """--placement 값 -> 데몬 수 ('3', '3 host1 host2', 'host1 host2', 'label:rgw')"""
+    tokens = str(placement or '').replace(';', ' ').split()
+    if not tokens:
+        return 1
+    if tokens[0].isdigit():
+        return int(tokens[0])
+    if tokens[0].startswith('label:'):
+        label = tokens[0][6:]
+        return sum(1 for h in _hosts(c) if label in h['labels']) or 1
+    return len(tokens)
+
+
+def _daemons(c, service):
+    hosts = [h['hostname'] for h in _hosts(c)] or ['localhost']
+    count = service['placement'].get('count', 1)
+    daemons = []
+    for i in range(count):
+        host = hosts[i % len(hosts)]
+        suffix = hashlib.sha1(f"{service['service_name']}/{i}".encode()).hexdigest()[:6]
+        if service['service_id']:
+            daemon_id = f"{service['service_id']}.{host}.{suffix}"
+        else:
+            daemon_id = host if i < len(hosts) else f"{host}.{suffix}"
+        daemons.append({'daemon_type': service['service_type'], 'daemon_id': daemon_id,
+                        'daemon_name': f"{service['service_type']}.{daemon_id}", 'hostname': host,
+                        'service_name': service['service_name'], 'status': 1, 'status_desc': 'running'})
+    return daemons
+
+
+def _service_listing(c, service):
+    count = service['placement'].get('count', 1)
+    return dict(service, status={'running': count, 'size': count})
+
+
+def _text_orch_ls(body):
+    return table(['NAME', 'PORTS', 'RUNNING', 'REFRESHED', 'AGE', 'PLACEMENT'],
+                 [[s['service_name'], '', f"{s['status']['running']}/{s['status']['size']}", '1m ago', '1h',
+                   f"count:{s['placement'].get('count')}"] for s in body])
+
+
+@command('ceph', 'orch ls', text=_text_orch_ls)
+def orch_ls(c, args, opts):
+    service_type = opts.get_one('service-type') or (args[0] if args else None)
+    service_name = opts.get_one('service-name') or (args[1] if len(args) > 1 else None)
+    services = []
+    for name, service in c.store.items('services'):
+        if service_type and service['service_type'] != service_type:
+            continue
+        if service_name and name != service_name:
+            continue
+        services.append(_service_listing(c, service))
+    return services
+
+
+def _text_orch_ps(body):
+    return table(['NAME', 'HOST', 'PORTS', 'STATUS', 'REFRESHED', 'AGE'],
+                 [[d['daemon_name'], d['hostname'], '', f"{d['status_desc']} (1h)", '1m ago', '1h'] for d in body])
+
+
+@command('ceph', 'orch ps', text=_text_orch_ps)
+def orch_ps(c, args, opts):
+    service_name, daemon_type = opts.get_one('service-name'), opts.get_one('daemon-type')
+    hostname = opts.get_one('hostname') or (args[0] if args else None)
+    daemons = []
+    for name, service in c.store.items('services'):
+        if service_name and name != service_name:
+            continue
+        for daemon in _daemons(c, service):
+            if (daemon_type and daemon['daemon_type'] != daemon_type) or (hostname and daemon['hostname'] != hostname):
+                continue
+            daemons.append(daemon)
+    return daemons
+
+
+@command('ceph', 'orch apply', write=True)
+def orch_apply(c, args, opts):
+    service_type = _words(args, 1, 'service_type')[0]
+    service_id = args[1] if len(args) > 1 else None
+    if service_type == 'osd' and opts.flag('all-available-devices'):
+        service_id = 'all-available-devices'
+    name = f"{service_type}.{service_id}" if service_id else service_type
+    placement = opts.get_one('placement') or (' '.join(args[2:]) if len(args) > 2 else None)
+    spec = {k: opts.get_one(k) for k in ('realm', 'zonegroup', 'zone', 'port') if opts.get_one(k)}
+    c.store.put('services', name, {'service_type': service_type, 'service_id': service_id, 'service_name': name,
+                                   'placement': {'count': _placement_count(c, placement)}, 'spec': spec})
+    return Message(f"Scheduled {name} update...")
+
+
+@command('ceph', 'orch rm', write=True)
+def orch_rm(c, args, opts):
+    name = _words(args, 1, 'service_name')[0]
+    if not c.store.delete('services', name):
+        raise CommandError(EINVAL, f"Error EINVAL: Failed to remove service. <{name}> was not found.")
+    return Message(f"Removed service {name}")
+
+
+@command('ceph', 'orch host ls', text=lambda b: table(['HOST', 'ADDR', 'LABELS', 'STATUS'],
+                                                      [[h['hostname'], h['addr'], ','.join(h['labels']), h['status']]
+                                                       for h in b]))
+def orch_host_ls(c, args, opts):
+    return _hosts(c)
+
+
+@command('ceph', 'orch host add', write=True)
+def orch_host_add(c, args, opts):
+    name = _words(args, 1, 'hostname')[0]
+    addr = args[1] if len(args) > 1 else name
+    labels = list(args[2:]) + [label for v in opts.get('labels', []) for label in str(v).split(',') if label]
+    host = c.store.get('hosts', name) or {'hostname': name, 'addr': addr, 'labels': [], 'status': ''}
+    host['addr'] = addr
+    host['labels'] = list(dict.fromkeys(host['labels'] + labels))
+    c.store.put('hosts', name, host)
+    return Message(f"Added host '{name}' with addr '{addr}'")
+
+
+@command('ceph', 'orch host label add', write=True)
+def orch_host_label_add(c, args, opts):
+    name, label = _words(args, 2, 'hostname label')[:2]
+    host = c.store.get('hosts', name)
+    if host is None:
+        raise CommandError(EINVAL, f"Error EINVAL: host {name} does not exist")
+    if label not in host['labels']:
+        host['labels'].append(label)
+        c.store.put('hosts', name, host)
+    return Message(f"Added label {label} to host {name}")
+
+
+@command('ceph', 'orch host rm', write=True)
+def orch_host_rm(c, args, opts):
+    name = _words(args, 1, 'hostname')[0]
+    if not c.store.delete('hosts', name):
+        raise CommandError(EINVAL, f"Error EINVAL: host {name} does not exist")
+    return Message(f"Removed host '{name}'")
+
+
+@command('ceph', 'orch device ls', text=lambda b: table(['HOST', 'PATH', 'TYPE', 'SIZE', 'AVAILABLE'], []))
+def orch_device_ls(c, args, opts):
+    return [{'name': h['hostname'], 'addr': h['addr'], 'devices': []} for h in _hosts(c)]
+
+
+# CephFS
+
+def _fs_daemons(c, name):
+    service = c.store.get('services', f"mds.{name}")
+    return _daemons(c, service) if service else []
+
+
+@command('ceph', 'fs dump')
+def fs_dump(c, args, opts):
+    filesystems, standbys = [], []
+    for name, fs in c.store.items('filesystems'):
+        info = {}
+        for i, daemon in enumerate(_fs_daemons(c, name)):
+            if i < fs['max_mds'] and not fs.get('failed'):
+                info[f"gid_{fs['id']}{i:03d}"] = {'name': daemon['daemon_id'], 'rank': i, 'state': 'up:active'}
+            else:
+                standbys.append({'name': daemon['daemon_id'], 'rank': -1, 'state': 'up:standby'})
+        filesystems.append({'id': fs['id'], 'mdsmap': {'fs_name': name, 'max_mds': fs['max_mds'], 'info': info,
+                                                        'metadata_pool': fs['metadata_pool'],
+                                                        'data_pools': fs['data_pools'],
+                                                        'flags': 0 if not fs.get('failed') else 16}})
+    return {'epoch': 1, 'filesystems': filesystems, 'standbys': standbys}
+
+
+@command('ceph', 'fs ls', text=lambda b: '\n'.join(f"name: {f['name']}, metadata pool: {f['metadata_pool']}, "
+                                                     f"data pools: [{' '.join(f['data_pools'])} ]" for f in b))
+def fs_ls(c, args, opts):
+    pools = {p['pool_id']: name for name, p in c.store.items('pools')}
+    return [{'name': name, 'metadata_pool': pools.get(fs['metadata_pool']),
+             'data_pools': [pools.get(p) for p in fs['data_pools']]} for name, fs in c.store.items('filesystems')]
+
+
+@command('ceph', 'fs volume create', write=True)
+def fs_volume_create(c, args, opts):
+    name = _words(args, 1, 'name')[0]
+    if c.store.get('filesystems', name) is not None:
+        return Message(f"Volume '{name}' already exists")
+    pool_ids = []
+    for suffix in ('meta', 'data'):
+        pool_name = f"cephfs.{name}.{suffix}"
+        pool = c.store.get('pools', pool_name) or new_pool(c.next_id('next_pool_id'), pool_name, 16)
+        pool['application_metadata']['cephfs'] = {suffix: name}
+        c.store.put('pools', pool_name, pool)
+        pool_ids.append(pool['pool_id'])
+    c.store.put('filesystems', name, {'id': c.next_id('next_fs_id'), 'max_mds': 1,
+                                      'metadata_pool': pool_ids[0], 'data_pools': [pool_ids[1]]})
+    c.store.put('services', f"mds.{name}", {'service_type': 'mds', 'service_id': name, 'service_name': f"mds.{name}",
+                                             'placement': {'count': 2}, 'spec': {}})
+    return None
+
+
+def _text_fs_status(body):
+    blocks = []
+    for fs in body:
+        rows = [[d['rank'], d['state'], d['name']] for d in fs['mds']]
+        blocks.append(f"{fs['name']} - {fs['clients']} clients\n" + table(['RANK', 'STATE', 'MDS'], rows))
+    return '\n\n'.join(blocks)
+
+
+@command('ceph', 'fs status', text=_text_fs_status)
+def fs_status(c, args, opts):
+    dump = fs_dump(c, [], opts)
+    result = []
+    for fs in dump['filesystems']:
+        name = fs['mdsmap']['fs_name']
+        if args and args[0] != name:
+            continue
+        mds = [{'rank': d['rank'], 'state': d['state'].split(':')[1], 'name': d['name']}
+               for d in fs['mdsmap']['info'].values()]
+        mds += [{'rank': 'standby', 'state': 'standby', 'name': d['name']} for d in dump['standbys']
+                if d['name'].startswith(f"{name}.")]
+        result.append({'name': name, 'clients': 0, 'mds': mds})
+    return result
+
+
+@command('ceph', 'fs fail', write=True)
+def fs_fail(c, args, opts):
+    name = _words(args, 1, 'fs_name')[0]
+    fs = c.store.get('filesystems', name)
+    if fs is None:
+        raise CommandError(ENOENT, f"Error ENOENT: Filesystem not found: '{name}'")
+    fs['failed'] = True
+    c.store.put('filesystems', name, fs)
+    return Message(f"{name} marked not joinable; MDS cannot join the cluster. All MDS ranks marked failed.")
+
+
+@command('ceph', 'fs rm', write=True)
+def fs_rm(c, args, opts):
+    name = _words(args, 1, 'fs_name')[0]
+    fs = c.store.get('filesystems', name)
+    if fs is None:
+        return Message(f"filesystem '{name}' does not exist")
+    if not opts.flag('yes-i-really-mean-it'):
+        raise CommandError(1, 'Error EPERM: this is a DESTRUCTIVE operation and will make data in your filesystem '
+                              'permanently inaccessible.  Add --yes-i-really-mean-it if you are sure you wish to '
+                              'continue.')
+    if not fs.get('failed'):
+        raise CommandError(EINVAL, "Error EINVAL: all MDS daemons must be inactive/failed before removing "
+                                   'filesystem. See `ceph fs fail`.')
+    c.store.delete('filesystems', name)
+    return None
+
+
+@command('ceph', 'fs set', write=True)
+def fs_set(c, args, opts):
+    name, key, value = _words(args, 3, 'fs_name var val')[:3]
+    fs = c.store.get('filesystems', name)
+    if fs is None:
+        raise CommandError(ENOENT, f"Error ENOENT: Filesystem not found: '{name}'")
+    if key == 'max_mds':
+        fs['max_mds'] = int(value)
+    elif key == 'joinable':
+        fs['failed'] = value.lower() not in ('true', '1')
+    c.store.put('filesystems', name, fs)
+    return None
@@ -0,0 +1,287 @@
+"""
+가짜 클러스터 모델과 명령 디스패처
+
+ceph / radosgw-admin / rbd 명령을 (도구, 단어 접두사) 로 등록된 처리기에 넘깁니다.
+처리기는 저장소에서 상태를 읽고 바꾼 뒤 응답 본문(dict/list)을 돌려주고, 디스패처가
+--format 에 따라 JSON 또는 텍스트로 출력합니다. 오류는 CommandError(rc, 메시지)로
+알리며, 실제 CLI 와 같은 종료 코드(ENOENT=2, EEXIST=17, EINVAL=22)를 씁니다.
+
+    cluster = FakeCluster(open_store('/tmp/cluster.db'))
+    rc, out, err = cluster.run('ceph', ['osd', 'pool', 'ls', 'detail', '--format', 'json'])
+"""
+
+import base64
+import json
+import os
+import time
+import uuid
+
+ENOENT, EEXIST, EINVAL = 2, 17, 22
+
+# 도구별 값을 받는 옵션 (그 외 --옵션은 플래그)
+VALUE_OPTIONS = {
+    'ceph': {'format', 'service-type', 'service-name', 'placement', 'realm', 'zonegroup', 'zone', 'port',
+             'labels', 'hostname', 'daemon-type', 'cluster', 'conf', 'keyring', 'name', 'id', 'connect-timeout'},
+    'radosgw-admin': {'format', 'uid', 'bucket', 'owner', 'display-name', 'email', 'caps', 'quota-scope',
+                      'max-size', 'max-objects', 'rgw-realm', 'rgw-zonegroup', 'rgw-zone', 'access-key',
+                      'secret-key', 'key-type', 'subuser', 'access', 'tenant', 'bucket-id', 'max-entries'},
+    'rbd': {'format', 'pool', 'image', 'size', 'image-format', 'object-size', 'image-feature', 'snap',
+            'namespace', 'data-pool', 'order'},
+}
+SHORT_OPTIONS = {
+    'ceph': {'-f': 'format', '-n': 'name', '-c': 'conf', '-k': 'keyring'},
+    'radosgw-admin': {'-f': 'format'},
+    'rbd': {'-p': 'pool', '-s': 'size', '-l': 'long', '-f': 'format'},
+}
+# 출력 형식을 지정하지 않았을 때 JSON 으로 응답하는 도구 (radosgw-admin 은 항상 JSON)
+JSON_BY_DEFAULT = {'radosgw-admin'}
+
+_REGISTRY = {}
+
+
+class CommandError(Exception):
+    """명령 실패 (CLI 종료 코드와 stderr 메시지)"""
+
+    def __init__(self, rc, message):
+        super().__init__(message)
+        self.rc = rc
+        self.message = message
+
+
+def command(tool, words, write=False, text=None):
+    """처리기 등록 데코레이터
+
+    words:  'osd pool create' 처럼 명령 접두사 (남은 위치 인자는 처리기의 args)
+    write:  상태를 바꾸는 명령 (쓰기 트랜잭션으로 실행)
+    text:   --format 을 지정하지 않았을 때 본문 -> 텍스트 변환 함수
+    """
+    def register(func):
+        _REGISTRY.setdefault(tool, {})[tuple(words.split())] = (func, write, text)
+        return func
+    return register
+
+
+class Options(dict):
+    """옵션 이름 -> 값 목록 (같은 옵션을 여러 번 줄 수 있음)"""
+
+    def get_one(self, name, default=None):
+        values = self.get(name)
+        return values[-1] if values else default
+
+    def flag(self, name):
+        return name in self
+
+
+def parse_args(tool, argv):
+    """CLI 인자 -> (위치 인자, Options)"""
+    values, shorts = VALUE_OPTIONS.get(tool, set()), SHORT_OPTIONS.get(tool, {})
+    words, opts, args = [], Options(), iter(argv)
+    for arg in args:
+        if arg.startswith('--') and len(arg) > 2:
+            key, eq, value = arg[2:].partition('=')
+            key = key.replace('_', '-')
+            if not eq:
+                value = next(args, '') if key in values else True
+            opts.setdefault(key, []).append(value)
+        elif arg in shorts:
+            key = shorts[arg]
+            opts.setdefault(key, []).append(next(args, '') if key in values else True)
+        else:
+            words.append(arg)
+    return words, opts
+
+
+def resolve(tool, words):
+    """가장 긴 접두사가 일치하는 처리기 -> ((처리기, write, text), 남은 위치 인자)"""
+    handlers = _REGISTRY.get(tool, {})
+    for size in range(min(len(words), 4), 0, -1):
+        entry = handlers.get(tuple(words[:size]))
+        if entry:
+            return entry, words[size:]
+    return None, words
+
+
+class Latency:
+    """명령별 지연 시간 모델
+
+    'ceph=0.3,rbd snap create=0.05,radosgw-admin=0.02,0.001' 형식의 명세에서
+    (도구 + 명령 단어)와 가장 길게 일치하는 항목을 쓰고, 없으면 숫자만 있는 기본값을 씁니다.
+    """
+
+    def __init__(self, spec='', defaults=None):
+        self.rules, self.default = {}, 0.0
+        for tool, seconds in (defaults or {}).items():
+            self.rules[tuple(tool.split())] = float(seconds)
+        for part in (spec or '').split(','):
+            name, eq, seconds = part.strip().rpartition('=')
+            if not seconds:
+                continue
+            if eq:
+                self.rules[tuple(name.split())] = float(seconds)
+            else:
+                self.default = float(seconds)
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """FAKE_CEPH_LATENCY, 기존 스텁의 CEPH_STUB_LATENCY / RGW_STUB_LATENCY"""
+        environ = os.environ if environ is None else environ
+        legacy = {tool: environ[var] for tool, var in (('ceph', 'CEPH_STUB_LATENCY'),
+                                                       ('radosgw-admin', 'RGW_STUB_LATENCY'))
+                  if environ.get(var)}
+        return cls(environ.get('FAKE_CEPH_LATENCY', ''), legacy)
+
+    def seconds(self, tool, words):
+        key = (tool, *words)
+        for size in range(len(key), 0, -1):
+            if key[:size] in self.rules:
+                return self.rules[key[:size]]
+        return self.default
+
+
+DEFAULT_HOSTS = ('ceph-node-1', 'ceph-node-2', 'ceph-node-3')
+
+
+def default_state(osds_per_host=4):
+    """새 클러스터: mon 3, 호스트 3 x OSD 4, .mgr/rbd 풀, client.admin"""
+    osds = {}
+    for h, host in enumerate(DEFAULT_HOSTS):
+        for i in range(osds_per_host):
+            osd_id = h * osds_per_host + i
+            osds[str(osd_id)] = {'id': osd_id, 'host': host, 'device_class': 'hdd', 'up': True, 'in': True,
+                                 'crush_weight': 1.0, 'kb': 1024 ** 3, 'kb_used': 0}
+    return {
+        'cluster': {'fsid': str(uuid.uuid4()), 'health': 'HEALTH_OK', 'mons': list(DEFAULT_HOSTS),
+                    'next_pool_id': 3, 'next_fs_id': 1},
+        'hosts': {h: {'hostname': h, 'addr': f"10.0.0.{i + 1}", 'labels': ['_admin'] if i == 0 else [],
+                      'status': ''} for i, h in enumerate(DEFAULT_HOSTS)},
+        'osds': osds,
+        'pools': {
+            '.mgr': new_pool(1, '.mgr', 1, {'mgr': {}}),
+            'rbd': new_pool(2, 'rbd', 32, {'rbd': {}}),
+        },
+        'services': {
+            'mon': {'service_type': 'mon', 'service_id': None, 'service_name': 'mon', 'placement': {'count': 3}},
+            'mgr': {'service_type': 'mgr', 'service_id': None, 'service_name': 'mgr', 'placement': {'count': 2}},
+        },
+        'auth': {'client.admin': {'entity': 'client.admin', 'key': new_key(),
+                                  'caps': {'mds': 'allow *', 'mgr': 'allow *', 'mon': 'allow *', 'osd': 'allow *'}}},
+    }
+
+
+def new_pool(pool_id, name, pg_num=32, applications=None):
+    """`ceph osd pool ls detail` 항목 형식의 새 풀"""
+    return {'pool_id': pool_id, 'pool_name': name, 'size': 3, 'min_size': 2, 'pg_num': pg_num,
+            'pg_placement_num': pg_num, 'pg_autoscale_mode': 'on', 'flags_names': 'hashpspool',
+            'application_metadata': applications or {}, 'options': {}}
+
+
+def new_key():
+    """ceph 키 형식(base64 40자)의 임의 키"""
+    return base64.b64encode(os.urandom(28)).decode()
+
+
+class FakeCluster:
+    """저장소 하나를 공유하는 ceph / radosgw-admin / rbd 명령 에뮬레이터"""
+
+    def __init__(self, store, latency=None, clock=time.time, log=None):
+        # 처리기 모듈을 import 해서 명령 등록
+        from . import ceph, radosgw, rbd  # noqa: F401
+
+        self.store = store
+        self.latency = latency or Latency()
+        self.clock = clock
+        self.log = log
+        self.commands = 0
+        self._seed()
+
+    def _seed(self):
+        with self.store.transaction():
+            if self.store.get('cluster', 'fsid') is not None:
+                return
+        with self.store.transaction(write=True):
+            if self.store.get('cluster', 'fsid') is not None:
+                return
+            for kind, entries in default_state().items():
+                for key, value in entries.items():
+                    if self.store.get(kind, key) is None:
+                        self.store.put(kind, key, value)
+
+    def setting(self, key, default=None):
+        return self.store.get('cluster', key, default)
+
+    def next_id(self, key):
+        value = self.store.get('cluster', key, 1)
+        self.store.put('cluster', key, value + 1)
+        return value
+
+    def pool(self, name, tool='ceph'):
+        pool = self.store.get('pools', name)
+        if pool is None:
+            if tool == 'rbd':
+                raise CommandError(ENOENT, f"rbd: error opening pool '{name}': (2) No such file or directory")
+            raise CommandError(ENOENT, f"Error ENOENT: unrecognized pool '{name}'")
+        return pool
+
+    def run(self, tool, argv):
+        """명령 실행 -> (rc, stdout, stderr)"""
+        start = time.monotonic()
+        words, opts = parse_args(tool, list(argv))
+        delay = self.latency.seconds(tool, words)
+        if delay:
+            time.sleep(delay)
+        self.commands += 1
+        entry, args = resolve(tool, words)
+        if entry is None:
+            rc, out, err = EINVAL, '', self._unknown(tool, words)
+        else:
+            handler, write, text = entry
+            try:
+                with self.store.transaction(write=write):
+                    body = handler(self, args, opts)
+                rc, out, err = 0, self._render(tool, opts, body, text), ''
+                if isinstance(body, Message):
+                    out, err = '', body.text
+            except CommandError as e:
+                rc, out, err = e.rc, '', e.message
+        if self.log:
+            self._log(tool, argv, rc, time.monotonic() - start)
+        return rc, out, err
+
+    @staticmethod
+    def _unknown(tool, words):
+        if tool == 'radosgw-admin':
+            return f"unrecognized arg {' '.join(words)}"
+        if tool == 'rbd':
+            return f"rbd: error parsing command '{' '.join(words)}'"
+        return 'Error EINVAL: invalid command'
+
+    @staticmethod
+    def _render(tool, opts, body, text):
+        if body is None or isinstance(body, Message):
+            return ''
+        fmt = opts.get_one('format')
+        if fmt in ('json', 'json-pretty') or (fmt is None and (tool in JSON_BY_DEFAULT or text is None)):
+            return json.dumps(body, indent=4 if fmt != 'json' else None)
+        return text(body)
+
+    def _log(self, tool, argv, rc, elapsed):
+        line = json.dumps({'tool': tool, 'argv': list(argv), 'rc': rc, 'elapsed': round(elapsed, 6),
+                           'time': self.clock()})
+        with open(self.log, 'a') as f:
+            f.write(line + '\n')
+
+
+def table(headers, rows):
+    """CLI 텍스트 출력 형식의 고정폭 표"""
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [max([len(h)] + [len(r[i]) for r in rows]) for i, h in enumerate(headers)]
+    lines = ['  '.join(c.ljust(w) for c, w in zip(row, widths)).rstrip() for row in [list(headers)] + rows]
+    return '\n'.join(lines)
+
+
+class Message(str):
+    """본문 대신 stderr 로 내보내는 상태 메시지 (예: "pool 'x' created")"""
+
+    @property
+    def text(self):
+        return str(self)
@@ -0,0 +1,189 @@
+"""
+가짜 클러스터를 대상으로 실제 플레이북을 localhost 에서 실행하는 하네스
+
+작업 디렉토리에 playbooks/ 복사본, ceph-vars.yml, 인벤토리, ansible.cfg 를 만들고
+PATH 맨 앞에 tests/fixtures/bin 을 넣어 ansible-playbook 을 실행합니다. 인벤토리의
+모든 그룹(admin, mons, mgrs, osds, rgws, mdss)은 local 연결의 호스트 하나이므로
+`ceph_rgw_users`, `ceph_rbd_provision` 같은 모듈과 command 태스크가 모두 가짜
+`ceph` / `radosgw-admin` / `rbd` 를 부르고, 실행 결과는 같은 상태 파일에 남습니다.
+
+run() 은 ansible-playbook 프로세스 트리의 CPU 시간/최대 RSS, task_timing 콜백의 태스크
+기록, 그 실행 동안의 가짜 CLI 명령 기록을 함께 돌려줍니다. profile_remote=True 면
+모듈 실행마다 인터프리터 래퍼(remote.py)가 원격 측 CPU 시간을 따로 기록합니다.
+
+    offline = OfflineCluster(tmp_path, {'rgw_instance': {...}, 'ceph': {...}})
+    result = offline.run('02-services/rgw-users.yml')
+    assert result.returncode == 0
+    assert offline.cluster().store.keys('users') == [...]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from .cluster import FakeCluster, new_pool
+from .radosgw import new_user
+from .rbd import new_image
+from .remote import write_wrapper
+from .store import open_store
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+STUB_BIN = PROJECT_ROOT / 'tests' / 'fixtures' / 'bin'
+GROUPS = ('admin', 'mons', 'mgrs', 'osds', 'rgws', 'mdss')
+
+ANSIBLE_CFG = """[defaults]
+host_key_checking = False
+retry_files_enabled = False
+inventory = inventory.yml
+library = {root}/library
+module_utils = {root}/module_utils
+filter_plugins = {root}/filter_plugins
+callback_plugins = {root}/callback_plugins
+callbacks_enabled = task_timing
+stdout_callback = default
+gathering = explicit
+interpreter_python = {python}
+"""
+
+
+def ansible_playbook():
+    """현재 파이썬 환경의 ansible-playbook 경로 (없으면 None)"""
+    candidate = Path(sys.executable).parent / 'ansible-playbook'
+    return str(candidate) if candidate.exists() else shutil.which('ansible-playbook')
+
+
+def read_jsonl(path, start=0):
+    """JSON lines 파일의 start 번째 줄부터 (파일이 없으면 빈 목록)"""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f.read().splitlines()[start:] if line]
+
+
+class PlaybookRun:
+    """플레이북 실행 결과 (CompletedProcess 의 returncode/stdout/stderr 포함)"""
+
+    def __init__(self, args, returncode, stdout, stderr, elapsed, usage, tasks, commands, remote):
+        self.args = args
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.elapsed = elapsed
+        # ansible-playbook 과 모든 자식(워커, 모듈, CLI) 프로세스 합계
+        self.cpu_s = usage.ru_utime + usage.ru_stime
+        self.max_rss_kb = usage.ru_maxrss
+        self.tasks = tasks
+        self.commands = commands
+        self.remote = remote
+
+
+class OfflineCluster:
+    """작업 디렉토리 하나 = 가짜 클러스터 하나"""
+
+    def __init__(self, workdir, ceph_vars, state='cluster.db', latency='', timeout=600, profile_remote=False):
+        self.workdir = Path(workdir)
+        self.state = str(self.workdir / state)
+        self.latency = latency
+        self.timeout = timeout
+        self.profile_remote = profile_remote
+        self.runs = 0
+        self._prepare(ceph_vars)
+
+    def _prepare(self, ceph_vars):
+        shutil.copytree(PROJECT_ROOT / 'playbooks', self.workdir / 'playbooks', dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns('*.txt', '*.csv', '*.json'))
+        (self.workdir / 'ceph-vars.yml').write_text(yaml.safe_dump(ceph_vars, sort_keys=False))
+        interpreter = sys.executable
+        if self.profile_remote:
+            interpreter = write_wrapper(str(self.workdir / 'remote-python'), self.workdir / 'remote.jsonl')
+        host = {'localhost': {'ansible_connection': 'local', 'ansible_python_interpreter': interpreter,
+                              'ansible_become': False}}
+        inventory = {'all': {'children': {group: {'hosts': host} for group in GROUPS}}}
+        (self.workdir / 'inventory.yml').write_text(yaml.safe_dump(inventory, sort_keys=False))
+        (self.workdir / 'ansible.cfg').write_text(ANSIBLE_CFG.format(root=PROJECT_ROOT, python=sys.executable))
+
+    def environ(self):
+        env = dict(os.environ)
+        for legacy in ('RGW_STUB_STATE', 'CEPH_STUB_STATE'):
+            env.pop(legacy, None)
+        env.update({
+            'PATH': f"{STUB_BIN}{os.pathsep}{env.get('PATH', '')}",
+            'FAKE_CEPH_STATE': self.state,
+            'FAKE_CEPH_LATENCY': self.latency,
+            'FAKE_CEPH_LOG': str(self.workdir / 'commands.jsonl'),
+            # 실행 중인 실제 에이전트가 있어도 쓰지 않도록 작업 디렉토리의 소켓을 지정
+            'CEPH_AGENT_SOCKET': str(self.workdir / 'ceph-agent.sock'),
+            'ANSIBLE_CONFIG': str(self.workdir / 'ansible.cfg'),
+            'ANSIBLE_LOCAL_TEMP': str(self.workdir / '.ansible-tmp'),
+            'ANSIBLE_TASK_TIMING_DIR': str(self.workdir / 'task-timing'),
+        })
+        return env
+
+    def run(self, playbook, *args, extra_vars=None):
+        """playbooks/ 기준 상대 경로의 플레이북 실행 -> PlaybookRun"""
+        cmd = [ansible_playbook(), str(Path('playbooks') / playbook), *args]
+        if extra_vars:
+            cmd += ['-e', json.dumps(extra_vars)]
+        self.runs += 1
+        run_id = f"run{self.runs:04d}"
+        env = dict(self.environ(), ANSIBLE_TASK_TIMING_RUN_ID=run_id)
+        logs = {name: self.workdir / f"{name}.jsonl" for name in ('commands', 'remote')}
+        offsets = {name: len(read_jsonl(path)) for name, path in logs.items()}
+        out_path, err_path = self.workdir / f"{run_id}.out", self.workdir / f"{run_id}.err"
+
+        start = time.monotonic()
+        with open(out_path, 'w') as out, open(err_path, 'w') as err:
+            proc = subprocess.Popen(cmd, cwd=self.workdir, env=env, stdout=out, stderr=err, text=True)
+            # 이 프로세스 트리만의 rusage 를 얻기 위해 wait4 로 직접 회수
+            while True:
+                pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+                if pid:
+                    break
+                if time.monotonic() - start > self.timeout:
+                    proc.kill()
+                    pid, status, usage = os.wait4(proc.pid, 0)
+                    break
+                time.sleep(0.01)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+        elapsed = time.monotonic() - start
+
+        timing = self.workdir / 'task-timing' / f"{Path(playbook).stem}-{run_id}.jsonl"
+        return PlaybookRun(cmd, proc.returncode, out_path.read_text(), err_path.read_text(), elapsed, usage,
+                           [r for r in read_jsonl(timing) if r['type'] == 'task'],
+                           read_jsonl(logs['commands'], offsets['commands']),
+                           read_jsonl(logs['remote'], offsets['remote']))
+
+    def cluster(self):
+        """같은 상태 파일을 여는 FakeCluster (검증/사전 상태 구성용)"""
+        return FakeCluster(open_store(self.state))
+
+    def seed(self, users=(), images=None, size=1024 ** 3):
+        """CLI 를 거치지 않고 기존 상태 구성 (대규모 벤치마크용)
+
+        users:  ceph-vars 형식의 사용자 목록 (버킷은 만들지 않음)
+        images: {풀 이름: 이미지 이름 목록}, 없는 풀은 rbd 애플리케이션과 함께 생성
+        """
+        cluster = self.cluster()
+        now = cluster.clock()
+        with cluster.store.transaction(write=True):
+            for user in users:
+                caps = ';'.join(f"{c['type']}={c['perm']}" for c in user.get('caps') or [])
+                cluster.store.put('users', user['user_id'], new_user(user['user_id'], user.get('display_name', ''),
+                                                                     user.get('email', ''), caps))
+            for pool, names in (images or {}).items():
+                if cluster.store.get('pools', pool) is None:
+                    cluster.store.put('pools', pool, new_pool(cluster.next_id('next_pool_id'), pool, 32,
+                                                              {'rbd': {}}))
+                for name in names:
+                    cluster.store.put('images', f"{pool}/{name}", new_image(name, size, now))
+        cluster.store.close()
+
+    def commands(self):
+        """실행된 가짜 CLI 명령 기록 [{'tool', 'argv', 'rc', 'elapsed', 'time'}, ...]"""
+        return read_jsonl(self.workdir / 'commands.jsonl')
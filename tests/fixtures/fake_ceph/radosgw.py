@@ -0,0 +1,278 @@
+"""
+radosgw-admin 명령 처리기
+
+사용자, 키, 버킷, 버킷 쿼터, realm/zonegroup/zone 명령을 흉내냅니다.
+radosgw-admin 은 --format 과 관계없이 항상 JSON 으로 응답합니다.
+"""
+
+import secrets
+
+from .cluster import EEXIST, EINVAL, ENOENT, CommandError, command
+
+DEFAULT_QUOTA = {'enabled': False, 'check_on_raw': False, 'max_size': -1, 'max_size_kb': 0, 'max_objects': -1}
+
+
+def _required(opts, name, what):
+    value = opts.get_one(name)
+    if not value or value is True:
+        raise CommandError(EINVAL, f"{what} was not specified")
+    return value
+
+
+def parse_caps(text):
+    """'users=*;buckets=read,write' -> [{'type': 'users', 'perm': '*'}, ...]"""
+    caps = []
+    for part in str(text or '').split(';'):
+        kind, _, perm = part.strip().partition('=')
+        if kind:
+            caps.append({'type': kind.strip(), 'perm': perm.strip()})
+    return caps
+
+
+def _new_key(uid):
+    return {'user': uid, 'access_key': secrets.token_hex(10).upper(), 'secret_key': secrets.token_urlsafe(30)}
+
+
+def new_user(uid, display_name='', email='', caps=None):
+    """users/{uid} 에 저장하는 사용자 (`user info` 출력 형식)"""
+    return {
+        'user_id': uid,
+        'display_name': display_name,
+        'email': email,
+        'suspended': 0,
+        'max_buckets': 1000,
+        'caps': parse_caps(caps),
+        'keys': [_new_key(uid)],
+        'user_quota': dict(DEFAULT_QUOTA),
+    }
+
+
+def _user(c, uid):
+    user = c.store.get('users', uid)
+    if user is None:
+        raise CommandError(EINVAL, 'could not fetch user info: no user info saved')
+    # 이전 스텁 상태 파일의 caps 는 문자열
+    if isinstance(user.get('caps'), str):
+        user['caps'] = parse_caps(user['caps'])
+    return user
+
+
+def _bucket(c, name):
+    bucket = c.store.get('buckets', name)
+    if bucket is None:
+        raise CommandError(ENOENT, 'failure: 2: (2) No such file or directory')
+    return bucket
+
+
+# 사용자
+
+@command('radosgw-admin', 'metadata list user')
+@command('radosgw-admin', 'user list')
+def user_list(c, args, opts):
+    return c.store.keys('users')
+
+
+@command('radosgw-admin', 'user info')
+def user_info(c, args, opts):
+    return _user(c, _required(opts, 'uid', 'user id'))
+
+
+@command('radosgw-admin', 'user create', write=True)
+def user_create(c, args, opts):
+    uid = _required(opts, 'uid', 'user id')
+    if c.store.get('users', uid) is not None:
+        raise CommandError(EEXIST, f"could not create user: unable to create user, user: {uid} exists")
+    user = new_user(uid, opts.get_one('display-name', ''), opts.get_one('email', ''), opts.get_one('caps'))
+    c.store.put('users', uid, user)
+    return user
+
+
+@command('radosgw-admin', 'user modify', write=True)
+def user_modify(c, args, opts):
+    user = _user(c, _required(opts, 'uid', 'user id'))
+    for option, field in (('display-name', 'display_name'), ('email', 'email')):
+        if opts.get_one(option) is not None:
+            user[field] = opts.get_one(option)
+    c.store.put('users', user['user_id'], user)
+    return user
+
+
+@command('radosgw-admin', 'user rm', write=True)
+def user_rm(c, args, opts):
+    uid = _required(opts, 'uid', 'user id')
+    _user(c, uid)
+    owned = [name for name, b in c.store.items('buckets') if b['owner'] == uid]
+    if owned and not opts.flag('purge-data'):
+        raise CommandError(EEXIST, 'could not remove user: unable to remove user, must specify purge data to '
+                                   'remove user with buckets')
+    for name in owned:
+        c.store.delete('buckets', name)
+    c.store.delete('users', uid)
+    return None
+
+
+@command('radosgw-admin', 'caps add', write=True)
+def caps_add(c, args, opts):
+    user = _user(c, _required(opts, 'uid', 'user id'))
+    caps = {cap['type']: cap for cap in user['caps']}
+    caps.update({cap['type']: cap for cap in parse_caps(_required(opts, 'caps', 'caps'))})
+    user['caps'] = list(caps.values())
+    c.store.put('users', user['user_id'], user)
+    return user
+
+
+@command('radosgw-admin', 'key create', write=True)
+def key_create(c, args, opts):
+    user = _user(c, _required(opts, 'uid', 'user id'))
+    key = _new_key(user['user_id'])
+    for option, field in (('access-key', 'access_key'), ('secret-key', 'secret_key')):
+        if opts.get_one(option):
+            key[field] = opts.get_one(option)
+    user['keys'].append(key)
+    c.store.put('users', user['user_id'], user)
+    return user
+
+
+# 버킷
+
+@command('radosgw-admin', 'metadata list bucket')
+@command('radosgw-admin', 'bucket list')
+def bucket_list(c, args, opts):
+    uid = opts.get_one('uid')
+    if uid:
+        return [name for name, b in c.store.items('buckets') if b['owner'] == uid]
+    return c.store.keys('buckets')
+
+
+@command('radosgw-admin', 'bucket stats')
+def bucket_stats(c, args, opts):
+    name = opts.get_one('bucket')
+    if name:
+        return _bucket(c, name)
+    return [b for _, b in c.store.items('buckets')]
+
+
+@command('radosgw-admin', 'bucket create', write=True)
+def bucket_create(c, args, opts):
+    name, owner = _required(opts, 'bucket', 'bucket name'), opts.get_one('owner')
+    if c.store.get('users', owner) is None:
+        raise CommandError(ENOENT, f"could not create bucket: owner {owner} does not exist")
+    if c.store.get('buckets', name) is None:
+        c.store.put('buckets', name, {'bucket': name, 'owner': owner, 'usage': {},
+                                      'bucket_quota': dict(DEFAULT_QUOTA)})
+    return None
+
+
+@command('radosgw-admin', 'bucket link', write=True)
+def bucket_link(c, args, opts):
+    bucket = _bucket(c, _required(opts, 'bucket', 'bucket name'))
+    bucket['owner'] = _user(c, _required(opts, 'uid', 'user id'))['user_id']
+    c.store.put('buckets', bucket['bucket'], bucket)
+    return None
+
+
+@command('radosgw-admin', 'bucket rm', write=True)
+def bucket_rm(c, args, opts):
+    bucket = _bucket(c, _required(opts, 'bucket', 'bucket name'))
+    if (bucket.get('usage') or {}).get('rgw.main', {}).get('num_objects') and not opts.flag('purge-objects'):
+        raise CommandError(39, 'ERROR: could not remove non-empty bucket ' + bucket['bucket'])
+    c.store.delete('buckets', bucket['bucket'])
+    return None
+
+
+def _quota(c, opts, action):
+    scope = opts.get_one('quota-scope')
+    if scope == 'user':
+        owner = _user(c, _required(opts, 'uid', 'user id'))
+        target, kind, key, field = owner, 'users', owner['user_id'], 'user_quota'
+    elif scope == 'bucket':
+        name = _required(opts, 'bucket', 'bucket name')
+        target = c.store.get('buckets', name)
+        if target is None:
+            raise CommandError(ENOENT, f"ERROR: could not find bucket {name}")
+        kind, key, field = 'buckets', name, 'bucket_quota'
+    else:
+        raise CommandError(EINVAL, 'ERROR: invalid quota scope specification.')
+    limits = target.setdefault(field, dict(DEFAULT_QUOTA))
+    if action == 'set':
+        if opts.get_one('max-size') is not None:
+            limits['max_size'] = int(opts.get_one('max-size'))
+            limits['max_size_kb'] = max(0, limits['max_size']) // 1024
+        if opts.get_one('max-objects') is not None:
+            limits['max_objects'] = int(opts.get_one('max-objects'))
+    else:
+        limits['enabled'] = action == 'enable'
+    c.store.put(kind, key, target)
+    return None
+
+
+@command('radosgw-admin', 'quota set', write=True)
+def quota_set(c, args, opts):
+    return _quota(c, opts, 'set')
+
+
+@command('radosgw-admin', 'quota enable', write=True)
+def quota_enable(c, args, opts):
+    return _quota(c, opts, 'enable')
+
+
+@command('radosgw-admin', 'quota disable', write=True)
+def quota_disable(c, args, opts):
+    return _quota(c, opts, 'disable')
+
+
+# realm / zonegroup / zone
+
+def _multisite_create(c, kind, opts, option, extra=None):
+    name = _required(opts, option, f"{kind} name")
+    if c.store.get(kind, name) is not None:
+        raise CommandError(EEXIST, f"ERROR: couldn't create {kind} {name}: (17) File exists")
+    entry = {'id': secrets.token_hex(16), 'name': name, **(extra or {})}
+    c.store.put(kind, name, entry)
+    if opts.flag('default') or c.store.get('cluster', f"default_{kind}") is None:
+        c.store.put('cluster', f"default_{kind}", name)
+    return entry
+
+
+def _multisite_list(c, kind, plural):
+    return {'default_info': c.store.get('cluster', f"default_{kind}", ''), plural: c.store.keys(kind)}
+
+
+@command('radosgw-admin', 'realm create', write=True)
+def realm_create(c, args, opts):
+    return _multisite_create(c, 'realm', opts, 'rgw-realm', {'current_period': secrets.token_hex(16), 'epoch': 1})
+
+
+@command('radosgw-admin', 'realm list')
+def realm_list(c, args, opts):
+    return _multisite_list(c, 'realm', 'realms')
+
+
+@command('radosgw-admin', 'zonegroup create', write=True)
+def zonegroup_create(c, args, opts):
+    realm = opts.get_one('rgw-realm') or c.store.get('cluster', 'default_realm', '')
+    return _multisite_create(c, 'zonegroup', opts, 'rgw-zonegroup', {'realm_id': realm,
+                                                                      'is_master': str(opts.flag('master')).lower()})
+
+
+@command('radosgw-admin', 'zonegroup list')
+def zonegroup_list(c, args, opts):
+    return _multisite_list(c, 'zonegroup', 'zonegroups')
+
+
+@command('radosgw-admin', 'zone create', write=True)
+def zone_create(c, args, opts):
+    zonegroup = opts.get_one('rgw-zonegroup') or c.store.get('cluster', 'default_zonegroup', '')
+    return _multisite_create(c, 'zone', opts, 'rgw-zone', {'zonegroup': zonegroup})
+
+
+@command('radosgw-admin', 'zone list')
+def zone_list(c, args, opts):
+    return _multisite_list(c, 'zone', 'zones')
+
+
+@command('radosgw-admin', 'period update', write=True)
+def period_update(c, args, opts):
+    epoch = c.next_id('period_epoch')
+    return {'id': c.store.get('cluster', 'default_realm', ''), 'epoch': epoch,
+            'realm_name': c.store.get('cluster', 'default_realm', '')}
@@ -0,0 +1,316 @@
+"""
+rbd 명령 처리기
+
+풀 초기화, 이미지 생성/조회/크기 변경/삭제, 스냅샷 생성/조회/보호/삭제,
+image-meta 명령을 흉내냅니다. 이미지는 images/{pool}/{image} 키에 스냅샷과
+메타데이터를 함께 저장하므로 `rbd ls -l` 은 풀 하나의 범위 조회 한 번입니다.
+"""
+
+import re
+import secrets
+import time
+
+from .cluster import EEXIST, EINVAL, ENOENT, CommandError, command, table
+
+EBUSY, ENOTEMPTY = 16, 39
+CLI_TIME_FORMAT = '%a %b %d %H:%M:%S %Y'
+DEFAULT_FEATURES = ['layering', 'exclusive-lock', 'object-map', 'fast-diff', 'deep-flatten']
+SIZE_UNITS = {'': 1024 ** 2, 'b': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4, 'p': 1024 ** 5}
+
+
+def size_bytes(value, default_unit=''):
+    """'20G' / '4M' / 1024 -> 바이트
+
+    단위가 없으면 rbd CLI 처럼 MiB 로 읽습니다. `--object-size` 처럼 CLI 가 바이트로 읽는
+    값은 default_unit='b' 로 넘깁니다.
+    """
+    match = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([bkmgtp]?)(?:i?b)?\s*$', str(value).lower())
+    if not match:
+        raise CommandError(EINVAL, f"rbd: invalid size value '{value}'")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2) or default_unit])
+
+
+def human_size(value):
+    for unit in ('B', 'KiB', 'MiB', 'GiB', 'TiB'):
+        if value < 1024 or unit == 'TiB':
+            return f"{value:g} {unit}" if unit != 'B' else f"{value} B"
+        value /= 1024
+
+
+def parse_spec(args, opts, snap=False):
+    """'pool/image@snap' 또는 --pool/--image/--snap -> (pool, image, snap)"""
+    spec = args[0] if args else opts.get_one('image', '')
+    pool, _, rest = spec.rpartition('/')
+    image, _, snap_name = rest.partition('@')
+    pool = pool or opts.get_one('pool') or 'rbd'
+    snap_name = snap_name or opts.get_one('snap')
+    if not image:
+        raise CommandError(EINVAL, 'rbd: image name was not specified')
+    if snap and not snap_name:
+        raise CommandError(EINVAL, 'rbd: snapshot name was not specified')
+    return pool, image, snap_name
+
+
+def _image(c, pool, name):
+    c.pool(pool, 'rbd')
+    image = c.store.get('images', f"{pool}/{name}")
+    if image is None:
+        raise CommandError(ENOENT, f"rbd: error opening image {name}: (2) No such file or directory")
+    return image
+
+
+def _snapshot(image, name):
+    for snap in image['snapshots']:
+        if snap['name'] == name:
+            return snap
+    raise CommandError(ENOENT, f"rbd: failed to find snapshot {name}: (2) No such file or directory")
+
+
+def new_image(name, size, now, image_format=2, object_size=4 * 1024 ** 2, features=None):
+    """images/{pool}/{image} 에 저장하는 이미지 (크기는 바이트)"""
+    return {
+        'name': name,
+        'id': secrets.token_hex(6),
+        'size': size,
+        'format': image_format,
+        'object_size': object_size,
+        'order': object_size.bit_length() - 1,
+        'features': features or list(DEFAULT_FEATURES),
+        'create_timestamp': time.strftime(CLI_TIME_FORMAT, time.localtime(now)),
+        'snapshots': [],
+        'next_snap_id': 4,
+        'metadata': {},
+    }
+
+
+def _put(c, pool, image):
+    c.store.put('images', f"{pool}/{image['name']}", image)
+
+
+@command('rbd', 'pool init', write=True)
+def pool_init(c, args, opts):
+    name = args[0] if args else opts.get_one('pool', 'rbd')
+    pool = c.pool(name, 'rbd')
+    pool['application_metadata'].setdefault('rbd', {})
+    c.store.put('pools', name, pool)
+    return None
+
+
+# 이미지
+
+def _ls_long_entries(c, pool):
+    entries = []
+    for _, image in c.store.items('images', f"{pool}/"):
+        entries.append({'image': image['name'], 'id': image['id'], 'size': image['size'], 'format': image['format']})
+        for snap in image['snapshots']:
+            entries.append({'image': image['name'], 'id': image['id'], 'snapshot': snap['name'],
+                            'snapshot_id': snap['id'], 'size': snap['size'], 'format': image['format'],
+                            'protected': str(snap['protected']).lower()})
+    return entries
+
+
+def _text_ls(body):
+    if body and isinstance(body[0], dict):
+        return table(['NAME', 'SIZE', 'PARENT', 'FMT', 'PROT', 'LOCK'],
+                     [[f"{e['image']}@{e['snapshot']}" if 'snapshot' in e else e['image'], human_size(e['size']), '',
+                       e['format'], 'yes' if e.get('protected') == 'true' else '', ''] for e in body])
+    return '\n'.join(body)
+
+
+@command('rbd', 'ls', text=_text_ls)
+@command('rbd', 'list', text=_text_ls)
+def ls(c, args, opts):
+    pool = args[0] if args else opts.get_one('pool', 'rbd')
+    c.pool(pool, 'rbd')
+    if opts.flag('long'):
+        return _ls_long_entries(c, pool)
+    return [key.split('/', 1)[1] for key in c.store.keys('images', f"{pool}/")]
+
+
+@command('rbd', 'create', write=True)
+def create(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    c.pool(pool, 'rbd')
+    if opts.get_one('size') in (None, True):
+        raise CommandError(EINVAL, 'rbd: must specify --size <M/G/T>')
+    if c.store.get('images', f"{pool}/{name}") is not None:
+        raise CommandError(EEXIST, 'rbd: create error: (17) File exists')
+    _put(c, pool, new_image(name, size_bytes(opts.get_one('size')), c.clock(),
+                            image_format=int(opts.get_one('image-format', 2)),
+                            object_size=size_bytes(opts.get_one('object-size', '4M'), 'b'),
+                            features=opts.get('image-feature')))
+    return None
+
+
+def _text_info(body):
+    return '\n'.join([
+        f"rbd image '{body['name']}':",
+        f"\tsize {human_size(body['size'])} in {body['objects']} objects",
+        f"\torder {body['order']} ({human_size(body['object_size'])} objects)",
+        f"\tid: {body['id']}",
+        f"\tblock_name_prefix: {body['block_name_prefix']}",
+        f"\tformat: {body['format']}",
+        f"\tfeatures: {', '.join(body['features'])}",
+        f"\tcreate_timestamp: {body['create_timestamp']}",
+    ])
+
+
+@command('rbd', 'info', text=_text_info)
+def info(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    image = _image(c, pool, name)
+    return {'name': name, 'id': image['id'], 'size': image['size'],
+            'objects': -(-image['size'] // image['object_size']), 'order': image['order'],
+            'object_size': image['object_size'], 'snapshot_count': len(image['snapshots']),
+            'block_name_prefix': f"rbd_data.{image['id']}", 'format': image['format'],
+            'features': image['features'], 'op_features': [], 'flags': [],
+            'create_timestamp': image['create_timestamp']}
+
+
+@command('rbd', 'resize', write=True)
+def resize(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    image = _image(c, pool, name)
+    size = size_bytes(opts.get_one('size'))
+    if size < image['size'] and not opts.flag('allow-shrink'):
+        raise CommandError(EINVAL, 'rbd: shrinking an image is only allowed with the --allow-shrink flag')
+    image['size'] = size
+    _put(c, pool, image)
+    return None
+
+
+@command('rbd', 'rm', write=True)
+@command('rbd', 'remove', write=True)
+def rm(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    image = _image(c, pool, name)
+    if image['snapshots']:
+        raise CommandError(ENOTEMPTY, "rbd: image has snapshots - these must be deleted with 'rbd snap purge' "
+                                      'before the image can be removed.')
+    c.store.delete('images', f"{pool}/{name}")
+    return None
+
+
+# 스냅샷
+
+@command('rbd', 'snap create', write=True)
+@command('rbd', 'snap add', write=True)
+def snap_create(c, args, opts):
+    pool, name, snap_name = parse_spec(args, opts, snap=True)
+    image = _image(c, pool, name)
+    if any(s['name'] == snap_name for s in image['snapshots']):
+        raise CommandError(EEXIST, 'rbd: failed to create snapshot: (17) File exists')
+    image['snapshots'].append({'id': image['next_snap_id'], 'name': snap_name, 'size': image['size'],
+                               'protected': False,
+                               'timestamp': time.strftime(CLI_TIME_FORMAT, time.localtime(c.clock()))})
+    image['next_snap_id'] += 1
+    _put(c, pool, image)
+    return None
+
+
+def _text_snap_ls(body):
+    return table(['SNAPID', 'NAME', 'SIZE', 'PROTECTED', 'TIMESTAMP'],
+                 [[s['id'], s['name'], human_size(s['size']), 'yes' if s['protected'] == 'true' else '',
+                   s['timestamp']] for s in body])
+
+
+@command('rbd', 'snap ls', text=_text_snap_ls)
+@command('rbd', 'snap list', text=_text_snap_ls)
+def snap_ls(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    return [dict(s, protected=str(s['protected']).lower()) for s in _image(c, pool, name)['snapshots']]
+
+
+def _set_protected(c, args, opts, protected):
+    pool, name, snap_name = parse_spec(args, opts, snap=True)
+    image = _image(c, pool, name)
+    snap = _snapshot(image, snap_name)
+    if snap['protected'] == protected:
+        state = 'protected' if protected else 'unprotected'
+        raise CommandError(EBUSY, f"rbd: {'protecting' if protected else 'unprotecting'} snap failed: "
+                                  f"(16) Device or resource busy (snap is already {state})")
+    snap['protected'] = protected
+    _put(c, pool, image)
+    return None
+
+
+@command('rbd', 'snap protect', write=True)
+def snap_protect(c, args, opts):
+    return _set_protected(c, args, opts, True)
+
+
+@command('rbd', 'snap unprotect', write=True)
+def snap_unprotect(c, args, opts):
+    return _set_protected(c, args, opts, False)
+
+
+@command('rbd', 'snap rm', write=True)
+@command('rbd', 'snap remove', write=True)
+def snap_rm(c, args, opts):
+    pool, name, snap_name = parse_spec(args, opts, snap=True)
+    image = _image(c, pool, name)
+    if _snapshot(image, snap_name)['protected']:
+        raise CommandError(EBUSY, f"rbd: snapshot '{snap_name}' is protected from removal.")
+    image['snapshots'] = [s for s in image['snapshots'] if s['name'] != snap_name]
+    _put(c, pool, image)
+    return None
+
+
+@command('rbd', 'snap purge', write=True)
+def snap_purge(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    image = _image(c, pool, name)
+    protected = [s for s in image['snapshots'] if s['protected']]
+    image['snapshots'] = protected
+    _put(c, pool, image)
+    if protected:
+        raise CommandError(EBUSY, 'rbd: removing snaps failed: (16) Device or resource busy')
+    return None
+
+
+# image-meta
+
+def _text_meta(body):
+    if not body:
+        return 'There are 0 metadata on this image.'
+    return f"There are {len(body)} metadata on this image:\n\n" + table(['Key', 'Value'], sorted(body.items()))
+
+
+@command('rbd', 'image-meta list', text=_text_meta)
+@command('rbd', 'image-meta ls', text=_text_meta)
+def image_meta_list(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    return _image(c, pool, name)['metadata']
+
+
+@command('rbd', 'image-meta get', text=str)
+def image_meta_get(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    if len(args) < 2:
+        raise CommandError(EINVAL, 'rbd: metadata key was not specified')
+    value = _image(c, pool, name)['metadata'].get(args[1])
+    if value is None:
+        raise CommandError(ENOENT, f"rbd: failed to get metadata {args[1]} of image : (2) No such file or directory")
+    return value
+
+
+@command('rbd', 'image-meta set', write=True)
+def image_meta_set(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    if len(args) < 3:
+        raise CommandError(EINVAL, 'rbd: metadata key or value was not specified')
+    image = _image(c, pool, name)
+    image['metadata'][args[1]] = args[2]
+    _put(c, pool, image)
+    return None
+
+
+@command('rbd', 'image-meta remove', write=True)
+@command('rbd', 'image-meta rm', write=True)
+def image_meta_remove(c, args, opts):
+    pool, name, _ = parse_spec(args, opts)
+    image = _image(c, pool, name)
+    if len(args) < 2 or image['metadata'].pop(args[1], None) is None:
+        raise CommandError(ENOENT, 'rbd: failed to remove metadata : (2) No such file or directory')
+    _put(c, pool, image)
+    return None
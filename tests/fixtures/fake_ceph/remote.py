@@ -0,0 +1,58 @@
+"""
+원격(관리 대상 호스트) 측 모듈 실행 계측용 파이썬 인터프리터 래퍼
+
+OfflineCluster(profile_remote=True) 가 ansible_python_interpreter 로 지정합니다.
+Ansible 이 모듈(AnsiballZ_*.py)을 실행할 때마다 실제 인터프리터를 자식 프로세스로
+실행하고, 모듈과 모듈이 실행한 CLI 프로세스의 CPU 시간을 JSON lines 로 기록합니다.
+플레이북 전체 CPU 시간에서 이 값을 빼면 컨트롤러 측 비용이 남습니다.
+"""
+
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+
+_MODULE_RE = re.compile(r'AnsiballZ_(.+)\.py$')
+
+WRAPPER = """#!{python}
+import sys
+sys.path.insert(0, {fixtures!r})
+from fake_ceph.remote import main
+sys.exit(main(sys.argv[1:], {log!r}))
+"""
+
+
+def module_name(argv):
+    for arg in argv:
+        match = _MODULE_RE.search(os.path.basename(arg))
+        if match:
+            return match.group(1)
+    return None
+
+
+def cpu_seconds(usage):
+    return usage.ru_utime + usage.ru_stime
+
+
+def write_wrapper(path, log):
+    """실행 가능한 인터프리터 래퍼 스크립트 생성"""
+    fixtures = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(path, 'w') as f:
+        f.write(WRAPPER.format(python=sys.executable, fixtures=fixtures, log=str(log)))
+    os.chmod(path, 0o755)
+    return path
+
+
+def main(argv, log):
+    start = time.monotonic()
+    rc = subprocess.call([sys.executable, *argv])
+    cpu = cpu_seconds(resource.getrusage(resource.RUSAGE_CHILDREN)) + \
+        cpu_seconds(resource.getrusage(resource.RUSAGE_SELF))
+    line = json.dumps({'module': module_name(argv), 'rc': rc, 'cpu_s': round(cpu, 6),
+                       'elapsed': round(time.monotonic() - start, 6)})
+    with open(log, 'a') as f:
+        f.write(line + '\n')
+    return rc
@@ -0,0 +1,158 @@
+"""
+가짜 클러스터 상태 저장소
+
+상태는 종류(kind)별 {키: JSON 값} 묶음입니다 (예: users/{uid}, images/{pool}/{image}).
+명령 하나가 트랜잭션 하나이며, 세 가지 저장소가 같은 인터페이스를 가집니다.
+
+- MemoryStore: 프로세스 안에서만 유지 (에이전트 백엔드, 단위 테스트)
+- JSONStore:   파일 전체를 flock 으로 잠그고 읽고/씁니다. 기존 스텁의 RGW_STUB_STATE
+               형식({"users": {...}, "buckets": {...}})과 같으며 작은 상태에 적합합니다.
+- SQLiteStore: 키 단위로 읽고 씁니다. 명령마다 바뀐 행만 기록하므로 사용자 1만 명,
+               이미지 5만 개 규모에서도 명령당 비용이 상태 크기에 비례하지 않습니다.
+"""
+
+import copy
+import fcntl
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+def _prefix_upper(prefix):
+    """prefix 로 시작하는 키 범위의 상한 (prefix <= key < upper)"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class MemoryStore:
+    """dict 기반 저장소 (스레드 간 공유 가능)"""
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else {}
+        self.dirty = False
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def transaction(self, write=False):
+        with self._lock:
+            yield self
+
+    def get(self, kind, key, default=None):
+        value = self.data.get(kind, {}).get(key)
+        return copy.deepcopy(value) if value is not None else default
+
+    def put(self, kind, key, value):
+        self.data.setdefault(kind, {})[key] = copy.deepcopy(value)
+        self.dirty = True
+
+    def delete(self, kind, key):
+        removed = self.data.get(kind, {}).pop(key, None) is not None
+        self.dirty = self.dirty or removed
+        return removed
+
+    def keys(self, kind, prefix=''):
+        return sorted(k for k in self.data.get(kind, {}) if k.startswith(prefix))
+
+    def items(self, kind, prefix=''):
+        bucket = self.data.get(kind, {})
+        return [(k, copy.deepcopy(bucket[k])) for k in self.keys(kind, prefix)]
+
+    def close(self):
+        pass
+
+
+class JSONStore(MemoryStore):
+    """JSON 파일 저장소 (트랜잭션마다 파일 전체를 잠그고 다시 읽음)"""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    @contextmanager
+    def transaction(self, write=False):
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            f.seek(0)
+            raw = f.read()
+            self.data = json.loads(raw) if raw.strip() else {}
+            self.dirty = False
+            yield self
+            if write and self.dirty:
+                f.seek(0)
+                f.truncate()
+                json.dump(self.data, f)
+
+
+class SQLiteStore:
+    """SQLite 저장소 (WAL, 키 단위 읽기/쓰기)"""
+
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS objects '
+                          '(kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (kind, key)) '
+                          'WITHOUT ROWID')
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self, write=False):
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self
+                finally:
+                    self._depth -= 1
+                return
+            # 쓰기 명령은 처음부터 쓰기 잠금을 잡아서 읽기 -> 쓰기 승격 중 SQLITE_BUSY 를 피함
+            self.conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+            self._depth = 1
+            try:
+                yield self
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            else:
+                self.conn.execute('COMMIT')
+            finally:
+                self._depth = 0
+
+    def get(self, kind, key, default=None):
+        row = self.conn.execute('SELECT value FROM objects WHERE kind = ? AND key = ?', (kind, key)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def put(self, kind, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO objects (kind, key, value) VALUES (?, ?, ?)',
+                          (kind, key, json.dumps(value)))
+
+    def delete(self, kind, key):
+        return self.conn.execute('DELETE FROM objects WHERE kind = ? AND key = ?', (kind, key)).rowcount > 0
+
+    def _range(self, columns, kind, prefix):
+        if not prefix:
+            return self.conn.execute(f'SELECT {columns} FROM objects WHERE kind = ? ORDER BY key', (kind,))
+        return self.conn.execute(f'SELECT {columns} FROM objects WHERE kind = ? AND key >= ? AND key < ? ORDER BY key',
+                                 (kind, prefix, _prefix_upper(prefix)))
+
+    def keys(self, kind, prefix=''):
+        return [row[0] for row in self._range('key', kind, prefix)]
+
+    def items(self, kind, prefix=''):
+        return [(key, json.loads(value)) for key, value in self._range('key, value', kind, prefix)]
+
+    def close(self):
+        self.conn.close()
+
+
+def open_store(path=None):
+    """경로 -> 저장소 (None/':memory:' 은 메모리, *.json 은 JSON 파일, 그 외는 SQLite)"""
+    if not path or path == ':memory:':
+        return MemoryStore()
+    if str(path).endswith('.json'):
+        return JSONStore(str(path))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return SQLiteStore(str(path))
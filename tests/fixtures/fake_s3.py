@@ -0,0 +1,222 @@
+"""
+테스트용 로컬 S3 대체 서버
+
+RGW 대신 사용할 최소한의 S3 호환 HTTP 서버입니다. 버킷/오브젝트를 메모리에 저장하며
+ListBuckets, CreateBucket, ListObjects(V1/V2), Put/Get/Head/DeleteObject 를 지원합니다.
+서명은 검증하지 않고 Authorization 헤더의 access key 만 확인합니다. 사용된 서명 방식
+(`AWS4-HMAC-SHA256`, `AWS` 등)은 auth_schemes 에 기록합니다.
+
+    with FakeS3Server(access_keys={"AK"}) as s3:
+        boto3.client("s3", endpoint_url=s3.endpoint_url, ...)
+"""
+
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+from xml.sax.saxutils import escape
+
+_ACCESS_KEY_RE = re.compile(r"(?:Credential=|AWS )([^/:,\s]+)")
+
+
+def _decode_aws_chunked(body):
+    """aws-chunked 인코딩 본문에서 실제 데이터만 추출"""
+    out, pos = bytearray(), 0
+    while pos < len(body):
+        line_end = body.index(b"\r\n", pos)
+        size = int(body[pos:line_end].split(b";")[0], 16)
+        if size == 0:
+            break
+        out += body[line_end + 2:line_end + 2 + size]
+        pos = line_end + 2 + size + 2
+    return bytes(out)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def store(self):
+        return self.server.store
+
+    # -- 공통 ------------------------------------------------------------
+    def _send(self, status, body=b"", content_type="application/xml", headers=None):
+        if isinstance(body, str):
+            body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _error(self, status, code, message=""):
+        self._send(status, f"<?xml version='1.0' encoding='UTF-8'?><Error><Code>{code}</Code>"
+                           f"<Message>{escape(message)}</Message></Error>")
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            data = bytearray()
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                data += self.rfile.read(size)
+                self.rfile.readline()
+            body = bytes(data)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if "aws-chunked" in self.headers.get("Content-Encoding", "") or \
+                self.headers.get("x-amz-content-sha256", "").startswith("STREAMING-"):
+            body = _decode_aws_chunked(body)
+        return body
+
+    def _route(self):
+        """(access_key, bucket, key, query) 반환; 인증 실패 시 None"""
+        self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        authorization = self.headers.get("Authorization", "")
+        self.server.auth_schemes.add(authorization.split(" ", 1)[0] or None)
+        match = _ACCESS_KEY_RE.search(authorization)
+        access_key = match.group(1) if match else None
+        if self.server.access_keys is not None and access_key not in self.server.access_keys:
+            self._read_body()
+            self._error(403, "InvalidAccessKeyId", "unknown access key")
+            return None
+        parsed = urlparse(self.path)
+        parts = unquote(parsed.path).lstrip("/").split("/", 1)
+        bucket = parts[0] or None
+        key = parts[1] if len(parts) > 1 and parts[1] else None
+        return access_key, bucket, key, parse_qs(parsed.query, keep_blank_values=True)
+
+    # -- 메서드 ------------------------------------------------------------
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            return
+        access_key, bucket, key, query = route
+        with self.server.lock:
+            if bucket is None:
+                names = sorted(b for b, meta in self.store.items())
+                entries = "".join(f"<Bucket><Name>{escape(n)}</Name>"
+                                  f"<CreationDate>2024-01-01T00:00:00.000Z</CreationDate></Bucket>" for n in names)
+                return self._send(200, "<?xml version='1.0' encoding='UTF-8'?><ListAllMyBucketsResult>"
+                                       f"<Owner><ID>{escape(access_key or '')}</ID></Owner>"
+                                       f"<Buckets>{entries}</Buckets></ListAllMyBucketsResult>")
+            if bucket not in self.store:
+                return self._error(404, "NoSuchBucket", bucket)
+            objects = self.store[bucket]["objects"]
+            if key is None:
+                prefix = query.get("prefix", [""])[0]
+                keys = sorted(k for k in objects if k.startswith(prefix))
+                contents = "".join(
+                    f"<Contents><Key>{escape(k)}</Key><Size>{len(objects[k])}</Size>"
+                    f"<ETag>\"{hashlib.md5(objects[k]).hexdigest()}\"</ETag>"
+                    f"<LastModified>2024-01-01T00:00:00.000Z</LastModified></Contents>" for k in keys)
+                return self._send(200, "<?xml version='1.0' encoding='UTF-8'?><ListBucketResult>"
+                                       f"<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>"
+                                       f"<KeyCount>{len(keys)}</KeyCount><MaxKeys>1000</MaxKeys>"
+                                       f"<IsTruncated>false</IsTruncated>{contents}</ListBucketResult>")
+            if key not in objects:
+                return self._error(404, "NoSuchKey", key)
+            data = objects[key]
+        self._send(200, data, "application/octet-stream", {"ETag": f"\"{hashlib.md5(data).hexdigest()}\""})
+
+    def do_HEAD(self):
+        route = self._route()
+        if route is None:
+            return
+        _, bucket, key, _ = route
+        with self.server.lock:
+            if bucket not in self.store or (key is not None and key not in self.store[bucket]["objects"]):
+                return self._send(404)
+            data = self.store[bucket]["objects"][key] if key else b""
+        self._send(200, b"", headers={"Content-Length": str(len(data))} if key else None)
+
+    def do_PUT(self):
+        route = self._route()
+        if route is None:
+            return
+        access_key, bucket, key, _ = route
+        body = self._read_body()
+        with self.server.lock:
+            if key is None:
+                self.store.setdefault(bucket, {"owner": access_key, "objects": {}})
+                return self._send(200, headers={"Location": f"/{bucket}"})
+            if bucket not in self.store:
+                return self._error(404, "NoSuchBucket", bucket)
+            self.store[bucket]["objects"][key] = body
+        self._send(200, headers={"ETag": f"\"{hashlib.md5(body).hexdigest()}\""})
+
+    def do_DELETE(self):
+        route = self._route()
+        if route is None:
+            return
+        _, bucket, key, _ = route
+        with self.server.lock:
+            if bucket not in self.store:
+                return self._error(404, "NoSuchBucket", bucket)
+            if key is None:
+                del self.store[bucket]
+            else:
+                self.store[bucket]["objects"].pop(key, None)
+        self._send(204)
+
+
+class FakeS3Server:
+    """백그라운드 스레드에서 동작하는 로컬 S3 서버"""
+
+    def __init__(self, buckets=(), access_keys=None, latency=0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = {name: {"owner": None, "objects": {}} for name in buckets}
+        self.httpd.lock = threading.Lock()
+        self.httpd.access_keys = set(access_keys) if access_keys is not None else None
+        self.httpd.latency = latency
+        self.httpd.requests = 0
+        self.httpd.auth_schemes = set()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def store(self):
+        return self.httpd.store
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    @property
+    def auth_schemes(self):
+        return self.httpd.auth_schemes
+
+    def objects(self, bucket):
+        return self.httpd.store[bucket]["objects"]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,207 @@
+"""
+테스트 세션 공용 플레이북 색인
+
+플레이북 YAML 을 파일마다 한 번만 C 로더(CSafeLoader, 없으면 SafeLoader)로 해석하고
+(경로, mtime, 크기) 기준으로 메모이즈합니다. 해석 결과와 함께 플레이별 태스크,
+핸들러, import/include 대상, 모듈 사용 현황을 미리 계산해 두고, 세션이 끝나면
+pytest 캐시(.pytest_cache/d/playbook-index/)에 저장해서 다음 실행에서는 바뀐 파일만
+다시 해석합니다.
+
+색인이 돌려주는 플레이북 내용은 모든 테스트가 공유하므로 수정하면 안 됩니다.
+
+    index = PlaybookIndex(project_root / "playbooks", cache_file)
+    for entry in index.glob("**/*.yml"):
+        entry.error, entry.plays, entry.tasks(0), entry.modules
+"""
+
+import os
+import pickle
+from collections import Counter
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:  # libyaml 없이 빌드된 PyYAML
+    from yaml import SafeLoader as Loader
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CACHE_VERSION = 1
+
+# 모듈 이름이 아닌 태스크 키워드
+TASK_KEYWORDS = {
+    'name', 'when', 'loop', 'loop_control', 'register', 'vars', 'tags', 'become', 'become_user', 'become_method',
+    'delegate_to', 'delegate_facts', 'run_once', 'notify', 'listen', 'changed_when', 'failed_when',
+    'ignore_errors', 'ignore_unreachable', 'environment', 'no_log', 'args', 'async', 'poll', 'retries', 'delay',
+    'until', 'check_mode', 'diff', 'any_errors_fatal', 'throttle', 'timeout', 'debugger', 'module_defaults',
+    'collections', 'connection', 'remote_user', 'block', 'rescue', 'always', 'local_action',
+}
+INCLUDE_MODULES = {
+    'import_playbook', 'import_tasks', 'include_tasks', 'include', 'import_role', 'include_role',
+    'ansible.builtin.import_playbook', 'ansible.builtin.import_tasks', 'ansible.builtin.include_tasks',
+    'ansible.builtin.import_role', 'ansible.builtin.include_role',
+}
+
+
+def task_module(task):
+    """태스크 dict -> 모듈 이름 (block 이나 키워드만 있으면 None)"""
+    for key in task:
+        if key not in TASK_KEYWORDS and not key.startswith('with_'):
+            return key
+    return task.get('local_action', {}).get('module') if isinstance(task.get('local_action'), dict) else None
+
+
+def walk_tasks(tasks):
+    """block/rescue/always 안쪽까지 태스크를 순서대로 생성"""
+    for task in tasks or []:
+        if not isinstance(task, dict):
+            continue
+        yield task
+        for section in ('block', 'rescue', 'always'):
+            if isinstance(task.get(section), list):
+                yield from walk_tasks(task[section])
+
+
+def include_target(task, module):
+    """import/include 태스크 -> 대상 파일 또는 역할 이름"""
+    value = task.get(module)
+    if isinstance(value, dict):
+        return value.get('file') or value.get('name')
+    return value
+
+
+class PlaybookEntry:
+    """플레이북 파일 하나의 해석 결과와 미리 계산한 조회 정보"""
+
+    __slots__ = ('path', 'key', 'text', 'content', 'error', '_tasks', '_handlers', 'imports', 'modules')
+
+    def __init__(self, path, key, text):
+        self.path = path
+        self.key = key
+        self.text = text
+        self.content, self.error = None, None
+        try:
+            self.content = yaml.load(text, Loader=Loader)
+        except yaml.YAMLError as e:
+            self.error = str(e)
+        self._tasks, self._handlers, self.imports, self.modules = [], [], [], Counter()
+        for play in self.plays:
+            if not isinstance(play, dict):
+                self._tasks.append([])
+                self._handlers.append([])
+                continue
+            if 'import_playbook' in play or 'ansible.builtin.import_playbook' in play:
+                self.imports.append(('import_playbook', play.get('import_playbook')
+                                     or play.get('ansible.builtin.import_playbook')))
+            tasks = [t for key in ('pre_tasks', 'tasks', 'post_tasks') for t in play.get(key) or []]
+            self._tasks.append(play.get('tasks') or [])
+            self._handlers.append(play.get('handlers') or [])
+            for task in walk_tasks(tasks + list(play.get('handlers') or [])):
+                module = task_module(task)
+                if module is None:
+                    continue
+                self.modules[module] += 1
+                if module in INCLUDE_MODULES:
+                    self.imports.append((module.rsplit('.', 1)[-1], include_target(task, module)))
+            for role in play.get('roles') or []:
+                self.imports.append(('role', role.get('role') or role.get('name') if isinstance(role, dict) else role))
+
+    @property
+    def lines(self):
+        return self.text.splitlines(keepends=True)
+
+    @property
+    def plays(self):
+        return self.content if isinstance(self.content, list) else []
+
+    def tasks(self, play_index=0):
+        return self._tasks[play_index] if play_index < len(self._tasks) else []
+
+    def handlers(self, play_index=0):
+        return self._handlers[play_index] if play_index < len(self._handlers) else []
+
+    def uses_module(self, name):
+        """짧은 이름(command)과 FQCN(ansible.builtin.command) 모두 일치"""
+        return any(m == name or m.rsplit('.', 1)[-1] == name for m in self.modules)
+
+
+class PlaybookIndex:
+    """(경로, mtime, 크기) 기준 메모이즈와 디스크 캐시를 가진 플레이북 색인"""
+
+    def __init__(self, root, cache_file=None):
+        self.root = Path(root)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.entries = {}
+        self.parsed = 0
+        self._globs = {}
+        self._dirty = False
+        self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, loader, entries = pickle.load(f)
+        except Exception:
+            return
+        if version == CACHE_VERSION and loader == Loader.__name__:
+            self.entries = entries
+
+    def save(self):
+        """바뀐 항목이 있으면 캐시 파일을 원자적으로 갱신"""
+        if not self.cache_file or not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump((CACHE_VERSION, Loader.__name__, self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.cache_file)
+        self._dirty = False
+
+    def get(self, path):
+        """파일 하나의 PlaybookEntry (바뀌지 않았으면 메모이즈된 항목)"""
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(str(path))
+        if entry is None or entry.key != key:
+            entry = PlaybookEntry(path, key, path.read_text())
+            self.entries[str(path)] = entry
+            self.parsed += 1
+            self._dirty = True
+        return entry
+
+    def load(self, path):
+        """yaml.safe_load 와 같은 결과 (해석 오류는 yaml.YAMLError 로 다시 발생)"""
+        entry = self.get(path)
+        if entry.error:
+            raise yaml.YAMLError(entry.error)
+        return entry.content
+
+    def glob(self, pattern='**/*.yml', root=None):
+        """root(기본은 색인 루트) 아래 pattern 에 맞는 항목 목록 (경로 순, 목록은 세션 동안 메모이즈)"""
+        root = Path(root) if root else self.root
+        cache_key = (str(root), pattern)
+        if cache_key not in self._globs:
+            self._globs[cache_key] = sorted(root.glob(pattern))
+        return [self.get(path) for path in self._globs[cache_key]]
+
+    def using_module(self, name, pattern='**/*.yml'):
+        return [entry for entry in self.glob(pattern) if entry.uses_module(name)]
+
+
+_shared = None
+
+
+def configure(cache_file=None):
+    """세션 시작 시 공용 색인 생성 (cache_file 이 None 이면 디스크 캐시 없이 메모리에만 유지)"""
+    global _shared
+    _shared = PlaybookIndex(PROJECT_ROOT / "playbooks", cache_file)
+    return _shared
+
+
+def shared_index():
+    """세션 공용 색인 (conftest 의 playbook_index 픽스처와 TestablePlaybook 이 같이 사용)"""
+    return _shared if _shared is not None else configure()
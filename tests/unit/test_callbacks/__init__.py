@@ -0,0 +1 @@
+"""커스텀 콜백 플러그인 단위 테스트"""
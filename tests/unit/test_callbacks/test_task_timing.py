@@ -0,0 +1,187 @@
+"""
+task_timing 콜백 플러그인 및 scripts/compare_task_timings.py 단위 테스트
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from compare_task_timings import compare, load_run, main  # noqa: E402
+from task_timing import CallbackModule, command_seconds, delta_seconds, prometheus_text  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def named(name, **attrs):
+    return SimpleNamespace(get_name=lambda: name, **attrs)
+
+
+class FakeStats:
+    processed = {"mon1": 1}
+
+    def summarize(self, host):
+        return {"ok": 3, "changed": 0, "failures": 0}
+
+
+def result(host, task, **data):
+    return SimpleNamespace(_host=host, _task=task, _result=data)
+
+
+@pytest.fixture
+def callback(tmp_path):
+    clock = FakeClock()
+    cb = CallbackModule(clock=clock)
+    cb.output_dir = str(tmp_path)
+    cb.run_id = "r1"
+    return cb, clock
+
+
+def run_playbook(cb, clock, items=3, item_s=0.5):
+    """loop 태스크 1개와 같은 이름의 태스크 2개를 호스트 1개에서 실행"""
+    host = named("mon1")
+    loop = named("Create buckets", _uuid="t1", action="command")
+    debug1 = named("Show", _uuid="t2", action="debug")
+    debug2 = named("Show", _uuid="t3", action="debug")
+
+    cb.v2_playbook_on_start(SimpleNamespace(_file_name="/x/playbooks/rgw-buckets.yml"))
+    cb.v2_playbook_on_play_start(named("RGW"))
+    cb.v2_playbook_on_task_start(loop, False)
+    cb.v2_runner_on_start(host, loop)
+    for i in range(items):
+        clock.advance(item_s)
+        cb.v2_runner_item_on_ok(result(host, loop, item={"name": f"b{i}"}, _ansible_item_label=f"b{i}",
+                                       delta="0:00:00.250000"))
+    clock.advance(0.1)
+    cb.v2_runner_on_ok(result(host, loop, changed=True, results=[{"delta": "0:00:00.250000"}] * items))
+    for task in (debug1, debug2):
+        cb.v2_playbook_on_task_start(task, False)
+        cb.v2_runner_on_start(host, task)
+        clock.advance(0.01)
+        cb.v2_runner_on_ok(result(host, task))
+    clock.advance(0.01)
+    cb.v2_playbook_on_stats(FakeStats())
+    return cb.path
+
+
+def read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTaskTimingCallback:
+    """JSON lines 및 Prometheus 기록 테스트"""
+
+    @pytest.mark.parametrize("delta,expected", [
+        ("0:00:01.500000", 1.5), ("1:02:03", 3723.0), ("", None), (None, None), ("bogus", None),
+    ])
+    def test_delta_seconds(self, delta, expected):
+        assert delta_seconds(delta) == expected
+
+    def test_command_seconds_sums_loop_items(self):
+        assert command_seconds({"results": [{"delta": "0:00:01"}, {"skipped": True}, {"delta": "0:00:02"}]}) == 3.0
+        assert command_seconds({"msg": "no command"}) is None
+
+    def test_writes_task_item_and_run_records(self, callback):
+        cb, clock = callback
+        records = read(run_playbook(cb, clock))
+
+        assert [r["type"] for r in records] == ["start", "item", "item", "item", "task", "task", "task", "run"]
+        items = [r for r in records if r["type"] == "item"]
+        assert [(r["index"], r["item"], r["wall_s"], r["command_s"]) for r in items] == [
+            (0, "b0", 0.5, 0.25), (1, "b1", 0.5, 0.25), (2, "b2", 0.5, 0.25)]
+        loop = records[4]
+        assert (loop["task_key"], loop["status"], loop["items"]) == ("RGW | Create buckets", "changed", 3)
+        assert loop["wall_s"] == pytest.approx(1.6)
+        assert loop["command_s"] == pytest.approx(0.75)
+        assert loop["overhead_s"] == pytest.approx(0.85)
+        assert [r["task_key"] for r in records[5:7]] == ["RGW | Show", "RGW | Show #2"]
+        assert records[-1]["duration_s"] == pytest.approx(1.63)
+        assert records[-1]["hosts"] == {"mon1": {"ok": 3, "changed": 0, "failures": 0}}
+
+    def test_failed_and_ignored_status(self, callback):
+        cb, clock = callback
+        host, task = named("mon1"), named("Probe", _uuid="t9", action="shell")
+        cb.v2_playbook_on_start(SimpleNamespace(_file_name="probe.yml"))
+        cb.v2_playbook_on_play_start(named("P"))
+        cb.v2_playbook_on_task_start(task, False)
+        cb.v2_runner_on_failed(result(host, task, rc=1), ignore_errors=True)
+        cb.v2_runner_on_unreachable(result(host, task, unreachable=True))
+
+        assert [r["status"] for r in cb.records] == ["ignored", "unreachable"]
+
+    def test_prometheus_textfile(self, callback, tmp_path):
+        cb, clock = callback
+        run_playbook(cb, clock)
+        text = (tmp_path / "ansible_task_timing_rgw-buckets.prom").read_text()
+
+        assert "# TYPE ansible_task_duration_seconds gauge" in text
+        assert 'ansible_task_loop_items{playbook="rgw-buckets.yml",task="RGW | Create buckets",host="mon1"} 3' in text
+        labels = 'playbook="rgw-buckets.yml",task="RGW | Create buckets",host="mon1"'
+        assert f"ansible_task_command_seconds{{{labels}}}" in text
+        assert 'ansible_playbook_tasks{playbook="rgw-buckets.yml",status="changed"} 1' in text
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_prometheus_label_escaping(self):
+        record = {"task_key": 'say "hi"\\', "host": "h", "wall_s": 1.0, "command_s": None, "items": 0,
+                  "status": "ok"}
+        text = prometheus_text("p.yml", [record], 1.0, 2.0)
+
+        assert 'task="say \\"hi\\"\\\\"' in text
+        assert "ansible_task_command_seconds" not in text
+
+
+class TestCompareTaskTimings:
+    """두 실행 비교 테스트"""
+
+    @pytest.fixture
+    def runs(self, tmp_path):
+        paths = []
+        for run_id, items in (("base", 10), ("new", 40)):
+            clock = FakeClock()
+            cb = CallbackModule(clock=clock)
+            cb.output_dir, cb.run_id = str(tmp_path), run_id
+            paths.append(run_playbook(cb, clock, items=items))
+        return paths
+
+    def test_load_run_aggregates_hosts(self, runs):
+        run = load_run(runs[0])
+
+        assert run["run"]["run_id"] == "base"
+        task = run["tasks"]["RGW | Create buckets"]
+        assert (task["items"], task["hosts"]) == (10, 1)
+        assert task["per_item_s"] == pytest.approx(0.51)
+
+    def test_flags_regressions_and_loops_scaling_with_items(self, runs):
+        report = compare(load_run(runs[0]), load_run(runs[1]))
+
+        assert report["slowest"][0]["task_key"] == "RGW | Create buckets"
+        assert [e["task_key"] for e in report["regressions"]] == ["RGW | Create buckets"]
+        assert report["regressions"][0]["delta_s"] == pytest.approx(15.0)
+        loop = report["loops"][0]
+        assert (loop["items"], loop["base_items"], loop["scales_with_items"]) == (40, 10, True)
+        assert loop["exponent"] == pytest.approx(0.99, abs=0.01)
+        assert report["added"] == report["removed"] == []
+
+    def test_same_run_has_no_regressions(self, runs):
+        report = compare(load_run(runs[0]), load_run(runs[0]))
+
+        assert report["regressions"] == []
+        assert report["loops"][0]["exponent"] is None
+
+    def test_cli_exit_code(self, runs, capsys):
+        assert main([runs[0], runs[1]]) == 0
+        assert "Regressions" in capsys.readouterr().out
+        assert main([runs[0], runs[1], "--fail-on-regression", "--json"]) == 1
+        assert json.loads(capsys.readouterr().out)["regressions"]
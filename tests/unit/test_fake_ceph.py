@@ -0,0 +1,210 @@
+"""
+가짜 Ceph / RGW CLI 에뮬레이터(tests/fixtures/fake_ceph) 테스트
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.fixtures.fake_ceph import FakeCluster, Latency, open_store, state_store
+from tests.fixtures.fake_ceph.offline import STUB_BIN
+
+
+@pytest.fixture(params=["memory", "json", "sqlite"])
+def store(request, tmp_path):
+    path = {"memory": None, "json": tmp_path / "state.json", "sqlite": tmp_path / "state.db"}[request.param]
+    store = open_store(str(path) if path else None)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def cluster():
+    return FakeCluster(open_store())
+
+
+def run_json(cluster, tool, *argv):
+    rc, out, err = cluster.run(tool, [*argv, "--format", "json"])
+    assert rc == 0, err
+    return json.loads(out) if out else None
+
+
+class TestStores:
+    """세 저장소의 공통 인터페이스"""
+
+    def test_put_get_keys_delete(self, store):
+        with store.transaction(write=True):
+            store.put("images", "rbd/a", {"size": 1})
+            store.put("images", "rbd/b", {"size": 2})
+            store.put("images", "rbd-x/c", {"size": 3})
+        with store.transaction():
+            assert store.keys("images", "rbd/") == ["rbd/a", "rbd/b"]
+            assert store.items("images", "rbd-x/") == [("rbd-x/c", {"size": 3})]
+            assert store.get("images", "missing", "default") == "default"
+        with store.transaction(write=True):
+            assert store.delete("images", "rbd/a") is True
+            assert store.delete("images", "rbd/a") is False
+        with store.transaction():
+            assert store.keys("images") == ["rbd-x/c", "rbd/b"]
+
+    def test_values_are_copies(self, store):
+        with store.transaction(write=True):
+            store.put("users", "u1", {"caps": []})
+            store.get("users", "u1")["caps"].append("changed")
+            assert store.get("users", "u1") == {"caps": []}
+
+    def test_sqlite_rolls_back_failed_command(self, tmp_path):
+        cluster = FakeCluster(open_store(str(tmp_path / "state.db")))
+        cluster.run("ceph", ["osd", "pool", "create", "vol"])
+        rc, _, err = cluster.run("rbd", ["snap", "create", "vol/missing@s1"])
+
+        assert rc == 2
+        assert "No such file or directory" in err
+        assert cluster.store.keys("images") == []
+
+
+class TestCephCommands:
+    """ceph 명령: 풀, auth, 오케스트레이터, CephFS"""
+
+    def test_pool_lifecycle(self, cluster):
+        assert cluster.run("ceph", ["osd", "pool", "create", "vol", "64"])[2] == "pool 'vol' created"
+        cluster.run("ceph", ["osd", "pool", "set", "vol", "bulk", "true"])
+        cluster.run("ceph", ["osd", "pool", "set", "vol", "target_size_ratio", "0.2"])
+
+        detail = {p["pool_name"]: p for p in run_json(cluster, "ceph", "osd", "pool", "ls", "detail")}
+        assert detail["vol"]["pg_num"] == 64
+        assert "bulk" in detail["vol"]["flags_names"].split(",")
+        assert detail["vol"]["options"]["target_size_ratio"] == 0.2
+
+        rc, _, err = cluster.run("ceph", ["osd", "pool", "rm", "vol"])
+        assert rc == 1 and "--yes-i-really-really-mean-it" in err
+        cluster.run("ceph", ["osd", "pool", "rm", "vol", "vol", "--yes-i-really-really-mean-it"])
+        assert "vol" not in run_json(cluster, "ceph", "osd", "pool", "ls")
+
+    def test_auth_get_or_create_rejects_different_caps(self, cluster):
+        entry = run_json(cluster, "ceph", "auth", "get-or-create", "client.csi", "mon", "profile rbd")[0]
+        again = run_json(cluster, "ceph", "auth", "get-or-create", "client.csi", "mon", "profile rbd")[0]
+        rc, _, err = cluster.run("ceph", ["auth", "get-or-create", "client.csi", "mon", "allow *"])
+
+        assert again["key"] == entry["key"]
+        assert rc == 22 and "does not match" in err
+        assert "client.csi" in [e["entity"] for e in run_json(cluster, "ceph", "auth", "ls")["auth_dump"]]
+
+    def test_orch_apply_creates_running_daemons(self, cluster):
+        cluster.run("ceph", ["orch", "apply", "rgw", "main", "--placement=2 ceph-node-1 ceph-node-2"])
+
+        services = {s["service_name"]: s for s in run_json(cluster, "ceph", "orch", "ls")}
+        daemons = run_json(cluster, "ceph", "orch", "ps", "--service-name", "rgw.main")
+        assert services["rgw.main"]["status"] == {"running": 2, "size": 2}
+        assert sorted(d["hostname"] for d in daemons) == ["ceph-node-1", "ceph-node-2"]
+        assert "running" in cluster.run("ceph", ["orch", "ps"])[1]
+
+    def test_fs_volume_create(self, cluster):
+        cluster.run("ceph", ["fs", "volume", "create", "shared"])
+
+        dump = run_json(cluster, "ceph", "fs", "dump")
+        assert [fs["mdsmap"]["fs_name"] for fs in dump["filesystems"]] == ["shared"]
+        assert len(dump["filesystems"][0]["mdsmap"]["info"]) == 1 and len(dump["standbys"]) == 1
+        assert {"cephfs.shared.meta", "cephfs.shared.data"} <= set(run_json(cluster, "ceph", "osd", "pool", "ls"))
+
+    def test_text_and_unknown_commands(self, cluster):
+        assert cluster.run("ceph", ["health"]) == (0, "HEALTH_OK", "")
+        assert cluster.run("ceph", ["no", "such"]) == (22, "", "Error EINVAL: invalid command")
+
+
+class TestRBDCommands:
+    """rbd 명령: 이미지, 스냅샷, image-meta"""
+
+    def test_images_and_snapshots_in_ls_long(self, cluster):
+        cluster.run("rbd", ["create", "rbd/vm-1", "--size", "10G"])
+        cluster.run("rbd", ["snap", "create", "rbd/vm-1@daily"])
+
+        entries = run_json(cluster, "rbd", "ls", "-l", "-p", "rbd")
+        assert entries[0] == {"image": "vm-1", "id": entries[0]["id"], "size": 10 * 1024 ** 3, "format": 2}
+        assert entries[1]["snapshot"] == "daily" and entries[1]["protected"] == "false"
+        assert run_json(cluster, "rbd", "ls", "-p", "rbd") == ["vm-1"]
+        assert cluster.run("rbd", ["create", "rbd/vm-1", "--size", "1G"])[0] == 17
+
+    def test_protected_snapshots_block_removal(self, cluster):
+        cluster.run("rbd", ["create", "rbd/vm-1", "--size", "1024"])
+        for name in ("a", "b"):
+            cluster.run("rbd", ["snap", "create", f"rbd/vm-1@{name}"])
+        cluster.run("rbd", ["snap", "protect", "rbd/vm-1@a"])
+
+        assert cluster.run("rbd", ["snap", "rm", "rbd/vm-1@a"])[0] == 16
+        assert cluster.run("rbd", ["snap", "purge", "rbd/vm-1"])[0] == 16
+        assert [s["name"] for s in run_json(cluster, "rbd", "snap", "ls", "rbd/vm-1")] == ["a"]
+        assert cluster.run("rbd", ["rm", "rbd/vm-1"])[0] == 39
+
+    def test_image_meta(self, cluster):
+        cluster.run("rbd", ["create", "vm-1", "-p", "rbd", "-s", "1G"])
+        cluster.run("rbd", ["image-meta", "set", "rbd/vm-1", "backup", "hourly"])
+
+        assert run_json(cluster, "rbd", "image-meta", "list", "rbd/vm-1") == {"backup": "hourly"}
+        assert cluster.run("rbd", ["ls", "-p", "missing"])[0] == 2
+
+
+class TestRadosgwCommands:
+    """radosgw-admin 명령: 사용자, 버킷, 쿼터"""
+
+    def test_users_and_buckets(self, cluster):
+        user = run_json(cluster, "radosgw-admin", "user", "create", "--uid=alice", "--display-name=Alice",
+                        "--caps=buckets=read,write;usage=read")
+        rc, _, err = cluster.run("radosgw-admin", ["user", "create", "--uid=alice", "--display-name=Alice"])
+
+        assert user["caps"] == [{"type": "buckets", "perm": "read,write"}, {"type": "usage", "perm": "read"}]
+        assert rc == 17 and "exists" in err
+        assert cluster.run("radosgw-admin", ["bucket", "create", "--bucket=b1", "--owner=bob"])[0] == 2
+
+        cluster.run("radosgw-admin", ["bucket", "create", "--bucket=b1", "--owner=alice"])
+        cluster.run("radosgw-admin", ["quota", "set", "--quota-scope=bucket", "--bucket=b1", "--max-size=2048"])
+        cluster.run("radosgw-admin", ["quota", "enable", "--quota-scope=bucket", "--bucket=b1"])
+        stats = run_json(cluster, "radosgw-admin", "bucket", "stats", "--bucket=b1")
+        assert stats["owner"] == "alice"
+        assert stats["bucket_quota"]["enabled"] is True and stats["bucket_quota"]["max_size_kb"] == 2
+
+    def test_legacy_json_state_with_string_caps(self, tmp_path):
+        state = tmp_path / "state.json"
+        state.write_text(json.dumps({"users": {"u1": {"user_id": "u1", "caps": "usage=read", "keys": []}}}))
+        cluster = FakeCluster(state_store({"RGW_STUB_STATE": str(state)}))
+
+        assert run_json(cluster, "radosgw-admin", "user", "info", "--uid=u1")["caps"] == [
+            {"type": "usage", "perm": "read"}]
+        assert json.loads(state.read_text())["users"]["u1"]["user_id"] == "u1"
+
+
+class TestLatency:
+    """명령별 지연 시간 명세"""
+
+    def test_longest_prefix_wins(self):
+        latency = Latency("ceph=0.3,rbd snap create=0.05,0.001")
+
+        assert latency.seconds("ceph", ["osd", "pool", "ls"]) == 0.3
+        assert latency.seconds("rbd", ["snap", "create"]) == 0.05
+        assert latency.seconds("rbd", ["ls"]) == 0.001
+
+    def test_legacy_variables_are_tool_defaults(self):
+        latency = Latency.from_env({"RGW_STUB_LATENCY": "0.2", "FAKE_CEPH_LATENCY": "radosgw-admin user=0.5"})
+
+        assert latency.seconds("radosgw-admin", ["bucket", "stats"]) == 0.2
+        assert latency.seconds("radosgw-admin", ["user", "info"]) == 0.5
+        assert latency.seconds("ceph", ["status"]) == 0.0
+
+
+def test_executables_share_one_state(tmp_path):
+    env = dict(os.environ, FAKE_CEPH_STATE=str(tmp_path / "cluster.db"), FAKE_CEPH_LOG=str(tmp_path / "log.jsonl"))
+
+    def cli(tool, *argv):
+        return subprocess.run([sys.executable, str(STUB_BIN / tool), *argv], env=env, capture_output=True, text=True)
+
+    cli("ceph", "osd", "pool", "create", "vol")
+    cli("rbd", "pool", "init", "vol")
+    cli("rbd", "create", "vol/img", "--size", "1G")
+
+    assert cli("rbd", "ls", "vol").stdout.split() == ["img"]
+    assert "rbd" in json.loads(cli("ceph", "osd", "pool", "application", "get", "vol", "--format=json").stdout)
+    assert [json.loads(line)["tool"] for line in (tmp_path / "log.jsonl").read_text().splitlines()] == [
+        "ceph", "rbd", "rbd", "rbd", "ceph"]
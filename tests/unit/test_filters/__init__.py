@@ -0,0 +1 @@
+"""커스텀 Jinja2 필터 단위 테스트"""
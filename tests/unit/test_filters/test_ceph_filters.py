@@ -0,0 +1,124 @@
+"""
+ceph_filters 필터 플러그인 단위 테스트
+"""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.errors import AnsibleFilterError  # noqa: E402
+from ceph_filters import FilterModule, csv_rows, index_by, osd_tree_index  # noqa: E402
+
+
+class TestIndexBy:
+    """index_by 필터 테스트"""
+
+    @pytest.fixture
+    def registered(self):
+        """loop 로 register 된 결과 형태"""
+        return {
+            "changed": False,
+            "results": [
+                {"item": {"user_id": "admin"}, "rc": 0},
+                {"item": {"user_id": "user1"}, "rc": 22},
+                {"skipped": True},
+            ],
+        }
+
+    def test_indexes_registered_results_by_default(self, registered):
+        index = index_by(registered)
+
+        assert set(index) == {"admin", "user1"}
+        assert index["user1"]["rc"] == 22
+
+    def test_accepts_results_list(self, registered):
+        assert index_by(registered["results"])["admin"]["rc"] == 0
+
+    def test_custom_dotted_key(self):
+        items = [{"meta": {"name": "a"}, "v": 1}, {"meta": {"name": "b"}, "v": 2}]
+        assert index_by(items, "meta.name")["b"]["v"] == 2
+
+    def test_integer_key_for_rows(self):
+        rows = [["user1", "U", "u@x", "AK1", "SK1"], ["user10", "U", "u@x", "AK10", "SK10"]]
+        index = index_by(rows, 0)
+
+        # 부분 문자열 검색과 달리 user1 / user10 을 구분
+        assert index["user1"][3] == "AK1"
+        assert index["user10"][3] == "AK10"
+
+    def test_duplicate_keys_keep_last(self):
+        items = [{"k": "a", "v": 1}, {"k": "a", "v": 2}]
+        assert index_by(items, "k")["a"]["v"] == 2
+
+    def test_rejects_non_list(self):
+        with pytest.raises(AnsibleFilterError):
+            index_by("not-a-list")
+
+    def test_registered_in_filter_module(self):
+        assert FilterModule().filters()["index_by"] is index_by
+
+
+class TestCsvRows:
+    """csv_rows 필터 테스트"""
+
+    def test_quoted_commas_stay_in_one_field(self):
+        text = 'User ID,Display Name,Email,Access Key,Secret Key\nuser1,"Kim, Minsu",k@x, AK1 ,SK1\n\n'
+        rows = csv_rows(text, 5)
+
+        assert rows == [["user1", "Kim, Minsu", "k@x", "AK1", "SK1"]]
+        assert index_by(rows, 0)["user1"][4] == "SK1"
+
+    def test_skips_rows_with_other_column_counts(self):
+        assert csv_rows("h\na,b\nc,d,e\n", 2) == [["a", "b"]]
+        assert csv_rows("a,b\n", header=False) == [["a", "b"]]
+
+    def test_rejects_non_text(self):
+        with pytest.raises(AnsibleFilterError):
+            csv_rows(["a,b"])
+
+
+class TestOsdTreeIndex:
+    """osd_tree_index 필터 테스트"""
+
+    @pytest.fixture
+    def tree(self):
+        """rack 아래 host 가 있는 비연속 OSD ID 트리"""
+        return {
+            "nodes": [
+                {"id": -1, "name": "default", "type": "root", "children": [-5, -3]},
+                {"id": -5, "name": "rack1", "type": "rack", "children": [-2]},
+                {"id": -2, "name": "node1", "type": "host", "children": [7, 0]},
+                {"id": -3, "name": "node2", "type": "host", "children": [12]},
+                {"id": 0, "name": "osd.0", "type": "osd", "device_class": "hdd", "status": "up", "reweight": 1.0},
+                {"id": 7, "name": "osd.7", "type": "osd", "device_class": "ssd", "status": "up", "reweight": 0.0},
+                {"id": 12, "name": "osd.12", "type": "osd", "device_class": "hdd", "status": "down", "reweight": 1.0},
+                {"id": 20, "name": "osd.20", "type": "osd", "device_class": "nvme", "status": "up", "reweight": 1.0},
+            ],
+            "stray": [{"id": 30, "name": "osd.30", "status": "down"}],
+        }
+
+    def test_builds_host_index_with_sparse_ids(self, tree):
+        index = osd_tree_index(tree)
+
+        assert index["hosts"] == {"node1": [0, 7], "node2": [12]}
+        assert index["osds"][12]["host"] == "node2"
+        assert index["total"] == 4
+
+    def test_reports_unplaced_stray_down_and_out(self, tree):
+        index = osd_tree_index(tree)
+
+        assert index["unplaced"] == [20]
+        assert index["stray"] == [30]
+        assert index["down"] == [12]
+        assert index["out"] == [7]
+
+    def test_device_classes(self, tree):
+        assert osd_tree_index(tree)["device_classes"] == ["hdd", "nvme", "ssd"]
+
+    def test_empty_tree(self):
+        index = osd_tree_index({"nodes": [], "stray": []})
+        assert index["hosts"] == {} and index["total"] == 0
+
+    def test_rejects_unparsed_output(self):
+        with pytest.raises(AnsibleFilterError):
+            osd_tree_index('{"nodes": []}')
@@ -0,0 +1 @@
+"""커스텀 Ansible 모듈 단위 테스트"""
@@ -0,0 +1,231 @@
+"""
+ceph_agent 모듈 및 module_utils/ceph_agent.py 단위 테스트 (로컬 UNIX 소켓 사용)
+"""
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_agent import (  # noqa: E402
+    AgentClient,
+    AgentFallback,
+    AgentServer,
+    AgentUnavailable,
+    agent_socket,
+    cli_result,
+    default_agent,
+    serve,
+    spawn_agent,
+    split_global_args,
+)
+from ansible.module_utils.ceph_cli import CephCLI, run_parallel  # noqa: E402
+from ceph_agent import AgentController  # noqa: E402
+
+
+class FakeBackend:
+    """argv 를 JSON 으로 되돌려주는 백엔드 (tell 은 CLI 로 넘김)"""
+
+    method = "fake"
+
+    def __init__(self):
+        self.closed = False
+
+    def command(self, argv, data=None):
+        parsed = split_global_args(argv, data)
+        if parsed is None:
+            raise AgentFallback("cli only")
+        words, fmt, inbuf = parsed
+        if words == ["boom"]:
+            raise RuntimeError("backend exploded")
+        return 0, json.dumps({"words": words, "format": fmt, "inbuf": inbuf.decode()}), ""
+
+    def mon_command(self, cmd, inbuf=""):
+        return 0, json.dumps(cmd), ""
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "agent.sock")
+
+
+@pytest.fixture
+def agent(socket_path):
+    backend = FakeBackend()
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(socket_path, backend, 0, ready.set), daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    client = AgentClient(socket_path, timeout=5)
+    yield client, backend
+    try:
+        client.shutdown()
+    except AgentUnavailable:
+        pass
+    client.close()
+    thread.join(5)
+
+
+class FakeRunner:
+    def __init__(self):
+        self.commands = []
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        self.commands.append(cmd)
+        return 0, '{"cli": true}', ""
+
+
+class TestProtocolHelpers:
+    """CLI 인자 분리와 결과 변환 테스트"""
+
+    @pytest.mark.parametrize("argv,expected", [
+        (["osd", "pool", "ls", "--format", "json"], (["osd", "pool", "ls"], "json", b"")),
+        (["status", "--format=json-pretty"], (["status"], "json-pretty", b"")),
+        (["auth", "import", "-i", "-"], (["auth", "import"], None, b"[client.x]")),
+        (["osd", "pool", "rm", "p", "p", "--yes-i-really-really-mean-it"],
+         (["osd", "pool", "rm", "p", "p", "--yes-i-really-really-mean-it"], None, b"")),
+        (["auth", "import", "-i", "keyring"], None),
+        (["tell", "osd.0", "version"], None),
+        (["-s"], None),
+        (["status", "--connect-timeout=5"], None),
+        ([], None),
+    ])
+    def test_split_global_args(self, argv, expected):
+        assert split_global_args(argv, "[client.x]") == expected
+
+    def test_cli_result_uses_errno_names(self):
+        assert cli_result(-2, b"", "pool 'x' does not exist") == (2, "", "Error ENOENT: pool 'x' does not exist")
+        assert cli_result(0, b'{"a": 1}', "") == (0, '{"a": 1}', "")
+
+    def test_agent_socket_from_environment(self, socket_path, monkeypatch):
+        monkeypatch.setenv("CEPH_AGENT_SOCKET", socket_path)
+        assert agent_socket() is None
+        open(socket_path, "w").close()
+        assert agent_socket() == socket_path
+        assert default_agent("/usr/bin/ceph").path == socket_path
+        assert default_agent("radosgw-admin") is None
+        monkeypatch.setenv("CEPH_AGENT_SOCKET", "")
+        assert agent_socket() is None
+
+
+class TestAgentServer:
+    """소켓 서버와 클라이언트 테스트"""
+
+    def test_commands_share_one_connection(self, agent):
+        client, _ = agent
+        for _ in range(3):
+            rc, out, err = client.command(["osd", "pool", "ls", "--format", "json"])
+        assert (rc, json.loads(out)) == (0, {"words": ["osd", "pool", "ls"], "format": "json", "inbuf": ""})
+        assert client.mon_command({"prefix": "status"})[1] == '{"prefix": "status"}'
+        assert len(client._sockets) == 1
+        assert client.ping()["requests"] == 5
+
+    def test_fallback_and_backend_errors(self, agent):
+        client, _ = agent
+        with pytest.raises(AgentFallback):
+            client.command(["tell", "mon.a", "version"])
+        with pytest.raises(AgentFallback, match="backend exploded"):
+            client.command(["boom"])
+        stats = client.ping()
+        assert (stats["fallbacks"], stats["errors"]) == (1, 1)
+
+    def test_input_file_is_read_relative_to_the_caller(self, agent, tmp_path, monkeypatch):
+        client, _ = agent
+        (tmp_path / "keyring").write_text("[client.file]")
+        monkeypatch.chdir(tmp_path)
+
+        rc, out, _ = client.command(["auth", "import", "-i", "keyring"])
+        assert (rc, json.loads(out)["inbuf"]) == (0, "[client.file]")
+        with pytest.raises(AgentFallback, match="missing"):
+            client.command(["auth", "import", "-i", "missing"])
+
+    def test_parallel_clients_use_separate_connections(self, agent):
+        client, _ = agent
+        results = run_parallel(lambda i: client.command(["osd", "dump", str(i)]), range(16), workers=4)
+
+        assert all(error is None for _, _, error in results)
+        assert [json.loads(r[1])["words"][-1] for _, r, _ in results] == [str(i) for i in range(16)]
+
+    def test_shutdown_removes_socket_and_closes_backend(self, agent, socket_path):
+        client, backend = agent
+        assert client.shutdown()["stopping"] is True
+        client.close()
+        with pytest.raises(AgentUnavailable):
+            for _ in range(50):
+                AgentClient(socket_path, timeout=1).ping()
+                threading.Event().wait(0.05)
+        assert backend.closed
+
+    def test_idle_timeout_stops_server(self, socket_path):
+        clock = [0.0]
+        server = AgentServer(socket_path, FakeBackend(), clock=lambda: clock[0])
+        try:
+            clock[0] = 5.0
+            thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+            thread.start()
+            server.watch_idle(idle_timeout=2, interval=0.01)
+            thread.join(5)
+            assert not thread.is_alive()
+        finally:
+            server.server_close()
+
+
+class TestCephCLIAgent:
+    """CephCLI 의 에이전트 사용과 CLI 대체 테스트"""
+
+    def test_ceph_commands_go_through_agent(self, agent):
+        client, _ = agent
+        runner = FakeRunner()
+        cli = CephCLI(runner, "ceph", agent=client)
+
+        assert cli.run_json(["osd", "pool", "ls"])["words"] == ["osd", "pool", "ls"]
+        assert cli.run_json(["tell", "osd.0", "version"]) == {"cli": True}
+        assert (cli.calls, cli.agent_calls) == (2, 1)
+        assert runner.commands == [["ceph", "tell", "osd.0", "version", "--format", "json"]]
+
+    def test_unreachable_agent_falls_back_to_cli(self, socket_path):
+        runner = FakeRunner()
+        cli = CephCLI(runner, "ceph", agent=AgentClient(socket_path))
+
+        assert cli.run_json(["status"]) == {"cli": True}
+        assert cli.agent is None
+        assert cli.run_json(["status"]) == {"cli": True}
+        assert len(runner.commands) == 2
+
+    def test_agent_disabled(self, agent, monkeypatch, socket_path):
+        monkeypatch.setenv("CEPH_AGENT_SOCKET", socket_path)
+        assert CephCLI(FakeRunner(), "ceph").agent is not None
+        assert CephCLI(FakeRunner(), "ceph", agent=False).agent is None
+
+
+class TestAgentController:
+    """ceph_agent 모듈 시작/종료 테스트"""
+
+    def test_start_status_stop(self, socket_path):
+        controller = AgentController(socket_path, FakeBackend, idle_timeout=60, timeout=5)
+
+        assert controller.status() is None
+        assert controller.start(check_mode=True) == {"changed": True, "running": False, "method": "librados"}
+        started = controller.start()
+        assert started["changed"] is True and started["pid"] > 0
+        assert controller.start()["changed"] is False
+        stopped = controller.stop()
+        assert (stopped["changed"], stopped["pid"]) == (True, started["pid"])
+        for _ in range(100):
+            if controller.status() is None:
+                break
+            threading.Event().wait(0.05)
+        assert controller.status() is None
+        assert controller.stop()["changed"] is False
+
+    def test_backend_failure_is_reported(self, socket_path):
+        def broken():
+            raise OSError("no keyring")
+
+        with pytest.raises(RuntimeError, match="no keyring"):
+            spawn_agent(socket_path, broken, timeout=5)
@@ -0,0 +1,176 @@
+"""
+ceph_auth_clients 모듈 및 module_utils/ceph_auth.py 단위 테스트
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_auth import caps_args, caps_drift, caps_report, entity_name  # noqa: E402
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ceph_auth_clients import AuthReconciler  # noqa: E402
+
+
+class FakeCephAuth:
+    """메모리 기반 ceph auth 명령 대체"""
+
+    def __init__(self, entities=None):
+        self.entities = {name: {"entity": name, "key": f"KEY-{name}", "caps": caps}
+                         for name, caps in (entities or {}).items()}
+        self.commands = []
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        self.commands.append(cmd)
+        args = [a for a in cmd[1:] if a not in ("--format", "json")]
+        if args[:2] == ["auth", "ls"]:
+            return 0, json.dumps({"auth_dump": list(self.entities.values())}), ""
+        if args[:2] in (["auth", "get-or-create"], ["auth", "caps"]):
+            entity, rest = args[2], args[3:]
+            caps = dict(zip(rest[::2], rest[1::2]))
+            if args[1] == "caps":
+                self.entities[entity]["caps"] = caps
+                return 0, "", f"updated caps for {entity}"
+            self.entities.setdefault(entity, {"entity": entity, "key": f"NEW-{entity}", "caps": caps})
+            return 0, json.dumps([self.entities[entity]]), ""
+        return 1, "", "unknown command"
+
+    def count(self, *prefix):
+        return sum(1 for c in self.commands if c[1:1 + len(prefix)] == list(prefix))
+
+
+@pytest.fixture
+def clients():
+    """ceph-vars.yml 의 ceph.csi 형식"""
+    return [
+        {"cluster_name": "k8sdev", "ceph_csi_user": "csi-rbd-user",
+         "caps": {"mon": "profile rbd", "osd": "profile rbd pool=rbd-oa", "mgr": "profile rbd pool=rbd-oa"}},
+        {"cluster_name": "k8sdev", "ceph_csi_user": "csi-rbd-admin",
+         "caps": {"mds": "allow *", "mgr": "allow *", "mon": "allow *", "osd": "allow * pool=rbd-oa"}},
+    ]
+
+
+def make(fake, **kwargs):
+    return AuthReconciler(CephCLI(fake, "ceph"), **kwargs)
+
+
+class TestAuthHelpers:
+    """entity 이름, caps 비교/인자 생성 테스트"""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("csi-rbd-user", "client.csi-rbd-user"),
+        ("client.csi", "client.csi"),
+        ("my.user", "client.my.user"),
+    ])
+    def test_entity_name(self, name, expected):
+        assert entity_name(name) == expected
+
+    def test_drift_ignores_whitespace(self):
+        assert caps_drift({"mon": "profile rbd,  allow r"}, {"mon": "profile rbd, allow r"}) == {}
+
+    def test_drift_reports_changed_missing_and_extra(self):
+        drift = caps_drift({"mon": "profile rbd", "osd": "profile rbd pool=a"},
+                           {"mon": "profile rbd", "osd": "profile rbd", "mds": "allow *"})
+
+        assert drift == {"mds": {"expected": None, "actual": "allow *"},
+                         "osd": {"expected": "profile rbd pool=a", "actual": "profile rbd"}}
+
+    def test_caps_report_is_exact_per_cap_type(self):
+        report = caps_report({"osd": "profile rbd", "mon": "profile rbd"},
+                             {"mon": "profile  rbd", "osd": "profile rbd pool=x", "mds": "allow *"})
+
+        assert list(report) == ["mon", "osd", "mds"]
+        assert report["mon"]["match"] is True
+        assert report["osd"] == {"expected": "profile rbd", "actual": "profile rbd pool=x", "match": False}
+        assert report["mds"] == {"expected": None, "actual": "allow *", "match": False}
+
+    def test_caps_args_order(self):
+        assert caps_args({"osd": "o", "mds": "d", "mon": "m"}) == ["mon", "m", "osd", "o", "mds", "d"]
+
+
+class TestAuthReconciler:
+    """auth dump 기반 생성/갱신 테스트"""
+
+    def test_creates_missing_clients_from_one_dump(self, clients):
+        fake = FakeCephAuth()
+        result = make(fake).apply(clients)
+
+        assert result["created"] == ["client.csi-rbd-user", "client.csi-rbd-admin"]
+        assert result["clients"]["client.csi-rbd-user"]["key"] == "NEW-client.csi-rbd-user"
+        assert fake.count("auth", "ls") == 1
+        assert fake.count("auth", "get-key") == 0
+
+    def test_noop_rerun_is_a_single_command(self, clients):
+        fake = FakeCephAuth()
+        make(fake).apply(clients)
+        fake.commands.clear()
+
+        result = make(fake).apply(clients)
+
+        assert result["created"] == [] and result["updated"] == [] and result["drift"] == {}
+        assert len(fake.commands) == 1
+        assert result["clients"]["client.csi-rbd-admin"]["key"] == "NEW-client.csi-rbd-admin"
+
+    def test_updates_drifted_caps(self, clients):
+        fake = FakeCephAuth({"client.csi-rbd-user": {"mon": "profile rbd"},
+                             "client.csi-rbd-admin": clients[1]["caps"]})
+        result = make(fake).apply(clients)
+
+        assert result["updated"] == ["client.csi-rbd-user"]
+        assert set(result["drift"]["client.csi-rbd-user"]) == {"osd", "mgr"}
+        assert fake.entities["client.csi-rbd-user"]["caps"] == clients[0]["caps"]
+        assert result["clients"]["client.csi-rbd-user"]["key"] == "KEY-client.csi-rbd-user"
+
+    def test_drift_only_reported_when_updates_disabled(self, clients):
+        fake = FakeCephAuth({"client.csi-rbd-user": {"mon": "profile rbd"}})
+        result = make(fake, update_caps=False).apply(clients[:1])
+
+        assert result["updated"] == []
+        assert result["clients"]["client.csi-rbd-user"]["status"] == "drifted"
+        assert fake.count("auth", "caps") == 0
+
+    def test_check_mode_makes_no_changes(self, clients):
+        fake = FakeCephAuth()
+        result = make(fake).apply(clients, check_mode=True)
+
+        assert result["created"] == ["client.csi-rbd-user", "client.csi-rbd-admin"]
+        assert fake.entities == {}
+
+
+class TestAuthValidation:
+    """apply=false 검증 테스트"""
+
+    def test_valid_tenants_from_one_dump(self, clients):
+        fake = FakeCephAuth({"client.csi-rbd-user": clients[0]["caps"], "client.csi-rbd-admin": clients[1]["caps"]})
+        result = make(fake).validate(clients)
+
+        assert result["valid"] is True
+        assert len(fake.commands) == 1
+        entry = result["validation"]["client.csi-rbd-user"]
+        assert entry["exists"] and entry["has_key"] and entry["problems"] == []
+        assert "key" not in entry
+
+    def test_prefix_match_is_not_accepted(self, clients):
+        # 부분 문자열 비교라면 'profile rbd pool=rbd-oa' 안에서 'profile rbd' 를 찾아 통과했을 경우
+        fake = FakeCephAuth({"client.csi-rbd-user": dict(clients[0]["caps"], mon="profile rbd pool=rbd-oa")})
+        result = make(fake).validate(clients)
+
+        assert result["valid"] is False
+        assert result["missing"] == ["client.csi-rbd-admin"]
+        user = result["validation"]["client.csi-rbd-user"]
+        assert user["caps"]["mon"]["match"] is False and user["caps"]["osd"]["match"] is True
+        assert user["problems"] == ["mon caps mismatch: expected 'profile rbd', got 'profile rbd pool=rbd-oa'"]
+        assert result["validation"]["client.csi-rbd-admin"]["problems"] == ["entity not found"]
+        assert fake.count("auth", "caps") == fake.count("auth", "get-or-create") == 0
+
+    def test_hundreds_of_tenants_in_one_call(self):
+        tenants = [{"ceph_csi_user": f"csi-{i}", "caps": {"mon": "profile rbd", "osd": f"profile rbd pool=p{i}"}}
+                   for i in range(500)]
+        fake = FakeCephAuth({f"client.csi-{i}": dict(t["caps"]) for i, t in enumerate(tenants)})
+        fake.entities["client.csi-7"]["caps"]["osd"] = "profile rbd pool=p8"
+
+        result = make(fake).validate(tenants)
+
+        assert len(fake.commands) == 1
+        assert list(result["drift"]) == ["client.csi-7"]
@@ -0,0 +1,127 @@
+"""
+ceph_cephfs 모듈 단위 테스트
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ceph_cephfs import CephFSReconciler, fs_index, mds_services  # noqa: E402
+
+
+def fs_entry(name, active=1, max_mds=1):
+    info = {f"gid_{4000 + i}": {"name": f"{name}.ceph{i}.abc", "state": "up:active", "rank": i}
+            for i in range(active)}
+    return {"id": 1, "mdsmap": {"fs_name": name, "max_mds": max_mds, "info": info,
+                                "metadata_pool": 2, "data_pools": [3]}}
+
+
+def mds_spec(name, count=1, running=1, size=1):
+    return {"service_type": "mds", "service_id": name, "service_name": f"mds.{name}",
+            "placement": {"count": count}, "status": {"running": running, "size": size}}
+
+
+class FakeCeph:
+    """fs dump / orch ls 응답과 변경 명령 기록"""
+
+    def __init__(self, filesystems=(), services=(), standbys=()):
+        self.dump = {"epoch": 7, "filesystems": list(filesystems),
+                     "standbys": [{"name": n, "state": "up:standby"} for n in standbys]}
+        self.services = list(services)
+        self.commands = []
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        args = cmd[1:]
+        self.commands.append(args)
+        if args[:2] == ["fs", "dump"]:
+            return 0, json.dumps(self.dump), ""
+        if args[:2] == ["orch", "ls"]:
+            return 0, json.dumps(self.services + [{"service_type": "mon", "service_name": "mon"}]), ""
+        if args[:3] in (["fs", "volume", "create"], ["orch", "apply", "mds"]):
+            return 0, "", ""
+        return 1, "", "unknown command"
+
+    def changes(self):
+        return [c for c in self.commands if c[:2] not in (["fs", "dump"], ["orch", "ls"])]
+
+
+def reconcile(fake, filesystems, **kwargs):
+    cli = CephCLI(fake.__call__, "ceph")
+    return CephFSReconciler(cli).apply(filesystems, **kwargs), cli
+
+
+DESIRED = [{"name": "fs-oa", "mds": {"count": 2}}, {"name": "fs-ob", "mds": {"count": 1}}]
+
+
+class TestParsing:
+    """fs dump / orch ls 해석 테스트"""
+
+    def test_fs_index_counts_ranks_and_standbys(self):
+        index = fs_index({"filesystems": [fs_entry("fs-oa", active=2, max_mds=2), fs_entry("fs-o", active=0)],
+                          "standbys": [{"name": "fs-oa.ceph3.xyz"}, {"name": "fs-o.ceph3.xyz"}]})
+
+        assert index["fs-oa"] == {"max_mds": 2, "active_ranks": 2, "standby": 1,
+                                  "metadata_pool": 2, "data_pools": [3]}
+        assert index["fs-o"]["active_ranks"] == 0 and index["fs-o"]["standby"] == 1
+
+    def test_mds_services_ignores_other_types(self):
+        services = mds_services([mds_spec("fs-oa", 2, 1, 2), {"service_type": "mgr", "service_id": None}])
+
+        assert services == {"fs-oa": {"placement": 2, "running": 1, "size": 2}}
+
+
+class TestCephFSReconciler:
+    """비교, 적용, 검증 테스트"""
+
+    def test_unchanged_cluster_costs_two_calls(self):
+        fake = FakeCeph([fs_entry("fs-oa"), fs_entry("fs-ob")],
+                        [mds_spec("fs-oa", 2, 2, 2), mds_spec("fs-ob")])
+        result, cli = reconcile(fake, DESIRED)
+
+        assert cli.calls == 2
+        assert result["created"] == [] and result["mds_applied"] == []
+        assert result["valid"] is True
+        assert result["filesystems"]["fs-oa"]["mds"] == {"service": "mds.fs-oa", "expected": 2,
+                                                         "placement": 2, "running": 2, "size": 2}
+
+    def test_only_missing_filesystem_and_changed_placement_are_applied(self):
+        fake = FakeCeph([fs_entry("fs-oa")], [mds_spec("fs-oa", 1, 1, 1)])
+        result, _ = reconcile(fake, DESIRED)
+
+        assert fake.changes() == [
+            ["orch", "apply", "mds", "fs-oa", "--placement=2"],
+            ["fs", "volume", "create", "fs-ob"],
+            ["orch", "apply", "mds", "fs-ob", "--placement=1"],
+        ]
+        assert result["created"] == ["fs-ob"]
+        assert result["mds_applied"] == ["fs-oa", "fs-ob"]
+        # 변경 전 조회 결과로 방금 만든 파일시스템을 실패로 보고하지 않음
+        assert result["filesystems"]["fs-ob"]["problems"] == []
+        assert result["filesystems"]["fs-ob"]["valid"] is None
+        assert result["valid"] is True
+
+    def test_validate_only_reports_problems(self):
+        fake = FakeCeph([fs_entry("fs-oa", active=0)], [mds_spec("fs-oa", 2, 1, 2)])
+        result, _ = reconcile(fake, DESIRED[:1], apply=False)
+
+        assert fake.changes() == []
+        assert result["valid"] is False
+        assert result["filesystems"]["fs-oa"]["problems"] == ["no active MDS rank", "MDS service 1/2 running"]
+
+    def test_filesystem_without_mds_count_is_not_placed(self):
+        fake = FakeCeph([fs_entry("fs-oa")], [mds_spec("fs-oa", 3, 3, 3)])
+        result, _ = reconcile(fake, [{"name": "fs-oa"}])
+
+        assert fake.changes() == []
+        assert result["valid"] is True
+
+    def test_check_mode_plans_without_changes(self):
+        fake = FakeCeph()
+        result, _ = reconcile(fake, DESIRED, check_mode=True)
+
+        assert fake.changes() == []
+        assert result["created"] == ["fs-oa", "fs-ob"]
+        assert result["filesystems"]["fs-oa"]["action"] == "planned"
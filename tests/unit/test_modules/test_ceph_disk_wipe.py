@@ -0,0 +1,139 @@
+"""
+ceph_disk_wipe 모듈 단위 테스트
+
+실제 블록 장치 대신 임시 파일을 장치로 사용하고, 외부 도구(ceph-volume, wipefs,
+sgdisk) 호출은 기록만 하는 run_command 로 대체합니다.
+"""
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ceph_disk_wipe import MIB, DiskWiper, parse_lsblk, zero_range  # noqa: E402
+
+
+class FakeTools:
+    """외부 도구 호출 기록 + wipefs 시그니처 조회 응답"""
+
+    def __init__(self, leftover=None):
+        self.commands = []
+        self.leftover = leftover or {}
+        self.lock = threading.Lock()
+
+    def __call__(self, args, check_rc=False, data=None):
+        with self.lock:
+            self.commands.append(args)
+        if args[0] == "wipefs" and "--no-act" in args:
+            sigs = [{"device": args[-1], "type": t} for t in self.leftover.get(args[-1], [])]
+            return 0, json.dumps({"signatures": sigs}) if sigs else "", ""
+        return 0, "", ""
+
+
+@pytest.fixture
+def disks(tmp_path):
+    """0xff 로 채운 가짜 장치 파일 3개"""
+    paths = []
+    for name in ("sdb", "sdc", "sdd"):
+        path = tmp_path / name
+        path.write_bytes(b"\xff" * (4 * MIB))
+        paths.append(str(path))
+    return paths
+
+
+def inventory_for(paths, mounted=()):
+    return {p: {"size": 4 * MIB, "type": "disk", "mounted": p in mounted} for p in paths}
+
+
+class TestParseLsblk:
+    """lsblk --json 해석 테스트"""
+
+    def test_children_and_mounts(self):
+        data = {"blockdevices": [
+            {"name": "/dev/sda", "type": "disk", "size": 100, "mountpoint": None, "children": [
+                {"name": "/dev/sda1", "type": "part", "size": 90, "mountpoint": "/"}]},
+            {"name": "/dev/sdb", "type": "disk", "size": 200, "mountpoint": None, "children": [
+                {"name": "/dev/mapper/ceph--x-osd--block", "type": "lvm", "size": 200, "mountpoint": None}]},
+            {"name": "/dev/sdc", "type": "disk", "size": 300, "mountpoints": [None]},
+        ]}
+        inventory = parse_lsblk(data)
+
+        assert inventory["/dev/sda"]["mounted"] is True
+        assert inventory["/dev/sda1"]["mounted"] is True
+        # Ceph LV 는 마운트되지 않으므로 초기화 대상
+        assert inventory["/dev/sdb"]["mounted"] is False
+        assert inventory["/dev/sdc"] == {"size": 300, "type": "disk", "mounted": False}
+
+
+class TestZeroRange:
+    """O_DIRECT 0 채우기 테스트"""
+
+    def test_zeroes_only_requested_range(self, tmp_path):
+        path = tmp_path / "dev"
+        path.write_bytes(b"\xff" * (3 * MIB))
+
+        zero_range(str(path), MIB, MIB)
+        data = path.read_bytes()
+
+        assert data[:MIB] == b"\xff" * MIB
+        assert data[MIB:2 * MIB] == bytes(MIB)
+        assert data[2 * MIB:] == b"\xff" * MIB
+
+    def test_unaligned_length(self, tmp_path):
+        path = tmp_path / "dev"
+        path.write_bytes(b"\xff" * 5000)
+
+        zero_range(str(path), 0, 5000)
+        assert path.read_bytes() == bytes(5000)
+
+
+class TestDiskWiper:
+    """장치 건너뛰기, 병렬 초기화, 검증 테스트"""
+
+    def test_wipes_head_and_tail_of_each_device(self, disks):
+        tools = FakeTools()
+        result = DiskWiper(tools, ceph_volume="ceph-volume", sgdisk="sgdisk", zero_mb=1).apply(
+            disks, inventory_for(disks))
+
+        assert result["wiped"] == disks
+        for path in disks:
+            data = open(path, "rb").read()
+            assert data[:MIB] == bytes(MIB) and data[-MIB:] == bytes(MIB)
+            assert data[MIB:-MIB] == b"\xff" * (2 * MIB)
+        entry = result["devices"][0]
+        assert [s["step"] for s in entry["steps"]] == ["ceph-volume", "wipefs", "zero", "sgdisk"]
+        assert entry["clean"] is True and entry["duration"] >= 0
+
+    def test_skips_absent_and_mounted_devices(self, disks, tmp_path):
+        tools = FakeTools()
+        missing = str(tmp_path / "nvme9n1")
+        result = DiskWiper(tools, zero_mb=1).apply(disks + [missing], inventory_for(disks, mounted=[disks[1]]))
+
+        assert result["excluded"] == {disks[1]: "mounted", missing: "absent"}
+        assert result["wiped"] == [disks[0], disks[2]]
+        assert not any(disks[1] in c for c in tools.commands)
+        assert open(disks[1], "rb").read(16) == b"\xff" * 16
+        assert [d["device"] for d in result["devices"]] == disks + [missing]
+
+    def test_optional_tools_are_not_called_when_missing(self, disks):
+        tools = FakeTools()
+        DiskWiper(tools, zero_mb=1).apply(disks[:1], inventory_for(disks))
+
+        assert {c[0] for c in tools.commands} == {"wipefs"}
+
+    def test_remaining_signatures_are_errors(self, disks):
+        tools = FakeTools(leftover={disks[0]: ["gpt"]})
+        result = DiskWiper(tools, zero_mb=1).apply(disks, inventory_for(disks))
+
+        assert result["errors"] == {disks[0]: "signatures remain after wipe: gpt"}
+        assert disks[0] not in result["wiped"]
+
+    def test_check_mode_writes_nothing(self, disks):
+        tools = FakeTools()
+        result = DiskWiper(tools, zero_mb=1).apply(disks, inventory_for(disks), check_mode=True)
+
+        assert [d["status"] for d in result["devices"]] == ["planned"] * 3
+        assert tools.commands == []
+        assert open(disks[0], "rb").read(16) == b"\xff" * 16
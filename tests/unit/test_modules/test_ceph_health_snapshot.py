@@ -0,0 +1,96 @@
+"""
+ceph_health_snapshot 모듈 (module_utils/ceph_health.py) 단위 테스트
+"""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_health import health_within, parse_status  # noqa: E402
+
+
+@pytest.fixture
+def status():
+    """Reef `ceph status --format json` 출력 일부"""
+    return {
+        "fsid": "0f1e2d3c-0000-1111-2222-333344445555",
+        "health": {
+            "status": "HEALTH_WARN",
+            "checks": {
+                "OSD_DOWN": {"severity": "HEALTH_WARN", "summary": {"message": "1 osds down", "count": 1},
+                             "muted": False},
+            },
+            "mutes": [],
+        },
+        "quorum": [0, 1],
+        "quorum_names": ["mon1", "mon2"],
+        "monmap": {"epoch": 3, "num_mons": 3},
+        "osdmap": {"epoch": 40, "num_osds": 6, "num_up_osds": 5, "num_in_osds": 6, "num_remapped_pgs": 0},
+        "pgmap": {
+            "pgs_by_state": [
+                {"state_name": "active+clean", "count": 90},
+                {"state_name": "active+undersized+degraded", "count": 7},
+                {"state_name": "peering", "count": 2},
+            ],
+            "num_pgs": 99, "num_pools": 3, "num_objects": 120,
+            "data_bytes": 4096, "bytes_used": 12288, "bytes_avail": 1 << 30, "bytes_total": (1 << 30) + 12288,
+        },
+        "mgrmap": {"available": True, "num_standbys": 1},
+    }
+
+
+class TestParseStatus:
+    """status JSON -> 스냅샷 변환 테스트"""
+
+    def test_health_and_checks(self, status):
+        snapshot = parse_status(status)
+
+        assert snapshot["status"] == "HEALTH_WARN"
+        assert snapshot["healthy"] is False
+        assert snapshot["checks"]["OSD_DOWN"] == {"severity": "HEALTH_WARN", "message": "1 osds down",
+                                                  "count": 1, "muted": False}
+
+    def test_osd_counts(self, status):
+        osd = parse_status(status)["osd"]
+
+        assert (osd["total"], osd["up"], osd["in"], osd["down"]) == (6, 5, 6, 1)
+        assert osd["all_up"] is False and osd["all_in"] is True
+
+    def test_quorum(self, status):
+        mon = parse_status(status)["mon"]
+
+        assert mon["quorum"] == ["mon1", "mon2"]
+        assert mon["out_of_quorum"] == 1
+        assert mon["has_quorum"] is True
+
+    def test_pg_states(self, status):
+        pg = parse_status(status)["pg"]
+
+        assert pg["states"]["peering"] == 2
+        assert pg["active_clean"] == 90
+        assert pg["inactive"] == 2
+        assert pg["all_active_clean"] is False
+
+    def test_legacy_nested_osdmap(self, status):
+        status["osdmap"] = {"osdmap": status["osdmap"]}
+        assert parse_status(status)["osd"]["up"] == 5
+
+    def test_empty_status_is_not_healthy(self):
+        snapshot = parse_status({})
+
+        assert snapshot["status"] == "HEALTH_ERR"
+        assert snapshot["mon"]["has_quorum"] is False
+
+
+class TestHealthWithin:
+    """헬스 수준 비교 테스트"""
+
+    @pytest.mark.parametrize("level,worst,expected", [
+        ("HEALTH_OK", "HEALTH_OK", True),
+        ("HEALTH_WARN", "HEALTH_OK", False),
+        ("HEALTH_WARN", "HEALTH_WARN", True),
+        ("HEALTH_ERR", "HEALTH_WARN", False),
+        ("UNKNOWN", "HEALTH_ERR", False),
+    ])
+    def test_levels(self, level, worst, expected):
+        assert health_within(level, worst) is expected
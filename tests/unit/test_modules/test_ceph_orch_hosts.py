@@ -0,0 +1,176 @@
+"""
+ceph_orch_hosts 모듈 단위 테스트
+"""
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ceph_orch_hosts import HostOnboarder, desired_hosts, host_index  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeOrch:
+    """cephadm 호스트 목록 대체. 추가된 호스트는 offline_polls 번의 host ls 동안 Offline 상태"""
+
+    def __init__(self, hosts=None, offline_polls=0, fail_add=()):
+        self.hosts = {h["hostname"]: dict(h) for h in hosts or []}
+        self.offline_polls = offline_polls
+        self.fail_add = set(fail_add)
+        self.pending = {}
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        args = cmd[1:]
+        with self.lock:
+            self.commands.append(args)
+            if args[:3] == ["orch", "host", "ls"]:
+                listing = []
+                for name, host in self.hosts.items():
+                    status = "Offline" if self.pending.get(name, 0) > 0 else ""
+                    listing.append(dict(host, status=status))
+                    if name in self.pending:
+                        self.pending[name] -= 1
+                return 0, json.dumps(listing), ""
+            if args[:3] == ["orch", "host", "add"]:
+                name, addr, labels = args[3], args[4], args[5:]
+                if name in self.fail_add:
+                    return 22, "", f"Failed to connect to {name} ({addr})."
+                self.hosts[name] = {"hostname": name, "addr": addr, "labels": list(labels)}
+                self.pending[name] = self.offline_polls
+                return 0, f"Added host '{name}' with addr '{addr}'", ""
+            if args[:4] == ["orch", "host", "label", "add"]:
+                self.hosts[args[4]]["labels"].append(args[5])
+                return 0, f"Added label {args[5]} to host {args[4]}", ""
+        return 1, "", "unknown command"
+
+    def count(self, *prefix):
+        return sum(1 for c in self.commands if c[:len(prefix)] == list(prefix))
+
+
+def onboarder(orch, clock=None, workers=8):
+    clock = clock or FakeClock()
+    return HostOnboarder(CephCLI(orch.__call__, "ceph"), workers=workers, clock=clock, sleep=clock.sleep)
+
+
+CLUSTER_HOSTS = [
+    {"name": "ceph2", "ip": "10.10.2.92", "labels": ["_admin"]},
+    {"name": "ceph3", "ip": "10.10.2.93", "labels": ["_admin", "osd"]},
+]
+
+
+class TestHelpers:
+    """host ls 해석과 입력 정규화 테스트"""
+
+    def test_host_index_status(self):
+        index = host_index([
+            {"hostname": "ceph1", "addr": "10.0.0.1", "labels": ["_admin"], "status": ""},
+            {"hostname": "ceph2", "addr": "10.0.0.2", "labels": [], "status": "Offline"},
+            {"hostname": "ceph3", "addr": "10.0.0.3", "status": "Maintenance"},
+        ])
+
+        assert index["ceph1"] == {"addr": "10.0.0.1", "labels": ["_admin"], "online": True}
+        assert index["ceph2"]["online"] is False
+        assert index["ceph3"] == {"addr": "10.0.0.3", "labels": [], "online": False}
+
+    def test_desired_hosts_accepts_addr_and_dedupes(self):
+        hosts = desired_hosts([{"name": "a", "ip": "1.1.1.1", "labels": ["x", "x"]},
+                               {"hostname": "b", "addr": "2.2.2.2"},
+                               {"name": "a", "ip": "1.1.1.9"}])
+
+        assert hosts == [("a", "1.1.1.9", []), ("b", "2.2.2.2", [])]
+
+    def test_missing_name_is_rejected(self):
+        with pytest.raises(ValueError):
+            desired_hosts([{"ip": "1.1.1.1"}])
+
+
+class TestHostOnboarder:
+    """단일 조회 비교, 병렬 추가, online 대기 테스트"""
+
+    def test_adds_missing_hosts_with_labels_in_one_command(self):
+        orch = FakeOrch([{"hostname": "ceph1", "addr": "10.10.2.91", "labels": ["_admin"]}])
+        result = onboarder(orch).apply(CLUSTER_HOSTS)
+
+        assert result["added"] == ["ceph2", "ceph3"]
+        assert ["orch", "host", "add", "ceph3", "10.10.2.93", "_admin", "osd"] in orch.commands
+        assert orch.count("orch", "host", "label") == 0
+        assert [h["status"] for h in result["hosts"]] == ["online", "online"]
+        assert result["offline"] == [] and result["errors"] == {}
+
+    def test_existing_hosts_get_only_missing_labels(self):
+        orch = FakeOrch([{"hostname": "ceph2", "addr": "10.10.2.92", "labels": ["_admin"]},
+                         {"hostname": "ceph3", "addr": "10.10.2.93", "labels": ["_admin", "rgw"]}])
+        result = onboarder(orch).apply(CLUSTER_HOSTS)
+
+        assert result["added"] == []
+        assert result["labeled"] == {"ceph3": ["osd"]}
+        assert orch.count("orch", "host", "label", "add") == 1
+        assert orch.hosts["ceph3"]["labels"] == ["_admin", "rgw", "osd"]
+        assert [h["action"] for h in result["hosts"]] == ["unchanged", "labeled"]
+
+    def test_noop_run_is_a_single_listing_plus_one_poll(self):
+        orch = FakeOrch([{"hostname": "ceph2", "addr": "10.10.2.92", "labels": ["_admin"]},
+                         {"hostname": "ceph3", "addr": "10.10.2.93", "labels": ["osd", "_admin"]}])
+        result = onboarder(orch).apply(CLUSTER_HOSTS)
+
+        assert result["added"] == [] and result["labeled"] == {}
+        assert orch.count("orch", "host", "ls") == 2
+        assert result["polls"] == 1
+
+    def test_waits_until_hosts_are_online_and_records_timing(self):
+        clock = FakeClock()
+        orch = FakeOrch(offline_polls=3)
+        result = onboarder(orch, clock).apply(CLUSTER_HOSTS, min_interval=1, max_interval=4)
+
+        assert result["offline"] == []
+        assert result["polls"] == 4
+        # 상태 변화가 없는 동안 간격이 늘어남
+        assert clock.sleeps == [1, 1.5, 2.25]
+        assert all(h["online_after"] == 4.75 for h in result["hosts"])
+        assert all(h["add_duration"] == 0 for h in result["hosts"])
+
+    def test_timeout_reports_offline_hosts(self):
+        clock = FakeClock()
+        orch = FakeOrch(offline_polls=100)
+        result = onboarder(orch, clock).apply(CLUSTER_HOSTS, timeout=10, min_interval=1, max_interval=2)
+
+        assert result["offline"] == ["ceph2", "ceph3"]
+        assert [h["status"] for h in result["hosts"]] == ["offline", "offline"]
+        assert result["elapsed"] == 10
+
+    def test_failed_add_is_reported_and_not_waited_for(self):
+        orch = FakeOrch(fail_add=["ceph3"])
+        result = onboarder(orch).apply(CLUSTER_HOSTS)
+
+        assert result["added"] == ["ceph2"]
+        assert "Failed to connect to ceph3" in result["errors"]["ceph3"]
+        assert [h["status"] for h in result["hosts"]] == ["online", "failed"]
+
+    def test_check_mode_only_lists(self):
+        orch = FakeOrch([{"hostname": "ceph2", "addr": "10.10.2.92", "labels": ["_admin"]}])
+        result = onboarder(orch).apply(CLUSTER_HOSTS, check_mode=True)
+
+        assert orch.commands == [["orch", "host", "ls", "--format", "json"]]
+        assert [h["status"] for h in result["hosts"]] == ["online", "planned"]
+
+    def test_new_host_without_ip_is_rejected(self):
+        with pytest.raises(ValueError):
+            onboarder(FakeOrch()).apply([{"name": "ceph9"}])
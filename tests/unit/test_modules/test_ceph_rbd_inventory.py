@@ -0,0 +1,148 @@
+"""
+ceph_rbd_inventory 모듈 단위 테스트
+
+librados 바인딩 없이 CLI 경로(`rbd ls -l --format json`)를 가짜 run_command 로 검증합니다.
+"""
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ansible.module_utils.ceph_rbd import (  # noqa: E402
+    CLIBackend,
+    parse_ls_long,
+    rbd_pools,
+    snap_timestamp,
+    summarize,
+)
+from ceph_rbd_inventory import RBDInventoryScanner, image_filter  # noqa: E402
+
+GIB = 1024 ** 3
+
+
+class FakeRBD:
+    """ceph osd pool ls detail / rbd ls -l / rbd snap ls 응답"""
+
+    def __init__(self, pools, broken=()):
+        # pools: {pool: {image: [(snap, protected), ...]}}
+        self.pools = pools
+        self.broken = set(broken)
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        with self.lock:
+            self.commands.append(cmd)
+        args = cmd[1:]
+        if cmd[0] == "ceph" and args[:4] == ["osd", "pool", "ls", "detail"]:
+            detail = [{"pool_name": p, "application_metadata": {"rbd": {}}} for p in self.pools]
+            detail.append({"pool_name": ".mgr", "application_metadata": {"mgr": {}}})
+            return 0, json.dumps(detail), ""
+        if cmd[0] == "rbd" and args[:2] == ["ls", "-l"]:
+            pool = args[3]
+            if pool in self.broken:
+                return 2, "", f"rbd: error opening pool '{pool}': (2) No such file or directory"
+            entries = []
+            for image, snaps in self.pools[pool].items():
+                entries.append({"image": image, "id": "abc", "size": GIB, "format": 2})
+                for i, (snap, protected) in enumerate(snaps):
+                    entries.append({"image": image, "snapshot": snap, "snapshot_id": i + 4, "size": GIB,
+                                    "format": 2, "protected": "true" if protected else "false"})
+            return 0, json.dumps(entries), ""
+        if cmd[0] == "rbd" and args[:2] == ["snap", "ls"]:
+            pool, image = args[2].split("/")
+            snaps = [{"id": i + 4, "name": s, "size": GIB, "protected": str(p).lower(),
+                      "timestamp": "Thu Mar 14 10:01:02 2024"} for i, (s, p) in enumerate(self.pools[pool][image])]
+            return 0, json.dumps(snaps), ""
+        return 1, "", "unknown command"
+
+    def count(self, *prefix):
+        return sum(1 for c in self.commands if c[:len(prefix)] == list(prefix))
+
+
+def scanner(fake):
+    backend = CLIBackend(CephCLI(fake.__call__, "ceph"), CephCLI(fake.__call__, "rbd"))
+    return RBDInventoryScanner(backend, workers=4)
+
+
+POOLS = {
+    "rbd-oa": {"vm-1": [("daily-1", True), ("daily-2", False)], "vm-2": []},
+    "rbd-ob": {"db-1": [("pre-upgrade", False)]},
+}
+
+
+class TestParsing:
+    """CLI 출력 해석 테스트"""
+
+    def test_parse_ls_long_groups_snapshots(self):
+        images = parse_ls_long([
+            {"image": "a", "size": 10, "format": 2},
+            {"image": "a", "snapshot": "s1", "snapshot_id": 4, "size": 10, "protected": "true"},
+            {"image": "b", "size": 20, "format": 1},
+        ])
+
+        assert [i["name"] for i in images] == ["a", "b"]
+        assert images[0]["snapshots"] == [{"name": "s1", "id": 4, "size": 10, "protected": True, "timestamp": None}]
+        assert images[1] == {"name": "b", "size": 20, "format": 1, "snapshots": []}
+
+    def test_rbd_pools_only_rbd_application(self):
+        assert rbd_pools([{"pool_name": "a", "application_metadata": {"rbd": {}}},
+                          {"pool_name": "b", "application_metadata": {"cephfs": {}}},
+                          {"pool_name": "c"}]) == ["a"]
+
+    def test_snap_timestamp(self):
+        assert snap_timestamp("Thu Mar 14 10:01:02 2024") == "2024-03-14T10:01:02"
+        assert snap_timestamp("Tue Oct  1 08:00:00 2024") == "2024-10-01T08:00:00"
+        assert snap_timestamp(None) is None
+
+    def test_summarize_totals(self):
+        inventory = summarize({"p": [{"name": "a", "size": 5, "format": 2,
+                                      "snapshots": [{"protected": True}, {"protected": False}]}]})
+
+        assert inventory["pools"]["p"] == {"images": 1, "snapshots": 2, "protected": 1, "provisioned_bytes": 5}
+        assert inventory["images"][0]["spec"] == "p/a"
+        assert inventory["totals"] == {"pools": 1, "images": 1, "snapshots": 2, "protected": 1}
+
+    def test_image_filter(self):
+        assert image_filter(["p/a", "p/b", "c"]) == ({"p": {"a", "b"}}, {"c"})
+
+
+class TestScanner:
+    """풀별 단일 조회와 필터링 테스트"""
+
+    def test_one_listing_per_pool(self):
+        fake = FakeRBD(POOLS)
+        inventory, errors = scanner(fake).scan()
+
+        assert errors == {}
+        assert fake.count("rbd", "ls", "-l") == 2
+        assert fake.count("rbd", "snap") == 0
+        assert inventory["totals"] == {"pools": 2, "images": 3, "snapshots": 3, "protected": 1}
+        assert sorted(i["spec"] for i in inventory["images"]) == ["rbd-oa/vm-1", "rbd-oa/vm-2", "rbd-ob/db-1"]
+
+    def test_pool_errors_do_not_stop_other_pools(self):
+        fake = FakeRBD(POOLS, broken=["rbd-ob"])
+        inventory, errors = scanner(fake).scan()
+
+        assert "No such file or directory" in errors["rbd-ob"]
+        assert list(inventory["pools"]) == ["rbd-oa"]
+
+    def test_image_specs_limit_pools_and_images(self):
+        fake = FakeRBD(POOLS)
+        inventory, _ = scanner(fake).scan(images=["rbd-oa/vm-1"])
+
+        assert fake.count("ceph") == 0
+        assert [i["spec"] for i in inventory["images"]] == ["rbd-oa/vm-1"]
+
+    def test_timestamps_only_for_images_with_snapshots(self):
+        fake = FakeRBD(POOLS)
+        inventory, _ = scanner(fake).scan(pools=["rbd-oa"], timestamps=True)
+
+        assert fake.count("rbd", "snap", "ls") == 1
+        vm1 = inventory["images"][0]
+        assert vm1["snapshots"][0] == {"name": "daily-1", "id": 4, "size": GIB, "protected": True,
+                                       "timestamp": "2024-03-14T10:01:02"}
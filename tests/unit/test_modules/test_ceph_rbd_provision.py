@@ -0,0 +1,178 @@
+"""
+ceph_rbd_provision 모듈 단위 테스트
+
+osd pool ls detail / rbd ls -l 응답을 메모리 상태로 돌려주는 가짜 CLI 로 CLI 백엔드를
+그대로 사용해 비교, 생성 명령, JSON diff 를 검증합니다.
+"""
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ansible.module_utils.ceph_rbd import CLIBackend, create_args, size_bytes  # noqa: E402
+from ceph_rbd_provision import RBDProvisioner, pool_changes, pool_state  # noqa: E402
+
+GIB = 1024 ** 3
+
+
+def pool_detail(name, rbd=True, size=3, autoscale="on", options=None, flags="hashpspool"):
+    return {"pool_name": name, "size": size, "min_size": 2, "pg_num": 32, "pg_autoscale_mode": autoscale,
+            "options": options or {}, "flags_names": flags,
+            "application_metadata": {"rbd": {}} if rbd else {}}
+
+
+class FakeCluster:
+    """{pool: detail} / {pool: {image: size}} 상태를 가진 ceph/rbd CLI"""
+
+    def __init__(self, pools=(), images=None, fail_images=()):
+        self.pools = {p["pool_name"]: p for p in pools}
+        self.images = images or {}
+        self.fail_images = set(fail_images)
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        with self.lock:
+            self.commands.append(cmd)
+        args = [a for a in cmd[1:] if a not in ("--format", "json")]
+        if cmd[0] == "ceph":
+            if args[:4] == ["osd", "pool", "ls", "detail"]:
+                return 0, json.dumps(list(self.pools.values())), ""
+            if args[:3] == ["osd", "pool", "create"]:
+                self.pools[args[3]] = pool_detail(args[3], rbd=False)
+                return 0, "", ""
+            if args[:3] == ["osd", "pool", "set"]:
+                return 0, "", ""
+        if args[:2] == ["pool", "init"]:
+            self.images.setdefault(args[2], {})
+            return 0, "", ""
+        if args[:2] == ["ls", "-l"]:
+            pool = args[3]
+            if pool not in self.images:
+                return 2, "", f"rbd: error opening pool '{pool}'"
+            return 0, json.dumps([{"image": n, "size": s, "format": 2} for n, s in self.images[pool].items()]), ""
+        if args[0] == "create":
+            pool, name = args[1].split("/")
+            if name in self.fail_images:
+                return 1, "", "rbd: create error: (17) File exists"
+            with self.lock:
+                self.images[pool][name] = size_bytes(args[args.index("--size") + 1])
+            return 0, "", ""
+        return 1, "", "unknown command"
+
+    def changes(self):
+        reads = (["ceph", "osd", "pool", "ls"], ["rbd", "ls", "-l"])
+        return [c for c in self.commands if c[:4] not in reads and c[:3] not in reads]
+
+
+def provision(fake, pools, **kwargs):
+    backend = CLIBackend(CephCLI(fake, "ceph"), CephCLI(fake, "rbd"))
+    return RBDProvisioner(CephCLI(fake, "ceph"), backend, workers=4).apply(pools, **kwargs)
+
+
+def image(name, size="1G", **extra):
+    return dict({"image_name": name, "size": size}, **extra)
+
+
+class TestHelpers:
+    """크기 해석, rbd create 인자, 풀 옵션 비교 테스트"""
+
+    def test_size_bytes_uses_binary_units_and_mib_default(self):
+        assert size_bytes("20G") == 20 * GIB
+        assert size_bytes("4MiB") == 4 * 1024 ** 2
+        assert size_bytes(1024) == GIB
+        # --object-size 처럼 단위 없는 값을 바이트로 읽는 옵션
+        assert size_bytes(4194304, "b") == size_bytes("4M", "b") == 4 * 1024 ** 2
+        with pytest.raises(ValueError):
+            size_bytes("big")
+
+    def test_create_args(self):
+        args = create_args("rbd-oa/image1", image("image1", "20G", image_format=2, object_size="4M",
+                                                   image_features=["layering", "exclusive-lock"]))
+
+        assert args == ["create", "rbd-oa/image1", "--size", "20G", "--image-format", "2", "--object-size", "4M",
+                        "--image-feature", "layering", "--image-feature", "exclusive-lock"]
+
+    def test_pool_changes_only_for_drifted_options(self):
+        current = pool_state(pool_detail("rbd-oa", options={"target_size_ratio": 0.2}, flags="hashpspool,bulk"))
+        desired = {"pool_name": "rbd-oa", "pool_pg_num": 64, "size": 3, "pg_autoscale_mode": True,
+                   "target_size_ratio": 0.2, "bulk": True, "pg_num_min": 16}
+
+        assert pool_changes(desired, current) == {"pg_num_min": {"before": None, "after": 16}}
+
+
+class TestRBDProvisioner:
+    """생성, 변경, diff 테스트"""
+
+    def test_unchanged_cluster_only_reads(self):
+        fake = FakeCluster([pool_detail("rbd-oa")], {"rbd-oa": {"image1": GIB}})
+        result = provision(fake, [{"pool_name": "rbd-oa", "pool_pg_num": 16, "images": [image("image1")]}])
+
+        assert fake.changes() == []
+        assert len(fake.commands) == 2
+        assert result["diff"] == {"pools": {}, "images": {}}
+        assert result["existing_images"] == 1
+
+    def test_missing_pool_and_images_are_created(self):
+        fake = FakeCluster()
+        result = provision(fake, [{"pool_name": "rbd-ob", "pool_pg_num": 16, "target_size_ratio": 0.1,
+                                   "images": [image("a"), image("b", image_features=["layering"])]}])
+
+        assert fake.changes()[:3] == [
+            ["ceph", "osd", "pool", "create", "rbd-ob", "16", "16"],
+            ["ceph", "osd", "pool", "set", "rbd-ob", "target_size_ratio", "0.1"],
+            ["rbd", "pool", "init", "rbd-ob"],
+        ]
+        # 새 풀은 비어 있으므로 이미지 목록을 조회하지 않음
+        assert not any(c[1:3] == ["ls", "-l"] for c in fake.commands)
+        assert result["created_pools"] == ["rbd-ob"]
+        assert result["created_images"] == ["rbd-ob/a", "rbd-ob/b"]
+        assert result["diff"]["pools"]["rbd-ob"] == {
+            "action": "created", "initialized": True,
+            "changes": {"target_size_ratio": {"before": None, "after": 0.1}}}
+        assert fake.images["rbd-ob"] == {"a": GIB, "b": GIB}
+
+    def test_autoscale_hints_without_pg_num(self):
+        fake = FakeCluster([pool_detail("rbd-oa", autoscale="warn")], {"rbd-oa": {}})
+        result = provision(fake, [{"pool_name": "rbd-oa", "pg_autoscale_mode": "on", "bulk": True}])
+
+        assert fake.changes() == [["ceph", "osd", "pool", "set", "rbd-oa", "pg_autoscale_mode", "on"],
+                                  ["ceph", "osd", "pool", "set", "rbd-oa", "bulk", "true"]]
+        assert result["updated_pools"] == ["rbd-oa"]
+        assert result["diff"]["pools"]["rbd-oa"]["initialized"] is False
+
+    def test_existing_pool_without_rbd_application_is_initialized(self):
+        fake = FakeCluster([pool_detail("rbd-oa", rbd=False)], {"rbd-oa": {}})
+        provision(fake, [{"pool_name": "rbd-oa", "pool_pg_num": 128}])
+
+        # 기존 풀의 PG 수는 변경하지 않음
+        assert fake.changes() == [["rbd", "pool", "init", "rbd-oa"]]
+
+    def test_size_drift_is_reported_not_resized(self):
+        fake = FakeCluster([pool_detail("rbd-oa")], {"rbd-oa": {"image1": GIB}})
+        result = provision(fake, [{"pool_name": "rbd-oa", "images": [image("image1", "2G")]}])
+
+        assert fake.changes() == []
+        assert result["diff"]["images"] == {"rbd-oa/image1": {"action": "size_differs",
+                                                              "size": {"before": GIB, "after": 2 * GIB}}}
+
+    def test_image_failures_are_reported_per_image(self):
+        fake = FakeCluster([pool_detail("rbd-oa")], {"rbd-oa": {}}, fail_images=["b"])
+        result = provision(fake, [{"pool_name": "rbd-oa", "images": [image("a"), image("b")]}])
+
+        assert result["created_images"] == ["rbd-oa/a"]
+        assert "File exists" in result["errors"]["rbd-oa/b"]
+        assert result["diff"]["images"]["rbd-oa/b"] == {"action": "failed"}
+
+    def test_check_mode_plans_without_changes(self):
+        fake = FakeCluster([pool_detail("rbd-oa")], {"rbd-oa": {}})
+        result = provision(fake, [{"pool_name": "rbd-oa", "images": [image("a")]},
+                                  {"pool_name": "rbd-ob", "images": [image("b")]}], check_mode=True)
+
+        assert fake.changes() == []
+        assert result["created_pools"] == ["rbd-ob"]
+        assert result["created_images"] == ["rbd-oa/a", "rbd-ob/b"]
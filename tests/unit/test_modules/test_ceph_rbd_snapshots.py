@@ -0,0 +1,203 @@
+"""
+ceph_rbd_snapshots 모듈 단위 테스트
+
+librados/CLI 대신 메모리 상태를 가진 백엔드로 선택자, 보존 정책, 병렬 실행 결과를 검증합니다.
+"""
+
+import calendar
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError  # noqa: E402
+from ansible.module_utils.ceph_rbd import CLIBackend  # noqa: E402
+from ceph_rbd_snapshots import SnapshotScheduler, expired, parse_age, snapshot_time  # noqa: E402
+
+NOW = calendar.timegm((2026, 10, 18, 9, 0, 0))
+
+
+def stamp(hours_ago, prefix="auto"):
+    t = NOW - hours_ago * 3600
+    return f"{prefix}-{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(t))}"
+
+
+class FakeBackend:
+    """{pool: {image: {'snaps': [(name, protected)], 'meta': {...}}}} 상태를 가진 백엔드"""
+
+    method = "fake"
+
+    def __init__(self, pools, fail_create=()):
+        self.state = pools
+        self.fail_create = set(fail_create)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _log(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def pools(self):
+        return list(self.state)
+
+    def images(self, pool, names=None, timestamps=False):
+        self._log("images", pool)
+        if pool not in self.state:
+            raise CephCommandError(["rbd", "ls"], 2, "", f"rbd: error opening pool '{pool}'")
+        return [{"name": name, "size": 1, "format": 2,
+                 "snapshots": [{"name": s, "protected": p} for s, p in image["snaps"]]}
+                for name, image in self.state[pool].items() if names is None or name in names]
+
+    def metadata(self, pool, image):
+        self._log("metadata", pool, image)
+        return self.state[pool][image].get("meta", {})
+
+    def create_snap(self, pool, image, name):
+        self._log("create", pool, image, name)
+        if image in self.fail_create:
+            raise CephCommandError(["rbd", "snap", "create"], 1, "", "rbd: failed to create snapshot: (28) No space")
+        self.state[pool][image]["snaps"].append((name, False))
+
+    def remove_snaps(self, pool, image, names):
+        self._log("remove", pool, image, tuple(names))
+        snaps = self.state[pool][image]["snaps"]
+        snaps[:] = [s for s in snaps if s[0] not in names]
+
+    def count(self, kind):
+        return sum(1 for c in self.calls if c[0] == kind)
+
+
+def fleet():
+    return {
+        "rbd-oa": {
+            "vm-1": {"snaps": [(stamp(3), False), (stamp(2), False), (stamp(1), False)], "meta": {"backup": "hourly"}},
+            "vm-2": {"snaps": [(stamp(50), True), ("manual", False)], "meta": {"backup": "daily"}},
+            "db-1": {"snaps": [], "meta": {}},
+        },
+        "rbd-ob": {"vm-9": {"snaps": [], "meta": {"backup": "hourly"}}},
+    }
+
+
+def run(backend, **kwargs):
+    return SnapshotScheduler(backend, workers=4).run(now=NOW, **kwargs)
+
+
+class TestRetentionHelpers:
+    """이름 시각 해석과 보존 정책 계산 테스트"""
+
+    def test_parse_age(self):
+        assert parse_age("36h") == 36 * 3600
+        assert parse_age("2d") == 172800
+        assert parse_age(90) == 90
+        with pytest.raises(ValueError):
+            parse_age("soon")
+
+    def test_snapshot_time_only_for_scheduled_names(self):
+        assert snapshot_time(stamp(0), "auto") == NOW
+        assert snapshot_time("manual", "auto") is None
+        assert snapshot_time("auto-yesterday", "auto") is None
+        assert snapshot_time(stamp(0, "hourly"), "auto") is None
+
+    def test_expired_by_count_and_age(self):
+        snaps = [{"name": stamp(h)} for h in (1, 5, 30, 80)] + [{"name": "manual"}]
+
+        assert expired(snaps, "auto", NOW, count=2) == [stamp(80), stamp(30)]
+        assert expired(snaps, "auto", NOW, max_age=24 * 3600) == [stamp(80), stamp(30)]
+        assert expired(snaps, "auto", NOW, count=3, max_age=48 * 3600) == [stamp(80)]
+
+
+class TestSnapshotScheduler:
+    """선택자, 생성, 일괄 삭제 테스트"""
+
+    def test_glob_selector_creates_one_named_snapshot_per_image(self):
+        backend = FakeBackend(fleet())
+        result = run(backend, selectors=[{"pool": "rbd-oa", "image": "vm-*"}])
+
+        assert result["snapshot"] == "auto-20261018T090000Z"
+        assert result["matched"] == 2
+        assert result["created"] == ["rbd-oa/vm-1", "rbd-oa/vm-2"]
+        assert backend.count("images") == 1
+        assert backend.count("metadata") == 0
+
+    def test_label_selector_fetches_metadata_only_for_glob_matches(self):
+        backend = FakeBackend(fleet())
+        result = run(backend, selectors=[{"pool": "rbd-oa", "image": "vm-*", "labels": {"backup": "hourly"}},
+                                         {"pool": "rbd-ob", "labels": {"backup": "hourly"}}])
+
+        assert result["created"] == ["rbd-oa/vm-1", "rbd-ob/vm-9"]
+        assert backend.count("metadata") == 3
+
+    def test_retention_removes_in_one_batch_after_create(self):
+        backend = FakeBackend(fleet())
+        result = run(backend, images=["rbd-oa/vm-1"], retention={"count": 2})
+
+        assert result["removed"] == {"rbd-oa/vm-1": [stamp(3), stamp(2)]}
+        assert [c[0] for c in backend.calls if c[0] != "images"] == ["create", "remove"]
+        assert [s for s, _ in backend.state["rbd-oa"]["vm-1"]["snaps"]] == [stamp(1), stamp(0)]
+        entry = result["images"][0]
+        assert entry["created"] is True and entry["create_duration"] >= 0 and entry["remove_duration"] >= 0
+
+    def test_protected_and_foreign_snapshots_are_kept(self):
+        backend = FakeBackend(fleet())
+        result = run(backend, images=["rbd-oa/vm-2"], create=False, retention={"max_age": "1d"})
+
+        assert result["removed"] == {}
+        assert result["images"][0]["protected"] == [stamp(50)]
+        assert backend.count("remove") == 0
+
+    def test_explicit_remove(self):
+        backend = FakeBackend(fleet())
+        result = run(backend, images=["rbd-oa/vm-2", "rbd-oa/db-1"], create=False, remove=["manual"])
+
+        assert result["removed"] == {"rbd-oa/vm-2": ["manual"]}
+        assert [i["status"] for i in result["images"]] == ["ok", "unchanged"]
+
+    def test_failures_are_reported_per_image(self):
+        backend = FakeBackend(fleet(), fail_create=["vm-1"])
+        result = run(backend, selectors=[{"pool": "rbd-oa", "image": "vm-*"}, {"pool": "missing"}],
+                     images=["rbd-oa/ghost"], retention={"count": 1})
+
+        assert "No space" in result["errors"]["rbd-oa/vm-1"]
+        assert "error opening pool" in result["errors"]["missing"]
+        assert result["errors"]["rbd-oa/ghost"] == "image not found"
+        # 생성에 실패한 이미지는 보존 정리도 하지 않음
+        assert not any(c[0] == "remove" and c[2] == "vm-1" for c in backend.calls)
+        assert result["created"] == ["rbd-oa/vm-2"]
+
+    def test_rerun_with_same_name_does_not_recreate(self):
+        backend = FakeBackend(fleet())
+        run(backend, images=["rbd-oa/db-1"], snapshot_name="pre-upgrade")
+        result = run(backend, images=["rbd-oa/db-1"], snapshot_name="pre-upgrade")
+
+        assert result["created"] == []
+        assert backend.count("create") == 1
+
+    def test_check_mode_plans_without_changes(self):
+        backend = FakeBackend(fleet())
+        result = SnapshotScheduler(backend).run(images=["rbd-oa/vm-1"], retention={"count": 1}, now=NOW,
+                                                check_mode=True)
+
+        assert result["images"][0]["status"] == "planned"
+        assert result["images"][0]["removed"] == [stamp(3), stamp(2), stamp(1)]
+        assert backend.count("create") == backend.count("remove") == 0
+
+
+class TestCLIBackend:
+    """CLI 백엔드 명령 형식 테스트"""
+
+    def test_snapshot_commands(self):
+        commands = []
+
+        def runner(cmd, check_rc=False, data=None):
+            commands.append(cmd)
+            return 0, "", ""
+
+        backend = CLIBackend(CephCLI(runner, "ceph"), CephCLI(runner, "rbd"))
+        backend.create_snap("rbd-oa", "vm-1", "auto-1")
+        backend.remove_snaps("rbd-oa", "vm-1", ["a", "b"])
+
+        assert commands == [["rbd", "snap", "create", "rbd-oa/vm-1@auto-1"],
+                            ["rbd", "snap", "rm", "rbd-oa/vm-1@a"],
+                            ["rbd", "snap", "rm", "rbd-oa/vm-1@b"]]
@@ -0,0 +1,133 @@
+"""
+ceph_rgw_bucket_stats 모듈 및 module_utils/rgw_buckets.py 단위 테스트
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI, CephCommandError, iter_json_array  # noqa: E402
+from ansible.module_utils.rgw_buckets import bucket_summary  # noqa: E402
+from ceph_rgw_bucket_stats import BucketStatsValidator, zone_args  # noqa: E402
+
+GB = 1024 ** 3
+
+
+def stats(name, owner, objects=0, size=0, quota=None):
+    quota = quota or {"enabled": False, "max_size": -1, "max_objects": -1}
+    return {"bucket": name, "owner": owner, "id": f"{name}.1", "bucket_quota": quota,
+            "usage": {"rgw.main": {"size": size, "size_actual": size, "num_objects": objects}}}
+
+
+class FakeRadosgwAdmin:
+    """존 인자별 bucket stats 응답"""
+
+    def __init__(self, zones):
+        self.zones = zones
+        self.commands = []
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        self.commands.append(cmd)
+        if cmd[1:3] != ["bucket", "stats"] or any(a.startswith("--bucket=") for a in cmd):
+            return 1, "", "unexpected command"
+        return 0, json.dumps(self.zones.get(tuple(cmd[3:]), []), indent=4), ""
+
+
+def validate(fake, instances, **kwargs):
+    cli = CephCLI(fake, "radosgw-admin", json_args=())
+    return BucketStatsValidator(cli, **kwargs).validate(instances), cli
+
+
+QUOTA_80G = {"enabled": True, "max_size": 80 * GB, "max_objects": -1}
+INSTANCE = {"realm": "default", "zonegroup": "default", "zone": "default", "service_name": "rgw-oa",
+            "users": [{"user_id": "admin", "buckets": [{"name": "admin-bucket1", "quota": "80GB"},
+                                                       {"name": "admin-bucket2"}]},
+                      {"user_id": "user1", "buckets": [{"name": "user-bucket1", "max_objects": 10}]}]}
+
+
+class TestStreamingIndex:
+    """JSON 배열 항목 단위 해석과 버킷 요약 테스트"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ('[{"a": 1}, {"b": [2, 3]}]', [{"a": 1}, {"b": [2, 3]}]),
+        ("\n[\n  1 ,\n  2\n]\n", [1, 2]),
+        ("[]", []),
+        ("", []),
+    ])
+    def test_iter_json_array(self, text, expected):
+        assert list(iter_json_array(text)) == expected
+
+    def test_iter_json_array_rejects_non_arrays(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array('{"a": 1}'))
+        with pytest.raises(ValueError):
+            list(iter_json_array("[1 2]"))
+
+    def test_invalid_output_is_a_command_error(self):
+        cli = CephCLI(lambda cmd, check_rc=False, data=None: (0, "[{", ""), "radosgw-admin", json_args=())
+        with pytest.raises(CephCommandError):
+            list(cli.iter_json(["bucket", "stats"]))
+
+    def test_bucket_summary_keeps_only_needed_fields(self):
+        summary = bucket_summary(stats("b", "admin", objects=3, size=4096, quota=QUOTA_80G))
+
+        assert summary == {"bucket": "b", "owner": "admin", "bucket_quota": QUOTA_80G,
+                           "num_objects": 3, "size": 4096}
+
+
+class TestBucketStatsValidator:
+    """존재, 소유자, 쿼터, 오브젝트 수 검증 테스트"""
+
+    def test_valid_buckets_from_one_call(self):
+        fake = FakeRadosgwAdmin({(): [stats("admin-bucket1", "admin", quota=QUOTA_80G),
+                                      stats("admin-bucket2", "admin"),
+                                      stats("user-bucket1", "user1", objects=4,
+                                            quota={"enabled": True, "max_size": -1, "max_objects": 10}),
+                                      stats("unrelated", "other")]})
+        result, cli = validate(fake, [INSTANCE])
+
+        assert result["valid"] is True
+        assert cli.calls == 1
+        assert result["indexed"] == 4
+        assert result["instances"] == {"rgw-oa": {"buckets": 3, "invalid": 0}}
+        assert result["buckets"]["user-bucket1"]["num_objects"] == 4
+
+    def test_reports_missing_owner_quota_and_object_count_problems(self):
+        fake = FakeRadosgwAdmin({(): [stats("admin-bucket1", "admin"),
+                                      stats("admin-bucket2", "user1"),
+                                      stats("user-bucket1", "user1", objects=12,
+                                            quota={"enabled": True, "max_size": -1, "max_objects": 10})]})
+        instance = dict(INSTANCE, users=INSTANCE["users"] + [{"user_id": "ghost", "buckets": [{"name": "gone"}]}])
+        result, _ = validate(fake, [instance])
+
+        problems = {name: entry["problems"] for name, entry in result["buckets"].items()}
+        assert problems["admin-bucket1"] == [f"quota mismatch: enabled False != True, max_size -1 != {80 * GB}"]
+        assert problems["admin-bucket2"] == ["owned by user1"]
+        assert problems["user-bucket1"] == ["over object quota (12/10)"]
+        assert problems["gone"] == ["bucket not found"]
+        assert result["invalid"] == ["admin-bucket1", "admin-bucket2", "user-bucket1", "gone"]
+        assert result["instances"]["rgw-oa"]["invalid"] == 4
+
+    def test_quota_check_can_be_disabled(self):
+        fake = FakeRadosgwAdmin({(): [stats("admin-bucket1", "admin"), stats("admin-bucket2", "admin"),
+                                      stats("user-bucket1", "user1")]})
+        result, _ = validate(fake, [INSTANCE], check_quota=False)
+
+        assert result["valid"] is True
+
+    def test_one_call_per_zone_for_every_instance(self):
+        second = {"realm": "tenants", "zonegroup": "zg", "zone": "z1", "service_name": "rgw-ob",
+                  "users": [{"user_id": "t1", "buckets": [{"name": "t1-bucket"}]}]}
+        third = dict(second, service_name="rgw-oc", users=[{"user_id": "t2", "buckets": [{"name": "t2-bucket"}]}])
+        zone = zone_args(second)
+        fake = FakeRadosgwAdmin({(): [stats("admin-bucket2", "admin")],
+                                 zone: [stats("t1-bucket", "t1"), stats("t2-bucket", "t2")]})
+        result, cli = validate(fake, [dict(INSTANCE, users=INSTANCE["users"][:1]), second, third])
+
+        assert zone == ("--rgw-realm=tenants", "--rgw-zonegroup=zg", "--rgw-zone=z1")
+        assert cli.calls == 2
+        assert result["instances"]["rgw-ob"] == {"buckets": 1, "invalid": 0}
+        assert result["instances"]["rgw-oc"] == {"buckets": 1, "invalid": 0}
+        assert result["invalid"] == ["admin-bucket1"]
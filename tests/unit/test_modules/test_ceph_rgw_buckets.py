@@ -0,0 +1,168 @@
+"""
+ceph_rgw_buckets 모듈 단위 테스트
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from ansible.module_utils.rgw_buckets import desired_quota, parse_size  # noqa: E402
+from ceph_rgw_buckets import RGWBucketProvisioner  # noqa: E402
+
+STUB = Path(__file__).parent.parent.parent / "fixtures" / "bin" / "radosgw-admin"
+
+GB = 1024 ** 3
+
+
+class FakeRadosgwAdmin:
+    """메모리 기반 radosgw-admin run_command 대체 (버킷/쿼터)"""
+
+    def __init__(self, buckets=None):
+        self.buckets = {}
+        for name, owner in (buckets or {}).items():
+            self.add(name, owner)
+        self.commands = []
+
+    def add(self, name, owner):
+        self.buckets[name] = {"bucket": name, "owner": owner,
+                              "bucket_quota": {"enabled": False, "max_size": -1, "max_objects": -1}}
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        self.commands.append(cmd)
+        args = cmd[1:]
+        opts = dict(a[2:].split("=", 1) for a in args if a.startswith("--") and "=" in a)
+        if args[:2] == ["bucket", "stats"]:
+            return 0, json.dumps(list(self.buckets.values())), ""
+        if args[:2] == ["bucket", "create"]:
+            self.add(opts["bucket"], opts["owner"])
+            return 0, "", ""
+        if args[:2] == ["quota", "set"]:
+            quota = self.buckets[opts["bucket"]]["bucket_quota"]
+            quota.update(max_size=int(opts["max-size"]), max_objects=int(opts["max-objects"]))
+            return 0, "", ""
+        if args[:2] == ["quota", "enable"]:
+            self.buckets[opts["bucket"]]["bucket_quota"]["enabled"] = True
+            return 0, "", ""
+        return 1, "", "unknown command"
+
+    def count(self, *prefix):
+        return sum(1 for c in self.commands if c[1:1 + len(prefix)] == list(prefix))
+
+
+@pytest.fixture
+def users():
+    return [
+        {"user_id": "admin", "buckets": [{"name": "admin-bucket1", "quota": "80GB"},
+                                         {"name": "admin-bucket2", "quota": "10GB", "max_objects": 1000}]},
+        {"user_id": "user1", "buckets": [{"name": "user-bucket1"}]},
+        {"user_id": "nobuckets"},
+    ]
+
+
+def make(fake, **kwargs):
+    return RGWBucketProvisioner(CephCLI(fake, "radosgw-admin", json_args=()), **kwargs)
+
+
+class TestQuotaParsing:
+    """쿼터 크기 해석 테스트"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("80GB", 80 * GB), ("10G", 10 * GB), ("512MiB", 512 * 1024 ** 2), ("1.5T", int(1.5 * 1024 ** 4)),
+        ("4096", 4096), (2048, 2048), (None, None),
+    ])
+    def test_parse_size(self, value, expected):
+        assert parse_size(value) == expected
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            parse_size("ten gigs")
+
+    def test_desired_quota(self):
+        assert desired_quota({"name": "b"}) is None
+        assert desired_quota({"name": "b", "max_objects": 5}) == {"enabled": True, "max_size": -1, "max_objects": 5}
+
+
+class TestRGWBucketProvisioner:
+    """버킷 diff, 생성 및 쿼터 적용 테스트"""
+
+    def test_creates_only_missing_buckets(self, users):
+        fake = FakeRadosgwAdmin(buckets={"admin-bucket1": "admin"})
+        result = make(fake).apply(users)
+
+        assert result["created"] == ["admin-bucket2", "user-bucket1"]
+        assert result["existing"] == ["admin-bucket1"]
+        assert fake.count("bucket", "create") == 2
+        # 존재 여부 확인은 버킷 수와 무관하게 한 번만 수행
+        assert fake.count("bucket", "stats") == 1
+
+    def test_applies_quota(self, users):
+        fake = FakeRadosgwAdmin()
+        result = make(fake).apply(users)
+
+        assert fake.buckets["admin-bucket1"]["bucket_quota"] == {"enabled": True, "max_size": 80 * GB,
+                                                                 "max_objects": -1}
+        assert fake.buckets["admin-bucket2"]["bucket_quota"]["max_objects"] == 1000
+        assert fake.buckets["user-bucket1"]["bucket_quota"]["enabled"] is False
+        assert result["quota_updated"] == ["admin-bucket1", "admin-bucket2"]
+
+    def test_second_run_is_idempotent(self, users):
+        fake = FakeRadosgwAdmin()
+        make(fake).apply(users)
+        fake.commands.clear()
+
+        result = make(fake).apply(users)
+
+        assert result["created"] == [] and result["quota_updated"] == []
+        assert fake.commands == [["radosgw-admin", "bucket", "stats"]]
+
+    def test_quota_enforcement_can_be_disabled(self, users):
+        fake = FakeRadosgwAdmin()
+        result = make(fake, enforce_quota=False).apply(users)
+
+        assert result["quota_updated"] == []
+        assert fake.count("quota") == 0
+
+    def test_foreign_owner_is_reported_as_conflict(self, users):
+        fake = FakeRadosgwAdmin(buckets={"user-bucket1": "someone-else"})
+        result = make(fake).apply(users)
+
+        assert result["conflicts"] == {"user-bucket1": "someone-else"}
+        assert "user-bucket1" not in result["buckets"]
+
+    def test_check_mode_makes_no_changes(self, users):
+        fake = FakeRadosgwAdmin()
+        result = make(fake).apply(users, check_mode=True)
+
+        assert result["created"] == ["admin-bucket1", "admin-bucket2", "user-bucket1"]
+        assert not fake.buckets
+
+    def test_failures_are_reported_per_bucket(self, users):
+        fake = FakeRadosgwAdmin()
+
+        def failing(cmd, check_rc=False, data=None):
+            if "--bucket=user-bucket1" in cmd:
+                return 1, "", "boom"
+            return fake(cmd, check_rc, data)
+
+        result = make(failing).apply(users)
+
+        assert result["errors"] == {"user-bucket1": "boom"}
+        assert result["created"] == ["admin-bucket1", "admin-bucket2"]
+
+    def test_against_stub_executable(self, users, tmp_path, monkeypatch):
+        state = tmp_path / "state.json"
+        state.write_text(json.dumps({"users": {"admin": {}, "user1": {}}}))
+        monkeypatch.setenv("RGW_STUB_STATE", str(state))
+        cli = CephCLI(subprocess_runner, str(STUB), json_args=())
+
+        first = RGWBucketProvisioner(cli, workers=2).apply(users)
+        second = RGWBucketProvisioner(cli, workers=2).apply(users)
+
+        assert first["created"] == ["admin-bucket1", "admin-bucket2", "user-bucket1"]
+        assert second["created"] == [] and second["quota_updated"] == []
+        stored = json.loads(state.read_text())["buckets"]
+        assert stored["admin-bucket1"]["bucket_quota"]["max_size"] == 80 * GB
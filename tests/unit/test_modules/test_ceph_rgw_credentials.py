@@ -0,0 +1,122 @@
+"""
+ceph_rgw_credentials 모듈 / rgw_credentials 헬퍼 단위 테스트
+"""
+
+import os
+import stat
+import time
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.rgw_credentials import (  # noqa: E402
+    CSV_HEADER,
+    iter_credentials,
+    load_credentials,
+    merge_credentials,
+)
+
+
+def make_user(uid, key_suffix=""):
+    return {
+        "user_id": uid,
+        "display_name": f"User {uid}",
+        "email": f"{uid}@example.com",
+        "access_key": f"AK-{uid}{key_suffix}",
+        "secret_key": f"SK-{uid}{key_suffix}",
+        "created": True,
+    }
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    return tmp_path / "ceph-rgw-users-creation-results.csv"
+
+
+class TestMergeCredentials:
+    """CSV 병합 동작 테스트"""
+
+    def test_creates_file_with_header_and_mode(self, csv_path):
+        result = merge_credentials(str(csv_path), {"a": make_user("a")})
+
+        assert result["changed"] is True
+        assert result["added"] == ["a"]
+        lines = csv_path.read_text().splitlines()
+        assert lines[0] == ",".join(CSV_HEADER)
+        assert lines[1] == "a,User a,a@example.com,AK-a,SK-a"
+        assert stat.S_IMODE(os.stat(csv_path).st_mode) == 0o600
+
+    def test_rerun_is_idempotent(self, csv_path):
+        users = [make_user("a"), make_user("b")]
+        merge_credentials(str(csv_path), users)
+        before = csv_path.read_text()
+
+        result = merge_credentials(str(csv_path), users)
+
+        assert result["changed"] is False
+        assert csv_path.read_text() == before
+
+    def test_updates_by_user_id(self, csv_path):
+        merge_credentials(str(csv_path), [make_user("a"), make_user("b")])
+        result = merge_credentials(str(csv_path), [make_user("b", "-rotated"), make_user("c")])
+
+        assert result["updated"] == ["b"]
+        assert result["added"] == ["c"]
+        creds = load_credentials(str(csv_path))
+        assert list(creds) == ["a", "b", "c"]
+        assert creds["b"]["access_key"] == "AK-b-rotated"
+
+    def test_collapses_duplicate_rows_from_legacy_runs(self, csv_path):
+        csv_path.write_text(
+            ",".join(CSV_HEADER) + "\n"
+            "a,User a,a@example.com,OLD,OLD\n"
+            "a,User a,a@example.com,AK-a,SK-a\n"
+        )
+        os.chmod(csv_path, 0o600)
+
+        result = merge_credentials(str(csv_path), [make_user("a")])
+
+        assert result["changed"] is True
+        assert len(csv_path.read_text().splitlines()) == 2
+
+    def test_skips_users_without_keys(self, csv_path):
+        user = make_user("a")
+        user["access_key"] = None
+        result = merge_credentials(str(csv_path), [user])
+
+        assert result["added"] == []
+
+    def test_check_mode_does_not_write(self, csv_path):
+        result = merge_credentials(str(csv_path), [make_user("a")], check_mode=True)
+
+        assert result["changed"] is True
+        assert not csv_path.exists()
+
+    def test_no_temp_files_left_behind(self, csv_path):
+        merge_credentials(str(csv_path), [make_user("a")])
+        assert [p.name for p in csv_path.parent.iterdir()] == [csv_path.name]
+
+    def test_ten_thousand_users_write_under_one_second(self, csv_path):
+        users = {f"u{i}": make_user(f"u{i}") for i in range(10000)}
+
+        start = time.perf_counter()
+        merge_credentials(str(csv_path), users)
+        merge_credentials(str(csv_path), users)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert sum(1 for _ in iter_credentials(str(csv_path))) == 10000
+
+
+class TestIterCredentials:
+    """스트리밍 읽기 테스트"""
+
+    def test_missing_file_yields_nothing(self, csv_path):
+        assert list(iter_credentials(str(csv_path))) == []
+
+    def test_ignores_malformed_rows(self, csv_path):
+        csv_path.write_text(",".join(CSV_HEADER) + "\n\nbroken,row\na, A ,a@x,AK,SK\n")
+        assert list(iter_credentials(str(csv_path))) == [
+            {"user_id": "a", "display_name": "A", "email": "a@x", "access_key": "AK", "secret_key": "SK"}
+        ]
@@ -0,0 +1,100 @@
+"""
+ceph_rgw_objects 모듈 단위 테스트 (로컬 대체 S3 서버 사용)
+"""
+
+import pytest
+
+pytest.importorskip("ansible")
+pytest.importorskip("boto3")
+
+from ansible.module_utils.rgw_s3 import S3ClientPool, percentiles  # noqa: E402
+from ceph_rgw_objects import S3ObjectUploader  # noqa: E402
+
+from tests.fixtures.fake_s3 import FakeS3Server  # noqa: E402
+
+
+@pytest.fixture
+def users():
+    return [
+        {"user_id": "admin", "buckets": [{"name": "admin-bucket1"}, {"name": "admin-bucket2"}]},
+        {"user_id": "user1", "buckets": [{"name": "user-bucket1"}]},
+        {"user_id": "nokeys", "buckets": [{"name": "orphan-bucket"}]},
+    ]
+
+
+@pytest.fixture
+def credentials():
+    return {
+        "admin": {"access_key": "AK-admin", "secret_key": "SK-admin"},
+        "user1": {"access_key": "AK-user1", "secret_key": "SK-user1"},
+    }
+
+
+@pytest.fixture
+def s3():
+    buckets = ["admin-bucket1", "admin-bucket2", "user-bucket1", "orphan-bucket"]
+    with FakeS3Server(buckets=buckets, access_keys={"AK-admin", "AK-user1"}) as server:
+        yield server
+
+
+def make_uploader(s3, **kwargs):
+    pool = S3ClientPool(s3.endpoint_url, validate_certs=False, max_connections=4)
+    return S3ObjectUploader(pool, concurrency=4, **kwargs)
+
+
+class TestS3ObjectUploader:
+    """업로드 계획 및 실행 테스트"""
+
+    def test_uploads_to_every_bucket_concurrently(self, s3, users, credentials):
+        result = make_uploader(s3).run(users, credentials)
+
+        assert result["throughput"]["objects"] == 3
+        assert result["throughput"]["failed"] == 0
+        assert result["skipped_users"] == ["nokeys"]
+        for bucket in ("admin-bucket1", "admin-bucket2", "user-bucket1"):
+            (data,) = s3.objects(bucket).values()
+            assert data == f"This is a test object created for bucket {bucket}".encode()
+        assert not s3.objects("orphan-bucket")
+
+    def test_one_client_per_credential_set(self, s3, users, credentials):
+        uploader = make_uploader(s3, objects_per_bucket=3)
+        result = uploader.run(users, credentials)
+
+        assert result["throughput"]["objects"] == 9
+        assert result["throughput"]["clients"] == 2
+
+    def test_object_size_and_latency_stats(self, s3, users, credentials):
+        result = make_uploader(s3, object_size=4096).run(users, credentials)
+
+        assert all(o["size"] == 4096 for o in result["objects"])
+        assert result["throughput"]["bytes"] == 3 * 4096
+        assert set(result["latency_ms"]) >= {"p50", "p95", "max"}
+        assert all(o["latency_ms"] >= 0 for o in result["objects"])
+
+    def test_failures_are_reported_per_object(self, s3, users, credentials):
+        del s3.store["user-bucket1"]
+        result = make_uploader(s3).run(users, credentials)
+
+        failed = [o for o in result["objects"] if not o["ok"]]
+        assert [o["bucket"] for o in failed] == ["user-bucket1"]
+        assert result["throughput"]["failed"] == 1
+
+    def test_keys_share_one_timestamp(self, users, credentials):
+        uploader = S3ObjectUploader(pool=None, objects_per_bucket=2)
+        jobs, _ = uploader.plan(users, credentials)
+
+        assert {j["key"] for j in jobs} == {f"test-object-{uploader.run_id}-0.txt",
+                                            f"test-object-{uploader.run_id}-1.txt"}
+
+
+class TestPercentiles:
+    """백분위수 계산 테스트"""
+
+    def test_nearest_rank(self):
+        stats = percentiles(range(1, 101))
+        assert stats["p50"] == 50
+        assert stats["p99"] == 99
+        assert stats["max"] == 100
+
+    def test_empty(self):
+        assert percentiles([]) == {}
@@ -0,0 +1,100 @@
+"""
+ceph_rgw_probe 모듈 단위 테스트 (로컬 대체 S3 서버 사용)
+"""
+
+import pytest
+
+pytest.importorskip("ansible")
+pytest.importorskip("boto3")
+
+from ansible.module_utils.rgw_s3 import S3EndpointClient  # noqa: E402
+from ceph_rgw_probe import S3AccessProber  # noqa: E402
+
+from tests.fixtures.fake_s3 import FakeS3Server  # noqa: E402
+
+
+@pytest.fixture
+def users():
+    return [
+        {"user_id": "admin", "buckets": [{"name": "admin-bucket1"}, {"name": "admin-bucket2"}]},
+        {"user_id": "user1", "buckets": [{"name": "user-bucket1"}]},
+        {"user_id": "nokeys", "buckets": [{"name": "orphan-bucket"}]},
+    ]
+
+
+@pytest.fixture
+def credentials():
+    return {
+        "admin": {"access_key": "AK-admin", "secret_key": "SK-admin"},
+        "user1": {"access_key": "AK-user1", "secret_key": "SK-user1"},
+    }
+
+
+@pytest.fixture
+def s3():
+    buckets = ["admin-bucket1", "admin-bucket2", "user-bucket1", "orphan-bucket"]
+    with FakeS3Server(buckets=buckets, access_keys={"AK-admin", "AK-user1"}) as server:
+        yield server
+
+
+def make_prober(s3, **kwargs):
+    pool = S3EndpointClient(s3.endpoint_url, validate_certs=False, max_connections=4)
+    return S3AccessProber(pool, concurrency=4, **kwargs)
+
+
+class TestS3AccessProber:
+    """프로브 계획 및 실행 테스트"""
+
+    def test_probes_every_bucket_with_sigv4(self, s3, users, credentials):
+        result = make_prober(s3).run(users, credentials)
+
+        assert result["ok"] is True
+        assert result["skipped_users"] == ["nokeys"]
+        assert [(p["user_id"], p["bucket"]) for p in result["probes"]] == [
+            ("admin", "admin-bucket1"), ("admin", "admin-bucket2"), ("user1", "user-bucket1")]
+        assert all(set(p["latency_ms"]) == {"list", "put", "get", "delete"} for p in result["probes"])
+        assert s3.auth_schemes == {"AWS4-HMAC-SHA256"}
+        # 프로브 오브젝트는 남지 않음
+        assert all(not s3.objects(b) for b in ("admin-bucket1", "admin-bucket2", "user-bucket1"))
+
+    def test_latency_percentiles_per_operation(self, s3, users, credentials):
+        result = make_prober(s3).run(users, credentials)
+
+        assert set(result["latency_ms"]) == {"list", "put", "get", "delete"}
+        assert set(result["latency_ms"]["put"]) >= {"p50", "p95", "p99", "max"}
+        assert result["summary"] == dict(result["summary"], probes=3, ok=3, errors=0, requests=12, clients=1)
+
+    def test_failures_are_reported_per_bucket(self, s3, users, credentials):
+        del s3.store["user-bucket1"]
+        credentials["admin"]["access_key"] = "AK-revoked"
+        result = make_prober(s3).run(users, credentials)
+
+        assert result["ok"] is False
+        errors = {p["bucket"]: (p["operation"], p["error"]) for p in result["probes"] if not p["ok"]}
+        assert errors == {"admin-bucket1": ("list", "InvalidAccessKeyId"),
+                          "admin-bucket2": ("list", "InvalidAccessKeyId"),
+                          "user-bucket1": ("list", "NoSuchBucket")}
+        assert result["latency_ms"] == {}
+
+    def test_probe_object_removed_without_delete_operation(self, s3, users, credentials):
+        result = make_prober(s3, operations=["put", "get"]).run(users[1:2], credentials)
+
+        assert result["probes"][0]["ok"] is True
+        assert set(result["probes"][0]["latency_ms"]) == {"put", "get"}
+        assert not s3.objects("user-bucket1")
+
+    def test_one_client_signs_with_each_users_keys(self, credentials):
+        users = [{"user_id": u, "buckets": [{"name": f"bucket-{u}-{i}"} for i in range(8)]} for u in credentials]
+        buckets = [b["name"] for u in users for b in u["buckets"]]
+        credentials["user1"]["access_key"] = "AK-revoked"
+        with FakeS3Server(buckets=buckets, access_keys={"AK-admin"}) as s3:
+            result = make_prober(s3, operations=["list"]).run(users, credentials)
+
+        # 스레드가 섞여도 요청마다 자기 사용자의 키로 서명
+        assert {(p["user_id"], p["ok"]) for p in result["probes"]} == {("admin", True), ("user1", False)}
+        assert result["summary"]["ok"] == 8 and result["summary"]["clients"] == 1
+
+    def test_operations_run_in_fixed_order(self):
+        prober = S3AccessProber(pool=None, operations=["delete", "get", "put"])
+
+        assert prober.operations == ["put", "get", "delete"]
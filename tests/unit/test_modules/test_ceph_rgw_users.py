@@ -0,0 +1,123 @@
+"""
+ceph_rgw_users 모듈 단위 테스트
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI, subprocess_runner  # noqa: E402
+from ceph_rgw_users import RGWUserProvisioner, build_caps  # noqa: E402
+
+STUB = Path(__file__).parent.parent.parent / "fixtures" / "bin" / "radosgw-admin"
+
+
+class FakeRadosgwAdmin:
+    """메모리 기반 radosgw-admin run_command 대체"""
+
+    def __init__(self, users=()):
+        self.users = {uid: {"user_id": uid, "keys": [{"access_key": f"AK-{uid}", "secret_key": f"SK-{uid}"}]}
+                      for uid in users}
+        self.commands = []
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        self.commands.append(cmd)
+        args = cmd[1:]
+        opts = dict(a[2:].split("=", 1) for a in args if a.startswith("--") and "=" in a)
+        if args[:3] == ["metadata", "list", "user"]:
+            return 0, json.dumps(sorted(self.users)), ""
+        if args[:2] == ["user", "info"]:
+            if opts["uid"] not in self.users:
+                return 22, "", "no user info saved"
+            return 0, json.dumps(self.users[opts["uid"]]), ""
+        if args[:2] == ["user", "create"]:
+            uid = opts["uid"]
+            self.users[uid] = {"user_id": uid, "keys": [{"access_key": f"NEW-{uid}", "secret_key": f"NSK-{uid}"}]}
+            return 0, json.dumps(self.users[uid]), ""
+        return 1, "", "unknown command"
+
+
+@pytest.fixture
+def users():
+    return [
+        {"user_id": "admin", "display_name": "Admin User", "email": "admin@example.com",
+         "caps": [{"type": "buckets", "perm": "read, write, delete"}, {"type": "metadata", "perm": "read"}]},
+        {"user_id": "user1", "display_name": "Regular User", "email": "user@example.com", "caps": []},
+    ]
+
+
+class TestBuildCaps:
+    """caps 문자열 생성 테스트"""
+
+    def test_groups_by_type_in_canonical_order(self):
+        caps = [{"type": "usage", "perm": "read"}, {"type": "buckets", "perm": "read"},
+                {"type": "buckets", "perm": "write"}]
+        assert build_caps(caps) == "buckets=read,write;usage=read"
+
+    def test_empty_caps(self):
+        assert build_caps([]) == ""
+        assert build_caps(None) == ""
+
+
+class TestRGWUserProvisioner:
+    """사용자 diff 및 생성 동작 테스트"""
+
+    def test_creates_only_missing_users(self, users):
+        fake = FakeRadosgwAdmin(users=["admin"])
+        cli = CephCLI(fake, "radosgw-admin", json_args=())
+        result = RGWUserProvisioner(cli).apply(users)
+
+        assert result["created"] == ["user1"]
+        assert result["existing"] == ["admin"]
+        assert result["users"]["user1"]["access_key"] == "NEW-user1"
+        assert result["users"]["admin"]["access_key"] == "AK-admin"
+        assert result["users"]["admin"]["created"] is False
+
+        creates = [c for c in fake.commands if c[1:3] == ["user", "create"]]
+        assert len(creates) == 1
+        # 존재 여부 확인은 사용자 수와 무관하게 한 번만 수행
+        assert sum(1 for c in fake.commands if c[1:3] == ["metadata", "list"]) == 1
+
+    def test_no_user_info_after_create(self, users):
+        fake = FakeRadosgwAdmin()
+        cli = CephCLI(fake, "radosgw-admin", json_args=())
+        RGWUserProvisioner(cli).apply(users)
+
+        assert not any(c[1:3] == ["user", "info"] for c in fake.commands)
+        assert cli.calls == 1 + len(users)
+
+    def test_check_mode_makes_no_changes(self, users):
+        fake = FakeRadosgwAdmin()
+        result = RGWUserProvisioner(CephCLI(fake, "radosgw-admin", json_args=())).apply(users, check_mode=True)
+
+        assert result["created"] == ["admin", "user1"]
+        assert not fake.users
+
+    def test_failures_are_reported_per_user(self, users):
+        fake = FakeRadosgwAdmin()
+
+        def failing(cmd, check_rc=False, data=None):
+            if "--uid=user1" in cmd:
+                return 1, "", "boom"
+            return fake(cmd, check_rc, data)
+
+        result = RGWUserProvisioner(CephCLI(failing, "radosgw-admin", json_args=())).apply(users)
+
+        assert result["errors"] == {"user1": "boom"}
+        assert result["created"] == ["admin"]
+
+    def test_against_stub_executable(self, users, tmp_path, monkeypatch):
+        monkeypatch.setenv("RGW_STUB_STATE", str(tmp_path / "state.json"))
+        cli = CephCLI(subprocess_runner, str(STUB), json_args=())
+
+        first = RGWUserProvisioner(cli, workers=2).apply(users)
+        second = RGWUserProvisioner(cli, workers=2).apply(users)
+
+        assert sorted(first["created"]) == ["admin", "user1"]
+        assert second["created"] == []
+        assert second["users"]["admin"]["secret_key"] == first["users"]["admin"]["secret_key"]
+        assert os.path.exists(tmp_path / "state.json")
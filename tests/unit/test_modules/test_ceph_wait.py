@@ -0,0 +1,124 @@
+"""
+ceph_wait 모듈 단위 테스트
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible.module_utils.ceph_cli import CephCLI  # noqa: E402
+from ceph_wait import HealthWaiter  # noqa: E402
+
+
+def status(level="HEALTH_OK", checks=(), osds_up=3):
+    return {
+        "health": {"status": level, "checks": {c: {"severity": "HEALTH_WARN", "summary": {"message": c}}
+                                               for c in checks}},
+        "quorum_names": ["mon1"], "monmap": {"num_mons": 1},
+        "osdmap": {"num_osds": 3, "num_up_osds": osds_up, "num_in_osds": osds_up},
+        "pgmap": {"pgs_by_state": [{"state_name": "active+clean", "count": 1}], "num_pgs": 1},
+    }
+
+
+class FakeCluster:
+    """폴링할 때마다 미리 정한 상태를 차례로 반환하는 ceph CLI 대체 (마지막 상태 유지)"""
+
+    def __init__(self, states, hosts=None, services=None):
+        self.states = list(states)
+        self.hosts = hosts or [[]]
+        self.services = services or [[]]
+        self.polls = 0
+
+    def _pick(self, seq):
+        return seq[min(self.polls - 1, len(seq) - 1)]
+
+    def __call__(self, cmd, check_rc=False, data=None):
+        args = cmd[1:]
+        if args[0] == "status":
+            self.polls += 1
+            state = self._pick(self.states)
+            if state is None:
+                return 1, "", "error connecting to the cluster"
+            return 0, json.dumps(state), ""
+        if args[:3] == ["orch", "host", "ls"]:
+            return 0, json.dumps([{"hostname": h} for h in self._pick(self.hosts)]), ""
+        if args[:2] == ["orch", "ls"]:
+            return 0, json.dumps([{"service_name": s} for s in self._pick(self.services)]), ""
+        return 1, "", "unknown command"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make(cluster, clock, **conditions):
+    return HealthWaiter(CephCLI(cluster, "ceph"), clock=clock, sleep=clock.sleep, **conditions)
+
+
+class TestHealthWaiter:
+    """대기 조건, 백오프, 타임라인 테스트"""
+
+    def test_returns_immediately_when_already_healthy(self):
+        clock = FakeClock()
+        result = make(FakeCluster([status()]), clock, health="HEALTH_OK").wait()
+
+        assert result["reached"] is True
+        assert result["polls"] == 1
+        assert clock.sleeps == []
+
+    def test_returns_on_first_poll_that_matches(self):
+        clock = FakeClock()
+        cluster = FakeCluster([None, status("HEALTH_ERR"), status("HEALTH_WARN", ["OSD_DOWN"]), status()])
+        result = make(cluster, clock, health="HEALTH_OK").wait()
+
+        assert result["reached"] is True
+        assert result["polls"] == 4
+        assert [t["status"] for t in result["timeline"]] == [None, "HEALTH_ERR", "HEALTH_WARN", "HEALTH_OK"]
+        assert result["timeline"][0]["error"] == "error connecting to the cluster"
+        assert result["snapshot"]["status"] == "HEALTH_OK"
+
+    def test_backoff_grows_while_unchanged_and_resets_on_change(self):
+        clock = FakeClock()
+        cluster = FakeCluster([status("HEALTH_WARN")] * 5 + [status("HEALTH_WARN", ["X"])] * 2 + [status()])
+        make(cluster, clock, health="HEALTH_OK").wait(min_interval=1, max_interval=3, backoff=2)
+
+        assert clock.sleeps == [1, 2, 3, 3, 3, 1, 2]
+
+    def test_timeout_reports_pending_conditions(self):
+        clock = FakeClock()
+        result = make(FakeCluster([status(osds_up=1)]), clock, min_osds_up=3).wait(timeout=10, max_interval=4)
+
+        assert result["reached"] is False
+        assert result["pending"] == ["min_osds_up"]
+        assert result["elapsed"] == 10
+        assert len(result["timeline"]) == 1
+
+    def test_absent_checks(self):
+        clock = FakeClock()
+        cluster = FakeCluster([status("HEALTH_WARN", ["MON_CLOCK_SKEW"]),
+                               status("HEALTH_WARN", ["POOL_NO_REDUNDANCY"])])
+        result = make(cluster, clock, absent_checks=["MON_CLOCK_SKEW"]).wait()
+
+        assert result["reached"] is True
+        assert result["timeline"][-1]["checks"] == ["POOL_NO_REDUNDANCY"]
+
+    def test_orchestrator_conditions(self):
+        clock = FakeClock()
+        cluster = FakeCluster([status()], hosts=[["a"], ["a", "b", "c"]],
+                              services=[["rgw.rgw-oa", "mon"], ["mon"]])
+        result = make(cluster, clock, min_hosts=3, absent_services=["rgw.rgw-oa"]).wait()
+
+        assert result["reached"] is True
+        assert result["polls"] == 2
+        assert result["timeline"][0]["pending"] == ["min_hosts", "absent_services"]
@@ -0,0 +1,117 @@
+"""
+가짜 클러스터 대상 플레이북 실행 테스트
+
+실제 플레이북을 localhost 에서 ansible-playbook 으로 실행하고, 모듈과 command 태스크가
+남긴 클러스터 상태와 명령 기록으로 동작을 확인합니다.
+"""
+
+import csv
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from tests.fixtures.fake_ceph.offline import OfflineCluster, ansible_playbook  # noqa: E402
+
+pytestmark = pytest.mark.skipif(ansible_playbook() is None, reason="ansible-playbook not available")
+
+CAPS = [{"type": "buckets", "perm": "read, write"}, {"type": "usage", "perm": "read"}]
+
+
+def ceph_vars(users=3, images=2):
+    return {
+        "rgw_instance": {
+            "users": [
+                {"user_id": f"tenant{i}", "display_name": f"Tenant {i}", "caps": CAPS,
+                 "buckets": [{"name": f"tenant{i}-bucket", "quota": "1GB"}]}
+                for i in range(users)
+            ],
+        },
+        "ceph": {
+            "rgw_user_creation_result_file": "rgw-users.csv",
+            "rbd": [{"pool_name": "rbd-oa", "pool_pg_num": 16,
+                     "images": [{"image_name": f"vm-{i}", "size": "1G"} for i in range(images)]}],
+        },
+    }
+
+
+def assert_ok(result):
+    assert result.returncode == 0, result.stdout[-3000:] + result.stderr[-3000:]
+
+
+def test_rgw_users_and_buckets(tmp_path):
+    offline = OfflineCluster(tmp_path, ceph_vars())
+
+    assert_ok(offline.run("02-services/rgw-users.yml"))
+    assert_ok(offline.run("02-services/rgw-buckets.yml"))
+
+    cluster = offline.cluster()
+    assert cluster.store.keys("users") == ["tenant0", "tenant1", "tenant2"]
+    assert cluster.store.get("buckets", "tenant1-bucket")["bucket_quota"]["enabled"] is True
+    with open(tmp_path / "playbooks" / "02-services" / "rgw-users.csv") as f:
+        assert [row["User ID"] for row in csv.DictReader(f)] == ["tenant0", "tenant1", "tenant2"]
+
+
+def test_rerun_only_reads(tmp_path):
+    offline = OfflineCluster(tmp_path, ceph_vars())
+    assert_ok(offline.run("02-services/rgw-users.yml"))
+    first = len(offline.commands())
+
+    result = offline.run("02-services/rgw-users.yml")
+
+    assert_ok(result)
+    assert "already exists" in result.stdout
+    rerun = [c["argv"][:2] for c in offline.commands()[first:]]
+    assert ["user", "create"] not in rerun
+
+
+def test_rbd_provision_validate_and_snapshot(tmp_path):
+    offline = OfflineCluster(tmp_path, ceph_vars(images=3))
+
+    assert_ok(offline.run("02-services/configure-rbd.yml"))
+    assert_ok(offline.run("04-validation/validate-rbd.yml"))
+    assert_ok(offline.run("03-operations/create-rbd-snapshot.yml",
+                          extra_vars={"rbd_image": "rbd-oa/vm-1", "snapshot_name": "pre-upgrade"}))
+
+    cluster = offline.cluster()
+    assert "rbd" in cluster.store.get("pools", "rbd-oa")["application_metadata"]
+    assert cluster.store.keys("images", "rbd-oa/") == ["rbd-oa/vm-0", "rbd-oa/vm-1", "rbd-oa/vm-2"]
+    assert [s["name"] for s in cluster.store.get("images", "rbd-oa/vm-1")["snapshots"]] == ["pre-upgrade"]
+
+
+def test_snapshot_bare_image_name_uses_rbd_pool(tmp_path):
+    variables = ceph_vars(images=1)
+    variables["ceph"]["rbd"][0]["pool_name"] = "rbd"
+    offline = OfflineCluster(tmp_path, variables)
+    snapshot = {"rbd_image": "vm-0", "snapshot_name": "pre-upgrade"}
+
+    assert_ok(offline.run("02-services/configure-rbd.yml"))
+    assert_ok(offline.run("03-operations/create-rbd-snapshot.yml", extra_vars=snapshot))
+    assert [s["name"] for s in offline.cluster().store.get("images", "rbd/vm-0")["snapshots"]] == ["pre-upgrade"]
+
+    assert_ok(offline.run("03-operations/remove-rbd-snapshot.yml", extra_vars=snapshot))
+    assert offline.cluster().store.get("images", "rbd/vm-0")["snapshots"] == []
+
+
+def test_latency_is_applied_per_command(tmp_path):
+    offline = OfflineCluster(tmp_path, ceph_vars(users=2), latency="radosgw-admin user create=0.2")
+
+    assert_ok(offline.run("02-services/rgw-users.yml"))
+
+    elapsed = {tuple(c["argv"][:2]): c["elapsed"] for c in offline.commands()}
+    assert elapsed[("user", "create")] >= 0.2
+    assert elapsed[("metadata", "list")] < 0.2
+
+
+def test_run_profile(tmp_path):
+    offline = OfflineCluster(tmp_path, ceph_vars(users=2), profile_remote=True)
+
+    assert_ok(offline.run("02-services/rgw-users.yml"))
+    result = offline.run("02-services/rgw-users.yml")
+
+    assert_ok(result)
+    assert result.cpu_s > 0 and result.max_rss_kb > 0
+    assert result.tasks[0]["task"] == "Provision RGW users in one batch"
+    assert result.commands == offline.commands()[-len(result.commands):]
+    assert [r["module"] for r in result.remote].count("ceph_rgw_users") == 1
+    assert all(r["rc"] == 0 and r["cpu_s"] > 0 for r in result.remote)
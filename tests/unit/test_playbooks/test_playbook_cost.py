@@ -0,0 +1,126 @@
+"""
+플레이북 원격 왕복 비용 정적 분석(scripts/playbook_cost.py) 테스트
+"""
+
+import json
+
+from playbook_cost import PROJECT_ROOT, Cost, CostAnalyzer, main, symbol_size
+
+from tests.fixtures.playbook_index import PlaybookIndex
+
+SNAPSHOT = """
+- name: Snapshot on every monitor
+  hosts: mons
+  tasks:
+    - name: List images
+      command: rbd ls -p {{ item.pool_name }}
+      loop: "{{ ceph.rbd }}"
+      register: listing
+    - name: Show images
+      debug:
+        msg: "{{ item.stdout }}"
+      loop: "{{ listing.results }}"
+    - name: Snapshot each image
+      command: rbd snap create {{ item.0.pool_name }}/{{ item.1.image_name }}@daily
+      with_subelements:
+        - "{{ ceph.rbd }}"
+        - images
+    - name: Cluster status once
+      command: ceph -s
+      run_once: true
+    - name: Save report
+      copy:
+        content: "{{ listing }}"
+        dest: report.json
+      delegate_to: localhost
+"""
+
+PER_INSTANCE = """
+- name: Users per RGW instance
+  hosts: admin[0]
+  tasks:
+    - name: Create users of each instance
+      include_tasks: tasks/users.yml
+      loop: "{{ ceph.rgw }}"
+      loop_control:
+        loop_var: rgw_instance
+- import_playbook: snapshot.yml
+"""
+
+USER_TASKS = """
+- name: Create user
+  command: radosgw-admin user create --uid={{ item.user_id }}
+  loop: "{{ rgw_instance.users }}"
+- name: Link buckets
+  command: radosgw-admin bucket link --bucket={{ item.1.name }}
+  loop: "{{ rgw_instance.users | subelements('buckets', skip_missing=True) }}"
+- name: Period commit
+  command: radosgw-admin period update --commit
+"""
+
+
+def analyze(tmp_path, name):
+    (tmp_path / "tasks").mkdir(exist_ok=True)
+    (tmp_path / "snapshot.yml").write_text(SNAPSHOT)
+    (tmp_path / "per-instance.yml").write_text(PER_INSTANCE)
+    (tmp_path / "tasks" / "users.yml").write_text(USER_TASKS)
+    return CostAnalyzer(PlaybookIndex(tmp_path), root=tmp_path).analyze(tmp_path / name)
+
+
+def test_cost_formula():
+    users = Cost.symbol("users")
+    cost = users + users + Cost.symbol("users") * Cost.symbol("hosts:mons") + Cost.const(2)
+
+    assert str(cost) == "|hosts:mons|·|users| + 2·|users| + 2"
+    assert cost.degree == 2
+    assert cost.evaluate({"users": 10, "hosts:mons": 3}.get) == 52
+    assert cost.evaluate({"users": 10}.get) is None
+    assert str(Cost()) == "0"
+
+
+def test_group_play_loops_and_findings(tmp_path):
+    result = analyze(tmp_path, "snapshot.yml")
+
+    assert str(result.remote) == "|ceph.rbd|·|hosts:mons| + |ceph.rbd[].images|·|hosts:mons| + 1"
+    assert str(result.local) == "|hosts:mons|"
+    assert [t.name for t in result.tasks] == ["List images", "Snapshot each image", "Cluster status once",
+                                              "Save report"]
+    kinds = sorted((f.kind, f.task) for f in result.findings)
+    assert kinds == [
+        ("fan-out", "List images"), ("fan-out", "Snapshot each image"),
+        ("n+1", "List images"), ("n+1", "Snapshot each image"),
+    ]
+    listing = next(f for f in result.findings if f.kind == "n+1" and f.task == "List images")
+    assert "JSON" in listing.message and "`rbd ls`" in listing.message
+
+
+def test_include_loop_var_and_import_playbook(tmp_path):
+    result = analyze(tmp_path, "per-instance.yml")
+
+    users = [t for t in result.tasks if t.file == "tasks/users.yml"]
+    assert [str(t.remote) for t in users] == ["|ceph.rgw[].users|", "|ceph.rgw[].users[].buckets|", "|ceph.rgw|"]
+    assert "Snapshot each image" in [t.name for t in result.tasks]
+
+    size = symbol_size({"ceph": {"rgw": [{"users": [{"buckets": [1, 2]}, {"buckets": [3]}]}, {"users": []}],
+                                 "rbd": [{"images": [1, 2, 3]}]}}, {"mons": 3})
+    assert result.remote.evaluate(size) == 2 + 3 + 2 + (3 * 3 + 1 * 3 + 1)
+
+
+def test_repository_playbooks():
+    analyzer = CostAnalyzer()
+
+    assert str(analyzer.analyze(PROJECT_ROOT / "playbooks/02-services/rgw-users.yml").remote) == "1"
+    validate = analyzer.analyze(PROJECT_ROOT / "playbooks/04-validation/validate-rbd.yml")
+    assert ("n+1", "Validate configured images exist") in [(f.kind, f.task) for f in validate.findings]
+    assert "|ceph.rbd[].images|" in str(validate.remote)
+
+
+def test_main_json(tmp_path, capsys):
+    analyze(tmp_path, "snapshot.yml")
+    vars_file = tmp_path / "vars.yml"
+    vars_file.write_text("ceph:\n  rbd:\n    - pool_name: a\n      images: [{image_name: x}, {image_name: y}]\n")
+
+    assert main([str(tmp_path / "snapshot.yml"), "--vars", str(vars_file), "--group", "mons=3", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report[0]["remote_value"] == 2 * 3 + 1 * 3 + 1
+    assert main([str(tmp_path / "snapshot.yml"), "--fail-on-finding"]) == 1
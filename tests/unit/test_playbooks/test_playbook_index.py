@@ -0,0 +1,124 @@
+"""
+세션 공용 플레이북 색인(tests/fixtures/playbook_index.py) 테스트
+"""
+
+import os
+
+import pytest
+import yaml
+
+from tests.fixtures.playbook_index import PlaybookIndex
+
+PLAYBOOK = """
+- import_playbook: common.yml
+
+- name: Sample
+  hosts: mons
+  pre_tasks:
+    - name: Facts
+      ansible.builtin.setup:
+  tasks:
+    - name: Status
+      command: ceph status
+    - block:
+        - name: Health
+          ansible.builtin.command: ceph health
+        - include_tasks: extra.yml
+      rescue:
+        - name: Report
+          debug:
+            msg: failed
+  handlers:
+    - name: restart
+      service:
+        name: ceph
+  roles:
+    - common
+    - role: monitor
+"""
+
+
+@pytest.fixture
+def playbooks(tmp_path):
+    (tmp_path / "sample.yml").write_text(PLAYBOOK)
+    (tmp_path / "broken.yml").write_text("- hosts: [unclosed\n")
+    return tmp_path
+
+
+class TestPlaybookIndex:
+    """플레이북 색인 메모이즈/캐시/조회 테스트"""
+
+    def test_parses_each_file_once(self, playbooks):
+        index = PlaybookIndex(playbooks)
+        first = index.glob()
+        second = index.glob()
+
+        assert index.parsed == 2
+        assert [e.path.name for e in first] == ["broken.yml", "sample.yml"]
+        assert first[1] is second[1]
+
+    def test_reparses_changed_file(self, playbooks):
+        index = PlaybookIndex(playbooks)
+        path = playbooks / "sample.yml"
+        before = index.get(path)
+        path.write_text(PLAYBOOK + "\n- hosts: osds\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        after = index.get(path)
+        assert after is not before
+        assert len(after.plays) == 3
+        assert index.parsed == 2
+
+    def test_disk_cache_round_trip(self, playbooks, tmp_path):
+        cache_file = tmp_path / "cache" / "index.pickle"
+        index = PlaybookIndex(playbooks, cache_file)
+        index.glob()
+        index.save()
+
+        warm = PlaybookIndex(playbooks, cache_file)
+        entries = warm.glob()
+        assert warm.parsed == 0
+        assert entries[1].modules == index.get(playbooks / "sample.yml").modules
+
+    def test_corrupt_cache_is_ignored(self, playbooks, tmp_path):
+        cache_file = tmp_path / "index.pickle"
+        cache_file.write_bytes(b"not a pickle")
+
+        index = PlaybookIndex(playbooks, cache_file)
+        index.glob()
+        assert index.parsed == 2
+
+    def test_precomputed_lookups(self, playbooks):
+        index = PlaybookIndex(playbooks)
+        entry = index.get(playbooks / "sample.yml")
+
+        assert [t.get("name") for t in entry.tasks(1)] == ["Status", None]
+        assert entry.handlers(1)[0]["name"] == "restart"
+        assert entry.modules["command"] == 1
+        assert entry.modules["ansible.builtin.command"] == 1
+        assert entry.modules["debug"] == 1
+        assert entry.modules["ansible.builtin.setup"] == 1
+        assert ("import_playbook", "common.yml") in entry.imports
+        assert ("include_tasks", "extra.yml") in entry.imports
+        assert ("role", "common") in entry.imports and ("role", "monitor") in entry.imports
+
+    def test_module_lookup_matches_fqcn(self, playbooks):
+        index = PlaybookIndex(playbooks)
+
+        assert [e.path.name for e in index.using_module("setup")] == ["sample.yml"]
+        assert index.using_module("ceph_pool") == []
+
+    def test_yaml_error_is_recorded(self, playbooks):
+        index = PlaybookIndex(playbooks)
+        entry = index.get(playbooks / "broken.yml")
+
+        assert entry.error and entry.plays == []
+        with pytest.raises(yaml.YAMLError):
+            index.load(entry.path)
+
+    def test_session_index_covers_repository(self, playbook_index):
+        entries = playbook_index.glob()
+
+        assert entries and all(e.error is None for e in entries)
+        assert playbook_index.glob()[0] is entries[0]
@@ -3,11 +3,11 @@ Ansible 플레이북 실행 테스트를 위한 기본 클래스
 """
 
 import pytest
-import yaml
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-import subprocess
+
+from tests.fixtures.playbook_index import shared_index
 
 
 class PlaybookTestRunner:
@@ -19,12 +19,11 @@ class PlaybookTestRunner:
         self.mock_results = {}
 
     def load_playbook(self):
-        """플레이북 YAML 파일 로드"""
+        """플레이북 YAML 파일 로드 (세션 공용 색인에서 한 번만 해석, 결과는 공유되므로 수정 금지)"""
         if not self.playbook_path.exists():
             raise FileNotFoundError(f"Playbook not found: {self.playbook_path}")
 
-        with open(self.playbook_path, 'r') as f:
-            return yaml.safe_load(f)
+        return shared_index().load(self.playbook_path)
 
     def get_tasks(self, play_index=0):
         """특정 플레이의 태스크 목록 반환"""
@@ -157,16 +156,11 @@ class TestablePlaybook:
         self.runner = PlaybookTestRunner(playbook_path)
 
     def syntax_check(self):
-        """문법 검사 실행"""
-        cmd = [
-            ".venv/bin/ansible-playbook",
-            "--syntax-check",
-            "-i", self.inventory_path,
-            str(self.playbook_path)
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode == 0
+        """문법 검사 실행 (ansible-playbook 프로세스 대신 세션 공용 SyntaxChecker 사용)"""
+        from syntax_check import shared_checker
+
+        self.syntax_result = shared_checker(self.inventory_path).check(self.playbook_path)
+        return self.syntax_result['ok']
 
     def dry_run(self):
         """드라이런 (--check) 실행"""
@@ -3,9 +3,7 @@ Ansible 플레이북 문법 검증 테스트
 """
 
 import pytest
-import subprocess
 from pathlib import Path
-import yaml
 
 
 class TestPlaybookSyntax:
@@ -25,34 +23,32 @@ class TestPlaybookSyntax:
         """모든 플레이북 파일 목록 반환"""
         return list(playbook_dir.glob("**/*.yml"))
 
+    def get_all_entries(self, playbook_index, playbook_dir):
+        """모든 플레이북의 색인 항목 반환 (파일마다 세션에서 한 번만 해석)"""
+        return playbook_index.glob("**/*.yml", root=playbook_dir)
+
     def test_playbooks_exist(self, playbook_dir):
         """플레이북 디렉토리 존재 확인"""
         assert playbook_dir.exists(), "playbooks 디렉토리가 존재해야 합니다"
         playbooks = self.get_all_playbooks(playbook_dir)
         assert len(playbooks) > 0, "최소 하나 이상의 플레이북이 있어야 합니다"
 
-    def test_yaml_syntax(self, playbook_dir):
+    def test_yaml_syntax(self, playbook_dir, playbook_index):
         """YAML 문법 검증"""
-        playbooks = self.get_all_playbooks(playbook_dir)
-        errors = []
-
-        for playbook in playbooks:
-            try:
-                with open(playbook, 'r') as f:
-                    yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                errors.append(f"{playbook}: {e}")
+        errors = [
+            f"{entry.path}: {entry.error}"
+            for entry in self.get_all_entries(playbook_index, playbook_dir)
+            if entry.error
+        ]
 
         assert not errors, f"YAML 문법 오류:\n" + "\n".join(errors)
 
-    def test_playbook_structure(self, playbook_dir):
+    def test_playbook_structure(self, playbook_dir, playbook_index):
         """플레이북 기본 구조 검증"""
-        playbooks = self.get_all_playbooks(playbook_dir)
         errors = []
 
-        for playbook in playbooks:
-            with open(playbook, 'r') as f:
-                content = yaml.safe_load(f)
+        for entry in self.get_all_entries(playbook_index, playbook_dir):
+            playbook, content = entry.path, playbook_index.load(entry.path)
 
             if not content:
                 continue
@@ -84,20 +80,17 @@ class TestPlaybookSyntax:
     )
     def test_ansible_syntax_check(self, playbook_dir, test_inventory):
         """Ansible 문법 검사"""
+        from syntax_check import check_playbooks, format_result
+
         playbooks = [
             p for p in self.get_all_playbooks(playbook_dir)
-            if not p.name.startswith('tasks/')  # tasks 하위는 제외
+            if 'tasks' not in p.relative_to(playbook_dir).parts  # tasks 하위는 제외
+        ]
+        errors = [
+            format_result(result)
+            for result in check_playbooks(playbooks, inventory=test_inventory)
+            if not result['ok']
         ]
-        errors = []
-
-        for playbook in playbooks:
-            result = subprocess.run(
-                ["ansible-playbook", "--syntax-check", str(playbook)],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                errors.append(f"{playbook}:\n{result.stderr}")
 
         assert not errors, f"Ansible 문법 오류:\n" + "\n".join(errors)
 
@@ -109,9 +102,8 @@ class TestPlaybookBestPractices:
     def playbook_dir(self):
         return Path(__file__).parent.parent.parent.parent / "playbooks"
 
-    def test_no_hardcoded_passwords(self, playbook_dir):
+    def test_no_hardcoded_passwords(self, playbook_dir, playbook_index):
         """하드코딩된 패스워드 검출"""
-        playbooks = list(playbook_dir.glob("**/*.yml"))
         violations = []
 
         password_patterns = [
@@ -119,11 +111,9 @@ class TestPlaybookBestPractices:
             'secret:', 'token:', 'api_key:'
         ]
 
-        for playbook in playbooks:
-            with open(playbook, 'r') as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines, 1):
+        for entry in playbook_index.glob("**/*.yml", root=playbook_dir):
+            playbook = entry.path
+            for i, line in enumerate(entry.lines, 1):
                 line_lower = line.lower()
                 for pattern in password_patterns:
                     if pattern in line_lower and not line.strip().startswith('#'):
@@ -135,18 +125,12 @@ class TestPlaybookBestPractices:
 
         assert not violations, f"보안 위반:\n" + "\n".join(violations)
 
-    def test_use_name_for_tasks(self, playbook_dir):
+    def test_use_name_for_tasks(self, playbook_dir, playbook_index):
         """모든 태스크에 name 필드 확인"""
-        playbooks = list(playbook_dir.glob("**/*.yml"))
         violations = []
 
-        for playbook in playbooks:
-            with open(playbook, 'r') as f:
-                try:
-                    content = yaml.safe_load(f)
-                except:
-                    continue
-
+        for entry in playbook_index.glob("**/*.yml", root=playbook_dir):
+            playbook, content = entry.path, entry.content
             if not content or not isinstance(content, list):
                 continue
 
@@ -166,18 +150,12 @@ class TestPlaybookBestPractices:
         if violations:
             print(f"⚠️  권장사항 위반:\n" + "\n".join(violations[:10]))
 
-    def test_no_become_in_tasks(self, playbook_dir):
+    def test_no_become_in_tasks(self, playbook_dir, playbook_index):
         """태스크 레벨 become 사용 검증 (플레이 레벨 권장)"""
-        playbooks = list(playbook_dir.glob("**/*.yml"))
         warnings = []
 
-        for playbook in playbooks:
-            with open(playbook, 'r') as f:
-                try:
-                    content = yaml.safe_load(f)
-                except:
-                    continue
-
+        for entry in playbook_index.glob("**/*.yml", root=playbook_dir):
+            playbook, content = entry.path, entry.content
             if not content or not isinstance(content, list):
                 continue
 
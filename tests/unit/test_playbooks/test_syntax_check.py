@@ -0,0 +1,142 @@
+"""
+프로세스 내 일괄 문법 검사(scripts/syntax_check.py) 테스트
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from syntax_check import check_playbooks, format_result, main, resolve_workers, shared_checker  # noqa: E402
+
+INVENTORY = "tests/fixtures/ansible_inventory.yml"
+
+VALID = """
+- name: Valid
+  hosts: all
+  gather_facts: false
+  tasks:
+    - name: Say hello
+      debug:
+        msg: hello
+    - name: Include tasks
+      import_tasks: tasks/extra.yml
+"""
+
+EXTRA_TASKS = """
+- name: Extra
+  command: ceph status
+  changed_when: false
+"""
+
+UNKNOWN_MODULE = """
+- name: Unknown module
+  hosts: all
+  tasks:
+    - name: Broken
+      no_such_module_for_tests:
+        arg: 1
+"""
+
+MISSING_IMPORT = """
+- name: Missing import
+  hosts: all
+  tasks:
+    - import_tasks: tasks/missing.yml
+"""
+
+
+@pytest.fixture
+def playbooks(tmp_path):
+    (tmp_path / "tasks").mkdir()
+    (tmp_path / "tasks" / "extra.yml").write_text(EXTRA_TASKS)
+    files = {}
+    for name, content in (("valid", VALID), ("unknown", UNKNOWN_MODULE), ("missing", MISSING_IMPORT)):
+        files[name] = tmp_path / f"{name}.yml"
+        files[name].write_text(content)
+    return files
+
+
+class TestSyntaxChecker:
+    """SyntaxChecker 검사 결과 테스트"""
+
+    def test_valid_playbook(self, playbooks):
+        result = shared_checker(INVENTORY).check(playbooks["valid"])
+
+        assert result["ok"] is True
+        assert result["error"] is None
+
+    def test_unknown_module_reports_location(self, playbooks):
+        result = shared_checker(INVENTORY).check(playbooks["unknown"])
+
+        assert result["ok"] is False
+        assert result["type"] == "AnsibleParserError"
+        assert "no_such_module_for_tests" in result["error"]
+        assert result["file"].endswith("unknown.yml")
+        assert result["line"] == 5
+
+    def test_missing_import(self, playbooks):
+        result = shared_checker(INVENTORY).check(playbooks["missing"])
+
+        assert result["ok"] is False
+        assert result["type"] == "AnsibleFileNotFound"
+        assert "tasks/missing.yml" in result["error"]
+
+    def test_missing_playbook(self, tmp_path):
+        result = shared_checker(INVENTORY).check(tmp_path / "absent.yml")
+
+        assert result["ok"] is False
+        assert "could not be found" in result["error"]
+
+    def test_checker_is_shared_per_inventory(self):
+        assert shared_checker(INVENTORY) is shared_checker(INVENTORY)
+        assert shared_checker(Path(INVENTORY).resolve()) is shared_checker(INVENTORY)
+
+    def test_checkers_for_different_inventories(self, playbooks, tmp_path):
+        other = tmp_path / "other-inventory.yml"
+        other.write_text("all:\n  hosts:\n    other-host:\n      ansible_connection: local\n")
+
+        first, second = shared_checker(INVENTORY), shared_checker(other)
+
+        assert first is not second
+        assert "other-host" in [h.name for h in second.inventory.get_hosts()]
+        assert "other-host" not in [h.name for h in first.inventory.get_hosts()]
+        assert first.check(playbooks["valid"])["ok"] is True
+        assert second.check(playbooks["valid"])["ok"] is True
+
+
+class TestCheckPlaybooks:
+    """일괄 검사/병렬 처리/출력 테스트"""
+
+    def test_process_pool_keeps_order(self, playbooks):
+        paths = [playbooks["unknown"], playbooks["valid"], playbooks["missing"]]
+
+        serial = check_playbooks(paths, INVENTORY, workers=1)
+        parallel = check_playbooks(paths, INVENTORY, workers=2)
+
+        assert [r["ok"] for r in parallel] == [False, True, False]
+        assert parallel == serial
+
+    def test_resolve_workers(self):
+        assert resolve_workers("auto", 10) == 1
+        assert resolve_workers("3", 10) == 3
+        assert resolve_workers("auto", 10000) >= 1
+
+    def test_format_result(self, playbooks):
+        ok = format_result({"path": "a.yml", "ok": True})
+        fail = format_result({"path": "b.yml", "ok": False, "type": "AnsibleParserError", "file": "b.yml",
+                              "line": 3, "column": 7, "error": "first\nsecond"})
+
+        assert ok == "ok    a.yml"
+        assert fail == "FAIL  b.yml: AnsibleParserError at b.yml:3:7: first second"
+
+    def test_main_json_and_exit_code(self, playbooks, tmp_path, capsys):
+        assert main(["-i", INVENTORY, str(playbooks["valid"])]) == 0
+        capsys.readouterr()
+
+        assert main(["-i", INVENTORY, "--json", str(tmp_path)]) == 1
+        results = json.loads(capsys.readouterr().out)
+        by_name = {r["path"].rsplit("/", 1)[-1]: r["ok"] for r in results}
+        assert by_name["valid.yml"] is True and by_name["unknown.yml"] is False
@@ -44,15 +44,22 @@ class TestValidateClusterHealth:
         # 필수 체크 태스크
         required_checks = [
             "Check cluster status",
-            "Check cluster health",
-            "Check OSD status",
-            "Check MON status"
         ]
 
         for check in required_checks:
             assert any(check in name for name in task_names), \
                 f"Required check '{check}' not found"
 
+    def test_single_structured_status_query(self, runner):
+        """상태 조회는 JSON 스냅샷 1회로 처리하고 텍스트를 정규식으로 해석하지 않음"""
+        tasks = runner.get_tasks(play_index=0)
+
+        snapshot_tasks = [t for t in tasks if 'ceph_health_snapshot' in t]
+        assert len(snapshot_tasks) == 1, "Cluster status should be collected once with ceph_health_snapshot"
+        assert not [t for t in tasks if 'command' in t or 'shell' in t], \
+            "No additional ceph CLI commands should be needed"
+        assert 'regex_search' not in str(tasks), "Status should not be parsed with regex_search"
+
     def test_validation_assertions(self, runner):
         """검증 assertion 태스크 확인"""
         tasks = runner.get_tasks(play_index=0)
@@ -104,7 +111,7 @@ class TestValidateClusterHealth:
         registered_vars = [t.get('register') for t in register_tasks if 'register' in t]
 
         # 중요한 변수들이 등록되어 있는지 확인
-        important_vars = ['ceph_status', 'ceph_health', 'osd_stat', 'mon_stat']
+        important_vars = ['ceph_status']
         for var in important_vars:
             assert var in registered_vars, f"Variable '{var}' should be registered"
 